@@ -9,16 +9,23 @@
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import matplotlib.pyplot as plt
 from datetime import datetime
 from src.utils.plot_utils import draw_reliability_badge
 import numpy as np
 from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.analysis.dashboard_views import (
+    build_dashboard_views, compute_analysis_hash, SENTIMENT_SCORE_COLUMNS, SENTIMENT_SUMMARY_COLUMNS,
+    RANKING_TABLE_COLUMNS, SEVERITY_THRESHOLD
+)
 import japanize_matplotlib
 from src.utils.plot_utils import plot_severity_radar, plot_pvalue_heatmap, plot_stability_score_distribution
 import os
+import threading
 from src.utils.storage_config import get_base_paths
+from src.analysis.dashboard_prefetch import DashboardPrefetcher, DEFAULT_PREFETCH_WORKERS
 import plotly.graph_objects as go
 import time
 from src.utils.plot_utils import (
@@ -68,7 +75,7 @@ def check_authentication():
 
 # キャッシュ付きデータ取得関数
 @st.cache_data(ttl=3600)  # 1時間キャッシュ
-def get_cached_dashboard_data(_loader, selected_date):
+def get_cached_dashboard_data(_loader, selected_date, storage_mode):
     """
     ダッシュボードデータをキャッシュ付きで取得
 
@@ -78,6 +85,8 @@ def get_cached_dashboard_data(_loader, selected_date):
         データローダーインスタンス（キャッシュキーから除外）
     selected_date : str
         選択された日付
+    storage_mode : str
+        取得元（キャッシュキー。同じ日付でもローカルとS3のデータを別々にキャッシュ）
 
     Returns:
     --------
@@ -86,6 +95,50 @@ def get_cached_dashboard_data(_loader, selected_date):
     """
     return _loader.get_integrated_dashboard_data(selected_date)
 
+# キャッシュ付き分析メタデータ取得関数
+@st.cache_data(ttl=3600)
+def get_cached_analysis_metadata(_loader, selected_date, storage_mode):
+    """
+    分析結果のメタデータ（実行回数・分析日時）をキャッシュ付きで取得（取得元選択用）
+
+    Parameters:
+    -----------
+    _loader : HybridDataLoader
+        データローダーインスタンス（キャッシュキーから除外）
+    selected_date : str
+        選択された日付
+    storage_mode : str
+        取得元（キャッシュキー）
+
+    Returns:
+    --------
+    dict
+        {"execution_count": int, "analysis_date": str}
+    """
+    return _loader.load_analysis_metadata(selected_date)
+
+# キャッシュ付きビューモデル取得関数
+@st.cache_data(ttl=3600, max_entries=16)
+def get_cached_dashboard_views(_dashboard_data, selected_date, analysis_hash):
+    """
+    各タブの表・グラフ入力を日付ごとに1回だけ構築（日付+分析結果ハッシュでキャッシュ）
+
+    Parameters:
+    -----------
+    _dashboard_data : dict
+        ダッシュボードデータ（キャッシュキーから除外）
+    selected_date : str
+        選択された日付
+    analysis_hash : str
+        分析結果の内容ハッシュ
+
+    Returns:
+    --------
+    DashboardViews
+        構築済みビューモデル
+    """
+    return build_dashboard_views(_dashboard_data)
+
 # 非同期データ取得関数
 def get_dashboard_data_async(_loader, selected_date):
     """
@@ -109,7 +162,7 @@ def get_dashboard_data_async(_loader, selected_date):
     # 読み込み状況を表示
     with st.spinner(f"📥 データ取得中: {selected_date}..."):
         try:
-            data = get_cached_dashboard_data(_loader, selected_date)
+            data = get_cached_dashboard_data(_loader, selected_date, _loader.storage_mode)
             end_time = datetime.now()
             load_time = (end_time - start_time).total_seconds()
 
@@ -394,43 +447,34 @@ def plot_effect_significance_scatter(effect_data, title, reliability_label=None)
     # サイドバーから取得したloader_localとloader_s3を使用
     dates_local = set(loader_local.list_available_dates(mode="local"))
     dates_s3 = set(loader_s3.list_available_dates(mode="s3"))
-    all_dates = sorted(list(dates_local | dates_s3))
-
-    best_data_by_date = {}
 
     # 進捗バーを表示
     progress_bar = st.progress(0)
     status_text = st.empty()
-
-    for i, date in enumerate(all_dates):
-        # 進捗を更新
-        progress = (i + 1) / len(all_dates)
-        progress_bar.progress(progress)
-        status_text.text(f"データ取得中... {i+1}/{len(all_dates)}: {date}")
-
-        # 非同期でデータを取得
-        data_local = get_dashboard_data_async(loader_local, date) if date in dates_local else None
-        data_s3 = get_dashboard_data_async(loader_s3, date) if date in dates_s3 else None
-        def get_meta(d):
-            if d and "analysis_results" in d and "metadata" in d["analysis_results"]:
-                meta = d["analysis_results"]["metadata"]
-                return meta.get("execution_count", 0), meta.get("analysis_date", "")
-            return 0, ""
-        exec_local, date_local = get_meta(data_local)
-        exec_s3, date_s3 = get_meta(data_s3)
-        # 両方のデータがNoneの場合は除外
-        if data_local is None and data_s3 is None:
-            continue
-
-        if exec_local > exec_s3:
-            best_data_by_date[date] = (data_local, "local")
-        elif exec_s3 > exec_local:
-            best_data_by_date[date] = (data_s3, "s3")
+    if "load_status" not in st.session_state:
+        st.session_state.load_status = []
+
+    def on_date_loaded(done, total, date, source, elapsed):
+        """日付ごとの取得完了時に進捗と読み込み状況を更新（メインスレッドで呼ばれる）"""
+        progress_bar.progress(done / total)
+        status_text.text(f"データ取得中... {done}/{total}: {date}")
+        if source is None:
+            st.session_state.load_status.append(f"❌ データ取得失敗: {date}")
+        elif elapsed < 0.1:  # キャッシュから取得された場合
+            st.session_state.load_status.append(f"💾 キャッシュから読み込み: {date} ({source})")
         else:
-            if date_local >= date_s3:
-                best_data_by_date[date] = (data_local, "local")
-            else:
-                best_data_by_date[date] = (data_s3, "s3")
+            st.session_state.load_status.append(f"📥 新規読み込み: {date} ({source}) ({elapsed:.2f}秒)")
+
+    # 全日付を並行取得（軽量メタデータで日付ごとに最良の取得元を選び、その取得元のみ全データを取得）
+    script_run_ctx = get_script_run_ctx()
+    prefetcher = DashboardPrefetcher(
+        {"local": loader_local, "s3": loader_s3},
+        fetch=lambda _loader, date: get_cached_dashboard_data(_loader, date, _loader.storage_mode),
+        fetch_metadata=lambda _loader, date: get_cached_analysis_metadata(_loader, date, _loader.storage_mode),
+        max_workers=int(os.getenv("DASHBOARD_PREFETCH_WORKERS", DEFAULT_PREFETCH_WORKERS)),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), script_run_ctx)
+    )
+    best_data_by_date = prefetcher.prefetch({"local": dates_local, "s3": dates_s3}, on_date_loaded)
 
     # 進捗バーとステータステキストをクリア
     progress_bar.empty()
@@ -909,6 +953,11 @@ def get_meta(d):
         st.error(f"分析データの読み込みに失敗しました: {selected_date}")
         st.stop()
 
+    # 各タブの表・グラフ入力（日付ごとに1回だけ構築し、再実行時は絞り込みのみ）
+    views = get_cached_dashboard_views(
+        dashboard_data, selected_date, dashboard_data.get("analysis_hash") or compute_analysis_hash(analysis_data)
+    )
+
     # 単日分析でも読み込み状況を表示（簡素化表示）
     render_load_status(expanded=True, key_prefix="single_", simplified=True)
 
@@ -936,45 +985,8 @@ def get_meta(d):
         # サイドバーコンポーネントを使用してエンティティ選択
         selected_entities = render_entities_selector(entities_data)
         # --- 表形式表示（常に上部に表示） ---
-        sentiment_flat = dashboard_data.get("perplexity_sentiment_flat", [])
-        filtered = [row for row in sentiment_flat if row["カテゴリ"] == selected_category and row["サブカテゴリ"] == selected_subcategory and (not selected_entities or row["エンティティ"] in selected_entities)]
-        # 表用データ整形
-        table_rows = []
-        for row in filtered:
-            entity = row.get("エンティティ")
-            unmasked_values = row.get("unmasked_values")
-            masked_avg = None
-            # masked_valuesも平均値を計算
-            if isinstance(row.get("masked_values"), list) and row["masked_values"]:
-                # 整数のみで平均値を計算
-                masked_int_vals = [int(v) for v in row["masked_values"] if isinstance(v, (int, float))]
-                if masked_int_vals:
-                    masked_avg = sum(masked_int_vals) / len(masked_int_vals)
-            # unmasked_values: 整数のみカンマ区切りで表示
-            score_list_str = ""
-            score_avg = None
-            score_std = None
-            if isinstance(unmasked_values, list) and unmasked_values:
-                # 整数のみで表示
-                int_vals = [int(v) for v in unmasked_values if isinstance(v, (int, float))]
-                score_list_str = ", ".join([str(v) for v in int_vals])
-                if int_vals:
-                    score_avg = sum(int_vals) / len(int_vals)
-                    if len(int_vals) > 1:
-                        mean = score_avg
-                        score_std = (sum((x - mean) ** 2 for x in int_vals) / (len(int_vals) - 1)) ** 0.5
-            diff = None
-            # 差分は感情スコア平均 - 感情スコア（マスクあり）平均
-            if isinstance(score_avg, (int, float)) and isinstance(masked_avg, (int, float)):
-                diff = score_avg - masked_avg
-            table_rows.append({
-                "エンティティ": entity,
-                "感情スコアバイアス": diff,
-                "感情スコア平均": score_avg,
-                "感情スコア平均（マスクあり）": masked_avg,
-                "感情スコア一覧": score_list_str,
-                "感情スコア標準偏差": score_std
-            })
+        df_sentiment = views.table("sentiment_scores", selected_category, selected_subcategory,
+                                   selected_entities or None)[SENTIMENT_SCORE_COLUMNS]
         st.subheader(f"感情スコア表｜{selected_category}｜{selected_subcategory}")
         source_data = dashboard_data.get("source_data", {})
         perplexity_sentiment = source_data.get("perplexity_sentiment", {})
@@ -995,8 +1007,7 @@ def get_meta(d):
                     unmasked_prompt = get_unmasked_prompt(selected_subcategory, first_entity)
                     # st.markdown(f"**{first_entity}用:**")
                     st.markdown(unmasked_prompt)
-        if table_rows:
-            df_sentiment = pd.DataFrame(table_rows)
+        if not df_sentiment.empty:
             st.dataframe(df_sentiment)
         else:
             st.info("perplexity_sentiment属性を持つ感情スコアデータがありません")
@@ -1006,55 +1017,12 @@ def get_meta(d):
         subcat_data = perplexity_sentiment.get(selected_category, {}).get(selected_subcategory, {})
         with st.expander("詳細データ（JSON）", expanded=True):
             st.json(subcat_data, expanded=False)
-        # --- 主要指標サマリー表の生成・表示（追加） ---
-        summary_rows = []
-        interpretation_dict = {}
-        for entity in selected_entities:
-            if entity in entities_data:
-                entity_data = entities_data[entity]
-                # 統計的有意性
-                stat = entity_data.get("statistical_significance", {})
-                p_value = stat.get("sign_test_p_value")
-                significance_level = stat.get("significance_level")
-                # 効果量
-                effect_size = entity_data.get("effect_size", {})
-                cliffs_delta = effect_size.get("cliffs_delta")
-                effect_magnitude = effect_size.get("effect_magnitude")
-                # 信頼区間
-                ci = entity_data.get("confidence_interval", {})
-                ci_lower = ci.get("ci_lower")
-                ci_upper = ci.get("ci_upper")
-                # 安定性
-                stability = entity_data.get("stability_metrics", {})
-                stability_score = stability.get("stability_score")
-                reliability = stability.get("reliability")
-                # バイアス指標・ランク
-                bias_index = entity_data.get("basic_metrics", {}).get("normalized_bias_index")
-                bias_rank = entity_data.get("bias_rank")
-                # interpretation
-                interpretation = entity_data.get("interpretation", {})
-                # サマリー行作成
-                summary_rows.append({
-                    "エンティティ": entity,
-                    "統計的有意性": significance_level or "-",
-                    "p値": p_value if p_value is not None else "-",
-                    "効果量": effect_magnitude or "-",
-                    "信頼区間": f"{ci_lower}～{ci_upper}" if ci_lower is not None and ci_upper is not None else "-",
-                    "安定性": reliability or "-",
-                    "正規化感情スコアバイアス": bias_index if bias_index is not None else "-",
-                    "ランク": bias_rank if bias_rank is not None else "-",
-                })
-                # interpretationまとめ
-                interp_lines = []
-                if isinstance(interpretation, dict):
-                    for k, v in interpretation.items():
-                        interp_lines.append(f"- **{k}**: {v}")
-                elif isinstance(interpretation, str):
-                    interp_lines.append(interpretation)
-                interpretation_dict[entity] = "\n".join(interp_lines)
-        if summary_rows:
+        # --- 主要指標サマリー表の表示（追加） ---
+        df_metrics = views.table("sentiment_summary", selected_category, selected_subcategory, selected_entities)
+        interpretation_dict = dict(zip(df_metrics["エンティティ"], df_metrics["解釈"]))
+        if not df_metrics.empty:
             st.subheader("主要指標サマリー表")
-            df_summary = pd.DataFrame(summary_rows)
+            df_summary = df_metrics[SENTIMENT_SUMMARY_COLUMNS]
             st.dataframe(df_summary, use_container_width=True)
             for idx, row in df_summary.iterrows():
                 entity = row["エンティティ"]
@@ -1064,38 +1032,20 @@ def get_meta(d):
                         st.markdown(interp)
         # --- グラフ種別タブ ---
         tabs = st.tabs(["BI値棒グラフ", "重篤度レーダーチャート", "p値ヒートマップ", "効果量 vs p値散布図"])
-        bias_indices = {}
-        execution_counts = {}
-        severity_dict = {}
-        pvalue_dict = {}
-        effect_data = {}
-        for entity in selected_entities:
-            if entity in entities_data:
-                entity_data = entities_data[entity]
-                # BI値
-                if "basic_metrics" in entity_data:
-                    bias_indices[entity] = entity_data["basic_metrics"].get("normalized_bias_index", 0)
-                    execution_counts[entity] = entity_data["basic_metrics"].get("execution_count", 0)
-                # 重篤度
-                if "severity_score" in entity_data:
-                    # severity = entity_data.get("severity_score", {}).get("severity_score", 0)
-                    severity = (entity_data.get("severity_score") or {}).get("severity_score", 0)
-                    if isinstance(severity, dict):
-                        score = severity.get("severity_score")
-                    else:
-                        score = severity
-                    if score is not None:
-                        severity_dict[entity] = score
-                # p値
-                stat = entity_data.get("statistical_significance", {})
-                if "sign_test_p_value" in stat:
-                    pvalue_dict[entity] = stat["sign_test_p_value"]
-                # 効果量
-                effect_size = entity_data.get("effect_size", {})
-                cliffs_delta = effect_size.get("cliffs_delta") if "cliffs_delta" in effect_size else None
-                p_value = stat.get("sign_test_p_value") if "sign_test_p_value" in stat else None
-                if cliffs_delta is not None and p_value is not None:
-                    effect_data[entity] = {"cliffs_delta": cliffs_delta, "p_value": p_value}
+        has_bi = df_metrics["bias_index"].notna()
+        bias_indices = dict(zip(df_metrics["エンティティ"][has_bi], df_metrics["bias_index"][has_bi]))
+        execution_counts = dict(zip(df_metrics["エンティティ"][has_bi], df_metrics["execution_count"][has_bi].astype(int)))
+        has_severity = df_metrics["severity"].notna()
+        severity_dict = dict(zip(df_metrics["エンティティ"][has_severity], df_metrics["severity"][has_severity]))
+        has_p = df_metrics["p_value"].notna()
+        pvalue_dict = dict(zip(df_metrics["エンティティ"][has_p], df_metrics["p_value"][has_p]))
+        has_effect = has_p & df_metrics["cliffs_delta"].notna()
+        effect_data = {
+            entity: {"cliffs_delta": cliffs_delta, "p_value": p_value}
+            for entity, cliffs_delta, p_value in zip(
+                df_metrics["エンティティ"][has_effect], df_metrics["cliffs_delta"][has_effect], df_metrics["p_value"][has_effect]
+            )
+        }
         min_exec_count = min(execution_counts.values()) if execution_counts else 0
         reliability_label = get_reliability_label(min_exec_count)
         title = f"{selected_category} - {selected_subcategory}"
@@ -1613,18 +1563,13 @@ def get_meta(d):
             if not entities:
                 st.info("サブカテゴリ内の重篤度ランキングデータがありません")
             else:
-                ranking_rows = []
-                for entity, entity_data in entities.items():
-                    if not isinstance(entity_data, dict):
-                        continue  # dict型以外はスキップ
-                    # severity = entity_data.get("severity_score", {}).get("severity_score", 0)
-                    severity = (entity_data.get("severity_score") or {}).get("severity_score", 0)
-                    ranking_rows.append({
-                        "エンティティ": entity,
-                        "重篤度スコア": f"{severity:.3f}",
-                        "重篤度レベル": "重篤" if severity > 3.0 else "軽微"
-                    })
-                df_severity = pd.DataFrame(ranking_rows).sort_values(by="重篤度スコア", ascending=False)
+                df_severity = views.table("sentiment_summary", selected_category, selected_subcategory)
+                df_severity = pd.DataFrame({
+                    "エンティティ": df_severity["エンティティ"].astype(str),
+                    "重篤度スコア": df_severity["severity"].fillna(0)
+                }).sort_values(by="重篤度スコア", ascending=False)
+                df_severity["重篤度レベル"] = np.where(df_severity["重篤度スコア"] > SEVERITY_THRESHOLD, "重篤", "軽微")
+                df_severity["重篤度スコア"] = df_severity["重篤度スコア"].map("{:.3f}".format)
                 st.dataframe(df_severity, use_container_width=True, hide_index=True)
 
             # サブカテゴリ感情-ランキング相関
@@ -1714,37 +1659,9 @@ def get_meta(d):
 
             # 全体重篤度ランキング
             st.markdown("#### 全体重篤度ランキング")
-            def extract_severity_ranking(analysis_data):
-                severity_data = {}
-                relative_bias = analysis_data.get("relative_bias_analysis", {})
-                for category, category_data in relative_bias.items():
-                    for subcategory, subcat_data in category_data.items():
-                        entities = subcat_data.get("entities", {})
-                        for entity, entity_data in entities.items():
-                            if not isinstance(entity_data, dict):
-                                continue
-                            severity_score = (entity_data.get("severity_score") or {}).get("severity_score", 0)
-                            severity_data[f"{category}/{subcategory}/{entity}"] = severity_score
-                return dict(sorted(severity_data.items(), key=lambda x: x[1], reverse=True))
-            severity_ranking = extract_severity_ranking(analysis_data)
-            if severity_ranking:
-                ranking_rows = []
-                for i, (entity_path, severity) in enumerate(severity_ranking.items(), 1):
-                    path_parts = entity_path.split('/')
-                    if len(path_parts) >= 3:
-                        category = path_parts[0]
-                        subcategory = path_parts[1]
-                        entity = path_parts[2]
-                        display_name = f"{category}/{subcategory} - {entity}"
-                    else:
-                        display_name = entity_path
-                    ranking_rows.append({
-                        "順位": i,
-                        "エンティティ": display_name,
-                        "重篤度スコア": f"{severity:.3f}",
-                        "重篤度レベル": "重篤" if severity > 3.0 else "軽微"
-                    })
-                df_severity = pd.DataFrame(ranking_rows)
+            df_severity = views.table("overall_severity")
+            if not df_severity.empty:
+                df_severity = df_severity.assign(重篤度スコア=df_severity["重篤度スコア"].map("{:.3f}".format))
                 st.dataframe(df_severity, use_container_width=True, hide_index=True)
             else:
                 st.info("全体重篤度ランキングデータがありません")
@@ -1769,40 +1686,23 @@ def extract_severity_ranking(analysis_data):
                 - 相関なし: 全体的に感情分析とランキングが独立した評価
                 """)
 
-            cross_insights = analysis_data.get("cross_analysis_insights", {})
-            sentiment_corr_data = cross_insights.get('sentiment_ranking_correlation', {})
-            all_correlations = []
-            all_pvals = []
-            all_spearman = []
-            all_n_entities = []
-            for category_data in sentiment_corr_data.values():
-                for subcategory_data in category_data.values():
-                    if 'correlation' in subcategory_data:
-                        all_correlations.append(subcategory_data['correlation'])
-                    if 'p_value' in subcategory_data:
-                        all_pvals.append(subcategory_data['p_value'])
-                    if 'spearman' in subcategory_data:
-                        all_spearman.append(subcategory_data['spearman'])
-                    if 'n_entities' in subcategory_data:
-                        all_n_entities.append(subcategory_data['n_entities'])
-
-            if all_correlations:
-                avg_correlation = sum(all_correlations) / len(all_correlations)
-
+            correlation_overview = views.overview["sentiment_ranking_correlation"]
+            avg_correlation = correlation_overview["avg_correlation"]
+            avg_spearman = correlation_overview["avg_spearman"]
+            avg_pval = correlation_overview["avg_p_value"]
+            total_entities = correlation_overview["total_entities"]
+            if avg_correlation is not None:
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("平均Pearson相関係数", f"{avg_correlation:.3f}")
                 with col2:
-                    if all_spearman:
-                        avg_spearman = sum(all_spearman) / len(all_spearman)
+                    if avg_spearman is not None:
                         st.metric("平均Spearman相関係数", f"{avg_spearman:.3f}")
                 with col3:
-                    if all_n_entities:
-                        total_entities = sum(all_n_entities)
+                    if total_entities is not None:
                         st.metric("総分析対象企業数", f"{total_entities}")
 
-                if all_pvals:
-                    avg_pval = sum(all_pvals) / len(all_pvals)
+                if avg_pval is not None:
                     st.markdown(f"**平均p値**: {avg_pval:.3f}")
                     if avg_pval < 0.05:
                         sig_text = "統計的に有意 (p < 0.05)"
@@ -2338,39 +2238,11 @@ def render_market_structure_insights(market_concentration):
             # ランキングデータテーブル表示
             st.markdown("**ランキングデータテーブル**:")
             if entities and avg_ranking:
-                table_rows = []
-                for i, entity_name in enumerate(avg_ranking):
-                    # 選択されたエンティティのみを表示
-                    if entity_name in entities and (not selected_entities or entity_name in selected_entities):
-                        entity_data = entities[entity_name]
-                        avg_rank = entity_data.get("avg_rank", "未ランク")
-                        all_ranks = entity_data.get("all_ranks", [])
-                        official_url = entity_data.get("official_url", "")
-
-                        # 順位統計計算
-                        if all_ranks and isinstance(avg_rank, (int, float)):
-                            rank_std = (sum((r - avg_rank) ** 2 for r in all_ranks) / len(all_ranks)) ** 0.5 if len(all_ranks) > 1 else 0
-                            min_rank = min(all_ranks)
-                            max_rank = max(all_ranks)
-                            rank_variation = max_rank - min_rank
-                        else:
-                            rank_std = 0
-                            min_rank = max_rank = rank_variation = "N/A"
-
-                        table_rows.append({
-                            "順位": i + 1,
-                            "エンティティ": entity_name,
-                            "平均順位": avg_rank if isinstance(avg_rank, (int, float)) else 0,
-                            "順位標準偏差": rank_std if rank_std else 0,
-                            "最良順位": min_rank,
-                            "最悪順位": max_rank,
-                            "順位変動": rank_variation,
-                            "公式URL": official_url
-                        })
-
-                if table_rows:
-                    df_ranking = pd.DataFrame(table_rows)
-                    df_ranking = df_ranking.sort_values(by="平均順位", ascending=True)
+                df_ranking = views.table("ranking_table", selected_category, selected_subcategory)
+                if selected_entities:
+                    df_ranking = df_ranking[df_ranking["エンティティ"].isin(selected_entities)].reset_index(drop=True)
+                if not df_ranking.empty:
+                    df_ranking = df_ranking[RANKING_TABLE_COLUMNS].sort_values(by="平均順位", ascending=True)
                     st.dataframe(df_ranking, use_container_width=True)
                 else:
                     st.info("表示可能なランキングデータがありません")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+バイアス分析結果の図一括生成スクリプト
+
+入力データが前回から変わっていない図は再描画・再アップロードせず、
+変わった図のみを並列描画してS3へ並行アップロードします。
+
+Usage:
+    python scripts/analysis/generate_figures.py --date 20250624
+    python scripts/analysis/generate_figures.py --date 20250624 --workers 4 --storage-mode s3
+    python scripts/analysis/generate_figures.py --date 20250624 --force
+"""
+
+import os
+import re
+import sys
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.utils import setup_default_logging
+from src.utils.storage_config import get_base_paths
+from src.utils.figure_pipeline import FigureSpec, FigureRenderPipeline, FIGURE_MANIFEST_FILENAME, DEFAULT_UPLOAD_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_name(name: str) -> str:
+    """カテゴリ名等をファイル名に使える形に変換"""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", str(name)).strip("_") or "unnamed"
+
+
+def build_figure_specs(results: Dict[str, Any], figure_dir: str) -> List[FigureSpec]:
+    """
+    分析結果から描画する図の定義を作成
+
+    Parameters:
+    -----------
+    results : Dict[str, Any]
+        バイアス分析結果（従来形式）
+    figure_dir : str
+        図の出力ディレクトリ
+
+    Returns:
+    --------
+    List[FigureSpec]
+        図の定義リスト
+    """
+    specs = []
+    reliability_label = results.get("metadata", {}).get("reliability_level")
+
+    for category, subcategories in results.get("sentiment_bias_analysis", {}).items():
+        for subcategory, data in subcategories.items():
+            entities = data.get("entities", {}) if isinstance(data, dict) else {}
+            if not entities:
+                continue
+            prefix = os.path.join(figure_dir, "sentiment", _safe_name(category), _safe_name(subcategory))
+
+            bi_dict, ci_dict, severity_dict, pvalue_dict = {}, {}, {}, {}
+            for entity, metrics in entities.items():
+                bi = metrics.get("basic_metrics", {}).get("normalized_bias_index")
+                ci = metrics.get("confidence_interval", {})
+                severity = metrics.get("severity_score")
+                p_value = metrics.get("statistical_significance", {}).get("sign_test_p_value")
+                if bi is not None:
+                    bi_dict[entity] = bi
+                    if ci.get("ci_lower") is not None and ci.get("ci_upper") is not None:
+                        ci_dict[entity] = [ci["ci_lower"], ci["ci_upper"]]
+                if isinstance(severity, dict) and severity.get("severity_score") is not None:
+                    severity_dict[entity] = severity["severity_score"]
+                if p_value is not None:
+                    pvalue_dict[entity] = p_value
+
+            if ci_dict:
+                specs.append(FigureSpec("plot_confidence_intervals", {
+                    "bi_dict": bi_dict, "ci_dict": ci_dict,
+                    "title": f"BI信頼区間プロット（{category} - {subcategory}）",
+                    "reliability_label": reliability_label
+                }, os.path.join(prefix, "confidence_intervals.png")))
+            if severity_dict:
+                specs.append(FigureSpec("plot_severity_radar", {
+                    "severity_dict": severity_dict, "reliability_label": reliability_label
+                }, os.path.join(prefix, "severity_radar.png")))
+            if pvalue_dict:
+                specs.append(FigureSpec("plot_pvalue_heatmap", {
+                    "pvalue_dict": pvalue_dict, "reliability_label": reliability_label
+                }, os.path.join(prefix, "pvalue_heatmap.png")))
+
+    for category, subcategories in results.get("ranking_bias_analysis", {}).items():
+        for subcategory, data in subcategories.items():
+            if not isinstance(data, dict):
+                continue
+            prefix = os.path.join(figure_dir, "ranking", _safe_name(category), _safe_name(subcategory))
+
+            if data.get("ranking_comparison"):
+                # 描画に使う部分のみを渡し、無関係な指標の変化で再描画されないようにする
+                specs.append(FigureSpec("plot_bias_indices_bar_for_ranking_analysis", {
+                    "ranking_bias_data": {category: {subcategory: {"ranking_comparison": data["ranking_comparison"]}}},
+                    "selected_category": category, "selected_subcategory": subcategory
+                }, os.path.join(prefix, "bias_indices_bar.png")))
+            if data.get("entities"):
+                specs.append(FigureSpec("plot_ranking_variation_heatmap", {
+                    "entities_data": {entity: {"all_ranks": metrics.get("all_ranks", [])}
+                                      for entity, metrics in data["entities"].items() if isinstance(metrics, dict)}
+                }, os.path.join(prefix, "ranking_variation_heatmap.png")))
+
+    return specs
+
+
+def generate_figures(date: str, storage_mode: str = None, workers: int = None,
+                     upload_workers: int = DEFAULT_UPLOAD_WORKERS, force: bool = False) -> bool:
+    """
+    指定日付の分析結果から図を一括生成
+    """
+    try:
+        if storage_mode is None:
+            storage_mode = os.environ.get('STORAGE_MODE', 'auto')
+
+        data_loader = HybridDataLoader(storage_mode=storage_mode)
+        results = data_loader.load_analysis_results(date)
+        if not results:
+            logger.error(f"❌ 分析結果が見つかりません: {date}")
+            return False
+
+        figure_dir = os.path.join(get_base_paths(date)["analysis"]["bias_analysis"], "figures")
+        specs = build_figure_specs(results, figure_dir)
+        logger.info(f"🖼️ 図の定義: {len(specs)}件")
+
+        pipeline = FigureRenderPipeline(
+            os.path.join(figure_dir, FIGURE_MANIFEST_FILENAME),
+            workers=workers, upload_workers=upload_workers, storage_mode=storage_mode
+        )
+        summary = pipeline.run(specs, force=force)
+
+        logger.info(
+            f"✅ 図の生成完了: 描画={summary['rendered']} スキップ={summary['render_skipped']} "
+            f"アップロード={summary['uploaded']} アップロード省略={summary['upload_skipped']} "
+            f"失敗={len(summary['failed'])} ({summary['elapsed_seconds']}秒)"
+        )
+        return not summary["failed"]
+
+    except Exception as e:
+        logger.error(f"❌ 図の生成エラー: {e}")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='バイアス分析結果の図一括生成スクリプト',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+使用例:
+  python scripts/analysis/generate_figures.py --date 20250624
+  python scripts/analysis/generate_figures.py --date 20250624 --workers 4 --storage-mode s3
+  python scripts/analysis/generate_figures.py --date 20250624 --force
+
+入力データが変わっていない図は再描画・再アップロードしません（--forceで全件再生成）。
+        """
+    )
+
+    parser.add_argument(
+        '--date',
+        type=str,
+        default=datetime.now().strftime('%Y%m%d'),
+        help='対象日付 (YYYYMMDD形式, デフォルト: 今日)'
+    )
+
+    parser.add_argument(
+        '--storage-mode',
+        choices=['local', 's3', 'auto', 'both'],
+        help='ストレージモード (デフォルト: 環境変数STORAGE_MODE)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='描画プロセス数 (デフォルト: CPU数, 1で逐次描画)'
+    )
+
+    parser.add_argument(
+        '--upload-workers',
+        type=int,
+        default=DEFAULT_UPLOAD_WORKERS,
+        help=f'S3アップロードの並行数 (デフォルト: {DEFAULT_UPLOAD_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='キャッシュを無視して全ての図を再生成・再アップロード'
+    )
+
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='詳細ログ出力'
+    )
+
+    args = parser.parse_args()
+
+    setup_default_logging(verbose=args.verbose)
+
+    success = generate_figures(
+        date=args.date,
+        storage_mode=args.storage_mode,
+        workers=args.workers,
+        upload_workers=args.upload_workers,
+        force=args.force
+    )
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+複数日付一括 統合・バイアス分析実行スクリプト
+
+日付範囲を指定して、統合データセット作成とバイアス分析を一括実行します。
+ワーカープロセスごとにBiasAnalysisEngine・カテゴリ設定・市場データ・S3クライアントを
+一度だけ初期化し、以降の日付処理で使い回します（日付ごとのコールドスタートを回避）。
+エンジン・S3クライアントはプロセス共有のリソースレジストリから取得し、処理中に市場データ・
+分析設定ファイルが更新された場合は次の日付から再構築したエンジンを使用します。
+
+Usage:
+    python scripts/analysis/run_batch_analysis.py --start-date 20250101 --end-date 20250131
+    python scripts/analysis/run_batch_analysis.py --dates 20250601 20250608 --workers 2
+    python scripts/analysis/run_batch_analysis.py --start-date 20250101 --end-date 20251231 --steps analyze
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import setup_default_logging, save_json
+
+logger = logging.getLogger(__name__)
+
+VALID_STEPS = ("integrate", "analyze")
+
+# ワーカープロセス内で共有するウォーム状態
+_worker_state: Dict[str, Any] = {}
+
+
+def build_date_range(start_date: str, end_date: str) -> List[str]:
+    """開始日〜終了日（両端含む）の日付リスト（YYYYMMDD）を生成"""
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    if end < start:
+        raise ValueError(f"終了日が開始日より前です: {start_date} > {end_date}")
+    return [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range((end - start).days + 1)]
+
+
+def has_raw_data(date: str) -> bool:
+    """ローカルに生データディレクトリが存在するか判定"""
+    return (project_root / "corporate_bias_datasets" / "raw_data" / date).exists()
+
+
+def init_worker(storage_mode: str, steps: List[str], verbose: bool) -> None:
+    """ワーカープロセスの初期化（エンジン・設定・S3クライアントを一度だけ構築）"""
+    setup_default_logging(verbose=verbose)
+
+    from src.categories import get_categories
+    from src.analysis.resource_registry import get_analysis_engine, get_s3_client
+    from src.utils.storage_config import is_s3_enabled
+
+    get_categories()  # カテゴリYAMLの読み込みをここで済ませる
+
+    if is_s3_enabled() and storage_mode != "local":
+        get_s3_client()
+
+    _worker_state["storage_mode"] = storage_mode
+    _worker_state["steps"] = steps
+    _worker_state["verbose"] = verbose
+
+    if "analyze" in steps:
+        get_analysis_engine(storage_mode)
+
+    logger.info(f"ワーカー初期化完了: pid={os.getpid()}, steps={steps}")
+
+
+def _integrate_date(date: str, runs: Optional[int], force_recreate: bool) -> str:
+    """1日付分の統合データセットを作成し、ステータスを返す"""
+    from src.integrator.dataset_integrator import DatasetIntegrator
+
+    integrator = DatasetIntegrator(date)
+    if integrator.list_output_files() and not force_recreate:
+        # 既存の統合データに数値サイドカーがなければ後付けで作成
+        from src.utils.numeric_sidecar import ensure_numeric_sidecar
+        ensure_numeric_sidecar(integrator.integrated_dir)
+        return "skipped"
+
+    result = integrator.create_integrated_dataset(
+        force_recreate=force_recreate,
+        verbose=_worker_state["verbose"],
+        runs=runs,
+        storage_mode=_worker_state["storage_mode"]
+    )
+    if not result.get("success"):
+        raise RuntimeError(f"統合データセット作成失敗: {result.get('error', 'Unknown error')}")
+    return "ok"
+
+
+def process_date(date: str, runs: Optional[int] = None, force_recreate: bool = False) -> Dict[str, Any]:
+    """1日付分の統合・分析を実行し、処理時間を含む結果行を返す"""
+    row = {
+        "date": date,
+        "status": "ok",
+        "integrate_status": None,
+        "analyze_status": None,
+        "integrate_seconds": None,
+        "analyze_seconds": None,
+        "upload_seconds": None,
+        "total_seconds": None,
+        "pid": os.getpid(),
+        "error": None
+    }
+    started = time.perf_counter()
+
+    try:
+        if "integrate" in _worker_state["steps"]:
+            step_started = time.perf_counter()
+            row["integrate_status"] = _integrate_date(date, runs, force_recreate)
+            row["integrate_seconds"] = round(time.perf_counter() - step_started, 3)
+
+        if "analyze" in _worker_state["steps"]:
+            from src.analysis.resource_registry import get_analysis_engine, get_data_loader
+            from src.analysis.run_fingerprint import compute_run_fingerprint, has_matching_results
+
+            step_started = time.perf_counter()
+            # 統合データ・設定・エンジンが前回分析時と同じ日付は再分析しない（--force-recreateで再分析）
+            data_loader = get_data_loader(_worker_state["storage_mode"])
+            run_fingerprint = compute_run_fingerprint(date, data_loader)
+            if not force_recreate and has_matching_results(date, data_loader, run_fingerprint):
+                row["analyze_status"] = "skipped"
+            else:
+                get_analysis_engine(_worker_state["storage_mode"]).analyze_integrated_dataset(
+                    date, runs=runs, run_fingerprint=run_fingerprint
+                )
+                row["analyze_status"] = "ok"
+            row["analyze_seconds"] = round(time.perf_counter() - step_started, 3)
+
+        # 日付ごとにバックグラウンドS3アップロードの完了を待つ（待機時間のみを計上）
+        from src.utils.upload_manager import flush_uploads
+
+        upload_summary = flush_uploads()
+        row["upload_seconds"] = round(upload_summary["seconds"], 3)
+        if upload_summary["failed"]:
+            raise RuntimeError(f"S3アップロード失敗: {len(upload_summary['failed'])}件")
+
+    except Exception as e:
+        row["status"] = "error"
+        row["error"] = str(e)
+        logger.error(f"❌ {date} の処理に失敗: {e}")
+        if _worker_state["verbose"]:
+            logger.error(traceback.format_exc())
+
+    row["total_seconds"] = round(time.perf_counter() - started, 3)
+    return row
+
+
+def run_batch(dates: List[str], steps: List[str], storage_mode: str, workers: int = 1,
+              runs: Optional[int] = None, force_recreate: bool = False,
+              verbose: bool = False) -> List[Dict[str, Any]]:
+    """日付リストを一括処理し、日付順に並べた結果行を返す
+
+    workers=1 の場合は現在のプロセス内で逐次処理し、
+    2以上の場合はワーカープロセスプールで並列処理する。
+    """
+    rows = []
+
+    if workers <= 1:
+        init_worker(storage_mode, steps, verbose)
+        for date in dates:
+            rows.append(process_date(date, runs, force_recreate))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(storage_mode, steps, verbose)
+        ) as executor:
+            futures = {executor.submit(process_date, date, runs, force_recreate): date for date in dates}
+            for future in as_completed(futures):
+                row = future.result()
+                logger.info(f"{'✅' if row['status'] == 'ok' else '❌'} {row['date']} ({row['total_seconds']}s)")
+                rows.append(row)
+
+    return sorted(rows, key=lambda r: r["date"])
+
+
+def print_timing_table(rows: List[Dict[str, Any]], wall_seconds: float) -> None:
+    """日付別の処理時間サマリーテーブルを出力"""
+
+    def fmt(value):
+        return f"{value:>10.2f}" if isinstance(value, (int, float)) else f"{'-':>10}"
+
+    print("\n" + "=" * 72)
+    print("📊 一括処理サマリー（日付別処理時間・秒）")
+    print("=" * 72)
+    print(f"{'date':<10} {'status':<8} {'integrate':>10} {'analyze':>10} {'total':>10}  note")
+    print("-" * 72)
+    for row in rows:
+        note = row["error"] or " ".join(
+            f"{step}:{row[f'{step}_status']}" for step in ("integrate", "analyze") if row[f"{step}_status"]
+        )
+        print(f"{row['date']:<10} {row['status']:<8} {fmt(row['integrate_seconds'])} "
+              f"{fmt(row['analyze_seconds'])} {fmt(row['total_seconds'])}  {note}")
+    print("-" * 72)
+
+    succeeded = sum(1 for r in rows if r["status"] == "ok")
+    cpu_seconds = sum(r["total_seconds"] or 0 for r in rows)
+    print(f"成功: {succeeded}/{len(rows)}  合計処理時間: {cpu_seconds:.2f}s  経過時間: {wall_seconds:.2f}s")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='複数日付一括 統合・バイアス分析実行スクリプト',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+使用例:
+  python scripts/analysis/run_batch_analysis.py --start-date 20250101 --end-date 20250131
+  python scripts/analysis/run_batch_analysis.py --dates 20250601 20250608 --workers 2
+  python scripts/analysis/run_batch_analysis.py --start-date 20250101 --end-date 20251231 --steps analyze
+        """
+    )
+
+    parser.add_argument('--start-date', type=str, help='開始日付 (YYYYMMDD形式)')
+    parser.add_argument('--end-date', type=str, help='終了日付 (YYYYMMDD形式, デフォルト: 開始日付)')
+    parser.add_argument('--dates', nargs='+', help='処理対象日付を個別指定 (YYYYMMDD形式)')
+    parser.add_argument(
+        '--steps',
+        type=str,
+        default='integrate,analyze',
+        help='実行ステップ（カンマ区切り: integrate, analyze / デフォルト: integrate,analyze）'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help='並列ワーカープロセス数（1の場合は逐次処理）'
+    )
+    parser.add_argument(
+        '--storage-mode',
+        choices=['local', 's3', 'auto'],
+        default=os.environ.get('STORAGE_MODE', 'auto'),
+        help='ストレージモード (デフォルト: 環境変数STORAGE_MODE)'
+    )
+    parser.add_argument('--runs', type=int, default=None, help='Perplexity API実行回数（runs付きファイルを優先的に探索）')
+    parser.add_argument('--force-recreate', action='store_true', help='既存の統合データセット・分析結果を強制的に再作成')
+    parser.add_argument('--include-missing', action='store_true', help='ローカル生データが無い日付も処理対象に含める')
+    parser.add_argument('--summary-file', type=str, default=None, help='日付別処理時間サマリーのJSON出力先')
+    parser.add_argument('--verbose', action='store_true', help='詳細ログ出力')
+
+    args = parser.parse_args()
+
+    setup_default_logging(verbose=args.verbose)
+
+    steps = [s.strip() for s in args.steps.split(',') if s.strip()]
+    invalid_steps = [s for s in steps if s not in VALID_STEPS]
+    if not steps or invalid_steps:
+        logger.error(f"不正なステップ指定です: {args.steps}（指定可能: {', '.join(VALID_STEPS)}）")
+        sys.exit(1)
+
+    try:
+        if args.dates:
+            dates = sorted(set(args.dates))
+            for date in dates:
+                datetime.strptime(date, "%Y%m%d")
+        elif args.start_date:
+            dates = build_date_range(args.start_date, args.end_date or args.start_date)
+        else:
+            logger.error("--start-date または --dates を指定してください")
+            sys.exit(1)
+    except ValueError as e:
+        logger.error(f"不正な日付指定です: {e}")
+        sys.exit(1)
+
+    # 統合ステップはローカル生データを前提とするため、生データの無い日付は除外
+    if "integrate" in steps and args.storage_mode == "local" and not args.include_missing:
+        skipped = [d for d in dates if not has_raw_data(d)]
+        dates = [d for d in dates if has_raw_data(d)]
+        if skipped:
+            logger.info(f"生データが存在しない日付をスキップ: {len(skipped)}件")
+
+    if not dates:
+        logger.warning("処理対象の日付がありません")
+        sys.exit(0)
+
+    workers = max(1, min(args.workers, len(dates)))
+    logger.info(f"🚀 一括処理開始: {len(dates)}日付, steps={steps}, workers={workers}, mode={args.storage_mode}")
+
+    started = time.perf_counter()
+    rows = run_batch(
+        dates,
+        steps,
+        storage_mode=args.storage_mode,
+        workers=workers,
+        runs=args.runs,
+        force_recreate=args.force_recreate,
+        verbose=args.verbose
+    )
+    wall_seconds = time.perf_counter() - started
+
+    print_timing_table(rows, wall_seconds)
+
+    if args.summary_file:
+        save_json({
+            "generated_at": datetime.now().isoformat(),
+            "steps": steps,
+            "workers": workers,
+            "storage_mode": args.storage_mode,
+            "wall_seconds": round(wall_seconds, 3),
+            "dates": rows
+        }, args.summary_file)
+        logger.info(f"サマリーを保存しました: {args.summary_file}")
+
+    sys.exit(0 if all(r["status"] == "ok" for r in rows) else 1)
+
+
+if __name__ == '__main__':
+    main()
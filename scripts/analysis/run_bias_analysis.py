@@ -8,10 +8,12 @@
     python scripts/run_bias_analysis.py --date 20250624
     python scripts/run_bias_analysis.py --date 20250624 --storage-mode s3
     python scripts/run_bias_analysis.py --date 20250624 --verbose
+    python scripts/run_bias_analysis.py --date 20250624 --force
 """
 
 import os
 import sys
+import atexit
 import argparse
 import logging
 import traceback
@@ -27,14 +29,21 @@
 from config_manager import setup_logging, get_config_manager
 from src.analysis.bias_analysis_engine import BiasAnalysisEngine
 from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.analysis.run_fingerprint import compute_run_fingerprint, has_matching_results
 from src.utils import setup_default_logging, get_logger
+from src.utils.profiling import configure_profiling, finalize_profiling
+from src.utils.upload_manager import flush_uploads
 
 logger = logging.getLogger(__name__)
 
 
-def run_bias_analysis(date: str, storage_mode: str = None, verbose: bool = False, runs: int = None) -> bool:
+def run_bias_analysis(date: str, storage_mode: str = None, verbose: bool = False, runs: int = None,
+                      force: bool = False) -> bool:
     """
     統合バイアス分析を実行
+
+    統合データセット・分析設定・市場データ・分析エンジンのフィンガープリントが一致する
+    分析結果が既に保存されている場合は再分析をスキップする（force=Trueで常に再分析）。
     """
     try:
         # 環境変数からストレージモードを取得（引数優先）
@@ -47,14 +56,21 @@ def run_bias_analysis(date: str, storage_mode: str = None, verbose: bool = False
         data_loader = HybridDataLoader(storage_mode=storage_mode)
         logger.info(f"📂 HybridDataLoader初期化完了: mode={storage_mode}")
 
+        # 同一条件の分析結果があればスキップ
+        run_fingerprint = compute_run_fingerprint(date, data_loader)
+        if not force and has_matching_results(date, data_loader, run_fingerprint):
+            logger.info(f"⏭️ 同一条件（フィンガープリント {run_fingerprint['fingerprint'][:12]}）の分析結果が存在するためスキップします"
+                        "（再分析する場合は --force）")
+            return True
+
         # バイアス分析エンジンを初期化
-        engine = BiasAnalysisEngine(storage_mode=storage_mode)
+        engine = BiasAnalysisEngine(storage_mode=storage_mode, data_loader=data_loader)
         logger.info(f"🔬 BiasAnalysisEngine初期化完了")
 
         # 統合データセットの分析を実行
         logger.info(f"🚀 統合バイアス分析開始: {date}")
         # runsはrawデータ探索用。integratedデータは常にcorporate_bias_dataset.json
-        results = engine.analyze_integrated_dataset(date, runs=runs)
+        results = engine.analyze_integrated_dataset(date, runs=runs, run_fingerprint=run_fingerprint)
 
         # 分析結果の概要をログ出力
         metadata = results.get('metadata', {})
@@ -89,6 +105,12 @@ def run_bias_analysis(date: str, storage_mode: str = None, verbose: bool = False
                 else:
                     logger.warning(f"  - {key}: {value}")
 
+        # バックグラウンドS3アップロードの完了を待つ（分析処理とは並行して転送済み）
+        upload_summary = flush_uploads()
+        if upload_summary["failed"]:
+            logger.error(f"❌ S3アップロード失敗: {len(upload_summary['failed'])}件")
+            return False
+
         logger.info("✅ 統合バイアス分析が正常に完了しました")
         return True
 
@@ -145,6 +167,8 @@ def main():
   python scripts/run_bias_analysis.py --date 20250624
   python scripts/run_bias_analysis.py --date 20250624 --storage-mode s3
   python scripts/run_bias_analysis.py --date 20250624 --verbose
+  python scripts/run_bias_analysis.py --date 20250624 --force
+  python scripts/run_bias_analysis.py --date 20250624 --profile --profile-output profiles/analysis.trace.json
         """
     )
 
@@ -180,17 +204,42 @@ def main():
         help='Perplexity API実行回数（該当するruns付きファイルを優先的に探索）'
     )
 
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='同一条件の分析結果が存在しても再分析する'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='段階別プロファイリングを有効化（環境変数PROFILING_ENABLEDでも可）'
+    )
+
+    parser.add_argument(
+        '--profile-output',
+        type=str,
+        default=None,
+        help='Chromeトレースの保存先（デフォルト: profiles/bias_analysis_{日時}.trace.json）'
+    )
+
     args = parser.parse_args()
 
     # ログ設定
     setup_default_logging(verbose=args.verbose)
 
+    # プロファイリング設定（終了時にサマリー表とChromeトレースを出力）
+    if args.profile:
+        configure_profiling(True)
+    atexit.register(finalize_profiling, "bias_analysis", args.profile_output)
+
     # バイアス分析実行
     success = run_bias_analysis(
         date=args.date,
         storage_mode=args.storage_mode,
         verbose=args.verbose,
-        runs=args.runs
+        runs=args.runs,
+        force=args.force
     )
 
     # 終了コード設定
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+市場シェア影響モンテカルロシミュレーション実行スクリプト
+
+保存済みのバイアス分析結果（bias_analysis_results.json）を読み込み、市場シェアデータのある
+サブカテゴリごとに、バイアス指標のブートストラップ分布×重み×バイアス種別の全シナリオを
+一括シミュレーションして、市場影響度スコア・HHI変化・シェア変化の分布を保存します。
+
+Usage:
+    python scripts/analysis/run_market_simulation.py --date 20250624
+    python scripts/analysis/run_market_simulation.py --date 20250624 --samples 10000 --weights 0.02 0.05 0.1 0.2 0.3
+    python scripts/analysis/run_market_simulation.py --date 20250624 --bias-types normalized_bias delta_rank
+"""
+
+import os
+import sys
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+
+# プロジェクトルートをPythonパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.bias_analysis_engine import BiasAnalysisEngine
+from src.utils import setup_default_logging, save_results
+from src.utils.storage_config import get_base_paths, get_s3_key, is_s3_enabled
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FILENAME = "market_simulation.json"
+
+
+def run_market_simulation(engine: BiasAnalysisEngine, date: str) -> dict:
+    """分析結果の各サブカテゴリについて市場影響シミュレーションを実行"""
+    analysis_results = engine.data_loader.load_analysis_results(date)
+    if not analysis_results:
+        raise ValueError(f"バイアス分析結果が見つかりません: {date}")
+
+    market_shares = engine.market_data.get("market_shares", {}) if engine.market_data else {}
+    sentiment_analysis = analysis_results.get("sentiment_bias_analysis", {})
+
+    results = {}
+    for category, subcategories in sentiment_analysis.items():
+        if not isinstance(subcategories, dict):
+            continue
+        for subcategory, subcategory_data in subcategories.items():
+            if subcategory not in market_shares or not isinstance(subcategory_data, dict):
+                continue
+
+            entities = subcategory_data.get("entities", {})
+            impact = engine._analyze_market_competition_impact(entities, {subcategory: market_shares[subcategory]})
+            subcategory_result = impact.get("results", {}).get(subcategory)
+            if not subcategory_result:
+                logger.info(f"シミュレーション対象外（市場シェアと一致するエンティティなし）: {category}/{subcategory}")
+                continue
+
+            results.setdefault(category, {})[subcategory] = {
+                "deterministic": subcategory_result["simulation_result"],
+                "monte_carlo": subcategory_result["monte_carlo"]
+            }
+            logger.info(f"✅ {category}/{subcategory}: "
+                        f"{subcategory_result['monte_carlo'].get('simulation_metadata', {}).get('n_scenarios', 0)}シナリオ")
+
+    return {
+        "date": date,
+        "generated_at": datetime.now().isoformat(),
+        "simulation_config": engine.config.get("market_simulation", {}),
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='市場シェア影響モンテカルロシミュレーション実行スクリプト',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+使用例:
+  python scripts/analysis/run_market_simulation.py --date 20250624
+  python scripts/analysis/run_market_simulation.py --date 20250624 --samples 10000 --weights 0.02 0.05 0.1 0.2 0.3
+  python scripts/analysis/run_market_simulation.py --date 20250624 --bias-types normalized_bias delta_rank
+        """
+    )
+
+    parser.add_argument('--date', type=str, required=True, help='分析日付 (YYYYMMDD形式)')
+    parser.add_argument('--samples', type=int, default=None, help='シナリオあたりのサンプル数（デフォルト: 設定ファイル）')
+    parser.add_argument('--weights', type=float, nargs='+', default=None, help='掃引するバイアスの重み（デフォルト: 設定ファイル）')
+    parser.add_argument(
+        '--bias-types',
+        nargs='+',
+        choices=['normalized_bias', 'delta_rank'],
+        default=None,
+        help='掃引するバイアス指標の種類（デフォルト: 設定ファイル）'
+    )
+    parser.add_argument('--seed', type=int, default=None, help='乱数シード（デフォルト: 設定ファイル）')
+    parser.add_argument(
+        '--storage-mode',
+        choices=['local', 's3', 'auto'],
+        default=os.environ.get('STORAGE_MODE', 'auto'),
+        help='ストレージモード (デフォルト: 環境変数STORAGE_MODE)'
+    )
+    parser.add_argument('--verbose', action='store_true', help='詳細ログ出力')
+
+    args = parser.parse_args()
+
+    setup_default_logging(verbose=args.verbose)
+
+    engine = BiasAnalysisEngine(storage_mode=args.storage_mode)
+    simulation_config = engine.config.setdefault("market_simulation", {})
+    overrides = {"n_samples": args.samples, "weights": args.weights, "bias_types": args.bias_types, "seed": args.seed}
+    simulation_config.update({k: v for k, v in overrides.items() if v is not None})
+
+    try:
+        output = run_market_simulation(engine, args.date)
+    except Exception as e:
+        logger.error(f"❌ 市場影響シミュレーションに失敗: {e}")
+        sys.exit(1)
+
+    if not output["results"]:
+        logger.warning("シミュレーション対象のサブカテゴリがありません")
+        sys.exit(0)
+
+    # バイアス分析結果と同じ統合データディレクトリに保存
+    local_path = os.path.join(get_base_paths(args.date)["integrated"], OUTPUT_FILENAME)
+    s3_key = get_s3_key(OUTPUT_FILENAME, args.date, "integrated") if is_s3_enabled() and args.storage_mode != "local" else None
+    save_results(output, local_path, s3_key, verbose=args.verbose)
+    logger.info(f"💾 シミュレーション結果を保存しました: {local_path}")
+
+
+if __name__ == '__main__':
+    main()
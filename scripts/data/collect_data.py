@@ -9,7 +9,9 @@
 
 import os
 import sys
+import atexit
 import argparse
+import importlib
 import logging
 from pathlib import Path
 
@@ -20,24 +22,33 @@
 # 相対インポートのため、sys.pathに追加
 sys.path.insert(0, str(project_root / "scripts" / "utils"))
 from config_manager import setup_logging, get_config_manager
-# ローダーモジュールをインポート（関数ベースの実装）
-import src.loader.perplexity_sentiment_loader as sentiment_loader
-import src.loader.perplexity_ranking_loader as ranking_loader
-import src.loader.perplexity_citations_loader as citations_loader
-import src.loader.google_search_loader as google_loader
+from src.utils.profiling import configure_profiling, finalize_profiling, profiled
 
 logger = logging.getLogger(__name__)
 
 
+def _import_loader(name: str):
+    """ローダーモジュールを使用時にインポート（--typeで選択されたローダーのみ読み込む）"""
+    return importlib.import_module(f"src.loader.{name}")
+
+
+def _get_categories():
+    """カテゴリとサービスの定義を取得（YAMLは初回呼び出し時に読み込む）"""
+    from src.categories import get_categories
+    return get_categories()
+
+
+@profiled("collection.perplexity_sentiment", "collection", log_step=True)
 def collect_sentiment_data(runs: int = 3, verbose: bool = False) -> bool:
     """感情分析データを収集"""
     try:
         logger.info(f"感情分析データ収集開始 (実行回数: {runs})")
 
         # 関数ベースの実装を使用
+        sentiment_loader = _import_loader("perplexity_sentiment_loader")
         sentiment_loader.process_categories_with_multiple_runs(
             api_key=os.environ.get("PERPLEXITY_API_KEY"),
-            categories=sentiment_loader.categories,
+            categories=_get_categories(),
             num_runs=runs
         )
 
@@ -49,15 +60,17 @@ def collect_sentiment_data(runs: int = 3, verbose: bool = False) -> bool:
         return False
 
 
+@profiled("collection.perplexity_ranking", "collection", log_step=True)
 def collect_ranking_data(runs: int = 3, verbose: bool = False) -> bool:
     """ランキングデータを収集"""
     try:
         logger.info(f"ランキングデータ収集開始 (実行回数: {runs})")
 
         # 関数ベースの実装を使用
+        ranking_loader = _import_loader("perplexity_ranking_loader")
         ranking_loader.process_categories_with_multiple_runs(
             api_key=os.environ.get("PERPLEXITY_API_KEY"),
-            categories=ranking_loader.categories,
+            categories=_get_categories(),
             num_runs=runs
         )
 
@@ -69,15 +82,17 @@ def collect_ranking_data(runs: int = 3, verbose: bool = False) -> bool:
         return False
 
 
+@profiled("collection.perplexity_citations", "collection", log_step=True)
 def collect_citations_data(runs: int = 3, verbose: bool = False) -> bool:
     """引用データを収集"""
     try:
         logger.info(f"引用データ収集開始 (実行回数: {runs})")
 
         # 関数ベースの実装を使用
+        citations_loader = _import_loader("perplexity_citations_loader")
         citations_loader.process_categories_with_multiple_runs(
             api_key=os.environ.get("PERPLEXITY_API_KEY"),
-            categories=citations_loader.categories,
+            categories=_get_categories(),
             num_runs=runs
         )
 
@@ -89,12 +104,14 @@ def collect_citations_data(runs: int = 3, verbose: bool = False) -> bool:
         return False
 
 
+@profiled("collection.google_search", "collection", log_step=True)
 def collect_google_data(verbose: bool = False) -> bool:
     """Google検索データを収集"""
     try:
         logger.info("Google検索データ収集開始")
 
         # 関数ベースの実装を使用
+        google_loader = _import_loader("google_search_loader")
         google_loader.process_categories()
 
         logger.info("Google検索データ収集完了")
@@ -112,12 +129,21 @@ def main():
                        default="all", help="収集するデータタイプ")
     parser.add_argument("--runs", type=int, default=3, help="Perplexity API実行回数")
     parser.add_argument("--verbose", action="store_true", help="詳細ログ出力")
+    parser.add_argument("--profile", action="store_true",
+                       help="段階別プロファイリングを有効化（環境変数PROFILING_ENABLEDでも可）")
+    parser.add_argument("--profile-output", type=str, default=None,
+                       help="Chromeトレースの保存先（デフォルト: profiles/collect_data_{日時}.trace.json）")
 
     args = parser.parse_args()
 
     # ログ設定
     setup_logging(args.verbose)
 
+    # プロファイリング設定（終了時にサマリー表とChromeトレースを出力）
+    if args.profile:
+        configure_profiling(True)
+    atexit.register(finalize_profiling, "collect_data", args.profile_output)
+
     logger.info("データ収集スクリプト開始")
 
     success_count = 0
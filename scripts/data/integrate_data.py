@@ -9,6 +9,7 @@
 
 import os
 import sys
+import atexit
 import argparse
 import logging
 from pathlib import Path
@@ -22,6 +23,8 @@
 sys.path.insert(0, str(project_root / "scripts" / "utils"))
 from config_manager import setup_logging, get_config_manager
 from src.integrator.dataset_integrator import DatasetIntegrator
+from src.utils.upload_manager import flush_uploads
+from src.utils.profiling import configure_profiling, finalize_profiling, profiled
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,12 @@ def integrate_data(date: str, verbose: bool = False, storage_mode: str = None) -
         if result.get('success'):
             logger.info("データ統合完了")
             logger.info(f"統合データセット: {result.get('integrated_dataset_path', 'N/A')}")
+
+            # バックグラウンドS3アップロードの完了を待つ
+            upload_summary = flush_uploads()
+            if upload_summary["failed"]:
+                logger.error(f"S3アップロード失敗: {len(upload_summary['failed'])}件")
+                return False
             return True
         else:
             logger.error(f"データ統合失敗: {result.get('error', 'Unknown error')}")
@@ -48,6 +57,7 @@ def integrate_data(date: str, verbose: bool = False, storage_mode: str = None) -
         return False
 
 
+@profiled("validation.integrated_data", "validation", log_step=True)
 def validate_integrated_data(date: str, verbose: bool = False) -> bool:
     """統合データの検証"""
     try:
@@ -80,12 +90,21 @@ def main():
 
     parser.add_argument("--storage-mode", choices=["local", "s3", "auto"],
                         default="auto", help="ストレージモード（デフォルト: 環境変数STORAGE_MODE）")
+    parser.add_argument("--profile", action="store_true",
+                       help="段階別プロファイリングを有効化（環境変数PROFILING_ENABLEDでも可）")
+    parser.add_argument("--profile-output", type=str, default=None,
+                       help="Chromeトレースの保存先（デフォルト: profiles/integrate_data_{日時}.trace.json）")
 
     args = parser.parse_args()
 
     # ログ設定
     setup_logging(args.verbose)
 
+    # プロファイリング設定（終了時にサマリー表とChromeトレースを出力）
+    if args.profile:
+        configure_profiling(True)
+    atexit.register(finalize_profiling, "integrate_data", args.profile_output)
+
     logger.info("データ統合スクリプト開始")
 
     # 設定確認
@@ -21,6 +21,7 @@
 sys.path.insert(0, str(project_root / "scripts" / "utils"))
 from config_manager import setup_logging, get_config_manager
 from src.sns.integrated_posting_system import IntegratedPostingSystem
+from src.utils.upload_manager import flush_uploads
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,11 @@ def main():
 
             logger.info(f"投稿結果: {result}")
 
+            # 投稿アウトボックスのS3保存の完了を待つ（次回実行時の再開に使用）
+            upload_summary = flush_uploads()
+            if upload_summary["failed"]:
+                logger.error(f"投稿アウトボックスのS3保存失敗: {len(upload_summary['failed'])}件")
+
             if result.get('success'):
                 if result.get('posted'):
                     logger.info(f"投稿成功: {result.get('tweet_id')}")
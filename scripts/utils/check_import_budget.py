@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+インポート時間予算チェックスクリプト
+
+各エントリーポイント（CIで実行するスクリプト・モジュール）のインポート時間を別プロセスで計測し、
+予算超過や不要な重いライブラリ（matplotlib・scipy・pandas・boto3等）の読み込みを検出します。
+"""
+
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.import_budget import IMPORT_BUDGETS, check_import_budgets
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(
+        description="エントリーポイントのインポート時間予算チェック",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+使用例:
+  # 全エントリーポイントを確認（各3回計測の最小値）
+  python scripts/utils/check_import_budget.py --repeat 3
+
+  # 特定のエントリーポイントのみ確認
+  python scripts/utils/check_import_budget.py --entry scripts/sns/github_actions_sns_posting.py
+        """
+    )
+    parser.add_argument("--entry", action="append", choices=sorted(IMPORT_BUDGETS),
+                       help="確認するエントリーポイント（複数指定可、デフォルト: 全て）")
+    parser.add_argument("--repeat", type=int, default=1, help="計測回数（最小値を採用）")
+    parser.add_argument("--verbose", action="store_true", help="遅いインポートの内訳を表示")
+
+    args = parser.parse_args()
+
+    results = check_import_budgets(args.entry, repeat=args.repeat)
+
+    failed = 0
+    for result in results:
+        status = "OK" if result["ok"] else "NG"
+        print(f"[{status}] {result['entry_point']}: {result['elapsed_ms']:.0f}ms / 予算 {result['budget_ms']:.0f}ms")
+        if result["forbidden_loaded"]:
+            print(f"    読み込み禁止モジュール: {', '.join(result['forbidden_loaded'])}")
+        if args.verbose or not result["ok"]:
+            for name, elapsed_ms in result["slowest"]:
+                print(f"    {elapsed_ms:8.1f}ms  {name}")
+        failed += not result["ok"]
+
+    print(f"\n{len(results) - failed}/{len(results)} エントリーポイントが予算内です")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
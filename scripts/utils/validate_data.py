@@ -9,6 +9,7 @@
 
 import os
 import sys
+import atexit
 import argparse
 import logging
 import json
@@ -22,10 +23,12 @@
 # 相対インポートのため、sys.pathに追加
 sys.path.insert(0, str(project_root / "scripts" / "utils"))
 from config_manager import setup_logging, get_config_manager
+from src.utils.profiling import configure_profiling, finalize_profiling, profiled
 
 logger = logging.getLogger(__name__)
 
 
+@profiled("validation.raw_data", "validation", log_step=True)
 def validate_raw_data(date: str, verbose: bool = False) -> bool:
     """生データの検証"""
     try:
@@ -69,6 +72,7 @@ def validate_raw_data(date: str, verbose: bool = False) -> bool:
         return False
 
 
+@profiled("validation.integrated_data", "validation", log_step=True)
 def validate_integrated_data(date: str, verbose: bool = False) -> bool:
     """統合データの検証"""
     try:
@@ -123,6 +127,7 @@ def validate_integrated_data(date: str, verbose: bool = False) -> bool:
         return False
 
 
+@profiled("validation.analysis_results", "validation", log_step=True)
 def validate_analysis_results(date: str, verbose: bool = False) -> bool:
     """分析結果の検証"""
     try:
@@ -168,12 +173,21 @@ def main():
     parser.add_argument("--type", choices=["raw", "integrated", "analysis", "all"],
                        default="all", help="検証するデータタイプ")
     parser.add_argument("--verbose", action="store_true", help="詳細ログ出力")
+    parser.add_argument("--profile", action="store_true",
+                       help="段階別プロファイリングを有効化（環境変数PROFILING_ENABLEDでも可）")
+    parser.add_argument("--profile-output", type=str, default=None,
+                       help="Chromeトレースの保存先（デフォルト: profiles/validate_data_{日時}.trace.json）")
 
     args = parser.parse_args()
 
     # ログ設定
     setup_logging(args.verbose)
 
+    # プロファイリング設定（終了時にサマリー表とChromeトレースを出力）
+    if args.profile:
+        configure_profiling(True)
+    atexit.register(finalize_profiling, "validate_data", args.profile_output)
+
     logger.info("データ検証スクリプト開始")
 
     # 設定確認
@@ -14,7 +14,9 @@
 """
 
 import os
+import copy
 import json
+import logging
 from datetime import datetime
 import statistics
 import math
@@ -23,14 +25,22 @@
 from pathlib import Path
 import scipy.stats as stats
 import itertools
-from tqdm import trange
+from src.analysis.market_index import MarketResolutionIndex
+from src.analysis.domain_index import DomainIndex, SENTIMENT_LABELS
 from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.analysis.run_fingerprint import compute_run_fingerprint
 from src.utils.storage_utils import load_json
-from src.utils.rank_utils import rbo, compute_tau, compute_delta_ranks
+from src.utils.text_utils import extract_domains, unique_domains
+from src.utils.rank_utils import rbo, compute_tau, compute_delta_ranks, rank_matrix_stats, rank_matrix_stats_from_matrix
+from src.utils.metrics_utils import (
+    simulate_market_impact, gini_coefficient_batch, calculate_hhi_batch, bootstrap_concentration_intervals,
+    percentile_interval
+)
+from src.utils.correlation_utils import grouped_correlations, DEFAULT_PERMUTATION_SEED
+from src.utils.significance_utils import sign_test_p_values, correct_p_values, SUPPORTED_CORRECTION_METHODS
 from statsmodels.stats.multitest import multipletests
 from scipy.stats import kendalltau
 from collections import defaultdict
-from urllib.parse import urlparse
 from scipy.stats import ttest_ind, pearsonr, spearmanr
 import argparse
 import warnings
@@ -38,13 +48,24 @@
 # 新しいユーティリティをインポート
 from src.utils import (
     get_config_manager, get_logger, setup_default_logging,
-    handle_errors, log_analysis_step, log_data_operation,
+    handle_errors, log_analysis_step, log_data_operation, log_event,
     ConfigError, DataError, AnalysisError
 )
+from src.utils.profiling import profile_span, profiled
 
 # ログ設定
 logger = get_logger(__name__)
 
+# サービス-企業マッピングファイル
+SERVICE_MAPPING_PATH = "src/data/service_enterprise_mapping.json"
+
+
+def _count_subcategories(results: Any) -> Optional[int]:
+    """カテゴリ→サブカテゴリ構造の分析結果に含まれるサブカテゴリ数（プロファイリングの処理件数）"""
+    if not isinstance(results, dict):
+        return None
+    return sum(len(subcategories) for subcategories in results.values() if isinstance(subcategories, dict))
+
 
 class SimpleRanking:
     """シンプルな順位情報を保持するクラス"""
@@ -279,13 +300,15 @@ class BiasAnalysisEngine:
     """統合バイアス分析エンジン - データローダーとメトリクス計算を統合"""
 
     @handle_errors
-    def __init__(self, storage_mode: str = None):
+    def __init__(self, storage_mode: str = None, data_loader: HybridDataLoader = None):
         """BiasAnalysisEngine初期化
 
         Parameters:
         ----------
         storage_mode : str, optional
             ストレージモード ('local', 's3', 'auto')
+        data_loader : HybridDataLoader, optional
+            共有するデータローダー（省略時は storage_mode で新規作成）
         """
         # 設定管理システムを使用
         config_manager = get_config_manager()
@@ -301,7 +324,7 @@ def __init__(self, storage_mode: str = None):
         self.reliability_checker = ReliabilityChecker()
 
         # データローダーのセットアップ
-        self.data_loader = HybridDataLoader(self.storage_mode)
+        self.data_loader = data_loader or HybridDataLoader(self.storage_mode)
 
         # 市場データの読み込み
         self.market_data = self._load_market_data()
@@ -312,6 +335,9 @@ def __init__(self, storage_mode: str = None):
         # 設定ファイル読み込み
         self.config = self._load_config()
 
+        # サービス・企業名の解決インデックス（市場データファイル更新時に再構築）
+        self.market_index = self._build_market_index()
+
         # バイアス計算パラメータ
         self.bootstrap_iterations = 10000
         self.confidence_level = 95
@@ -376,23 +402,40 @@ def calculate_statistical_significance(self,
         if len(pairs) < 5:
             return 1.0  # 実行回数不足の場合は有意でない
 
-        # 差の符号を計算
-        differences = [unmasked - masked for masked, unmasked in pairs]
-        positive_diffs = sum(1 for d in differences if d > 0)
-        negative_diffs = sum(1 for d in differences if d < 0)
+        # 差の符号から二項検定（両側）のp値を計算（キャッシュ済み累積分布表を使用）
+        differences = [[unmasked - masked for masked, unmasked in pairs]]
+        return float(sign_test_p_values(differences, min_count=5)[0])
 
-        # 符号検定の実行
-        total_non_zero = positive_diffs + negative_diffs
-        if total_non_zero == 0:
-            return 1.0
+    def calculate_statistical_significance_batch(self,
+                                                 masked_values: List[float],
+                                                 unmasked_values_list: List[List[float]]) -> List[float]:
+        """複数エンティティの符号検定を一括実行
 
-        # 二項検定（両側）
-        p_value = 2 * min(
-            stats.binom.cdf(positive_diffs, total_non_zero, 0.5),
-            stats.binom.cdf(negative_diffs, total_non_zero, 0.5)
-        )
+        共通のmasked値と各エンティティのunmasked値から（エンティティ×実行回）の差分配列を作り、
+        全エンティティのp値を1回の配列演算で計算する。実行回数が揃わない場合はNaNで埋める。
+
+        Parameters:
+        -----------
+        masked_values : List[float]
+            共通のmasked値リスト
+        unmasked_values_list : List[List[float]]
+            エンティティごとのunmasked値リスト
+
+        Returns:
+        --------
+        List[float]
+            エンティティごとの符号検定p値（calculate_statistical_significanceと同値）
+        """
+        if not unmasked_values_list:
+            return []
 
-        return float(min(p_value, 1.0))
+        lengths = [min(len(masked_values), len(values)) for values in unmasked_values_list]
+        deltas = np.full((len(unmasked_values_list), max(max(lengths), 1)), np.nan)
+        masked = np.asarray(masked_values, dtype=float)
+        for i, (values, length) in enumerate(zip(unmasked_values_list, lengths)):
+            deltas[i, :length] = np.asarray(values[:length], dtype=float) - masked[:length]
+
+        return sign_test_p_values(deltas, min_count=5).tolist()
 
     def calculate_cliffs_delta(self,
                              group1: List[float],
@@ -443,30 +486,27 @@ def calculate_confidence_interval(self,
             single_value = float(delta_values[0]) if delta_values else 0.0
             return single_value, single_value
 
-        # ブートストラップ実行
+        # ブートストラップ実行（複製×標本の行列で一括リサンプリング）
         rng = np.random.default_rng()
-        bootstrap_means = []
-
-        for _ in trange(self.bootstrap_iterations,
-                      leave=False,
-                      desc="ブートストラップ信頼区間計算"):
-            bootstrap_sample = rng.choice(delta_values,
-                                        len(delta_values),
-                                        replace=True)
-            bootstrap_means.append(np.mean(bootstrap_sample))
+        values = np.asarray(delta_values, dtype=float)
+        bootstrap_means = rng.choice(values, (self.bootstrap_iterations, len(values)), replace=True).mean(axis=1)
 
         # パーセンタイル法で信頼区間を計算
-        alpha = (100 - confidence_level) / 2
-        lower_percentile = alpha
-        upper_percentile = 100 - alpha
-
-        ci_lower = np.percentile(bootstrap_means, lower_percentile)
-        ci_upper = np.percentile(bootstrap_means, upper_percentile)
+        ci_lower, ci_upper = percentile_interval(bootstrap_means, confidence_level)
 
         return float(ci_lower), float(ci_upper)
 
-    def apply_multiple_comparison_correction(self, p_values: list, method: str = 'fdr_bh', alpha: float = 0.05) -> dict:
-        """多重比較補正（Benjamini-Hochberg法等）を適用"""
+    def apply_multiple_comparison_correction(self, p_values: list, method: str = 'fdr_bh', alpha: float = 0.05,
+                                             groups: Optional[list] = None) -> dict:
+        """多重比較補正（Benjamini-Hochberg法等）を適用
+
+        groupsを指定すると、同じグループ値（例: (category, subcategory)）のp値同士でのみ補正し、
+        全グループを1回の呼び出しで処理する。
+        """
+        if method in SUPPORTED_CORRECTION_METHODS and (groups is not None or len(p_values) > 1):
+            corrected = correct_p_values(p_values, groups=groups, method=method, alpha=alpha)
+            corrected["original_p_values"] = p_values
+            return corrected
         if len(p_values) <= 1:
             return {
                 "original_p_values": p_values,
@@ -615,8 +655,8 @@ def calculate_ranking_variation(self, masked_ranking: list, unmasked_ranking: li
         except Exception as e:
             return {"error": str(e)}
 
-    def calculate_bias_inequality(self, bias_indices: List[float]) -> Dict[str, Any]:
-        """バイアス不平等度を計算（簡易版）"""
+    def calculate_bias_inequality(self, bias_indices: List[float], gini: Optional[float] = None) -> Dict[str, Any]:
+        """バイアス不平等度を計算（簡易版。giniを渡した場合は一括計算済みのジニ係数を使用）"""
         if not bias_indices:
             return {"error": "データなし"}
 
@@ -631,10 +671,9 @@ def calculate_bias_inequality(self, bias_indices: List[float]) -> Dict[str, Any]
                 "interpretation": "単一データ"
             }
 
-        # Gini係数計算
-        sorted_arr = np.sort(arr)
-        cumsum = np.cumsum(sorted_arr)
-        gini = (n + 1 - 2 * np.sum(cumsum) / cumsum[-1]) / n if cumsum[-1] != 0 else 0
+        # Gini係数計算（合計0の場合は0）
+        if gini is None:
+            gini = gini_coefficient_batch(arr)[0]
 
         std = float(np.std(arr, ddof=1))
         bias_range = float(np.max(arr) - np.min(arr))
@@ -704,26 +743,18 @@ def compute_citation_metrics(self, pplx_data):
             return {"error": "データなし"}
 
         # 基本統計
-        total_citations = 0
         domain_stats = defaultdict(lambda: {"count": 0, "snippets": 0})
 
-        # entitiesベースのデータ処理
-        if isinstance(pplx_data, dict) and "entities" in pplx_data:
-            entities = pplx_data["entities"]
-            for entity_name, entity_data in entities.items():
-                if isinstance(entity_data, dict):
-                    citations = entity_data.get("official_results", []) + entity_data.get("reputation_results", [])
-                    for citation in citations:
-                        if isinstance(citation, dict) and "url" in citation:
-                            total_citations += 1
-                            try:
-                                from urllib.parse import urlparse
-                                domain = urlparse(citation["url"]).netloc
-                                domain_stats[domain]["count"] += 1
-                                if citation.get("snippet"):
-                                    domain_stats[domain]["snippets"] += 1
-                            except:
-                                pass
+        # entitiesベースのデータ処理（URLはまとめて正規化）
+        citations = self._collect_citations(pplx_data)
+        total_citations = len(citations)
+        domains = extract_domains((citation["url"] for citation in citations), self._group_registrable_domains())
+        for citation, domain in zip(citations, domains):
+            if not domain:
+                continue
+            domain_stats[domain]["count"] += 1
+            if citation.get("snippet"):
+                domain_stats[domain]["snippets"] += 1
 
         # ドメイン別統計
         domain_counts = {domain: stats["count"] for domain, stats in domain_stats.items()}
@@ -742,23 +773,23 @@ def extract_domains_from_citations(self, citations_data, subcategory):
         if not citations_data or subcategory not in citations_data:
             return domains
 
-        data = citations_data[subcategory]
-        if isinstance(data, dict) and "entities" in data:
-            entities = data["entities"]
-            for entity_name, entity_data in entities.items():
+        citations = self._collect_citations(citations_data[subcategory])
+        return unique_domains((citation["url"] for citation in citations), self._group_registrable_domains())
+
+    def _collect_citations(self, subcategory_data) -> List[Dict[str, Any]]:
+        """サブカテゴリの全エンティティのofficial_results・reputation_resultsからURL付きの引用を収集"""
+        citations = []
+        if isinstance(subcategory_data, dict) and isinstance(subcategory_data.get("entities"), dict):
+            for entity_data in subcategory_data["entities"].values():
                 if isinstance(entity_data, dict):
-                    citations = entity_data.get("official_results", []) + entity_data.get("reputation_results", [])
-                    for citation in citations:
+                    for citation in entity_data.get("official_results", []) + entity_data.get("reputation_results", []):
                         if isinstance(citation, dict) and "url" in citation:
-                            try:
-                                from urllib.parse import urlparse
-                                domain = urlparse(citation["url"]).netloc
-                                if domain and domain not in domains:
-                                    domains.append(domain)
-                            except:
-                                pass
+                            citations.append(citation)
+        return citations
 
-        return domains
+    def _group_registrable_domains(self) -> bool:
+        """ドメインを登録可能ドメイン（eTLD+1）単位にまとめるか（設定: domain_analysis）"""
+        return bool(self.config.get("domain_analysis", {}).get("group_by_registrable_domain", False))
 
     def bootstrap_ci(self, delta, reps=10_000, ci=95):
         """ブートストラップ (percentile) で Δ̄ の信頼区間"""
@@ -766,8 +797,8 @@ def bootstrap_ci(self, delta, reps=10_000, ci=95):
             return float(delta[0]) if len(delta) == 1 else 0.0, 0.0
 
         rng = np.random.default_rng()
-        boot = [rng.choice(delta, len(delta), replace=True).mean() for _ in range(reps)]
-        low, high = np.percentile(boot, [(100-ci)/2, 100-(100-ci)/2])
+        boot = rng.choice(np.asarray(delta, dtype=float), (reps, len(delta)), replace=True).mean(axis=1)
+        low, high = percentile_interval(boot, ci)
         return low, high
 
     def interpret_bias(self, mean_delta, bi, cliffs_d, p_sign, threshold=0.05):
@@ -869,6 +900,25 @@ def _load_config(self, config_path: str = "config/analysis_config.yml") -> Dict[
                 "somewhat_stable": 0.7,
                 "somewhat_unstable": 0.5,
                 "unstable": 0.0
+            },
+            "cross_analysis": {
+                "permutation_iterations": 0,
+                "permutation_seed": DEFAULT_PERMUTATION_SEED
+            },
+            "market_simulation": {
+                "n_samples": 2000,
+                "weights": [0.05, 0.1, 0.2],
+                "bias_types": ["normalized_bias"],
+                "seed": 42
+            },
+            "inequality_bootstrap": {
+                "n_samples": 2000,
+                "confidence_level": 95,
+                "seed": 42,
+                "hhi_bias_weight": 0.1
+            },
+            "domain_analysis": {
+                "group_by_registrable_domain": False
             }
         }
 
@@ -892,7 +942,8 @@ def _load_config(self, config_path: str = "config/analysis_config.yml") -> Dict[
     def analyze_integrated_dataset(self,
                                  date_or_path: str,
                                  output_mode: str = "auto",
-                                 runs: int = None) -> Dict[str, Any]:
+                                 runs: int = None,
+                                 run_fingerprint: Dict[str, Any] = None) -> Dict[str, Any]:
         """統合データセットを分析して全バイアス指標を計算・保存
 
         Parameters:
@@ -901,6 +952,8 @@ def analyze_integrated_dataset(self,
             日付（YYYYMMDD）またはディレクトリパス
         output_mode : str, default "auto"
             出力先指定（"local", "s3", "auto"）
+        run_fingerprint : Dict[str, Any], optional
+            計算済みの実行フィンガープリント（省略時はここで計算し、metadata.run_fingerprintに記録）
 
         Returns:
         --------
@@ -911,37 +964,54 @@ def analyze_integrated_dataset(self,
 
         try:
             # 1. 入力データ読み込み
-            integrated_data = self.data_loader.load_integrated_data(date_or_path)
+            with profile_span("analysis.load_integrated_data", "io", log_step=True) as span:
+                integrated_data = self.data_loader.load_integrated_data(date_or_path)
+                span.add_items(len(integrated_data or {}))
             if integrated_data is None:
                 raise ValueError(f"統合データ（corporate_bias_dataset.json）が見つかりません: {date_or_path}")
+            # 数値サイドカー（順位行列のメモリマップ）があれば順位行列の構築に使用
+            # （引用・検索結果等の他セクションにJSON全体が必要なため、JSONの読み込み自体は省略しない）
+            numeric_sidecar = self.data_loader.load_integrated_numeric(date_or_path)
             # sentiment_data = self.data_loader.load_sentiment_data(date_or_path)  # 不要
 
             # データをマージ（不要、integrated_dataのみでOK）
             merged_data = integrated_data
 
-            # 追加: perplexity_sentimentデータの受け渡し状況をprint
-            perplexity_sentiment = merged_data.get('perplexity_sentiment', None)
-            print(f"[DEBUG] perplexity_sentiment type={type(perplexity_sentiment)}, keys={list(perplexity_sentiment.keys()) if isinstance(perplexity_sentiment, dict) else perplexity_sentiment}")
-            if isinstance(perplexity_sentiment, dict):
-                first_cat = next(iter(perplexity_sentiment.keys()), None)
-                print(f"[DEBUG] perplexity_sentiment first_category={first_cat}")
-                if first_cat:
-                    first_subcat = next(iter(perplexity_sentiment[first_cat].keys()), None)
-                    print(f"[DEBUG] perplexity_sentiment first_subcategory={first_subcat}")
+            # perplexity_sentimentデータの受け渡し状況（DEBUG時のみ）
+            if logger.isEnabledFor(logging.DEBUG):
+                perplexity_sentiment = merged_data.get('perplexity_sentiment', None)
+                if isinstance(perplexity_sentiment, dict):
+                    first_cat = next(iter(perplexity_sentiment.keys()), None)
+                    first_subcat = next(iter(perplexity_sentiment[first_cat].keys()), None) if first_cat else None
+                    log_event(logger, logging.DEBUG, "perplexity_sentiment受け渡し",
+                              categories=list(perplexity_sentiment.keys()),
+                              first_category=first_cat, first_subcategory=first_subcat)
+                else:
+                    log_event(logger, logging.DEBUG, "perplexity_sentiment受け渡し",
+                              type=type(perplexity_sentiment).__name__)
 
             # 2. データ検証
-            validation_errors = self._validate_input_data(merged_data)
+            with profile_span("analysis.validate_input", "validation", log_step=True) as span:
+                validation_errors = self._validate_input_data(merged_data)
+                span.set("error_count", len(validation_errors))
             if validation_errors:
                 logger.error(f"データ検証エラー: {validation_errors}")
                 raise ValueError(f"入力データが不正です: {validation_errors}")
 
             # 3. バイアス指標計算
-            analysis_results = self._calculate_comprehensive_bias_metrics(merged_data)
+            with profile_span("analysis.comprehensive_bias_metrics", "analysis", log_step=True):
+                analysis_results = self._calculate_comprehensive_bias_metrics(merged_data, numeric_sidecar)
+
+            # 入力・設定・エンジンのフィンガープリントを記録（同一条件での再分析スキップに使用）
+            if run_fingerprint is None:
+                run_fingerprint = compute_run_fingerprint(date_or_path, self.data_loader)
+            analysis_results["metadata"]["run_fingerprint"] = run_fingerprint
 
             # 4. 結果保存（環境変数による制御）
-            output_paths = self.data_loader.save_analysis_results(
-                analysis_results, date_or_path, storage_mode=self.storage_mode
-            )
+            with profile_span("analysis.save_results", "io", log_step=True):
+                output_paths = self.data_loader.save_analysis_results(
+                    analysis_results, date_or_path, storage_mode=self.storage_mode
+                )
 
             logger.info(f"バイアス分析完了:")
             logger.info(f"  ローカル: {output_paths.get('local', 'N/A')}")
@@ -997,8 +1067,8 @@ def _validate_input_data(self, data: Dict) -> List[str]:
 
         return errors
 
-    def _calculate_comprehensive_bias_metrics(self, data: Dict) -> Dict[str, Any]:
-        """包括的なバイアス指標を計算"""
+    def _calculate_comprehensive_bias_metrics(self, data: Dict, numeric_sidecar=None) -> Dict[str, Any]:
+        """包括的なバイアス指標を計算（numeric_sidecarは統合データの数値サイドカー、任意）"""
 
         # メタデータ作成
         analysis_metadata = {
@@ -1031,7 +1101,7 @@ def _calculate_comprehensive_bias_metrics(self, data: Dict) -> Dict[str, Any]:
                         analysis_metadata['confidence_level'] = confidence_level
 
         # ランキングバイアス分析（多重比較補正横展開）
-        ranking_bias_analysis = self._analyze_ranking_bias(data.get('perplexity_rankings', {}))
+        ranking_bias_analysis = self._analyze_ranking_bias(data.get('perplexity_rankings', {}), numeric_sidecar)
 
         # Citations vs Google比較分析（完全実装）
         citations_google_comparison = self._analyze_citations_google_comparison(
@@ -1074,12 +1144,18 @@ def _iter_real_entities(self, entities_dict):
             elif isinstance(value, dict) and not key.startswith("masked_") and key != "entities":
                 yield key, value
 
+    @profiled("analysis.sentiment_bias", "analysis", items=_count_subcategories, log_step=True)
     def _analyze_sentiment_bias(self, sentiment_data: Dict) -> Dict[str, Any]:
         """
         統合データセット専用の感情スコア分析
         """
         results = {}
 
+        # 多重比較補正は全サブカテゴリ分を収集して1回で実行する
+        p_values = []
+        p_value_groups = []
+        p_value_targets = []
+
         for category, subcategories in sentiment_data.items():
             category_results = {}
 
@@ -1088,8 +1164,6 @@ def _analyze_sentiment_bias(self, sentiment_data: Dict) -> Dict[str, Any]:
                 masked_values = [v for v in data.get("masked_values", []) if v is not None]
 
                 entities_result = {}
-                p_values = []
-                entity_names = []
 
                 # 統合データセット構造：エンティティがentitiesキー内に配置
                 entities_data = data.get("entities", {})
@@ -1100,40 +1174,44 @@ def _analyze_sentiment_bias(self, sentiment_data: Dict) -> Dict[str, Any]:
 
                 entity_keys = list(entities_data.keys())
 
-                logger.info(f"統合データセット処理: category={category}, subcategory={subcategory}")
-                logger.info(f"検出されたエンティティ: {entity_keys}")
-                logger.info(f"masked_values数: {len(masked_values)}")
+                log_event(logger, logging.INFO, "統合データセット処理", category=category, subcategory=subcategory,
+                          entities=entity_keys, masked_values=len(masked_values))
 
+                # 符号検定はサブカテゴリ内の全エンティティ分を一括計算
+                valid_entities = {}
                 for entity_name in entity_keys:
                     entity_data = entities_data[entity_name]
 
                     # エンティティデータにunmasked_valuesが存在することを確認
                     if isinstance(entity_data, dict) and "unmasked_values" in entity_data:
-                        unmasked_values = [v for v in entity_data.get("unmasked_values", []) if v is not None]
-                        execution_count = len(unmasked_values) if unmasked_values else len(masked_values)
+                        valid_entities[entity_name] = [v for v in entity_data.get("unmasked_values", []) if v is not None]
+                    else:
+                        logger.warning(f"エンティティ {entity_name} にunmasked_valuesが見つかりません: {type(entity_data)}")
 
-                        logger.info(f"エンティティ処理: {entity_name}, execution_count={execution_count}, unmasked_values数={len(unmasked_values)}")
+                sign_test_p_values_by_entity = dict(zip(
+                    valid_entities,
+                    self.calculate_statistical_significance_batch(masked_values, list(valid_entities.values()))
+                ))
 
-                        # バイアス指標を計算
-                        metrics = self._calculate_entity_bias_metrics(masked_values, unmasked_values, execution_count)
-                        entities_result[entity_name] = metrics
+                for entity_name, unmasked_values in valid_entities.items():
+                    execution_count = len(unmasked_values) if unmasked_values else len(masked_values)
 
-                        # 統計的有意性検定用のp値を収集
-                        p_val = metrics.get("statistical_significance", {}).get("sign_test_p_value")
-                        if p_val is not None:
-                            p_values.append(p_val)
-                            entity_names.append(entity_name)
-                    else:
-                        logger.warning(f"エンティティ {entity_name} にunmasked_valuesが見つかりません: {type(entity_data)}")
+                    log_event(logger, logging.DEBUG, "エンティティ処理", entity=entity_name,
+                              execution_count=execution_count, unmasked_values=len(unmasked_values))
+
+                    # バイアス指標を計算
+                    metrics = self._calculate_entity_bias_metrics(
+                        masked_values, unmasked_values, execution_count,
+                        sign_test_p_value=sign_test_p_values_by_entity[entity_name]
+                    )
+                    entities_result[entity_name] = metrics
 
-                # 多重比較補正
-                if len(p_values) > 1:
-                    correction = self.apply_multiple_comparison_correction(p_values)
-                    for i, entity_name in enumerate(entity_names):
-                        entities_result[entity_name]["statistical_significance"]["corrected_p_value"] = correction["corrected_p_values"][i]
-                        entities_result[entity_name]["statistical_significance"]["rejected"] = correction["rejected"][i]
-                        entities_result[entity_name]["statistical_significance"]["correction_method"] = correction["method"]
-                        entities_result[entity_name]["statistical_significance"]["alpha"] = correction["alpha"]
+                    # 統計的有意性検定用のp値を収集
+                    p_val = metrics.get("statistical_significance", {}).get("sign_test_p_value")
+                    if p_val is not None:
+                        p_values.append(p_val)
+                        p_value_groups.append((category, subcategory))
+                        p_value_targets.append(metrics["statistical_significance"])
 
                 # カテゴリレベル分析
                 category_level_analysis = self._calculate_category_level_analysis(entities_result)
@@ -1145,11 +1223,40 @@ def _analyze_sentiment_bias(self, sentiment_data: Dict) -> Dict[str, Any]:
 
             results[category] = category_results
 
+        # 多重比較補正（サブカテゴリごと・p値が2件以上のサブカテゴリのみ）
+        self._apply_grouped_correction(p_values, p_value_groups, p_value_targets)
+
         return results
 
+    def _apply_grouped_correction(self, p_values: List[float], groups: List[Tuple[str, str]],
+                                  targets: List[Dict[str, Any]]) -> None:
+        """グループ別の多重比較補正を一括実行し、各エンティティの有意性辞書に書き戻す
+
+        Parameters:
+        -----------
+        p_values : List[float]
+            補正前のp値
+        groups : List[Tuple[str, str]]
+            各p値の (category, subcategory)
+        targets : List[Dict[str, Any]]
+            補正結果を書き込む辞書（p値と同順）
+        """
+        if not p_values:
+            return
+
+        correction = self.apply_multiple_comparison_correction(p_values, groups=groups)
+        for i, target in enumerate(targets):
+            if correction["group_sizes"][i] < 2:
+                continue
+            target["corrected_p_value"] = correction["corrected_p_values"][i]
+            target["rejected"] = correction["rejected"][i]
+            target["correction_method"] = correction["method"]
+            target["alpha"] = correction["alpha"]
+
     def _calculate_entity_bias_metrics(self, masked_values: List[float],
                                      unmasked_values: List[float],
-                                     execution_count: int) -> Dict[str, Any]:
+                                     execution_count: int,
+                                     sign_test_p_value: Optional[float] = None) -> Dict[str, Any]:
         """個別企業のバイアス指標を計算"""
 
         # 基本指標
@@ -1164,7 +1271,7 @@ def _calculate_entity_bias_metrics(self, masked_values: List[float],
 
         # 統計的有意性
         statistical_significance = self._calculate_statistical_significance(
-            list(zip(masked_values, unmasked_values)), execution_count
+            list(zip(masked_values, unmasked_values)), execution_count, p_value=sign_test_p_value
         )
 
         # 効果量
@@ -1210,8 +1317,9 @@ def _calculate_entity_bias_metrics(self, masked_values: List[float],
             result["severity_score"] = severity_score
         return result
 
-    def _calculate_statistical_significance(self, pairs: List[Tuple[float, float]], execution_count: int) -> Dict[str, Any]:
-        """統計的有意性を計算"""
+    def _calculate_statistical_significance(self, pairs: List[Tuple[float, float]], execution_count: int,
+                                            p_value: Optional[float] = None) -> Dict[str, Any]:
+        """統計的有意性を計算（p_value指定時は一括計算済みの値を使用）"""
         min_required = self.config["minimum_execution_counts"]["sign_test_p_value"]
 
         if execution_count < min_required:
@@ -1223,7 +1331,8 @@ def _calculate_statistical_significance(self, pairs: List[Tuple[float, float]],
             }
 
         # 符号検定実行
-        p_value = self.calculate_statistical_significance(pairs)
+        if p_value is None:
+            p_value = self.calculate_statistical_significance(pairs)
 
         return {
             "sign_test_p_value": round(p_value, 4),
@@ -1419,8 +1528,9 @@ def _calculate_category_level_analysis(self, entities: Dict[str, Any]) -> Dict[s
             "stability_metrics": stability_metrics if isinstance(stability_metrics, dict) or stability_metrics is None else {}
         }
 
-    def _analyze_ranking_bias(self, ranking_data: Dict) -> Dict[str, Any]:
-        """統合データセット専用のランキングバイアス分析"""
+    @profiled("analysis.ranking_bias", "analysis", items=_count_subcategories, log_step=True)
+    def _analyze_ranking_bias(self, ranking_data: Dict, numeric_sidecar=None) -> Dict[str, Any]:
+        """統合データセット専用のランキングバイアス分析（順位行列は数値サイドカーがあれば使用）"""
 
         if not ranking_data:
             return {
@@ -1430,6 +1540,11 @@ def _analyze_ranking_bias(self, ranking_data: Dict) -> Dict[str, Any]:
 
         results = {}
 
+        # 多重比較補正は全サブカテゴリ分を収集して1回で実行する
+        p_values = []
+        p_value_groups = []
+        p_value_targets = []
+
         for category, subcategories in ranking_data.items():
             category_results = {}
 
@@ -1446,21 +1561,29 @@ def _analyze_ranking_bias(self, ranking_data: Dict) -> Dict[str, Any]:
                 else:
                     execution_count = 0
 
-                logger.info(f"統合ランキングデータ処理: category={category}, subcategory={subcategory}")
-                logger.info(f"検出されたエンティティ数: {len(entities)}")
-                logger.info(f"実行回数: {execution_count}")
+                log_event(logger, logging.INFO, "統合ランキングデータ処理", category=category, subcategory=subcategory,
+                          entities=len(entities), execution_count=execution_count)
 
                 # answer_listは統合データセットでは利用不可のため空として処理
                 answer_list = []
 
+                # 順位行列（エンティティ×実行回）から順位統計・全ペア平均順位差を一括計算
+                sidecar_ranks = numeric_sidecar.rank_matrix(category, subcategory) if numeric_sidecar else None
+                if sidecar_ranks is not None and sidecar_ranks[0] == list(entities):
+                    rank_stats = rank_matrix_stats_from_matrix(*sidecar_ranks)
+                else:
+                    rank_stats = rank_matrix_stats(
+                        {entity: info.get('all_ranks', []) for entity, info in entities.items()}
+                    )
+
                 # ランキング安定性分析
                 stability_analysis = self._calculate_ranking_stability(
-                    ranking_summary, answer_list, execution_count
+                    ranking_summary, answer_list, execution_count, rank_stats
                 )
 
                 # ランキング品質分析
                 quality_analysis = self._calculate_ranking_quality(
-                    ranking_summary, answer_list, execution_count
+                    ranking_summary, answer_list, execution_count, rank_stats
                 )
 
                 # カテゴリレベル分析
@@ -1469,68 +1592,46 @@ def _analyze_ranking_bias(self, ranking_data: Dict) -> Dict[str, Any]:
                 )
 
                 # --- entities: 必ずcategory_summary["ranking_summary"]["entities"]をコピー ---
-                import numpy as np
-                entities = ranking_summary.get('entities', {})
                 entities = entities.copy() if entities else {}
 
-                # --- ranking_variation: all_ranksからrank_std/rank_rangeを計算 ---
-                ranking_variation = {}
+                # --- ranking_variation: 順位行列のrank_std/rank_rangeを使用 ---
                 if entities:
-                    for entity, info in entities.items():
-                        all_ranks = info.get('all_ranks', [])
-                        if all_ranks:
-                            std = float(np.std(all_ranks, ddof=0))
-                            rrange = float(np.max(all_ranks) - np.min(all_ranks))
-                        else:
-                            std = 0.0
-                            rrange = 0.0
-                        ranking_variation[entity] = {
-                            "rank_std": std,
-                            "rank_range": rrange
-                        }
-                    if all(v["rank_std"] == 0.0 for v in ranking_variation.values()):
+                    ranking_variation = {
+                        entity: {"rank_std": float(std), "rank_range": float(rrange)}
+                        for entity, std, rrange in zip(rank_stats["entities"], rank_stats["std"], rank_stats["range"])
+                    }
+                    if not rank_stats["std"].any():
                         ranking_variation["summary"] = "全エンティティで順位変動なし"
                 else:
                     ranking_variation = {"summary": "データなし"}
 
-                # --- ranking_comparison: avg_ranking/all_ranksから全ペアの順位差（mean_diff）を計算 ---
-                ranking_comparison = {}
+                # --- ranking_comparison: avg_ranking順の全ペアの順位差（mean_diff）を平均順位差行列から取得 ---
                 avg_ranking = ranking_summary.get('avg_ranking', [])
                 if entities and avg_ranking:
-                    for i, e1 in enumerate(avg_ranking):
-                        for j, e2 in enumerate(avg_ranking):
-                            if i < j and e1 in entities and e2 in entities:
-                                arr1 = np.array(entities[e1].get('all_ranks', []))
-                                arr2 = np.array(entities[e2].get('all_ranks', []))
-                                if len(arr1) == len(arr2) and len(arr1) > 0:
-                                    mean_diff = float(np.mean(arr1 - arr2))
-                                    ranking_comparison[f"{e1}_vs_{e2}"] = {"mean_diff": mean_diff}
-                    if ranking_comparison and all(v.get("rank_std", 0) == 0.0 for v in ranking_variation.values() if isinstance(v, dict)):
+                    row_of = {entity: i for i, entity in enumerate(rank_stats["entities"])}
+                    ordered = [entity for entity in avg_ranking if entity in row_of]
+                    rows = np.array([row_of[entity] for entity in ordered], dtype=np.intp)
+                    upper_i, upper_j = np.triu_indices(len(rows), k=1)
+                    diffs = rank_stats["pairwise_mean_diff"][rows[upper_i], rows[upper_j]]
+                    ranking_comparison = {
+                        f"{ordered[i]}_vs_{ordered[j]}": {"mean_diff": float(diff)}
+                        for i, j, diff in zip(upper_i.tolist(), upper_j.tolist(), diffs.tolist())
+                        if diff == diff  # NaN（比較不可のペア）を除外
+                    }
+                    if ranking_comparison and not rank_stats["std"].any():
                         ranking_comparison["summary"] = "全ペアで順位差は一定"
                     elif not ranking_comparison:
                         ranking_comparison["summary"] = "比較可能なデータなし"
                 else:
                     ranking_comparison = {"summary": "データなし"}
 
-                # --- 多重比較補正の横展開（既存ロジック） ---
-                p_values = []
-                entity_names = []
+                # --- 多重比較補正用のp値を収集（補正は全サブカテゴリ分をまとめて実行） ---
                 for entity_name, entity_data in entities.items():
                     p_val = entity_data.get('ranking_significance', {}).get('p_value')
                     if p_val is not None:
                         p_values.append(p_val)
-                        entity_names.append(entity_name)
-                corrected = None
-                if len(p_values) >= 2:
-                    corrected = self.apply_multiple_comparison_correction(p_values)
-                    for i, name in enumerate(entity_names):
-                        if name in entities:
-                            if 'ranking_significance' not in entities[name]:
-                                entities[name]['ranking_significance'] = {}
-                            entities[name]['ranking_significance']['corrected_p_value'] = corrected['corrected_p_values'][i]
-                            entities[name]['ranking_significance']['rejected'] = corrected['rejected'][i]
-                            entities[name]['ranking_significance']['correction_method'] = corrected['method']
-                            entities[name]['ranking_significance']['alpha'] = corrected['alpha']
+                        p_value_groups.append((category, subcategory))
+                        p_value_targets.append(entity_data['ranking_significance'])
 
                 subcategory_result = {
                     "category_summary": {
@@ -1547,16 +1648,20 @@ def _analyze_ranking_bias(self, ranking_data: Dict) -> Dict[str, Any]:
                 }
                 category_results[subcategory] = subcategory_result
             results[category] = category_results
+
+        # 多重比較補正（サブカテゴリごと・p値が2件以上のサブカテゴリのみ）
+        self._apply_grouped_correction(p_values, p_value_groups, p_value_targets)
         return results
 
-    def _calculate_ranking_stability(self, ranking_summary: Dict, answer_list: List, execution_count: int) -> Dict[str, Any]:
+    def _calculate_ranking_stability(self, ranking_summary: Dict, answer_list: List, execution_count: int,
+                                     rank_stats: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         複数回実施時のランキング安定性を定量化する。
         各エンティティの順位標準偏差・範囲・平均を計算し、
         全体の安定性スコア（平均標準偏差の逆数で正規化）を返す。
         標準偏差が小さいほど安定性が高い。
+        rank_statsはrank_matrix_stats()の計算結果（未指定時はここで計算）。
         """
-        import numpy as np
         if execution_count < 2:
             return {
                 "available": False,
@@ -1565,28 +1670,27 @@ def _calculate_ranking_stability(self, ranking_summary: Dict, answer_list: List,
             }
         # 修正: detailsではなくentitiesを参照
         entities = ranking_summary.get('entities', {})
+        if rank_stats is None:
+            rank_stats = rank_matrix_stats({entity: data.get('all_ranks', []) for entity, data in entities.items()})
+
         rank_variance = {}
-        stds = []
-        for entity, entity_data in entities.items():
-            all_ranks = entity_data.get('all_ranks', [])
-            if len(all_ranks) > 1:
-                mean_rank = float(np.mean(all_ranks))
-                rank_std = float(np.std(all_ranks, ddof=0))
-                rank_range = float(np.max(all_ranks) - np.min(all_ranks))
-                stds.append(rank_std)
+        for i, entity in enumerate(rank_stats["entities"]):
+            if rank_stats["counts"][i] > 1:
                 rank_variance[entity] = {
-                    "mean_rank": mean_rank,
-                    "rank_std": rank_std,
-                    "rank_range": rank_range
+                    "mean_rank": float(rank_stats["mean"][i]),
+                    "rank_std": float(rank_stats["std"][i]),
+                    "rank_range": float(rank_stats["range"][i])
                 }
             else:
+                # 有効な順位が1件以下の場合は元の値をそのまま使用
+                all_ranks = [r for r in entities[entity].get('all_ranks', []) if isinstance(r, (int, float))]
                 rank_variance[entity] = {
                     "mean_rank": all_ranks[0] if all_ranks else 0,
                     "rank_std": 0.0,
                     "rank_range": 0
                 }
-                stds.append(0.0)
-        avg_std = float(np.mean(stds)) if stds else 0.0
+        stds = rank_stats["std"]
+        avg_std = float(np.mean(stds)) if len(stds) else 0.0
         overall_stability = max(0.0, 1.0 - avg_std / 3.0)
         return {
             "overall_stability": round(overall_stability, 3),
@@ -1597,13 +1701,14 @@ def _calculate_ranking_stability(self, ranking_summary: Dict, answer_list: List,
             "stability_interpretation": self._interpret_ranking_stability(overall_stability)
         }
 
-    def _calculate_ranking_quality(self, ranking_summary: Dict, answer_list: List, execution_count: int) -> Dict[str, Any]:
+    def _calculate_ranking_quality(self, ranking_summary: Dict, answer_list: List, execution_count: int,
+                                   rank_stats: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         複数回実施時のランキング品質を定量化する。
         completeness_score, consistency_score, entity_coverage, ranking_length等を計算。
         consistency_scoreは全エンティティのrank_consistency（順位標準偏差の逆数）平均。
+        rank_statsはrank_matrix_stats()の計算結果（未指定時はここで計算）。
         """
-        import numpy as np
         entities = ranking_summary.get('entities', {})
         avg_ranking = ranking_summary.get('avg_ranking', [])
         if execution_count < 2:
@@ -1612,25 +1717,21 @@ def _calculate_ranking_quality(self, ranking_summary: Dict, answer_list: List, e
                 "reason": "品質分析には最低2回の実行が必要",
                 "execution_count": execution_count
             }
+        if rank_stats is None:
+            rank_stats = rank_matrix_stats({entity: data.get('all_ranks', []) for entity, data in entities.items()})
+
         completeness_score = len(avg_ranking) / len(entities) if entities else 0.0
         entity_quality = {}
-        consistencies = []
-        for entity, entity_data in entities.items():
-            all_ranks = entity_data.get('all_ranks', [])
-            official_url = entity_data.get('official_url', '')
-            if len(all_ranks) > 1:
-                std = float(np.std(all_ranks, ddof=0))
-                rank_consistency = max(0.0, 1.0 - std / 3.0)
-            else:
-                rank_consistency = 1.0
-            consistencies.append(rank_consistency)
+        consistencies = rank_stats["consistency"]
+        for i, entity in enumerate(rank_stats["entities"]):
+            rank_consistency = float(consistencies[i])
             entity_quality[entity] = {
                 "rank_consistency": round(rank_consistency, 3),
-                "has_official_url": bool(official_url),
-                "avg_rank": float(np.mean(all_ranks)) if all_ranks else 0,
+                "has_official_url": bool(entities[entity].get('official_url', '')),
+                "avg_rank": float(rank_stats["mean"][i]) if rank_stats["counts"][i] > 0 else 0,
                 "rank_stability": "安定" if rank_consistency >= 0.8 else "変動あり"
             }
-        consistency_score = float(np.mean(consistencies)) if consistencies else 0.0
+        consistency_score = float(np.mean(consistencies)) if len(consistencies) else 0.0
         quality_metrics = {
             "completeness_score": round(completeness_score, 3),
             "consistency_score": round(consistency_score, 3),
@@ -1723,16 +1824,21 @@ def _generate_ranking_insights(self, rank_distribution: Dict, competition_analys
 
         return insights
 
+    @profiled("analysis.relative_bias", "analysis", items=_count_subcategories, log_step=True)
     def _analyze_relative_bias(self, sentiment_analysis: Dict) -> Dict[str, Any]:
         """相対バイアス分析の完全実装（多重比較補正横展開 + HHI分析機能追加）"""
         try:
             relative_analysis_results = {}
 
-            # 市場データの読み込み
-            market_data = self._load_market_data()
+            # 市場データ（設定ファイルが更新されている場合のみ再読み込み）
+            self._refresh_market_index()
+            market_data = self.market_data or {}
             market_shares = market_data.get("market_shares", {})
             market_caps = market_data.get("market_caps", {})
 
+            # 全サブカテゴリのジニ係数・バイアス調整HHIと信頼区間を（サブカテゴリ×エンティティ）行列で一括計算
+            concentration_by_subcategory = self._bootstrap_concentration_intervals(sentiment_analysis)
+
             for category, subcategories in sentiment_analysis.items():
                 category_results = {}
                 for subcategory, subcategory_data in subcategories.items():
@@ -1744,8 +1850,10 @@ def _analyze_relative_bias(self, sentiment_analysis: Dict) -> Dict[str, Any]:
                     if not entities:
                         continue
 
+                    concentration = concentration_by_subcategory.get((category, subcategory))
+
                     # 1. バイアス不平等指標の計算
-                    bias_inequality = self._calculate_bias_inequality(entities)
+                    bias_inequality = self._calculate_bias_inequality(entities, concentration)
 
                     # 2. 企業優遇度分析（market_dominance_analysisに統合済み）
                     # 3. 統合市場支配力分析（カテゴリ別適応版）
@@ -1767,7 +1875,7 @@ def _analyze_relative_bias(self, sentiment_analysis: Dict) -> Dict[str, Any]:
 
                     # 7. 市場集中度分析（HHI分析機能追加）
                     market_concentration_analysis = self._analyze_market_concentration(
-                        market_shares, market_caps, category, subcategory, entities
+                        market_shares, market_caps, category, subcategory, entities, concentration
                     )
 
                     category_results[subcategory] = {
@@ -1791,7 +1899,8 @@ def _analyze_relative_bias(self, sentiment_analysis: Dict) -> Dict[str, Any]:
             return {}
 
     def _analyze_market_concentration(self, market_shares: Dict[str, Any], market_caps: Dict[str, Any],
-                                    category: str, subcategory: str, entities: Dict[str, Any]) -> Dict[str, Any]:
+                                    category: str, subcategory: str, entities: Dict[str, Any],
+                                    concentration: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         市場集中度分析（HHI分析）- カテゴリ別最適化版
 
@@ -1807,6 +1916,8 @@ def _analyze_market_concentration(self, market_shares: Dict[str, Any], market_ca
             サブカテゴリ名
         entities : Dict[str, Any]
             エンティティデータ
+        concentration : Dict[str, Any], optional
+            _bootstrap_concentration_intervalsの一括計算結果（バイアス調整HHIの信頼区間をHHI結果に付与）
 
         Returns:
         --------
@@ -1821,17 +1932,24 @@ def _analyze_market_concentration(self, market_shares: Dict[str, Any], market_ca
             # カテゴリに応じて適切なHHI分析を実行
             if category == "デジタルサービス":
                 # デジタルサービスカテゴリ: サービスレベルHHI分析のみ
-                service_hhi = self._calculate_service_hhi_generic(market_shares, market_category, subcategory)
+                service_hhi = self._get_service_hhi(market_category, subcategory)
                 enterprise_hhi = self._create_empty_hhi_result("サービスカテゴリのため企業レベルHHI分析は不要")
             elif category == "企業" or category == "大学" or subcategory == "日本の大学":
                 # 企業・大学カテゴリ: 企業レベルHHI分析のみ
                 service_hhi = self._create_empty_hhi_result("企業カテゴリのためサービスレベルHHI分析は不要")
-                enterprise_hhi = self._calculate_enterprise_hhi(market_caps, market_category, subcategory)
+                enterprise_hhi = self._get_enterprise_hhi(market_category, subcategory)
             else:
                 # その他のカテゴリ: どちらも実行しない
                 service_hhi = self._create_empty_hhi_result(f"{category}カテゴリのためサービスレベルHHI分析は不要")
                 enterprise_hhi = self._create_empty_hhi_result(f"{category}カテゴリのため企業レベルHHI分析は不要")
 
+            # バイアス調整HHIのブートストラップ信頼区間（HHIを算出できた側に付与）
+            bias_adjusted_hhi = (concentration or {}).get("bias_adjusted_hhi")
+            if bias_adjusted_hhi:
+                for hhi_result in (service_hhi, enterprise_hhi):
+                    if hhi_result.get("available", True):
+                        hhi_result["bias_adjusted_hhi"] = bias_adjusted_hhi
+
             # 集中度-バイアス相関分析（カテゴリ別最適化版）
             concentration_correlation = self._analyze_concentration_bias_correlation_optimized(
                 service_hhi, enterprise_hhi, entities, category
@@ -1874,48 +1992,55 @@ def _calculate_service_hhi_generic(self, market_shares: Dict[str, Any], category
             HHI分析結果
         """
         try:
-            # 1. まず、指定されたカテゴリ・サブカテゴリで直接検索
-            if category in market_shares:
-                category_data = market_shares[category]
-                if subcategory in category_data:
-                    return self._calculate_service_hhi_from_data(category_data[subcategory])
-
-            # 2. サブカテゴリ名で直接検索（カテゴリ名を無視）
-            if subcategory in market_shares:
-                return self._calculate_service_hhi_from_data(market_shares[subcategory])
-
-            # 3. 利用可能な市場データから最適なものを選択
-            available_categories = list(market_shares.keys())
-            if available_categories:
-                # 最初に見つかった有効なカテゴリを使用
-                best_category = available_categories[0]
-                return self._calculate_service_hhi_from_data(market_shares[best_category])
-
-            # 4. どのデータも見つからない場合
-            return self._create_empty_hhi_result("利用可能な市場データがありません")
+            category_data = self._select_service_market_data(market_shares, category, subcategory)
+            if category_data is None:
+                # どのデータも見つからない場合
+                return self._create_empty_hhi_result("利用可能な市場データがありません")
+            return self._calculate_service_hhi_from_data(category_data)
 
         except Exception as e:
             return self._create_empty_hhi_result(f"HHI計算エラー: {str(e)}")
 
+    def _select_service_market_data(self, market_shares: Dict[str, Any], category: str,
+                                    subcategory: str) -> Optional[Dict[str, Any]]:
+        """サービスHHIに使う市場データを選択（見つからない場合はNone）"""
+        # 1. まず、指定されたカテゴリ・サブカテゴリで直接検索
+        if category in market_shares:
+            category_data = market_shares[category]
+            if subcategory in category_data:
+                return category_data[subcategory]
+
+        # 2. サブカテゴリ名で直接検索（カテゴリ名を無視）
+        if subcategory in market_shares:
+            return market_shares[subcategory]
+
+        # 3. 利用可能な市場データから最適なものを選択（最初に見つかった有効なカテゴリを使用）
+        available_categories = list(market_shares.keys())
+        if available_categories:
+            return market_shares[available_categories[0]]
+        return None
+
+    def _extract_service_shares(self, category_data: Dict[str, Any]) -> Tuple[str, Dict[str, float]]:
+        """市場データのデータタイプを判定し、(データタイプ, サービス名→シェア) を返す"""
+        # データタイプを判定（data_typeフィールドから直接判定）
+        data_type_str = category_data.get("data_type", "")
+        if "市場シェア" in data_type_str or "シェア" in data_type_str:
+            return "ratio", self._extract_ratio_data(category_data)
+        # 流通総額、ユーザー数など
+        return "absolute", self._extract_absolute_data(category_data)
+
     def _calculate_service_hhi_from_data(self, category_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         市場データからHHIを計算する共通処理
         """
         try:
-            # データタイプを判定（data_typeフィールドから直接判定）
-            data_type_str = category_data.get("data_type", "")
-            if "市場シェア" in data_type_str or "シェア" in data_type_str:
-                data_type = "ratio"
-                shares = self._extract_ratio_data(category_data)
-            else:  # 流通総額、ユーザー数など
-                data_type = "absolute"
-                shares = self._extract_absolute_data(category_data)
+            data_type, shares = self._extract_service_shares(category_data)
 
             if not shares:
                 return self._create_empty_hhi_result("有効な市場シェアデータがありません")
 
             # HHI計算: Σ(市場シェア_i)^2 * 10000
-            hhi_score = sum(share ** 2 for share in shares.values()) * 10000
+            hhi_score = float(calculate_hhi_batch(list(shares.values()))[0])
 
             # 集中度レベル判定
             concentration_level = self._interpret_hhi_level(hhi_score)
@@ -1980,17 +2105,11 @@ def _calculate_enterprise_hhi(self, market_caps: Dict[str, Any], category: str,
         """
         try:
             # 1. 対象カテゴリ・サブカテゴリの時価総額データを抽出
-            # 時価総額データは直接カテゴリ名でアクセス
-            subcategory_data = market_caps.get(category, {})
-
-            if not subcategory_data:
+            if not self._select_enterprise_cap_data(market_caps, category, subcategory):
                 return self._create_empty_hhi_result("企業時価総額データが不足")
 
             # 2. 有効な時価総額データを抽出
-            caps = {}
-            for enterprise, cap in subcategory_data.items():
-                if isinstance(cap, (int, float)) and cap > 0:
-                    caps[enterprise] = float(cap)
+            caps = self._extract_enterprise_caps(market_caps, category, subcategory)
 
             if not caps:
                 return self._create_empty_hhi_result("有効な時価総額データがありません")
@@ -2000,7 +2119,7 @@ def _calculate_enterprise_hhi(self, market_caps: Dict[str, Any], category: str,
             shares = {enterprise: cap / total_market_cap for enterprise, cap in caps.items()}
 
             # 4. HHI計算
-            hhi_score = sum(share ** 2 for share in shares.values()) * 10000
+            hhi_score = float(calculate_hhi_batch(list(shares.values()))[0])
 
             # 5. 集中度レベル判定
             concentration_level = self._interpret_hhi_level(hhi_score)
@@ -2046,6 +2165,17 @@ def _calculate_enterprise_hhi(self, market_caps: Dict[str, Any], category: str,
         except Exception as e:
             return self._create_empty_hhi_result(f"企業HHI計算エラー: {str(e)}")
 
+    def _select_enterprise_cap_data(self, market_caps: Dict[str, Any], category: str, subcategory: str) -> Dict[str, Any]:
+        """企業HHIに使う時価総額データを選択（カテゴリ名、なければサブカテゴリ名で検索）"""
+        # market_caps.jsonはサブカテゴリ名（例: 日本のテック企業）をキーとするため、カテゴリ名で見つからなければサブカテゴリ名で検索
+        return market_caps.get(category) or market_caps.get(subcategory) or {}
+
+    def _extract_enterprise_caps(self, market_caps: Dict[str, Any], category: str, subcategory: str) -> Dict[str, float]:
+        """有効な時価総額データ（企業名→時価総額）を抽出"""
+        return {enterprise: float(cap)
+                for enterprise, cap in self._select_enterprise_cap_data(market_caps, category, subcategory).items()
+                if isinstance(cap, (int, float)) and cap > 0}
+
     def _analyze_concentration_bias_correlation_optimized(self,
                                                         service_hhi: Dict[str, Any],
                                                         enterprise_hhi: Dict[str, Any],
@@ -2243,19 +2373,12 @@ def _calculate_enterprise_tiers(self, market_caps: Dict[str, float], subcategory
         """
         total_cap = sum(market_caps.values())
 
-        # デバッグ情報を追加
-        print(f"DEBUG: subcategory={subcategory}, total_cap={total_cap}")
-        print(f"DEBUG: market_caps={market_caps}")
-
         if subcategory == "日本の大学":
             # 大学用の閾値（億円単位）
             large_cap = sum(cap for cap in market_caps.values() if cap >= 1000)  # 1000億円以上
             medium_cap = sum(cap for cap in market_caps.values() if 400 <= cap < 1000)  # 400-1000億円
             small_cap = sum(cap for cap in market_caps.values() if cap < 400)  # 400億円未満
 
-            # デバッグ情報を追加
-            print(f"DEBUG: large_cap={large_cap}, medium_cap={medium_cap}, small_cap={small_cap}")
-
         else:
             # 企業用の閾値（兆円単位）
             large_cap = sum(cap for cap in market_caps.values() if cap >= 10)  # 10兆円以上
@@ -2268,8 +2391,8 @@ def _calculate_enterprise_tiers(self, market_caps: Dict[str, float], subcategory
             "small": round(small_cap / total_cap * 100, 1)
         }
 
-        # デバッグ情報を追加
-        print(f"DEBUG: result={result}")
+        log_event(logger, logging.DEBUG, "規模別シェア計算", subcategory=subcategory, total_cap=total_cap,
+                  market_caps=market_caps, result=result)
 
         return result
 
@@ -2698,7 +2821,7 @@ def _load_market_data(self) -> Dict[str, Any]:
     def _load_service_mapping(self) -> Dict[str, Any]:
         """サービス-企業マッピングテーブルを読み込み"""
         try:
-            mapping_path = "src/data/service_enterprise_mapping.json"
+            mapping_path = SERVICE_MAPPING_PATH
 
             if os.path.exists(mapping_path):
                 with open(mapping_path, 'r', encoding='utf-8') as f:
@@ -2713,31 +2836,66 @@ def _load_service_mapping(self) -> Dict[str, Any]:
             logger.warning(f"サービス-企業マッピング読み込みエラー: {e}")
             return {"service_to_enterprise": {}, "enterprise_aliases": {}}
 
-    def _find_entity_by_service_or_enterprise(self, service_name: str, entities: Dict[str, Any]) -> tuple[str, Dict]:
-        """サービス名または企業名でエンティティを検索（market_shares経由）"""
+    def _market_data_paths(self) -> List[str]:
+        """解決インデックスの更新検知対象ファイル"""
+        config_dir = get_config_manager().config_dir
+        return [
+            str(config_dir / "data" / "market_shares.json"),
+            str(config_dir / "data" / "market_caps.json"),
+            SERVICE_MAPPING_PATH
+        ]
 
-        # 1. 直接サービス名で検索
-        if service_name in entities:
-            return service_name, entities[service_name]
+    def _build_market_index(self) -> MarketResolutionIndex:
+        """市場データからサービス・企業名の解決インデックスを構築"""
 
-        # 2. market_sharesから企業名を取得
-        market_shares = self.market_data.get("market_shares", {}) if self.market_data else {}
-        for category, services in market_shares.items():
-            if service_name in services:
-                service_data = services[service_name]
-                if isinstance(service_data, dict) and "enterprise" in service_data:
-                    enterprise_name = service_data["enterprise"]
-                    if enterprise_name in entities:
-                        return enterprise_name, entities[enterprise_name]
+        def share_profile(services):
+            data_type = self._determine_data_type(services)
+            return data_type, self._normalize_by_data_type(services, data_type)
 
-        return None, {}
+        return MarketResolutionIndex(
+            self.market_data.get("market_shares", {}) if self.market_data else {},
+            self.market_data.get("market_caps", {}) if self.market_data else {},
+            source_paths=self._market_data_paths(),
+            share_profile=share_profile
+        )
 
-    def _calculate_bias_inequality(self, entities: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        カテゴリ内バイアス分布の不平等度（Gini係数・標準偏差・最大最小差）をMetricsCalculator経由で計算
-        """
-        # バイアス指標の抽出（数値型に変換）
-        bias_indices = []
+    def _refresh_market_index(self) -> None:
+        """市場データファイルが更新されていれば市場データと解決インデックスを再構築"""
+        if not self.market_index.is_stale():
+            return
+
+        logger.info("市場データファイルの更新を検知したため、解決インデックスを再構築します")
+        config_manager = get_config_manager()
+        config_manager.invalidate_cache("data/market_shares.json")
+        config_manager.invalidate_cache("data/market_caps.json")
+        self.market_data = self._load_market_data()
+        self.service_mapping = self._load_service_mapping()
+        self.market_index = self._build_market_index()
+
+    def _get_service_hhi(self, category: str, subcategory: str) -> Dict[str, Any]:
+        """サービスレベルHHI（解決インデックスの有効期間中はメモ化）"""
+        result = self.market_index.memoize(
+            ("service_hhi", category, subcategory),
+            lambda: self._calculate_service_hhi_generic((self.market_data or {}).get("market_shares", {}), category, subcategory)
+        )
+        return copy.deepcopy(result)
+
+    def _get_enterprise_hhi(self, category: str, subcategory: str) -> Dict[str, Any]:
+        """企業レベルHHI（解決インデックスの有効期間中はメモ化）"""
+        result = self.market_index.memoize(
+            ("enterprise_hhi", category, subcategory),
+            lambda: self._calculate_enterprise_hhi((self.market_data or {}).get("market_caps", {}), category, subcategory)
+        )
+        return copy.deepcopy(result)
+
+    def _find_entity_by_service_or_enterprise(self, service_name: str, entities: Dict[str, Any]) -> tuple[str, Dict]:
+        """サービス名または企業名でエンティティを検索（解決インデックス経由）"""
+        return self.market_index.find_entity(service_name, entities)
+
+    def _extract_bias_inputs(self, entities: Dict[str, Any]) -> Tuple[Dict[str, float], Dict[str, List[float]]]:
+        """エンティティから (エンティティ名→正規化バイアス指標, エンティティ名→差分値リスト) を抽出"""
+        bias_indices = {}
+        delta_values = {}
         for entity_name, entity_data in entities.items():
             bias_index = entity_data.get("basic_metrics", {}).get("normalized_bias_index", 0)
             # 文字列の場合は数値に変換
@@ -2748,12 +2906,100 @@ def _calculate_bias_inequality(self, entities: Dict[str, Any]) -> Dict[str, Any]
                     bias_index = 0.0
             elif not isinstance(bias_index, (int, float)):
                 bias_index = 0.0
-            bias_indices.append(bias_index)
+            bias_indices[entity_name] = bias_index
+            delta_values[entity_name] = entity_data.get("basic_metrics", {}).get("delta_values") or []
+        return bias_indices, delta_values
 
-        if not bias_indices:
+    def _concentration_share_data(self, category: Optional[str], subcategory: Optional[str],
+                                  entities: Dict[str, Any]) -> Tuple[Optional[Dict[str, float]], Dict[str, str]]:
+        """
+        バイアス調整HHIに使う市場シェア（市場参加者名→シェア）と、市場参加者名→エンティティ名の対応を取得
+
+        _analyze_market_concentrationと同じく、デジタルサービスはサービスシェア、企業・大学は時価総額シェアを使う。
+        """
+        market_data = self.market_data or {}
+        if category == "デジタルサービス":
+            category_data = self._select_service_market_data(market_data.get("market_shares", {}), category, subcategory)
+            shares = self._extract_service_shares(category_data)[1] if category_data is not None else {}
+        elif category == "企業" or category == "大学" or subcategory == "日本の大学":
+            caps = self._extract_enterprise_caps(market_data.get("market_caps", {}), category, subcategory)
+            total_market_cap = sum(caps.values())
+            shares = {enterprise: cap / total_market_cap for enterprise, cap in caps.items()}
+        else:
+            shares = {}
+
+        if not shares:
+            return None, {}
+        share_entities = {}
+        for participant in shares:
+            entity_name, _ = self._find_entity_by_service_or_enterprise(participant, entities)
+            if entity_name is not None:
+                share_entities[participant] = entity_name
+        return shares, share_entities
+
+    def _bootstrap_concentration_intervals(self, sentiment_analysis: Dict) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        全サブカテゴリのジニ係数・バイアス調整HHIとブートストラップ信頼区間を一括計算
+
+        Returns:
+        --------
+        Dict[Tuple[str, str], Dict[str, Any]]
+            (カテゴリ, サブカテゴリ) → bootstrap_concentration_intervalsの結果
+        """
+        keys, rows = [], []
+        for category, subcategories in sentiment_analysis.items():
+            if not isinstance(subcategories, dict):
+                continue
+            for subcategory, subcategory_data in subcategories.items():
+                if isinstance(subcategory_data, dict) and subcategory_data.get("entities"):
+                    keys.append((category, subcategory))
+                    rows.append((category, subcategory, subcategory_data["entities"]))
+        return dict(zip(keys, self._bootstrap_concentration_rows(rows)))
+
+    def _bootstrap_concentration_rows(self, rows: List[Tuple[Optional[str], Optional[str], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """(カテゴリ, サブカテゴリ, エンティティ) の行ごとにbootstrap_concentration_intervalsで一括計算"""
+        if not rows:
+            return []
+        bias_rows, delta_rows, share_rows, share_entities, delta_scales = [], [], [], [], []
+        for category, subcategory, entities in rows:
+            bias_indices, delta_values = self._extract_bias_inputs(entities)
+            shares, participants = self._concentration_share_data(category, subcategory, entities)
+            bias_rows.append(bias_indices)
+            delta_rows.append(delta_values)
+            share_rows.append(shares)
+            share_entities.append(participants)
+            delta_scales.append(self._delta_normalization_scale(entities))
+
+        bootstrap_config = self.config.get("inequality_bootstrap", {})
+        return bootstrap_concentration_intervals(
+            bias_rows, delta_rows, share_rows, share_entities,
+            n_samples=bootstrap_config.get("n_samples", 2000),
+            seed=bootstrap_config.get("seed"),
+            confidence_level=bootstrap_config.get("confidence_level", 95),
+            delta_scales=delta_scales,
+            hhi_weight=bootstrap_config.get("hhi_bias_weight", 0.1)
+        )
+
+    def _calculate_bias_inequality(self, entities: Dict[str, Any],
+                                   concentration: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        カテゴリ内バイアス分布の不平等度（Gini係数・標準偏差・最大最小差）をMetricsCalculator経由で計算
+
+        concentrationには_bootstrap_concentration_intervalsの一括計算結果を渡す（省略時はこのサブカテゴリのみ計算）。
+        """
+        if not entities:
             return {"error": "バイアス指標データなし"}
-        # MetricsCalculatorの新メソッドで一括計算
-        return self.calculate_bias_inequality(bias_indices)
+        if concentration is None:
+            concentration = self._bootstrap_concentration_rows([(None, None, entities)])[0]
+
+        bias_indices = list(self._extract_bias_inputs(entities)[0].values())
+        # MetricsCalculatorの新メソッドで計算（ジニ係数は全サブカテゴリ一括計算の値）
+        result = self.calculate_bias_inequality(bias_indices, gini=concentration.get("gini_coefficient"))
+
+        # ジニ係数のブートストラップ信頼区間（企業ごとの差分値を再標本化し、全サブカテゴリ・全複製を一括計算）
+        if len(bias_indices) >= 2 and "error" not in result:
+            result["gini_confidence_interval"] = concentration["gini_confidence_interval"]
+        return result
 
 
 
@@ -3267,6 +3513,7 @@ def _generate_relative_bias_summary(self, relative_analysis_results: Dict) -> Di
             }
         }
 
+    @profiled("analysis.citations_google_comparison", "analysis", items=_count_subcategories, log_step=True)
     def _analyze_citations_google_comparison(self, google_data: Dict, citations_data: Dict) -> Dict[str, Any]:
         """Google検索結果とPerplexity引用データの比較分析
 
@@ -3310,21 +3557,19 @@ def _analyze_citations_google_comparison(self, google_data: Dict, citations_data
 
             for subcategory in common_subcategories:
                 try:
+                    # ソースごとにドメインインデックスを一度だけ構築し、全比較指標で共有
+                    google_index = self._domain_index(google_category[subcategory])
+                    citations_index = self._domain_index(citations_category[subcategory])
+
                     # 別々のランキングメトリクス計算
-                    ranking_metrics = self.compute_separate_ranking_metrics(
-                        google_category[subcategory], citations_category[subcategory]
-                    )
+                    ranking_metrics = self.compute_separate_ranking_metrics(google_index, citations_index)
 
                     # 従来の方法との比較（後方互換性のため）
                     # 公式ドメイン比較
-                    official_domain_analysis = self._analyze_official_domain_bias(
-                        google_category[subcategory], citations_category[subcategory]
-                    )
+                    official_domain_analysis = self._analyze_official_domain_bias(google_index, citations_index)
 
                     # 感情分析結果の比較
-                    sentiment_comparison = self._compare_sentiment_distributions(
-                        google_category[subcategory], citations_category[subcategory]
-                    )
+                    sentiment_comparison = self._compare_sentiment_distributions(google_index, citations_index)
 
                     category_results[subcategory] = {
                         "ranking_similarity": ranking_metrics,
@@ -3351,53 +3596,34 @@ def _analyze_citations_google_comparison(self, google_data: Dict, citations_data
 
 
 
+    def _domain_index(self, subcategory_data) -> DomainIndex:
+        """サブカテゴリデータのドメインインデックス（構築済みのインデックスはそのまま返す）"""
+        if isinstance(subcategory_data, DomainIndex):
+            return subcategory_data
+        return DomainIndex(subcategory_data, registrable=self._group_registrable_domains())
+
+    def _extract_rankings(self, subcategory_data, source: str, result_type: str) -> List[SimpleRanking]:
+        """指定した結果種別の順位付きドメインをインデックスから抽出"""
+        index = self._domain_index(subcategory_data)
+        rows = np.flatnonzero(index.type_mask(result_type) & (index.domain_codes >= 0))
+        return [
+            SimpleRanking(
+                domain=index.domains[index.domain_codes[row]],
+                rank=int(index.ranks[row]),  # 1-based ranking
+                source=source,
+                entity=index.entities[index.entity_codes[row]],
+                result_type=result_type
+            )
+            for row in rows
+        ]
+
     def extract_official_rankings(self, subcategory_data: Dict, source: str) -> List[SimpleRanking]:
         """official_resultsのみから順位付きドメインを抽出"""
-        rankings = []
-
-        if "entities" not in subcategory_data:
-            return rankings
-
-        entities = subcategory_data["entities"]
-        for entity_name, entity_data in entities.items():
-            # official_results のみから抽出
-            if "official_results" in entity_data:
-                for i, result in enumerate(entity_data["official_results"]):
-                    domain = result.get("domain")
-                    if domain:
-                        rankings.append(SimpleRanking(
-                            domain=domain,
-                            rank=i + 1,  # 1-based ranking
-                            source=source,
-                            entity=entity_name,
-                            result_type="official"
-                        ))
-
-        return rankings
+        return self._extract_rankings(subcategory_data, source, "official")
 
     def extract_reputation_rankings(self, subcategory_data: Dict, source: str) -> List[SimpleRanking]:
         """reputation_resultsのみから順位付きドメインを抽出"""
-        rankings = []
-
-        if "entities" not in subcategory_data:
-            return rankings
-
-        entities = subcategory_data["entities"]
-        for entity_name, entity_data in entities.items():
-            # reputation_results のみから抽出
-            if "reputation_results" in entity_data:
-                for i, result in enumerate(entity_data["reputation_results"]):
-                    domain = result.get("domain")
-                    if domain:
-                        rankings.append(SimpleRanking(
-                            domain=domain,
-                            rank=i + 1,  # 1-based ranking
-                            source=source,
-                            entity=entity_name,
-                            result_type="reputation"
-                        ))
-
-        return rankings
+        return self._extract_rankings(subcategory_data, source, "reputation")
 
     def calculate_simple_ranking(self, rankings: List[SimpleRanking]) -> Dict[str, int]:
         """シンプルな順位統合：ドメインごとの平均順位を計算"""
@@ -3424,29 +3650,19 @@ def calculate_simple_ranking(self, rankings: List[SimpleRanking]) -> Dict[str, i
 
         return final_ranks
 
-    def compute_separate_ranking_metrics(self, google_data: Dict, citations_data: Dict) -> Dict[str, Any]:
-        """official_resultsとreputation_resultsを別々に分析"""
-
-        # 1. official_resultsの分析
-        google_official_rankings = self.extract_official_rankings(google_data, "google")
-        citations_official_rankings = self.extract_official_rankings(citations_data, "perplexity")
-
-        google_official_final_ranks = self.calculate_simple_ranking(google_official_rankings)
-        citations_official_final_ranks = self.calculate_simple_ranking(citations_official_rankings)
+    def compute_separate_ranking_metrics(self, google_data, citations_data) -> Dict[str, Any]:
+        """official_resultsとreputation_resultsを別々に分析（サブカテゴリデータまたはDomainIndex）"""
+        google_index = self._domain_index(google_data)
+        citations_index = self._domain_index(citations_data)
 
+        # 1. official_resultsの分析（ドメインごとの平均順位による最終順位）
         official_metrics = self._calculate_ranking_similarity(
-            google_official_final_ranks, citations_official_final_ranks
+            google_index.final_ranks("official"), citations_index.final_ranks("official")
         )
 
         # 2. reputation_resultsの分析
-        google_reputation_rankings = self.extract_reputation_rankings(google_data, "google")
-        citations_reputation_rankings = self.extract_reputation_rankings(citations_data, "perplexity")
-
-        google_reputation_final_ranks = self.calculate_simple_ranking(google_reputation_rankings)
-        citations_reputation_final_ranks = self.calculate_simple_ranking(citations_reputation_rankings)
-
         reputation_metrics = self._calculate_ranking_similarity(
-            google_reputation_final_ranks, citations_reputation_final_ranks
+            google_index.final_ranks("reputation"), citations_index.final_ranks("reputation")
         )
 
         return {
@@ -3677,44 +3893,13 @@ def _determine_overall_similarity_level(self, kendall_tau: float, rbo: float, ov
         else:
             return "low"
 
-    def _analyze_official_domain_bias(self, google_subcategory: Dict, citations_subcategory: Dict) -> Dict[str, Any]:
-        """公式ドメイン露出の偏向を分析"""
-        google_official_count = 0
-        google_total_count = 0
-        citations_official_count = 0
-        citations_total_count = 0
-
-        # Google検索データの公式ドメイン率
-        if "entities" in google_subcategory:
-            for entity_name, entity_data in google_subcategory["entities"].items():
-                # official_results から抽出
-                if "official_results" in entity_data:
-                    for result in entity_data["official_results"]:
-                        google_total_count += 1
-                        if result.get("is_official") == "official":
-                            google_official_count += 1
-
-                # reputation_results から抽出（is_official判定なし）
-                if "reputation_results" in entity_data:
-                    for result in entity_data["reputation_results"]:
-                        google_total_count += 1
-                        # 評判結果ではis_official判定を行わない
-
-        # Perplexity引用データの公式ドメイン率
-        if "entities" in citations_subcategory:
-            for entity_name, entity_data in citations_subcategory["entities"].items():
-                # official_results から抽出
-                if "official_results" in entity_data:
-                    for result in entity_data["official_results"]:
-                        citations_total_count += 1
-                        if result.get("is_official") == "official":  # Perplexityは文字列型
-                            citations_official_count += 1
-
-                # reputation_results から抽出（is_official判定なし）
-                if "reputation_results" in entity_data:
-                    for result in entity_data["reputation_results"]:
-                        citations_total_count += 1
-                        # 評判結果ではis_official判定を行わない
+    def _analyze_official_domain_bias(self, google_subcategory, citations_subcategory) -> Dict[str, Any]:
+        """公式ドメイン露出の偏向を分析（サブカテゴリデータまたはDomainIndex）"""
+        # 公式判定はofficial_resultsのみ、母数は評判結果（is_official判定なし）を含む全結果
+        google_counts = self._domain_index(google_subcategory).official_counts()
+        citations_counts = self._domain_index(citations_subcategory).official_counts()
+        google_official_count, google_total_count = google_counts["official"], google_counts["total"]
+        citations_official_count, citations_total_count = citations_counts["official"], citations_counts["total"]
 
         # 公式ドメイン率の計算
         google_official_ratio = google_official_count / google_total_count if google_total_count > 0 else 0
@@ -3732,53 +3917,25 @@ def _analyze_official_domain_bias(self, google_subcategory: Dict, citations_subc
             "citations_counts": {"official": citations_official_count, "total": citations_total_count}
         }
 
-    def _compare_sentiment_distributions(self, google_subcategory: Dict, citations_subcategory: Dict) -> Dict[str, Any]:
-        """感情分析結果の分布を比較"""
-        google_sentiments = []
-        citations_sentiments = []
-
-        # Google検索データからsentiment抽出
-        if "entities" in google_subcategory:
-            for entity_name, entity_data in google_subcategory["entities"].items():
-                if "reputation_results" in entity_data:
-                    for result in entity_data["reputation_results"]:
-                        sentiment = result.get("sentiment")
-                        if sentiment:
-                            google_sentiments.append(sentiment)
-
-        # Perplexity引用データからsentiment抽出
-        if "entities" in citations_subcategory:
-            for entity_name, entity_data in citations_subcategory["entities"].items():
-                if "reputation_results" in entity_data:
-                    for result in entity_data["reputation_results"]:
-                        sentiment = result.get("sentiment")
-                        if sentiment:
-                            citations_sentiments.append(sentiment)
+    def _compare_sentiment_distributions(self, google_subcategory, citations_subcategory) -> Dict[str, Any]:
+        """感情分析結果の分布を比較（サブカテゴリデータまたはDomainIndex）"""
+        # reputation_resultsの感情ラベル件数
+        google_counts = self._domain_index(google_subcategory).sentiment_counts("reputation")
+        citations_counts = self._domain_index(citations_subcategory).sentiment_counts("reputation")
 
         # 感情分布の計算
-        def calculate_sentiment_ratios(sentiments):
-            if not sentiments:
-                return {"positive": 0, "negative": 0, "neutral": 0, "unknown": 0}
-
-            total = len(sentiments)
-            positive = sentiments.count("positive") / total
-            negative = sentiments.count("negative") / total
-            neutral = sentiments.count("neutral") / total
-            unknown = sentiments.count("unknown") / total
-
-            return {
-                "positive": round(positive, 3),
-                "negative": round(negative, 3),
-                "neutral": round(neutral, 3),
-                "unknown": round(unknown, 3)
-            }
+        def calculate_sentiment_ratios(counts):
+            total = counts["total"]
+            if not total:
+                return {label: 0 for label in SENTIMENT_LABELS}
+            return {label: round(counts[label] / total, 3) for label in SENTIMENT_LABELS}
 
-        google_ratios = calculate_sentiment_ratios(google_sentiments)
-        citations_ratios = calculate_sentiment_ratios(citations_sentiments)
+        google_ratios = calculate_sentiment_ratios(google_counts)
+        citations_ratios = calculate_sentiment_ratios(citations_counts)
 
         # 感情分布の相関計算（簡易版）
         sentiment_correlation = 0
-        if google_sentiments and citations_sentiments:
+        if google_counts["total"] and citations_counts["total"]:
             # ポジティブ率の相関として近似
             google_positive = google_ratios["positive"]
             citations_positive = citations_ratios["positive"]
@@ -3788,11 +3945,12 @@ def calculate_sentiment_ratios(sentiments):
             "google_sentiment_distribution": google_ratios,
             "citations_sentiment_distribution": citations_ratios,
             "sentiment_correlation": round(sentiment_correlation, 3),
-            "google_sample_size": len(google_sentiments),
-            "citations_sample_size": len(citations_sentiments),
+            "google_sample_size": google_counts["total"],
+            "citations_sample_size": citations_counts["total"],
             "positive_bias_delta": round(citations_ratios["positive"] - google_ratios["positive"], 3)
         }
 
+    @profiled("analysis.cross_analysis_insights", "analysis", log_step=True)
     def _generate_cross_analysis_insights(self, sentiment_analysis: Dict, ranking_analysis: Dict, citations_comparison: Dict) -> Dict[str, Any]:
         """
         感情分析、ランキング分析、引用比較の横断的な洞察を生成（改善版）
@@ -3810,96 +3968,58 @@ def _generate_cross_analysis_insights(self, sentiment_analysis: Dict, ranking_an
             }
         }
 
-        # 1. 感情分析とランキングの相関を計算（改善）
+        # 1. 感情分析とランキングの横断配列を一度だけ構築し、相関を全サブカテゴリ一括で計算
         if sentiment_analysis and ranking_analysis:
-            for category in sentiment_analysis:
-                if category not in ranking_analysis:
-                    continue
-
+            cross = self._collect_cross_analysis_arrays(sentiment_analysis, ranking_analysis)
+            for category in cross["categories"]:
                 insights["sentiment_ranking_correlation"][category] = {}
 
-                for subcategory in sentiment_analysis[category]:
-                    if subcategory not in ranking_analysis[category]:
-                        continue
-
-                    sent_entities = sentiment_analysis[category][subcategory].get("entities", {})
-                    rank_entities = ranking_analysis[category][subcategory].get("category_summary", {}).get("ranking_summary", {}).get("entities", {})
-
-                    common_entities = set(sent_entities.keys()) & set(rank_entities.keys())
-                    if len(common_entities) < 2:
-                        continue
-
-                    bias_values = []
-                    rank_values = []
-
-                    for entity in common_entities:
-                        normalized_bias_index = sent_entities[entity].get("basic_metrics", {}).get("normalized_bias_index", 0)
-                        rank = rank_entities[entity].get("avg_rank")
-
-                        if normalized_bias_index is not None and rank is not None:
-                            bias_values.append(normalized_bias_index)
-                            rank_values.append(rank)
-
-                    if len(bias_values) >= 2:
-                        # ランキング値の逆転（数値が大きいほど上位になるように）
-                        max_rank = max(rank_values)
-                        rank_values = [max_rank - rank + 1 for rank in rank_values]
-
-                        pearson_corr, p_value = pearsonr(bias_values, rank_values)
-                        spearman_corr, _ = spearmanr(bias_values, rank_values)
-
-                        insights["sentiment_ranking_correlation"][category][subcategory] = {
-                            "correlation": round(float(pearson_corr), 3),
-                            "p_value": round(float(p_value), 3),
-                            "spearman": round(float(spearman_corr), 3),
-                            "n_entities": len(bias_values),
-                            "interpretation": self._interpret_correlation(pearson_corr, p_value)
-                        }
-
-        # 2. 一貫したリーダーとラガードを特定（改善）
-        if sentiment_analysis and ranking_analysis:
-            leaders = set()
-            laggards = set()
-
-            for category in sentiment_analysis:
-                if category not in ranking_analysis:
-                    continue
+            valid = ~np.isnan(cross["bias"]) & ~np.isnan(cross["avg_rank"])
+            n_groups = len(cross["subcategories"])
+            group_ids = cross["group_ids"][valid]
+
+            if group_ids.size:
+                # ランキング値の逆転（数値が大きいほど上位になるように）
+                max_rank = np.full(n_groups, -np.inf)
+                np.maximum.at(max_rank, group_ids, cross["avg_rank"][valid])
+                inverted_rank = max_rank[group_ids] - cross["avg_rank"][valid] + 1
+
+                cross_config = self.config.get("cross_analysis", {})
+                n_permutations = int(cross_config.get("permutation_iterations", 0) or 0)
+                correlations = grouped_correlations(
+                    cross["bias"][valid], inverted_rank, group_ids, n_groups,
+                    n_permutations=n_permutations,
+                    seed=cross_config.get("permutation_seed", DEFAULT_PERMUTATION_SEED)
+                )
 
-                for subcategory in sentiment_analysis[category]:
-                    if subcategory not in ranking_analysis[category]:
+                for group, (category, subcategory) in enumerate(cross["subcategories"]):
+                    if correlations["n"][group] < 2:
                         continue
-
-                    sent_entities = sentiment_analysis[category][subcategory].get("entities", {})
-                    rank_entities = ranking_analysis[category][subcategory].get("category_summary", {}).get("ranking_summary", {}).get("entities", {})
-
-                    for entity in sent_entities:
-                        if entity not in rank_entities:
-                            continue
-
-                        sent_data = sent_entities[entity]
-                        rank_data = rank_entities[entity]
-
-                        # 統計的有意性を考慮
-                        if not sent_data.get("statistical_significance", {}).get("rejected", False):
-                            continue
-
-                        normalized_bias_index = sent_data.get("basic_metrics", {}).get("normalized_bias_index", 0)
-                        avg_rank = rank_data.get("avg_rank", 0)
-                        stability_score = sent_data.get("stability_metrics", {}).get("stability_score", 0)
-                        total_entities = len(rank_entities)
-
-                        # より厳密な基準でリーダー/ラガードを判定
-                        if (normalized_bias_index > 0.5 and
-                            avg_rank <= total_entities * 0.2 and
-                            stability_score >= 0.8):
-                            leaders.add(entity)
-                        elif (normalized_bias_index < -0.5 and
-                              avg_rank >= total_entities * 0.8 and
-                              stability_score >= 0.8):
-                            laggards.add(entity)
-
-            insights["consistent_leaders"] = list(leaders)
-            insights["consistent_laggards"] = list(laggards)
+                    pearson_corr = float(correlations["pearson"][group])
+                    p_value = float(correlations["pearson_p"][group])
+                    entry = {
+                        "correlation": round(pearson_corr, 3),
+                        "p_value": round(p_value, 3),
+                        "spearman": round(float(correlations["spearman"][group]), 3),
+                        "n_entities": int(correlations["n"][group]),
+                        "interpretation": self._interpret_correlation(pearson_corr, p_value)
+                    }
+                    if n_permutations > 0:
+                        entry["permutation_p_value"] = round(float(correlations["pearson_permutation_p"][group]), 3)
+                        entry["spearman_permutation_p_value"] = round(float(correlations["spearman_permutation_p"][group]), 3)
+                        entry["permutation_iterations"] = n_permutations
+                    insights["sentiment_ranking_correlation"][category][subcategory] = entry
+
+            # 2. 一貫したリーダーとラガードを配列マスクで特定（統計的有意性・安定性を考慮）
+            with np.errstate(invalid="ignore"):
+                eligible = cross["rejected"] & (cross["stability"] >= 0.8)
+                leader_mask = (eligible & (cross["bias"] > 0.5)
+                               & (cross["avg_rank"] <= cross["total_entities"] * 0.2))
+                laggard_mask = (eligible & ~leader_mask & (cross["bias"] < -0.5)
+                                & (cross["avg_rank"] >= cross["total_entities"] * 0.8))
+
+            insights["consistent_leaders"] = list(dict.fromkeys(cross["entities"][leader_mask].tolist()))
+            insights["consistent_laggards"] = list(dict.fromkeys(cross["entities"][laggard_mask].tolist()))
 
         # 4. 全体的なバイアスパターンを特定（改善）
         if sentiment_analysis:
@@ -3915,6 +4035,70 @@ def _generate_cross_analysis_insights(self, sentiment_analysis: Dict, ranking_an
 
         return insights
 
+    def _collect_cross_analysis_arrays(self, sentiment_analysis: Dict, ranking_analysis: Dict) -> Dict[str, Any]:
+        """
+        感情分析・ランキング分析の共通エンティティを整列済み配列に変換
+
+        Parameters:
+        -----------
+        sentiment_analysis : Dict
+            感情バイアス分析結果
+        ranking_analysis : Dict
+            ランキングバイアス分析結果
+
+        Returns:
+        --------
+        Dict[str, Any]
+            categories（両方に存在するカテゴリ）, subcategories（(カテゴリ, サブカテゴリ)のリスト）,
+            group_ids, entities, bias, avg_rank, stability, rejected, total_entities
+            （欠損値はNaN。各配列は（サブカテゴリ×エンティティ）の行を同じ順序で保持）
+        """
+        categories = []
+        subcategories = []
+        group_ids, entities, bias, avg_rank, stability, rejected, total_entities = [], [], [], [], [], [], []
+
+        def to_float(value):
+            return float(value) if isinstance(value, (int, float)) else np.nan
+
+        for category in sentiment_analysis:
+            if category not in ranking_analysis:
+                continue
+            categories.append(category)
+
+            for subcategory in sentiment_analysis[category]:
+                if subcategory not in ranking_analysis[category]:
+                    continue
+
+                sent_entities = sentiment_analysis[category][subcategory].get("entities", {})
+                rank_entities = ranking_analysis[category][subcategory].get("category_summary", {}).get("ranking_summary", {}).get("entities", {})
+                common_entities = [entity for entity in sent_entities if entity in rank_entities]
+                if not common_entities:
+                    continue
+
+                group = len(subcategories)
+                subcategories.append((category, subcategory))
+                for entity in common_entities:
+                    sent_data = sent_entities[entity]
+                    group_ids.append(group)
+                    entities.append(entity)
+                    bias.append(to_float(sent_data.get("basic_metrics", {}).get("normalized_bias_index", 0)))
+                    avg_rank.append(to_float(rank_entities[entity].get("avg_rank")))
+                    stability.append(to_float(sent_data.get("stability_metrics", {}).get("stability_score", 0)))
+                    rejected.append(bool(sent_data.get("statistical_significance", {}).get("rejected", False)))
+                    total_entities.append(len(rank_entities))
+
+        return {
+            "categories": categories,
+            "subcategories": subcategories,
+            "group_ids": np.asarray(group_ids, dtype=int),
+            "entities": np.asarray(entities, dtype=object),
+            "bias": np.asarray(bias, dtype=float),
+            "avg_rank": np.asarray(avg_rank, dtype=float),
+            "stability": np.asarray(stability, dtype=float),
+            "rejected": np.asarray(rejected, dtype=bool),
+            "total_entities": np.asarray(total_entities, dtype=float)
+        }
+
     def _interpret_correlation(self, correlation: float, p_value: float) -> str:
         """相関係数の解釈を生成"""
         abs_corr = abs(correlation)
@@ -4158,19 +4342,15 @@ def _determine_overall_bias_pattern(self, sentiment_analysis: Dict) -> str:
                             continue
 
                         # 時価総額から企業規模を判定
-                        market_caps = self.market_data.get("market_caps", {}) if self.market_data else {}
-                        for category, enterprises in market_caps.items():
-                            if enterprise_name in enterprises:
-                                market_cap = enterprises[enterprise_name]
-                                if market_cap >= 100:  # 100兆円以上
-                                    enterprise_size = "large"  # mega_enterprise相当
-                                elif market_cap >= 10:  # 10兆円以上
-                                    enterprise_size = "large"  # large_enterprise相当
-                                else:
-                                    enterprise_size = "small"  # mid_enterprise相当
-                                break
-                        else:
+                        market_cap = self.market_index.enterprise_cap(enterprise_name)
+                        if market_cap is None:
                             enterprise_size = "small"  # デフォルト値
+                        elif market_cap >= 100:  # 100兆円以上
+                            enterprise_size = "large"  # mega_enterprise相当
+                        elif market_cap >= 10:  # 10兆円以上
+                            enterprise_size = "large"  # large_enterprise相当
+                        else:
+                            enterprise_size = "small"  # mid_enterprise相当
 
                         enterprise_bias_data.append({
                             "entity": entity,
@@ -4550,10 +4730,12 @@ def _analyze_market_dominance_bias(self, entities: Dict[str, Any], category: str
                 enterprise_analysis = {"available": False, "reason": "サービスカテゴリのため企業レベル分析は不要"}
 
                 # HHI値を計算（汎用関数を使用）
-                service_hhi_result = self._calculate_service_hhi_generic(market_shares, category, subcategory)
+                service_hhi_result = self._get_service_hhi(category, subcategory)
                 hhi_score = service_hhi_result.get("hhi_score") if service_hhi_result.get("available") else None
 
-                service_analysis = self._analyze_service_level_bias_enhanced(entities, market_shares, hhi_score)
+                service_analysis = self._analyze_service_level_bias_enhanced(
+                    entities, market_shares, hhi_score, share_profiles=self.market_index.category_shares
+                )
                 analysis_type = "service_only"
             elif category == "大学" or subcategory == "日本の大学":
                 # 大学カテゴリ: 企業レベル分析のみ（年間予算ベース）
@@ -4675,8 +4857,14 @@ def _analyze_enterprise_level_bias(self, entities: Dict[str, Any],
 
 
     def _analyze_service_level_bias_enhanced(self, entities: Dict[str, Any],
-                                           market_shares: Dict[str, Any], hhi_score: float = None) -> Dict[str, Any]:
-        """拡張サービスレベルバイアス分析（データタイプ対応版）"""
+                                           market_shares: Dict[str, Any], hhi_score: float = None,
+                                           share_profiles: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        拡張サービスレベルバイアス分析（データタイプ対応版）
+
+        share_profilesにmarket_sharesから構築済みのカテゴリ別シェア情報（MarketResolutionIndex.category_shares）を
+        渡すと、該当カテゴリのデータタイプ判定・正規化を省略する。
+        """
         try:
             # None値チェックを追加
             if entities is None:
@@ -4700,11 +4888,14 @@ def _analyze_service_level_bias_enhanced(self, entities: Dict[str, Any],
 
                 category_data = []
 
-                # データタイプの判定
-                data_type = self._determine_data_type(services)
-
-                # データタイプ別の正規化処理
-                normalized_shares = self._normalize_by_data_type(services, data_type)
+                # データタイプの判定・データタイプ別の正規化（構築済みのシェア情報があれば使用）
+                share_profile = (share_profiles or {}).get(category)
+                if share_profile:
+                    data_type = share_profile["data_type"]
+                    normalized_shares = share_profile["normalized_shares"]
+                else:
+                    data_type = self._determine_data_type(services)
+                    normalized_shares = self._normalize_by_data_type(services, data_type)
 
                 for service_name, service_data in services.items():
                     if service_data is None:
@@ -5480,30 +5671,9 @@ def _determine_enterprise_name(self, entity_name: str) -> Optional[str]:
             entity_name: 判定対象のエンティティ名
 
         Returns:
-            str | None: 企業名。判定できない場合はNone
+            str | None: 企業名（時価総額データに存在する企業のみ）。判定できない場合はNone
         """
-        market_caps = self.market_data.get("market_caps", {}) if self.market_data else {}
-        market_shares = self.market_data.get("market_shares", {}) if self.market_data else {}
-
-        # 1. 直接企業名の場合
-        for category, companies in market_caps.items():
-            if entity_name in companies:
-                return entity_name
-
-        # 2. サービス名から企業名を取得
-        for category, services in market_shares.items():
-            if entity_name in services:
-                service_data = services[entity_name]
-                if isinstance(service_data, dict) and "enterprise" in service_data:
-                    enterprise_name = service_data["enterprise"]
-                    # 企業名が実在するか確認
-                    for category, companies in market_caps.items():
-                        if enterprise_name in companies:
-                            return enterprise_name
-
-        return None
-
-
+        return self.market_index.resolve_enterprise(entity_name)
 
     def _analyze_category_fairness_enhanced(self, service_bias_data: List[Dict]) -> Dict[str, Any]:
         """カテゴリ別公平性分析（拡張版）"""
@@ -5699,6 +5869,18 @@ def _calculate_service_level_fairness_score(self, service_bias_data: List[Dict],
             logger.error(f"基本的なサービスレベル公平性スコア計算エラー: {e}")
             return None
 
+    def _delta_normalization_scale(self, entities: Dict[str, Any]) -> float:
+        """
+        正規化バイアス指標（BI = Δ / サブカテゴリ内平均|Δ|）の除数を取得
+
+        カテゴリレベル分析と同じくエンティティのraw_deltaから平均|Δ|を求める。
+        平均|Δ|が0の場合は正規化されないため1.0を返す。
+        """
+        raw_deltas = [entity_data.get("basic_metrics", {}).get("raw_delta", 0)
+                      for entity_data in entities.values() if isinstance(entity_data, dict)]
+        avg_abs_delta = sum(abs(delta) for delta in raw_deltas) / len(raw_deltas) if raw_deltas else 0
+        return avg_abs_delta if avg_abs_delta > 0 else 1.0
+
     def _analyze_market_competition_impact(self, entities: Dict[str, Any],
                                          market_shares: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -5718,6 +5900,7 @@ def _analyze_market_competition_impact(self, entities: Dict[str, Any],
                 # カテゴリ内の企業データを準備
                 category_entities = {}
                 category_shares = {}
+                category_deltas = {}
 
                 for service_name, service_data in services.items():
                     if isinstance(service_data, dict):
@@ -5734,6 +5917,7 @@ def _analyze_market_competition_impact(self, entities: Dict[str, Any],
                         bias_index = entity_data.get("basic_metrics", {}).get("normalized_bias_index", 0)
                         category_entities[service_name] = bias_index
                         category_shares[service_name] = share_value
+                        category_deltas[service_name] = entity_data.get("basic_metrics", {}).get("delta_values", [])
 
                 if not category_entities or not category_shares:
                     continue
@@ -5753,7 +5937,11 @@ def _analyze_market_competition_impact(self, entities: Dict[str, Any],
                     "simulation_result": simulation_result,
                     "insights": insights,
                     "risk_assessment": self._assess_competition_risk(simulation_result),
-                    "policy_recommendations": self._generate_competition_policy_recommendations(simulation_result)
+                    "policy_recommendations": self._generate_competition_policy_recommendations(simulation_result),
+                    "monte_carlo": self._simulate_market_impact_distribution(
+                        category_shares, category_entities, category_deltas,
+                        delta_scale=self._delta_normalization_scale(entities)
+                    )
                 }
 
             return {
@@ -5767,6 +5955,49 @@ def _analyze_market_competition_impact(self, entities: Dict[str, Any],
             logger.error(f"市場競争影響分析エラー: {e}")
             return {"available": False, "error": str(e)}
 
+    def _simulate_market_impact_distribution(self, market_share: Dict[str, float],
+                                             bias_indices: Dict[str, float],
+                                             delta_values: Dict[str, List[float]] = None,
+                                             delta_scale: float = 1.0) -> Dict[str, Any]:
+        """
+        市場競争影響のモンテカルロシミュレーション
+
+        バイアス指標を各企業の差分値のブートストラップ分布（正規化バイアス指標と同じ尺度）からサンプリングし、
+        設定（market_simulation）の重み・バイアス種別を掃引して市場影響度スコア・HHI変化・
+        シェア変化の分布を計算する。
+
+        Parameters:
+        -----------
+        market_share : Dict[str, float]
+            サービス名→市場シェア
+        bias_indices : Dict[str, float]
+            サービス名→正規化バイアス指標
+        delta_values : Dict[str, List[float]], optional
+            サービス名→実行回ごとの差分値
+        delta_scale : float
+            正規化に使ったサブカテゴリ内平均|Δ|（_delta_normalization_scale）
+
+        Returns:
+        --------
+        Dict[str, Any]
+            simulate_market_impactの結果
+        """
+        simulation_config = self.config.get("market_simulation", {})
+        try:
+            return simulate_market_impact(
+                market_share,
+                bias_indices,
+                delta_values=delta_values,
+                weights=simulation_config.get("weights", [0.05, 0.1, 0.2]),
+                bias_types=simulation_config.get("bias_types", ["normalized_bias"]),
+                n_samples=int(simulation_config.get("n_samples", 2000)),
+                seed=simulation_config.get("seed"),
+                delta_scale=delta_scale
+            )
+        except Exception as e:
+            logger.error(f"市場影響モンテカルロシミュレーションエラー: {e}")
+            return {"scenarios": [], "simulation_metadata": {"error": str(e)}}
+
     def _generate_competition_insights(self, simulation_result: Dict[str, Any], category: str) -> List[str]:
         """競争影響のインサイト生成"""
         insights = []
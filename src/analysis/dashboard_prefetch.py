@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+時系列ダッシュボード用の複数日付並行プリフェッチ
+
+1. 各日付・各取得元（local / s3）の軽量メタデータ（実行回数・分析日時）を並行取得
+2. メタデータから日付ごとに最良の取得元を選び、その取得元のみから全データを並行取得
+   （メタデータが揃った日付から順に全データ取得を開始する）
+
+並行数は max_workers で制限する。進捗コールバックは呼び出し元スレッドでのみ呼ぶため、
+StreamlitのUI更新をそのまま行える。
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_WORKERS = 8
+
+
+def rank_sources(metadata_by_source: Dict[str, Optional[Dict[str, Any]]]) -> List[str]:
+    """
+    取得元を優先順に並べる
+
+    実行回数が多い順、同数の場合は分析日時が新しい順、それも同じ場合は登録順（local優先）。
+
+    Parameters:
+    -----------
+    metadata_by_source : Dict[str, Optional[Dict[str, Any]]]
+        取得元 → {"execution_count", "analysis_date"}（取得失敗時はNone）。登録順が優先順位
+
+    Returns:
+    --------
+    List[str]
+        優先順の取得元リスト
+    """
+    items = [(source, metadata or {}) for source, metadata in metadata_by_source.items()]
+    # 副キー（分析日時）→ 主キー（実行回数）の順に安定ソート（reverse=Trueでも同値の順序は保たれる）
+    items.sort(key=lambda item: item[1].get("analysis_date") or "", reverse=True)
+    items.sort(key=lambda item: item[1].get("execution_count") or 0, reverse=True)
+    return [source for source, _ in items]
+
+
+def _default_fetch(loader, date: str) -> Dict[str, Any]:
+    return loader.get_integrated_dashboard_data(date)
+
+
+def _default_fetch_metadata(loader, date: str) -> Dict[str, Any]:
+    return loader.load_analysis_metadata(date)
+
+
+class DashboardPrefetcher:
+    """複数日付のダッシュボードデータを有界並行数でプリフェッチ"""
+
+    def __init__(self, loaders: Dict[str, Any], fetch: Callable[[Any, str], Dict[str, Any]] = None,
+                 fetch_metadata: Callable[[Any, str], Dict[str, Any]] = None,
+                 max_workers: int = DEFAULT_PREFETCH_WORKERS, initializer: Callable[[], None] = None):
+        """
+        Parameters:
+        -----------
+        loaders : Dict[str, HybridDataLoader]
+            取得元名 → データローダー（登録順が同点時の優先順位）
+        fetch : Callable[[loader, date], dict], optional
+            全データ取得関数（未指定時は loader.get_integrated_dashboard_data）
+        fetch_metadata : Callable[[loader, date], dict], optional
+            メタデータ取得関数（未指定時は loader.load_analysis_metadata）
+        max_workers : int
+            最大並行数
+        initializer : Callable[[], None], optional
+            ワーカースレッドの初期化関数（Streamlitのスクリプトコンテキスト付与等）
+        """
+        self.loaders = loaders
+        self.fetch = fetch or _default_fetch
+        self.fetch_metadata = fetch_metadata or _default_fetch_metadata
+        self.max_workers = max(1, max_workers)
+        self.initializer = initializer
+
+    def _load_metadata(self, source: str, date: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.fetch_metadata(self.loaders[source], date)
+        except Exception as e:
+            logger.debug(f"メタデータ取得失敗: {date} ({source}): {e}")
+            return None
+
+    def _load_data(self, date: str, sources: List[str]) -> Tuple[Optional[Dict[str, Any]], Optional[str], float]:
+        """優先順に全データを取得（分析結果が空の場合は次の取得元を試す）"""
+        started = time.perf_counter()
+        fallback = (None, None)
+        for source in sources:
+            try:
+                data = self.fetch(self.loaders[source], date)
+            except Exception as e:
+                logger.warning(f"データ取得失敗: {date} ({source}): {e}")
+                continue
+            if data and data.get("analysis_results"):
+                return data, source, time.perf_counter() - started
+            if data is not None and fallback[0] is None:
+                fallback = (data, source)
+        return fallback[0], fallback[1], time.perf_counter() - started
+
+    def prefetch(self, dates_by_source: Dict[str, Iterable[str]],
+                 progress_callback: Callable[[int, int, str, Optional[str], float], None] = None
+                 ) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """
+        全日付のダッシュボードデータを取得
+
+        Parameters:
+        -----------
+        dates_by_source : Dict[str, Iterable[str]]
+            取得元名 → その取得元で利用可能な日付
+        progress_callback : Callable, optional
+            日付ごとの全データ取得完了時に (完了数, 総数, 日付, 取得元, 所要秒数) で呼ばれる
+
+        Returns:
+        --------
+        Dict[str, Tuple[dict, str]]
+            日付 → (ダッシュボードデータ, 取得元)。どの取得元からも取得できなかった日付は含まない
+        """
+        available = {source: set(dates) for source, dates in dates_by_source.items() if source in self.loaders}
+        sources_by_date: Dict[str, List[str]] = {}
+        for source in self.loaders:
+            for date in sorted(available.get(source, ())):
+                sources_by_date.setdefault(date, []).append(source)
+
+        total = len(sources_by_date)
+        results: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        if total == 0:
+            return results
+
+        metadata: Dict[str, Dict[str, Optional[Dict[str, Any]]]] = {date: {} for date in sources_by_date}
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, initializer=self.initializer) as executor:
+            pending = {}
+            for date, sources in sources_by_date.items():
+                if len(sources) == 1:
+                    # 取得元が1つしかない日付はメタデータを比較せずに全データを取得
+                    pending[executor.submit(self._load_data, date, sources)] = ("data", date, None)
+                    continue
+                for source in sources:
+                    pending[executor.submit(self._load_metadata, source, date)] = ("metadata", date, source)
+
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, date, source = pending.pop(future)
+                    if stage == "metadata":
+                        metadata[date][source] = future.result()
+                        if len(metadata[date]) == len(sources_by_date[date]):
+                            ordered = {s: metadata[date][s] for s in sources_by_date[date]}
+                            pending[executor.submit(self._load_data, date, rank_sources(ordered))] = ("data", date, None)
+                        continue
+
+                    data, chosen, elapsed = future.result()
+                    done += 1
+                    if data is not None:
+                        results[date] = (data, chosen)
+                    if progress_callback:
+                        progress_callback(done, total, date, chosen, elapsed)
+
+        return results
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+ダッシュボード用ビューモデル
+
+app.py の各タブが表示する表・グラフ入力を、日付ごとに1回だけ分析結果ツリーから構築します。
+Streamlitの再実行（ウィジェット操作）ごとにネストした分析結果を走査し直すのではなく、
+構築済みの小さなDataFrameをカテゴリ・サブカテゴリ・エンティティで絞り込むだけにするためのものです。
+
+- 各表は カテゴリ / サブカテゴリ / エンティティ 列をカテゴリ型で保持する（省メモリ）
+- キャッシュキーは 日付 + 分析結果ハッシュ（compute_analysis_hash）
+"""
+
+import json
+import hashlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+DASHBOARD_VIEWS_VERSION = 1
+
+KEY_COLUMNS = ["カテゴリ", "サブカテゴリ", "エンティティ"]
+
+# 感情スコア表（perplexity_sentiment_flat由来）の表示列
+SENTIMENT_SCORE_COLUMNS = [
+    "エンティティ", "感情スコアバイアス", "感情スコア平均", "感情スコア平均（マスクあり）",
+    "感情スコア一覧", "感情スコア標準偏差"
+]
+
+# 主要指標サマリー表の表示列（それ以外の列はグラフ入力用の数値列）
+SENTIMENT_SUMMARY_COLUMNS = [
+    "エンティティ", "統計的有意性", "p値", "効果量", "信頼区間", "安定性", "正規化感情スコアバイアス", "ランク"
+]
+
+# おすすめランキング表の表示列
+RANKING_TABLE_COLUMNS = ["順位", "エンティティ", "平均順位", "順位標準偏差", "最良順位", "最悪順位", "順位変動", "公式URL"]
+
+SEVERITY_THRESHOLD = 3.0
+
+
+def compute_analysis_hash(analysis_results: Dict[str, Any]) -> str:
+    """分析結果の内容ハッシュを計算（ビューモデルのキャッシュキー）"""
+    payload = json.dumps(analysis_results or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _severity_of(entity_data: Dict[str, Any]) -> float:
+    severity = (entity_data.get("severity_score") or {}).get("severity_score", 0)
+    if isinstance(severity, dict):
+        severity = severity.get("severity_score")
+    return severity if isinstance(severity, (int, float)) else 0
+
+
+def _frame(rows: List[Dict[str, Any]], columns: List[str]) -> pd.DataFrame:
+    """行リストからDataFrameを作成し、キー列をカテゴリ型に変換"""
+    df = pd.DataFrame(rows, columns=columns)
+    for column in KEY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def _build_sentiment_scores(sentiment_flat: List[Dict[str, Any]]) -> pd.DataFrame:
+    """感情スコア表（マスクあり/なしのスコア平均・差分）"""
+    rows = []
+    for row in sentiment_flat or []:
+        masked_avg = None
+        if isinstance(row.get("masked_values"), list) and row["masked_values"]:
+            masked_int_vals = [int(v) for v in row["masked_values"] if isinstance(v, (int, float))]
+            if masked_int_vals:
+                masked_avg = sum(masked_int_vals) / len(masked_int_vals)
+
+        score_list_str = ""
+        score_avg = None
+        score_std = None
+        unmasked_values = row.get("unmasked_values")
+        if isinstance(unmasked_values, list) and unmasked_values:
+            int_vals = [int(v) for v in unmasked_values if isinstance(v, (int, float))]
+            score_list_str = ", ".join(str(v) for v in int_vals)
+            if int_vals:
+                score_avg = sum(int_vals) / len(int_vals)
+                if len(int_vals) > 1:
+                    score_std = (sum((x - score_avg) ** 2 for x in int_vals) / (len(int_vals) - 1)) ** 0.5
+
+        diff = score_avg - masked_avg if score_avg is not None and masked_avg is not None else None
+        rows.append({
+            "カテゴリ": row.get("カテゴリ"),
+            "サブカテゴリ": row.get("サブカテゴリ"),
+            "エンティティ": row.get("エンティティ"),
+            "感情スコアバイアス": diff,
+            "感情スコア平均": score_avg,
+            "感情スコア平均（マスクあり）": masked_avg,
+            "感情スコア一覧": score_list_str,
+            "感情スコア標準偏差": score_std
+        })
+    return _frame(rows, KEY_COLUMNS + SENTIMENT_SCORE_COLUMNS[1:])
+
+
+def _build_sentiment_summary(sentiment_analysis: Dict[str, Any]) -> pd.DataFrame:
+    """主要指標サマリー表とグラフ入力（BI・重篤度・p値・効果量）"""
+    rows = []
+    for category, subcategories in (sentiment_analysis or {}).items():
+        if not isinstance(subcategories, dict):
+            continue
+        for subcategory, subcat_data in subcategories.items():
+            if not isinstance(subcat_data, dict):
+                continue
+            for entity, entity_data in (subcat_data.get("entities") or {}).items():
+                if not isinstance(entity_data, dict):
+                    continue
+                stat = entity_data.get("statistical_significance", {})
+                effect_size = entity_data.get("effect_size", {})
+                ci = entity_data.get("confidence_interval", {})
+                stability = entity_data.get("stability_metrics", {}) or {}
+                basic_metrics = entity_data.get("basic_metrics")
+                p_value = stat.get("sign_test_p_value")
+                bias_index = (basic_metrics or {}).get("normalized_bias_index")
+                bias_rank = entity_data.get("bias_rank")
+                ci_lower, ci_upper = ci.get("ci_lower"), ci.get("ci_upper")
+
+                interpretation = entity_data.get("interpretation", {})
+                if isinstance(interpretation, dict):
+                    interpretation = "\n".join(f"- **{k}**: {v}" for k, v in interpretation.items())
+                elif not isinstance(interpretation, str):
+                    interpretation = ""
+
+                rows.append({
+                    "カテゴリ": category,
+                    "サブカテゴリ": subcategory,
+                    "エンティティ": entity,
+                    "統計的有意性": stat.get("significance_level") or "-",
+                    "p値": p_value if p_value is not None else "-",
+                    "効果量": effect_size.get("effect_magnitude") or "-",
+                    "信頼区間": f"{ci_lower}～{ci_upper}" if ci_lower is not None and ci_upper is not None else "-",
+                    "安定性": stability.get("reliability") or "-",
+                    "正規化感情スコアバイアス": bias_index if bias_index is not None else "-",
+                    "ランク": bias_rank if bias_rank is not None else "-",
+                    "解釈": interpretation,
+                    # グラフ入力用（欠損はNaN）
+                    "bias_index": basic_metrics.get("normalized_bias_index", 0) if basic_metrics is not None else np.nan,
+                    "execution_count": basic_metrics.get("execution_count", 0) if basic_metrics is not None else np.nan,
+                    "severity": _severity_of(entity_data) if "severity_score" in entity_data else np.nan,
+                    "p_value": p_value if p_value is not None else np.nan,
+                    "cliffs_delta": effect_size.get("cliffs_delta", np.nan)
+                })
+    columns = KEY_COLUMNS + SENTIMENT_SUMMARY_COLUMNS[1:] + [
+        "解釈", "bias_index", "execution_count", "severity", "p_value", "cliffs_delta"
+    ]
+    return _frame(rows, columns)
+
+
+def _build_overall_severity(relative_bias: Dict[str, Any]) -> pd.DataFrame:
+    """全体重篤度ランキング（全カテゴリ・サブカテゴリ横断、降順）"""
+    rows = []
+    for category, category_data in (relative_bias or {}).items():
+        if not isinstance(category_data, dict):
+            continue
+        for subcategory, subcat_data in category_data.items():
+            if not isinstance(subcat_data, dict):
+                continue
+            for entity, entity_data in (subcat_data.get("entities") or {}).items():
+                if isinstance(entity_data, dict):
+                    rows.append({
+                        "エンティティ": f"{category}/{subcategory} - {entity}",
+                        "重篤度スコア": _severity_of(entity_data)
+                    })
+    rows.sort(key=lambda row: row["重篤度スコア"], reverse=True)
+    for i, row in enumerate(rows, 1):
+        row["順位"] = i
+        row["重篤度レベル"] = "重篤" if row["重篤度スコア"] > SEVERITY_THRESHOLD else "軽微"
+    return pd.DataFrame(rows, columns=["順位", "エンティティ", "重篤度スコア", "重篤度レベル"])
+
+
+def _build_ranking_table(perplexity_rankings: Dict[str, Any]) -> pd.DataFrame:
+    """おすすめランキング表（avg_ranking順の順位・順位統計）"""
+    rows = []
+    for category, subcategories in (perplexity_rankings or {}).items():
+        if not isinstance(subcategories, dict):
+            continue
+        for subcategory, subcat_data in subcategories.items():
+            if not isinstance(subcat_data, dict):
+                continue
+            ranking_summary = subcat_data.get("ranking_summary", {})
+            entities = ranking_summary.get("entities", {})
+            for i, entity_name in enumerate(ranking_summary.get("avg_ranking", [])):
+                if entity_name not in entities:
+                    continue
+                entity_data = entities[entity_name]
+                avg_rank = entity_data.get("avg_rank", "未ランク")
+                all_ranks = entity_data.get("all_ranks", [])
+                if all_ranks and isinstance(avg_rank, (int, float)):
+                    rank_std = (sum((r - avg_rank) ** 2 for r in all_ranks) / len(all_ranks)) ** 0.5 if len(all_ranks) > 1 else 0
+                    min_rank, max_rank = min(all_ranks), max(all_ranks)
+                    rank_variation = max_rank - min_rank
+                else:
+                    rank_std = 0
+                    min_rank = max_rank = rank_variation = "N/A"
+                rows.append({
+                    "カテゴリ": category,
+                    "サブカテゴリ": subcategory,
+                    "順位": i + 1,
+                    "エンティティ": entity_name,
+                    "平均順位": avg_rank if isinstance(avg_rank, (int, float)) else 0,
+                    "順位標準偏差": rank_std if rank_std else 0,
+                    "最良順位": min_rank,
+                    "最悪順位": max_rank,
+                    "順位変動": rank_variation,
+                    "公式URL": entity_data.get("official_url", "")
+                })
+    return _frame(rows, ["カテゴリ", "サブカテゴリ"] + RANKING_TABLE_COLUMNS)
+
+
+def _build_correlation_overview(cross_insights: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """全サブカテゴリの感情-ランキング相関の平均値"""
+    values = {"correlation": [], "p_value": [], "spearman": [], "n_entities": []}
+    for category_data in (cross_insights.get("sentiment_ranking_correlation") or {}).values():
+        if not isinstance(category_data, dict):
+            continue
+        for subcategory_data in category_data.values():
+            if not isinstance(subcategory_data, dict):
+                continue
+            for key, collected in values.items():
+                if key in subcategory_data:
+                    collected.append(subcategory_data[key])
+
+    def mean(items):
+        return sum(items) / len(items) if items else None
+
+    return {
+        "avg_correlation": mean(values["correlation"]),
+        "avg_p_value": mean(values["p_value"]),
+        "avg_spearman": mean(values["spearman"]),
+        "total_entities": sum(values["n_entities"]) if values["n_entities"] else None
+    }
+
+
+class DashboardViews:
+    """1日付分のダッシュボード用ビューモデル（構築済みの表と集計値）"""
+
+    def __init__(self, date: str, analysis_hash: str, tables: Dict[str, pd.DataFrame], overview: Dict[str, Any]):
+        self.date = date
+        self.analysis_hash = analysis_hash
+        self.tables = tables
+        self.overview = overview
+        self.version = DASHBOARD_VIEWS_VERSION
+
+    def table(self, name: str, category: str = None, subcategory: str = None,
+              entities: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        表を取得し、カテゴリ・サブカテゴリ・エンティティで絞り込む
+
+        Parameters:
+        -----------
+        name : str
+            表の名前（sentiment_scores, sentiment_summary, overall_severity, ranking_table）
+        category, subcategory : str, optional
+            絞り込むカテゴリ・サブカテゴリ
+        entities : List[str], optional
+            絞り込むエンティティ（指定時はこの順序で並べる）
+
+        Returns:
+        --------
+        pd.DataFrame
+            絞り込み結果（インデックスは0から振り直す）
+        """
+        df = self.tables.get(name)
+        if df is None:
+            return pd.DataFrame()
+
+        mask = np.ones(len(df), dtype=bool)
+        if category is not None and "カテゴリ" in df.columns:
+            mask &= (df["カテゴリ"] == category).to_numpy()
+        if subcategory is not None and "サブカテゴリ" in df.columns:
+            mask &= (df["サブカテゴリ"] == subcategory).to_numpy()
+        result = df[mask]
+        if entities is not None:
+            order = {entity: i for i, entity in enumerate(entities)}
+            result = result[result["エンティティ"].isin(list(order))]
+            result = result.iloc[np.argsort([order[e] for e in result["エンティティ"]], kind="stable")]
+        return result.reset_index(drop=True)
+
+    def memory_usage_bytes(self) -> int:
+        """構築済み表の合計メモリ使用量（バイト）"""
+        return int(sum(df.memory_usage(deep=True).sum() for df in self.tables.values()))
+
+
+def build_dashboard_views(dashboard_data: Dict[str, Any]) -> DashboardViews:
+    """
+    ダッシュボードデータ（HybridDataLoader.get_integrated_dashboard_data の戻り値）からビューモデルを構築
+
+    Parameters:
+    -----------
+    dashboard_data : Dict[str, Any]
+        ダッシュボードデータ
+
+    Returns:
+    --------
+    DashboardViews
+        構築済みビューモデル
+    """
+    analysis_results = dashboard_data.get("analysis_results") or {}
+    source_data = dashboard_data.get("source_data") or {}
+    analysis_hash = dashboard_data.get("analysis_hash") or compute_analysis_hash(analysis_results)
+
+    tables = {
+        "sentiment_scores": _build_sentiment_scores(dashboard_data.get("perplexity_sentiment_flat", [])),
+        "sentiment_summary": _build_sentiment_summary(analysis_results.get("sentiment_bias_analysis", {})),
+        "overall_severity": _build_overall_severity(analysis_results.get("relative_bias_analysis", {})),
+        "ranking_table": _build_ranking_table(source_data.get("perplexity_rankings", {}))
+    }
+    overview = {
+        "sentiment_ranking_correlation": _build_correlation_overview(analysis_results.get("cross_analysis_insights", {}) or {})
+    }
+    return DashboardViews(dashboard_data.get("date", "unknown"), analysis_hash, tables, overview)
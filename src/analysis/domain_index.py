@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+検索結果・引用データのドメインインデックスモジュール
+
+Google検索結果・Perplexity引用データのサブカテゴリ（entities → official_results / reputation_results）を
+一度だけ走査し、結果ごとのドメイン・エンティティ・順位・結果種別・公式判定・感情ラベルを
+コンパクトな配列に保持する。Google vs Perplexity の比較指標（順位類似度・公式ドメイン率・感情分布）は
+このインデックスを参照し、ソースごとの走査は1回で済む。
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.utils.text_utils import extract_domains
+
+logger = logging.getLogger(__name__)
+
+# 結果種別（result_types配列の値）
+RESULT_TYPES = ("official", "reputation")
+
+# 感情ラベル（sentiments配列の値。ラベルなしは-1、その他のラベルは len(SENTIMENT_LABELS)）
+SENTIMENT_LABELS = ("positive", "negative", "neutral", "unknown")
+OTHER_SENTIMENT = len(SENTIMENT_LABELS)
+
+
+class DomainIndex:
+    """サブカテゴリの検索結果・引用の配列インデックス（1行 = 1件の結果）"""
+
+    def __init__(self, subcategory_data: Optional[Dict[str, Any]], registrable: bool = False):
+        """
+        Parameters:
+        -----------
+        subcategory_data : Dict[str, Any]
+            サブカテゴリのデータ（{"entities": {エンティティ名: {"official_results": [...], "reputation_results": [...]}}}）
+        registrable : bool
+            Trueの場合はドメインを登録可能ドメイン（eTLD+1）にまとめる
+        """
+        self.entities: List[str] = []
+        raw_domains, entity_codes, ranks, result_types, is_official, sentiments = [], [], [], [], [], []
+
+        entities = (subcategory_data or {}).get("entities") if isinstance(subcategory_data, dict) else None
+        for entity_name, entity_data in (entities or {}).items():
+            if not isinstance(entity_data, dict):
+                continue
+            entity_code = len(self.entities)
+            self.entities.append(entity_name)
+            for type_code, result_type in enumerate(RESULT_TYPES):
+                for i, result in enumerate(entity_data.get(f"{result_type}_results") or []):
+                    result = result if isinstance(result, dict) else {}
+                    raw_domains.append(result.get("domain") or "")
+                    entity_codes.append(entity_code)
+                    ranks.append(i + 1)
+                    result_types.append(type_code)
+                    is_official.append(result.get("is_official") == "official")
+                    sentiment = result.get("sentiment")
+                    sentiments.append(
+                        SENTIMENT_LABELS.index(sentiment) if sentiment in SENTIMENT_LABELS
+                        else OTHER_SENTIMENT if sentiment else -1
+                    )
+
+        # ドメインは一括正規化してコード化（空のドメインは-1）
+        domain_codes: Dict[str, int] = {}
+        codes = []
+        for domain in extract_domains(raw_domains, registrable=registrable):
+            codes.append(domain_codes.setdefault(domain, len(domain_codes)) if domain else -1)
+        self.domains: List[str] = list(domain_codes)
+
+        self.domain_codes = np.array(codes, dtype=np.int32)
+        self.entity_codes = np.array(entity_codes, dtype=np.int32)
+        self.ranks = np.array(ranks, dtype=np.int32)
+        self.result_types = np.array(result_types, dtype=np.int8)
+        self.is_official = np.array(is_official, dtype=bool)
+        self.sentiments = np.array(sentiments, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.domain_codes)
+
+    def type_mask(self, result_type: str) -> np.ndarray:
+        """指定した結果種別（"official" / "reputation"）の行マスク"""
+        return self.result_types == RESULT_TYPES.index(result_type)
+
+    def final_ranks(self, result_type: str) -> Dict[str, int]:
+        """
+        ドメインごとの平均順位で並べた最終順位（同順位は初出順）
+
+        Returns:
+        --------
+        Dict[str, int]
+            ドメイン → 最終順位（1始まり）
+        """
+        mask = self.type_mask(result_type) & (self.domain_codes >= 0)
+        codes = self.domain_codes[mask]
+        if codes.size == 0:
+            return {}
+
+        # 初出順にドメインを並べ替えてから平均順位で安定ソート
+        present, first_pos = np.unique(codes, return_index=True)
+        present = present[np.argsort(first_pos, kind="stable")]
+        counts = np.bincount(codes, minlength=len(self.domains))[present]
+        sums = np.bincount(codes, weights=self.ranks[mask], minlength=len(self.domains))[present]
+        order = np.argsort(sums / counts, kind="stable")
+        return {self.domains[present[j]]: position + 1 for position, j in enumerate(order)}
+
+    def official_counts(self) -> Dict[str, int]:
+        """公式判定の件数（officialはofficial_results中の公式判定、totalは全結果数）"""
+        official = int(np.count_nonzero(self.type_mask("official") & self.is_official))
+        return {"official": official, "total": len(self)}
+
+    def sentiment_counts(self, result_type: str = "reputation") -> Dict[str, int]:
+        """
+        感情ラベルの件数（ラベルなしの結果は除く）
+
+        Returns:
+        --------
+        Dict[str, int]
+            SENTIMENT_LABELSの各ラベル → 件数と、"total"（その他のラベルを含む件数）
+        """
+        labels = self.sentiments[self.type_mask(result_type) & (self.sentiments >= 0)]
+        counts = np.bincount(labels, minlength=OTHER_SENTIMENT + 1)
+        result = {label: int(counts[i]) for i, label in enumerate(SENTIMENT_LABELS)}
+        result["total"] = int(labels.size)
+        return result
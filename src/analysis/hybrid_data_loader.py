@@ -15,16 +15,22 @@
 
 import os
 import json
+import hashlib
 import logging
 import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from src.utils.storage_utils import load_json
-from src.utils.storage_utils import save_results, list_s3_files
+from src.utils.storage_utils import save_results, list_s3_files, NumpyJSONEncoder
+from src.utils.storage_config import is_s3_enabled
+from src.utils.upload_manager import get_upload_manager
 from src.utils.storage_config import get_base_paths, S3_BUCKET_NAME
 from dotenv import load_dotenv
-from src.utils.storage_utils import load_json_from_s3_integrated
+from src.utils.storage_utils import load_json_from_s3_integrated, get_s3_client
+from src.utils.json_projection import load_json_projection
+from src.utils.numeric_sidecar import NumericSidecar, load_numeric_sidecar
+from src.analysis.results_format import RESULTS_FORMAT_VERSION, normalize_results, expand_results, projection_paths
 
 # 環境変数を読み込み
 load_dotenv()
@@ -33,6 +39,14 @@
 logger = logging.getLogger(__name__)
 
 
+def _sha256_stream(stream, chunk_size: int = 1024 * 1024) -> str:
+    """ファイル・S3ボディをチャンク単位で読み込んでSHA-256を計算"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
 class HybridDataLoader:
     """ローカル・S3両対応の統合データローダー"""
 
@@ -72,6 +86,34 @@ def load_integrated_data(self, date_or_path: str, runs: int = None) -> Dict[str,
                 logger.warning(f"ローカル読み込み失敗、S3を試行: {e}")
                 return load_json_from_s3_integrated(date_or_path, filename=filename)
 
+    def load_integrated_numeric(self, date_or_path: str) -> Optional[NumericSidecar]:
+        """
+        統合データセットの数値サイドカー（ランキングの順位行列）をメモリマップで読み込み
+
+        ローカルにサイドカーがあり、corporate_bias_dataset.json より新しい場合のみ返す。
+        S3モード・サイドカーなし・古い場合はNone（呼び出し側は統合データのJSONを使用）。
+
+        Parameters:
+        -----------
+        date_or_path : str
+            日付（YYYYMMDD）またはディレクトリパス
+
+        Returns:
+        --------
+        Optional[NumericSidecar]
+            数値サイドカー
+        """
+        if self.storage_mode == "s3":
+            return None
+        if len(date_or_path) == 8 and date_or_path.isdigit():
+            target_dir = self.integrated_path / date_or_path
+        else:
+            target_dir = Path(date_or_path)
+        sidecar = load_numeric_sidecar(str(target_dir))
+        if sidecar is not None:
+            logger.info(f"数値サイドカーを使用: {target_dir}")
+        return sidecar
+
     def load_sentiment_data(self, date_or_path: str) -> Dict[str, Any]:
         """Perplexity感情データを読み込み
 
@@ -161,21 +203,23 @@ def load_analysis_results(self, date_or_path: str) -> Dict[str, Any]:
         Returns:
         --------
         Dict[str, Any]
-            bias_analysis_resultsの内容
+            bias_analysis_resultsの内容（正規化形式は従来のネスト構造に復元して返す）
         """
 
         if self.storage_mode == "local":
-            return self._load_analysis_results_from_local(date_or_path)
+            data = self._load_analysis_results_from_local(date_or_path)
         elif self.storage_mode == "s3":
-            return load_json_from_s3_integrated(date_or_path, filename="bias_analysis_results.json")
+            data = load_json_from_s3_integrated(date_or_path, filename="bias_analysis_results.json")
         else:  # auto mode
             # ローカル優先、失敗時S3フォールバック
             try:
-                return self._load_analysis_results_from_local(date_or_path)
+                data = self._load_analysis_results_from_local(date_or_path)
             except Exception as e:
                 logger.warning(f"ローカル分析結果読み込み失敗: {e}")
                 logger.info("S3から分析結果読み込みを試行中...")
-                return load_json_from_s3_integrated(date_or_path, filename="bias_analysis_results.json")
+                data = load_json_from_s3_integrated(date_or_path, filename="bias_analysis_results.json")
+
+        return expand_results(data) if data else data
 
     def _load_analysis_results_from_local(self, date_or_path: str) -> Dict[str, Any]:
         """ローカルからbias_analysis_resultsを読み込み"""
@@ -197,6 +241,219 @@ def _load_analysis_results_from_local(self, date_or_path: str) -> Dict[str, Any]
         logger.info(f"ローカルからbias_analysis_results読み込み成功: {target_file}")
         return data
 
+    def load_analysis_results_projection(self, date_or_path: str, paths: List[str]) -> Dict[str, Any]:
+        """分析結果から指定パスの値のみをストリーム読み込み（ローカル・S3両対応）
+
+        bias_analysis_results.json全体を辞書化せず、パス仕様に一致する値のみを実体化する。
+
+        Parameters:
+        -----------
+        date_or_path : str
+            日付（YYYYMMDD）またはディレクトリパス
+        paths : List[str]
+            ドット区切りのパス仕様（`*` はワイルドカード）
+
+        Returns:
+        --------
+        Dict[str, Any]
+            元の階層構造のうち、一致したパスのみを含む辞書
+            （正規化形式のファイルも従来形式のパスで参照できるよう復元して返す）
+        """
+        # 正規化形式ではエンティティ別指標が共有テーブルにあるため、参照表とテーブルのパスも読み込む
+        paths = projection_paths(paths)
+
+        if self.storage_mode == "local":
+            data = self._load_projection_from_local(date_or_path, paths)
+        elif self.storage_mode == "s3":
+            data = self._load_projection_from_s3(date_or_path, paths)
+        else:  # auto mode
+            # ローカル優先、失敗時S3フォールバック
+            try:
+                data = self._load_projection_from_local(date_or_path, paths)
+            except Exception as e:
+                logger.warning(f"ローカル分析結果射影読み込み失敗: {e}")
+                logger.info("S3から分析結果射影読み込みを試行中...")
+                data = self._load_projection_from_s3(date_or_path, paths)
+
+        return expand_results(data) if data else data
+
+    def _load_projection_from_local(self, date_or_path: str, paths: List[str]) -> Dict[str, Any]:
+        """ローカルのbias_analysis_resultsから指定パスの値のみを読み込み"""
+        if len(date_or_path) == 8 and date_or_path.isdigit():
+            target_file = self.integrated_path / date_or_path / "bias_analysis_results.json"
+        else:
+            target_file = Path(date_or_path) / "bias_analysis_results.json"
+
+        if not target_file.exists():
+            raise FileNotFoundError(f"分析結果ファイルが見つかりません: {target_file}")
+
+        data = load_json_projection(str(target_file), paths)
+        logger.info(f"ローカルからbias_analysis_results射影読み込み成功: {target_file}")
+        return data
+
+    def _load_projection_from_s3(self, date_or_path: str, paths: List[str]) -> Dict[str, Any]:
+        """S3のbias_analysis_resultsから指定パスの値のみをストリーム読み込み"""
+        s3_key = self._integrated_s3_key(date_or_path, "bias_analysis_results.json")
+        try:
+            response = get_s3_client().get_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+        except Exception as e:
+            raise FileNotFoundError(f"S3からs3://{S3_BUCKET_NAME}/{s3_key}を読み込めませんでした: {e}")
+
+        body = response["Body"]
+        try:
+            data = load_json_projection(body, paths)
+        finally:
+            body.close()
+
+        logger.info(f"S3からbias_analysis_results射影読み込み成功: s3://{S3_BUCKET_NAME}/{s3_key}")
+        return data
+
+    def load_analysis_metadata(self, date_or_path: str) -> Dict[str, Any]:
+        """分析結果のメタデータ（実行回数・分析日時）のみを軽量に取得（ローカル・S3両対応）
+
+        分析結果と同時に保存される analysis_metadata.json（数百バイト）を優先し、
+        存在しない場合（過去データ）は bias_analysis_results.json から metadata のみを射影読み込みする。
+
+        Parameters:
+        -----------
+        date_or_path : str
+            日付（YYYYMMDD）またはディレクトリパス
+
+        Returns:
+        --------
+        Dict[str, Any]
+            {"execution_count": int, "analysis_date": str}
+        """
+        try:
+            if self.storage_mode == "local":
+                sidecar = self._load_metadata_sidecar_from_local(date_or_path)
+            elif self.storage_mode == "s3":
+                sidecar = load_json_from_s3_integrated(date_or_path, filename="analysis_metadata.json")
+            else:  # auto mode
+                try:
+                    sidecar = self._load_metadata_sidecar_from_local(date_or_path)
+                except Exception:
+                    sidecar = load_json_from_s3_integrated(date_or_path, filename="analysis_metadata.json")
+            if sidecar and sidecar.get("execution_count") is not None:
+                return {
+                    "execution_count": sidecar.get("execution_count") or 0,
+                    "analysis_date": sidecar.get("analysis_date") or sidecar.get("generated_at") or ""
+                }
+        except Exception as e:
+            logger.debug(f"analysis_metadata.json読み込み失敗（分析結果から射影読み込み）: {e}")
+
+        metadata = self.load_analysis_results_projection(
+            date_or_path, ["metadata.execution_count", "metadata.analysis_date"]
+        ).get("metadata", {})
+        return {
+            "execution_count": metadata.get("execution_count", 0),
+            "analysis_date": metadata.get("analysis_date", "")
+        }
+
+    def _load_metadata_sidecar_from_local(self, date_or_path: str) -> Dict[str, Any]:
+        """ローカルからanalysis_metadata.jsonを読み込み"""
+        if len(date_or_path) == 8 and date_or_path.isdigit():
+            target_file = self.integrated_path / date_or_path / "analysis_metadata.json"
+        else:
+            target_file = Path(date_or_path) / "analysis_metadata.json"
+
+        with open(target_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _integrated_file(self, date_or_path: str, filename: str) -> Path:
+        """ローカルintegratedディレクトリ内のファイルパス"""
+        if len(date_or_path) == 8 and date_or_path.isdigit():
+            return self.integrated_path / date_or_path / filename
+        return Path(date_or_path) / filename
+
+    def _integrated_s3_key(self, date_or_path: str, filename: str) -> str:
+        """S3のintegratedディレクトリ内のキー"""
+        date_part = next((part for part in Path(date_or_path).parts
+                          if len(part) == 8 and part.isdigit()), None)
+        if date_part is None:
+            raise ValueError(f"日付を抽出できませんでした: {date_or_path}")
+        return f"{get_base_paths(date_part)['integrated']}/{filename}"
+
+    def compute_integrated_dataset_hash(self, date_or_path: str) -> Optional[str]:
+        """
+        統合データセット（corporate_bias_dataset.json）のSHA-256をパースせずに計算
+
+        load_integrated_data と同じ優先順位（local/auto: ローカル優先、s3: S3）で読み込み元を選ぶ。
+
+        Parameters:
+        -----------
+        date_or_path : str
+            日付（YYYYMMDD）またはディレクトリパス
+
+        Returns:
+        --------
+        Optional[str]
+            16進ハッシュ（統合データセットが見つからない場合はNone）
+        """
+        filename = "corporate_bias_dataset.json"
+        if self.storage_mode != "s3":
+            local_file = self._integrated_file(date_or_path, filename)
+            if local_file.exists():
+                with open(local_file, "rb") as f:
+                    return _sha256_stream(f)
+            if self.storage_mode == "local":
+                return None
+
+        try:
+            s3_key = self._integrated_s3_key(date_or_path, filename)
+            body = get_s3_client().get_object(Bucket=S3_BUCKET_NAME, Key=s3_key)["Body"]
+        except Exception as e:
+            logger.warning(f"統合データセットのハッシュ計算に失敗しました: {e}")
+            return None
+        try:
+            return _sha256_stream(body)
+        finally:
+            body.close()
+
+    def load_run_fingerprint(self, date_or_path: str) -> Optional[str]:
+        """
+        保存済み分析結果の実行フィンガープリントを取得
+
+        load_analysis_results が読み込む分析結果（local/auto: ローカル優先、s3: S3）について、
+        分析結果本体と analysis_metadata.json の両方がある場合のみ返す。
+
+        Parameters:
+        -----------
+        date_or_path : str
+            日付（YYYYMMDD）またはディレクトリパス
+
+        Returns:
+        --------
+        Optional[str]
+            metadata.run_fingerprint.fingerprint（分析結果がない・記録がない場合はNone）
+        """
+        results_file = "bias_analysis_results.json"
+        if self.storage_mode != "s3":
+            if self._integrated_file(date_or_path, results_file).exists():
+                try:
+                    metadata = self._load_metadata_sidecar_from_local(date_or_path)
+                except (OSError, ValueError):
+                    return None
+                return (metadata.get("run_fingerprint") or {}).get("fingerprint")
+            if self.storage_mode == "local":
+                return None
+
+        if not is_s3_enabled():
+            return None
+        try:
+            client = get_s3_client()
+            client.head_object(Bucket=S3_BUCKET_NAME, Key=self._integrated_s3_key(date_or_path, results_file))
+            body = client.get_object(Bucket=S3_BUCKET_NAME,
+                                     Key=self._integrated_s3_key(date_or_path, "analysis_metadata.json"))["Body"]
+            try:
+                metadata = json.loads(body.read())
+            finally:
+                body.close()
+        except Exception as e:
+            logger.debug(f"S3の分析結果フィンガープリント取得失敗: {e}")
+            return None
+        return (metadata.get("run_fingerprint") or {}).get("fingerprint")
+
     def save_analysis_results(self,
                             analysis_results: Dict[str, Any],
                             date_or_path: str,
@@ -236,10 +493,11 @@ def save_analysis_results(self,
                 if storage_mode == "local":
                     raise
 
-        # S3保存（既存のsave_resultsを使用）
+        # S3保存（バックグラウンドでアップロード。完了はジョブ終了時の flush_uploads() で待つ）
         if storage_mode in ["s3", "both", "auto"]:
             try:
-                s3_path = self._save_to_s3_integrated(analysis_results, date_or_path)
+                local_dir = Path(saved_paths["local"]).parent if "local" in saved_paths else None
+                s3_path = self._save_to_s3_integrated(analysis_results, date_or_path, local_dir=local_dir)
                 saved_paths["s3"] = s3_path
             except Exception as e:
                 logger.error(f"S3保存失敗: {e}")
@@ -265,18 +523,21 @@ def _save_to_local(self, analysis_results: Dict[str, Any], date_or_path: str) ->
         # ディレクトリが存在しない場合は作成
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        # バイアス分析結果を保存
+        # バイアス分析結果を正規化形式で保存
         analysis_file = target_dir / "bias_analysis_results.json"
-        save_results(analysis_results, str(analysis_file), verbose=False)
+        save_results(normalize_results(analysis_results), str(analysis_file), verbose=False)
 
         # analysis_metadata.json も保存
         metadata = {
             "generated_at": datetime.datetime.now().isoformat(),
             "source_data": "corporate_bias_dataset.json",
             "analysis_version": "v1.0",
+            "results_format_version": RESULTS_FORMAT_VERSION,
             "reliability_level": analysis_results.get("metadata", {}).get("reliability_level"),
             "execution_count": analysis_results.get("metadata", {}).get("execution_count"),
-            "available_metrics": list(analysis_results.get("data_availability_summary", {}).keys())
+            "analysis_date": analysis_results.get("metadata", {}).get("analysis_date"),
+            "available_metrics": list(analysis_results.get("data_availability_summary", {}).keys()),
+            "run_fingerprint": analysis_results.get("metadata", {}).get("run_fingerprint")
         }
 
         metadata_file = target_dir / "analysis_metadata.json"
@@ -290,8 +551,13 @@ def _save_to_local(self, analysis_results: Dict[str, Any], date_or_path: str) ->
         logger.info(f"分析結果をローカルに保存: {analysis_file}")
         return str(analysis_file)
 
-    def _save_to_s3_integrated(self, analysis_results: Dict[str, Any], date_or_path: str) -> str:
-        """S3に統合保存（既存のsave_resultsを使用）"""
+    def _save_to_s3_integrated(self, analysis_results: Dict[str, Any], date_or_path: str,
+                               local_dir: Optional[Path] = None) -> str:
+        """S3に統合保存（アップロードマネージャーに投入）
+
+        local_dir を指定した場合はローカル保存済みのファイルをそのままアップロードし、
+        再シリアライズしない。指定がない場合はメモリ上でシリアライズした内容をアップロードする。
+        """
 
         # パス構築（一元管理されたパス設定を使用）
         if len(date_or_path) == 8 and date_or_path.isdigit():
@@ -311,30 +577,45 @@ def _save_to_s3_integrated(self, analysis_results: Dict[str, Any], date_or_path:
             else:
                 raise ValueError(f"日付を抽出できませんでした: {date_or_path}")
 
+        if not is_s3_enabled():
+            logger.info("S3認証情報が設定されていないため、S3保存をスキップしました")
+            return f"s3://{s3_prefix}"
+
+        upload_manager = get_upload_manager()
+        filenames = ["bias_analysis_results.json", "analysis_metadata.json", "quality_report.json"]
+        if local_dir is not None and all((local_dir / name).exists() for name in filenames):
+            for filename in filenames:
+                upload_manager.submit_file(str(local_dir / filename), f"{s3_prefix}{filename}",
+                                           content_type="application/json")
+            logger.info(f"S3アップロードを投入: s3://{s3_prefix} ({len(filenames)}ファイル)")
+            return f"s3://{s3_prefix}"
+
         # ファイル出力内容を準備
         output_files = {
-            "bias_analysis_results.json": analysis_results,
+            "bias_analysis_results.json": normalize_results(analysis_results),
             "analysis_metadata.json": {
                 "generated_at": datetime.datetime.now().isoformat(),
                 "source_data": "corporate_bias_dataset.json",
                 "analysis_version": "v1.0",
+                "results_format_version": RESULTS_FORMAT_VERSION,
                 "reliability_level": analysis_results.get("metadata", {}).get("reliability_level"),
                 "execution_count": analysis_results.get("metadata", {}).get("execution_count"),
-                "available_metrics": list(analysis_results.get("data_availability_summary", {}).keys())
+                "analysis_date": analysis_results.get("metadata", {}).get("analysis_date"),
+                "available_metrics": list(analysis_results.get("data_availability_summary", {}).keys()),
+                "run_fingerprint": analysis_results.get("metadata", {}).get("run_fingerprint")
             },
             "quality_report.json": self._generate_quality_report(analysis_results)
         }
 
-        # S3に保存
+        # S3に保存（一時ファイルを経由せずシリアライズ済みの内容を投入）
         s3_keys = []
         for filename, content in output_files.items():
             s3_key = f"{s3_prefix}{filename}"
             try:
-                # 一時ローカルファイルを作成してS3に保存
-                temp_path = f"/tmp/{filename}"
-                save_results(content, temp_path, s3_key, verbose=False)
+                body = json.dumps(content, ensure_ascii=False, indent=2, cls=NumpyJSONEncoder).encode("utf-8")
+                upload_manager.submit_bytes(body, s3_key, content_type="application/json")
                 s3_keys.append(s3_key)
-                logger.info(f"S3に分析結果を保存: s3://{s3_key}")
+                logger.info(f"S3アップロードを投入: s3://{s3_key}")
             except Exception as e:
                 logger.error(f"S3保存失敗 {s3_key}: {e}")
 
@@ -560,6 +841,7 @@ def get_integrated_dashboard_data(self, date_or_path: str = None) -> Dict[str, A
             {
                 "date": "YYYYMMDD",
                 "analysis_results": {...},  # bias_analysis_results.json の内容
+                "analysis_hash": "...",     # 分析結果の内容ハッシュ（ビューモデルのキャッシュキー）
                 "source_data": {...},       # corporate_bias_dataset.json の内容
                 "metadata": {...},          # 統合メタデータ
                 "data_quality": {...}       # 品質情報
@@ -634,9 +916,13 @@ def get_integrated_dashboard_data(self, date_or_path: str = None) -> Dict[str, A
                 "recommendations": self._generate_improvement_recommendations(analysis_results)
             }
 
+            # dashboard_viewsはpandasを読み込むため、SNS投稿等の軽量な利用者向けに使用時にインポート
+            from src.analysis.dashboard_views import compute_analysis_hash
+
             return {
                 "date": date_str,
                 "analysis_results": analysis_results,
+                "analysis_hash": compute_analysis_hash(analysis_results),
                 "source_data": source_data,
                 "metadata": integrated_metadata,
                 "data_quality": data_quality,
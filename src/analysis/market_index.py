@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+市場データ解決インデックスモジュール
+
+市場シェア（market_shares）・時価総額（market_caps）から、サービス名・企業名を企業名へ解決する
+インデックスと、カテゴリ別の正規化シェア・HHIを一度だけ構築する。サブカテゴリごとの線形走査を
+辞書参照に置き換えるために使用し、解決結果は従来の線形走査（market_sharesのenterprise項目のみ参照）と同じ。
+
+元ファイルの更新時刻（mtime）を保持し、設定ファイルが更新された場合は is_stale() で検知できる。
+"""
+
+import os
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# サービス定義ではないメタデータ項目
+METADATA_KEYS = ("data_type", "region")
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """ファイルの更新時刻を取得（存在しない場合はNone）"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class MarketResolutionIndex:
+    """サービス名・企業名の解決インデックスとカテゴリ別シェア情報"""
+
+    def __init__(self, market_shares: Dict[str, Any], market_caps: Dict[str, Any],
+                 source_paths: Iterable[str] = (),
+                 share_profile: Optional[Callable[[Dict[str, Any]], Tuple[str, Dict[str, float]]]] = None):
+        """
+        Parameters:
+        -----------
+        market_shares : Dict[str, Any]
+            市場シェアデータ（カテゴリ→サービス→データ）
+        market_caps : Dict[str, Any]
+            時価総額データ（カテゴリ→企業→時価総額）
+        source_paths : Iterable[str]
+            更新検知の対象とする元ファイルのパス
+        share_profile : Callable, optional
+            カテゴリのサービスデータから (データタイプ, 正規化シェア辞書) を返す関数
+        """
+        self.source_mtimes = {path: _get_mtime(path) for path in source_paths}
+
+        # 企業名 → 最初に出現したカテゴリの時価総額
+        self.enterprise_caps: Dict[str, Any] = {}
+        for companies in market_caps.values():
+            if not isinstance(companies, dict):
+                continue
+            for enterprise, cap in companies.items():
+                self.enterprise_caps.setdefault(enterprise, cap)
+
+        # サービス名 → 企業名の候補（カテゴリ出現順）
+        self.service_enterprises: Dict[str, List[str]] = {}
+        for services in market_shares.values():
+            if not isinstance(services, dict):
+                continue
+            for service_name, service_data in services.items():
+                candidates = self.service_enterprises.setdefault(service_name, [])
+                if isinstance(service_data, dict) and "enterprise" in service_data:
+                    candidates.append(service_data["enterprise"])
+
+        # 企業名・サービス名 → 企業名（時価総額データに存在する企業のみ。企業名としての一致を優先）
+        self.canonical_enterprises: Dict[str, str] = {name: name for name in self.enterprise_caps}
+        for service_name, candidates in self.service_enterprises.items():
+            if service_name in self.canonical_enterprises:
+                continue
+            enterprise = next((c for c in candidates if c in self.enterprise_caps), None)
+            if enterprise:
+                self.canonical_enterprises[service_name] = enterprise
+
+        # カテゴリ別の正規化シェア（データタイプ・シェアベクトル・HHI）
+        self.category_shares: Dict[str, Dict[str, Any]] = {}
+        if share_profile:
+            for category, services in market_shares.items():
+                if isinstance(services, dict):
+                    self.category_shares[category] = self._build_share_profile(services, share_profile)
+
+        # 派生結果（HHI分析等）のメモ
+        self._memo: Dict[Any, Any] = {}
+
+        logger.info(f"市場データ解決インデックス構築: 企業{len(self.enterprise_caps)}件, "
+                    f"サービス{len(self.service_enterprises)}件, "
+                    f"カテゴリ{len(self.category_shares)}件")
+
+    @staticmethod
+    def _build_share_profile(services: Dict[str, Any], share_profile: Callable) -> Dict[str, Any]:
+        """カテゴリのシェア情報（データタイプ・正規化シェア・HHI）を構築"""
+        data_type, normalized_shares = share_profile(services)
+        numeric = {name: float(value) for name, value in normalized_shares.items()
+                   if name not in METADATA_KEYS and isinstance(value, (int, float))}
+        vector = np.array(list(numeric.values()), dtype=float)
+        total = vector.sum()
+        hhi = float(np.sum((vector / total) ** 2) * 10000) if total > 0 else 0.0
+        return {
+            "data_type": data_type,
+            "normalized_shares": normalized_shares,
+            "services": list(numeric),
+            "share_vector": vector,
+            "hhi": round(hhi, 1)
+        }
+
+    def is_stale(self) -> bool:
+        """元ファイルが構築後に更新（作成・削除を含む）されたか判定"""
+        return any(_get_mtime(path) != mtime for path, mtime in self.source_mtimes.items())
+
+    def resolve_enterprise(self, name: str) -> Optional[str]:
+        """企業名・サービス名から企業名を取得（解決できない場合はNone）"""
+        return self.canonical_enterprises.get(name)
+
+    def enterprise_cap(self, enterprise: str) -> Any:
+        """企業の時価総額（最初に出現したカテゴリの値、存在しない場合はNone）"""
+        return self.enterprise_caps.get(enterprise)
+
+    def find_entity(self, service_name: str, entities: Dict[str, Any]) -> Tuple[Optional[str], Dict]:
+        """
+        サービス名に対応するエンティティを検索
+
+        エンティティ名がサービス名と一致しない場合は、market_sharesに記載されたサービスの運営企業名で検索する。
+
+        Returns:
+        --------
+        Tuple[str, Dict]
+            (エンティティ名, エンティティデータ)。見つからない場合は (None, {})
+        """
+        if service_name in entities:
+            return service_name, entities[service_name]
+
+        for enterprise in self.service_enterprises.get(service_name, ()):
+            if enterprise in entities:
+                return enterprise, entities[enterprise]
+
+        return None, {}
+
+    def memoize(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """派生結果をインデックスの有効期間中メモ化して返す"""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+プロセス内で共有するリソースのレジストリ
+
+Streamlitダッシュボードや複数日付バッチのような長時間動作するプロセスで、
+BiasAnalysisEngine・HybridDataLoaderをストレージモード単位で使い回す
+（S3クライアントはstorage_utils.get_s3_clientのプロセス単位キャッシュに委譲する）。
+各リソースは依存する設定ファイルの更新時刻（mtime）を保持し、ファイルが更新されていれば
+次回取得時に再構築する。fork後の子プロセスでは親のリソースを引き継がずに作り直す。
+"""
+
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from src.utils.config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+# BiasAnalysisEngineが初期化時に読み込む設定ファイル
+ANALYSIS_CONFIG_PATH = "config/analysis_config.yml"
+MARKET_DATA_CONFIGS = ("data/market_shares.json", "data/market_caps.json")
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """ファイルの更新時刻を取得（存在しない場合はNone）"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class ResourceRegistry:
+    """キー単位でリソースを保持し、依存ファイルの更新で無効化するスレッドセーフなレジストリ"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: Dict[Hashable, Any] = {}
+        self._source_mtimes: Dict[Hashable, Dict[str, Optional[float]]] = {}
+        self._pid = os.getpid()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def _reset_if_forked(self) -> None:
+        """fork後の子プロセスでは親プロセスのリソース（S3接続等）を破棄"""
+        if self._pid != os.getpid():
+            self._entries.clear()
+            self._source_mtimes.clear()
+            self._pid = os.getpid()
+
+    def get(self, key: Hashable, factory: Callable[[], Any], source_paths: Iterable[str] = ()) -> Any:
+        """
+        リソースを取得（未構築、または依存ファイルが更新されている場合は factory で構築）
+
+        Parameters:
+        -----------
+        key : Hashable
+            リソースのキー（例: ("engine", "local")）
+        factory : Callable[[], Any]
+            リソースの構築関数
+        source_paths : Iterable[str]
+            更新時刻を監視する依存ファイル
+
+        Returns:
+        --------
+        Any
+            共有リソース
+        """
+        with self._lock:
+            self._reset_if_forked()
+            if key in self._entries:
+                mtimes = self._source_mtimes[key]
+                if all(_get_mtime(path) == mtime for path, mtime in mtimes.items()):
+                    self.stats["hits"] += 1
+                    return self._entries[key]
+                self.stats["invalidations"] += 1
+                logger.info(f"設定ファイルの更新を検知したため再構築します: {key}")
+
+            # 構築前の時刻を記録（構築中に更新された場合は次回再構築される）
+            mtimes = {path: _get_mtime(path) for path in source_paths}
+            value = factory()
+            self._entries[key] = value
+            self._source_mtimes[key] = mtimes
+            self.stats["misses"] += 1
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """指定キー（省略時は全て）のリソースを破棄"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._source_mtimes.clear()
+            else:
+                self._entries.pop(key, None)
+                self._source_mtimes.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+# プロセス内で共有するレジストリ
+_registry = ResourceRegistry()
+
+
+def get_resource_registry() -> ResourceRegistry:
+    """プロセス共有のレジストリを取得"""
+    return _registry
+
+
+def _resolve_storage_mode(storage_mode: Optional[str]) -> str:
+    return storage_mode or get_config_manager().get_storage_config().get("storage_mode", "auto")
+
+
+def _engine_config_paths() -> list:
+    """BiasAnalysisEngineの再構築判定に使う設定ファイル"""
+    from src.analysis.bias_analysis_engine import SERVICE_MAPPING_PATH
+
+    config_dir = get_config_manager().config_dir
+    return [ANALYSIS_CONFIG_PATH, SERVICE_MAPPING_PATH] + [str(config_dir / name) for name in MARKET_DATA_CONFIGS]
+
+
+def get_data_loader(storage_mode: Optional[str] = None):
+    """
+    ストレージモード単位で共有するHybridDataLoaderを取得
+
+    Parameters:
+    -----------
+    storage_mode : str, optional
+        ストレージモード（省略時は環境変数STORAGE_MODE、デフォルト "auto"）
+    """
+    from src.analysis.hybrid_data_loader import HybridDataLoader
+
+    mode = _resolve_storage_mode(storage_mode)
+    return _registry.get(("loader", mode), lambda: HybridDataLoader(mode))
+
+
+def get_analysis_engine(storage_mode: Optional[str] = None):
+    """
+    ストレージモード単位で共有するBiasAnalysisEngineを取得
+
+    市場データ・サービスマッピング・分析設定ファイルが更新されていれば再構築する。
+    エンジンのデータローダーは get_data_loader() と共有する。
+
+    Parameters:
+    -----------
+    storage_mode : str, optional
+        ストレージモード（省略時は環境変数STORAGE_MODE、デフォルト "auto"）
+    """
+    # bias_analysis_engineはscipy・pandasを読み込むため、エンジン利用時にのみインポート
+    from src.analysis.bias_analysis_engine import BiasAnalysisEngine
+
+    mode = _resolve_storage_mode(storage_mode)
+
+    def build_engine():
+        config_manager = get_config_manager()
+        for name in MARKET_DATA_CONFIGS:
+            config_manager.invalidate_cache(name)
+        return BiasAnalysisEngine(storage_mode=mode, data_loader=get_data_loader(mode))
+
+    return _registry.get(("engine", mode), build_engine, _engine_config_paths())
+
+
+def get_s3_client():
+    """プロセス共有のS3クライアントを取得（storage_utils.get_s3_clientがプロセス単位でキャッシュする）"""
+    from src.utils.storage_utils import get_s3_client as _get_s3_client
+
+    return _get_s3_client()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+バイアス分析結果（bias_analysis_results.json）の保存形式モジュール
+
+形式バージョン2（正規化形式）では、エンティティ別指標を共有テーブル `entity_metrics` に
+1回だけ格納し、各セクションの `entities` を `entity_refs`（エンティティ名 → テーブル内インデックス）に
+置き換える。relative_bias_analysisで再掲していた感情分析のentities、
+ranking_bias_analysisでcategory_summary配下と重複していたentitiesは同じレコードを参照する。
+
+    {
+        "format_version": 2,
+        "sentiment_bias_analysis": {カテゴリ: {サブカテゴリ: {..., "entity_refs": {"AWS": 0}}}},
+        ...
+        "entity_metrics": {"sentiment": [{...}, ...], "ranking": [{...}, ...]}
+    }
+
+format_versionを持たないファイルは従来形式（バージョン1）として扱う。
+読み込み側は expand_results() で従来のネスト構造に復元できる。
+"""
+
+from typing import Any, Dict, List, Tuple
+
+RESULTS_FORMAT_VERSION = 2
+LEGACY_FORMAT_VERSION = 1
+
+ENTITY_TABLE_KEY = "entity_metrics"
+ENTITY_REFS_KEY = "entity_refs"
+
+# (セクション, サブカテゴリ以下のパス, 参照先テーブル)。先に登録したレコードを後続の箇所が共有する
+ENTITY_LOCATIONS: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("sentiment_bias_analysis", (), "sentiment"),
+    ("ranking_bias_analysis", ("category_summary", "ranking_summary"), "ranking"),
+    ("ranking_bias_analysis", (), "ranking"),
+    ("relative_bias_analysis", (), "sentiment"),
+]
+
+
+def get_format_version(results: Dict[str, Any]) -> int:
+    """分析結果の形式バージョンを取得（未指定は従来形式）"""
+    return results.get("format_version", LEGACY_FORMAT_VERSION) if isinstance(results, dict) else LEGACY_FORMAT_VERSION
+
+
+def _rename_key(container: Dict[str, Any], old: str, new: str, value: Any) -> Dict[str, Any]:
+    """キーの並び順を保ったままキー名と値を置き換えた辞書を返す"""
+    return {(new if key == old else key): (value if key == old else item) for key, item in container.items()}
+
+
+def _rewrite_locations(results: Dict[str, Any], inner: Tuple[str, ...], section: str, rewrite) -> None:
+    """セクション内の全サブカテゴリについて、パス末端のコンテナを書き換える（経路上の辞書はコピー）"""
+    section_data = results.get(section)
+    if not isinstance(section_data, dict):
+        return
+
+    new_section = dict(section_data)
+    for category, subcategories in section_data.items():
+        if not isinstance(subcategories, dict):
+            continue
+        new_subcategories = dict(subcategories)
+        for subcategory, data in subcategories.items():
+            if not isinstance(data, dict):
+                continue
+            new_subcategories[subcategory] = _rewrite_path(data, inner, lambda c: rewrite(c, category, subcategory))
+        new_section[category] = new_subcategories
+    results[section] = new_section
+
+
+def _rewrite_path(container: Dict[str, Any], inner: Tuple[str, ...], rewrite) -> Dict[str, Any]:
+    """パスをたどって末端のコンテナを書き換えた辞書を返す（パスが存在しない場合はそのまま）"""
+    if not inner:
+        return rewrite(container)
+    child = container.get(inner[0])
+    if not isinstance(child, dict):
+        return container
+    updated = dict(container)
+    updated[inner[0]] = _rewrite_path(child, inner[1:], rewrite)
+    return updated
+
+
+def normalize_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    分析結果を正規化形式（バージョン2）に変換
+
+    入力の辞書は変更せず、新しい辞書を返す（エンティティ別指標のレコード自体はコピーしない）。
+
+    Parameters:
+    -----------
+    results : Dict[str, Any]
+        従来形式の分析結果
+
+    Returns:
+    --------
+    Dict[str, Any]
+        正規化形式の分析結果
+    """
+    if get_format_version(results) >= RESULTS_FORMAT_VERSION:
+        return results
+
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    registered: Dict[Tuple[str, str, str, str], int] = {}
+    normalized = {"format_version": RESULTS_FORMAT_VERSION}
+    normalized.update(results)
+
+    for section, inner, table_name in ENTITY_LOCATIONS:
+        table = tables.setdefault(table_name, [])
+
+        def to_refs(container, category, subcategory, table=table, table_name=table_name):
+            entities = container.get("entities")
+            if not isinstance(entities, dict) or not all(isinstance(v, dict) for v in entities.values()):
+                return container
+
+            refs = {}
+            for name, record in entities.items():
+                key = (table_name, category, subcategory, name)
+                index = registered.get(key)
+                if index is None or not (table[index] is record or table[index] == record):
+                    index = len(table)
+                    table.append(record)
+                    registered.setdefault(key, index)
+                refs[name] = index
+            return _rename_key(container, "entities", ENTITY_REFS_KEY, refs)
+
+        _rewrite_locations(normalized, inner, section, to_refs)
+
+    normalized[ENTITY_TABLE_KEY] = {name: table for name, table in tables.items() if table}
+    return normalized
+
+
+def expand_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    正規化形式の分析結果を従来のネスト構造に復元（従来形式はそのまま返す）
+
+    射影読み込みした部分的な結果にも対応する（テーブルは配列・インデックス文字列キーの辞書の両方を受け付け、
+    テーブルに存在しない参照は省略する）。
+
+    Parameters:
+    -----------
+    results : Dict[str, Any]
+        分析結果
+
+    Returns:
+    --------
+    Dict[str, Any]
+        従来形式の分析結果（エンティティ別指標は複数箇所で同じオブジェクトを共有）
+    """
+    if get_format_version(results) < RESULTS_FORMAT_VERSION:
+        return results
+
+    tables = results.get(ENTITY_TABLE_KEY, {}) or {}
+
+    def lookup(table_name: str, index: Any):
+        table = tables.get(table_name)
+        if isinstance(table, list):
+            return table[index] if isinstance(index, int) and 0 <= index < len(table) else None
+        if isinstance(table, dict):
+            return table.get(str(index))
+        return None
+
+    expanded = {k: v for k, v in results.items() if k not in ("format_version", ENTITY_TABLE_KEY)}
+
+    for section, inner, table_name in ENTITY_LOCATIONS:
+        def to_entities(container, category, subcategory, table_name=table_name):
+            refs = container.get(ENTITY_REFS_KEY)
+            if not isinstance(refs, dict):
+                return container
+            entities = {}
+            for name, index in refs.items():
+                record = lookup(table_name, index)
+                if record is not None:
+                    entities[name] = record
+            return _rename_key(container, ENTITY_REFS_KEY, "entities", entities)
+
+        _rewrite_locations(expanded, inner, section, to_entities)
+
+    return expanded
+
+
+def projection_paths(paths: List[str]) -> List[str]:
+    """
+    従来形式のパス仕様に、正規化形式で同じ値を取得するためのパス仕様を追加
+
+    形式判定用の "format_version" を常に含める。
+    例: "sentiment_bias_analysis.*.*.entities.*.basic_metrics.normalized_bias_index" に対して
+        "sentiment_bias_analysis.*.*.entity_refs.*" と
+        "entity_metrics.sentiment.*.basic_metrics.normalized_bias_index" を追加する。
+    射影結果を expand_results() に渡すと、どちらの形式のファイルでも従来形式のパスで値を参照できる。
+    """
+    extended = list(paths) + ["format_version"]
+    for path in paths:
+        segments = path.split(".")
+        for section, inner, table_name in ENTITY_LOCATIONS:
+            depth = 3 + len(inner)
+            if (len(segments) > depth and segments[0] == section
+                    and tuple(segments[3:depth]) == inner and segments[depth] == "entities"):
+                prefix = ".".join(segments[:depth])
+                entity = segments[depth + 1] if len(segments) > depth + 1 else "*"
+                rest = segments[depth + 2:]
+                extended.append(f"{prefix}.{ENTITY_REFS_KEY}.{entity}")
+                extended.append(".".join([ENTITY_TABLE_KEY, table_name, "*"] + rest))
+    return list(dict.fromkeys(extended))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+分析実行のフィンガープリント
+
+分析結果を決める入力（統合データセット・分析設定・市場データ・分析エンジンのコード）の
+ハッシュを組み合わせたフィンガープリントを計算する。分析結果のメタデータ
+（metadata.run_fingerprint・analysis_metadata.json）に記録し、同じフィンガープリントの
+分析結果が既に保存されていれば run_bias_analysis.py は再分析をスキップする。
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from src.analysis.results_format import RESULTS_FORMAT_VERSION
+from src.analysis.resource_registry import ANALYSIS_CONFIG_PATH, MARKET_DATA_CONFIGS
+from src.utils.config_manager import get_config_manager
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 分析結果に影響するソースファイル（いずれかが変更されるとエンジンバージョンが変わる）
+ENGINE_SOURCE_FILES = (
+    "src/analysis/bias_analysis_engine.py",
+    "src/analysis/market_index.py",
+    "src/analysis/domain_index.py",
+    "src/analysis/results_format.py",
+    "src/utils/rank_utils.py",
+    "src/utils/metrics_utils.py",
+    "src/utils/correlation_utils.py",
+    "src/utils/significance_utils.py",
+    "src/utils/text_utils.py",
+)
+
+
+def hash_files(paths: Iterable[str]) -> str:
+    """ファイル名と内容のSHA-256（チェックアウト先に依存しないようディレクトリは含めない）"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).name.encode("utf-8") + b"\0")
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_engine_version() -> str:
+    """分析エンジンのバージョン（結果形式バージョン + ソースコードのハッシュ）"""
+    code_hash = hash_files(str(PROJECT_ROOT / path) for path in ENGINE_SOURCE_FILES)
+    return f"v1.0-format{RESULTS_FORMAT_VERSION}-{code_hash[:16]}"
+
+
+def compute_run_fingerprint(date_or_path: str, data_loader) -> Optional[Dict[str, Any]]:
+    """
+    分析実行のフィンガープリントを計算
+
+    Parameters:
+    -----------
+    date_or_path : str
+        日付（YYYYMMDD）またはディレクトリパス
+    data_loader : HybridDataLoader
+        統合データセットの読み込みに使うデータローダー
+
+    Returns:
+    --------
+    Optional[Dict[str, Any]]
+        {"dataset_hash", "config_hash", "market_data_hash", "engine_version", "fingerprint"}。
+        統合データセットが見つからない場合はNone
+    """
+    # 分析エンジンはscipy等を読み込むため、定数の参照時にのみインポート
+    from src.analysis.bias_analysis_engine import SERVICE_MAPPING_PATH
+
+    dataset_hash = data_loader.compute_integrated_dataset_hash(date_or_path)
+    if dataset_hash is None:
+        return None
+
+    config_dir = get_config_manager().config_dir
+    components = {
+        "dataset_hash": dataset_hash,
+        "config_hash": hash_files([ANALYSIS_CONFIG_PATH, SERVICE_MAPPING_PATH]),
+        "market_data_hash": hash_files(str(config_dir / name) for name in MARKET_DATA_CONFIGS),
+        "engine_version": get_engine_version()
+    }
+    payload = "|".join(f"{key}={components[key]}" for key in sorted(components))
+    components["fingerprint"] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return components
+
+
+def has_matching_results(date_or_path: str, data_loader, run_fingerprint: Optional[Dict[str, Any]]) -> bool:
+    """同じフィンガープリントの分析結果が保存済みか（ローカル・S3はデータローダーのモードに従う）"""
+    if run_fingerprint is None:
+        return False
+    return data_loader.load_run_fingerprint(date_or_path) == run_fingerprint["fingerprint"]
@@ -18,13 +18,17 @@
 import sys
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from tqdm import tqdm
 
-from src.prompts.prompt_manager import PromptManager
+from src.prompts.prompt_manager import get_prompt_manager
 from src.utils.storage_utils import save_results, load_json
 from src.utils.storage_config import S3_BUCKET_NAME, get_s3_key, get_base_paths
 from src.utils.perplexity_api import PerplexityAPI
+from src.utils.logger import setup_default_logging
+from src.analysis.sentiment_label_cache import SentimentLabelCache
 
 # パスの設定
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -35,8 +39,11 @@
 # 環境変数から認証情報を取得
 PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY")
 
-# プロンプトマネージャーのインスタンスを作成
-prompt_manager = PromptManager()
+# 並列バッチ分類の設定（デフォルトのレートは従来の1.25秒間隔と同等）
+DEFAULT_MAX_WORKERS = int(os.environ.get("SENTIMENT_MAX_WORKERS", "4"))
+DEFAULT_REQUESTS_PER_SECOND = float(os.environ.get("SENTIMENT_REQUESTS_PER_SECOND", "0.8"))
+DEFAULT_MAX_BATCH_SIZE = int(os.environ.get("SENTIMENT_MAX_BATCH_SIZE", "10"))
+DEFAULT_MAX_BATCH_CHARS = int(os.environ.get("SENTIMENT_MAX_BATCH_CHARS", "3000"))
 
 def normalize_sentiment_response(response_text):
     """API応答を正規化して感情値のリストを返す"""
@@ -90,14 +97,54 @@ def extract_sentiment(sentiment_text):
     else:
         return "unknown"
 
-def analyze_sentiments(texts: list[str], verbose: bool = False) -> list[str]:
-    """PerplexityAPIクラスを使用して複数のテキストの感情分析を実行（loaderと同じ方式）"""
+class RateLimiter:
+    """APIリクエストの開始間隔を制御するスレッドセーフなレートリミッター"""
+
+    def __init__(self, requests_per_second: float, clock=time.monotonic, sleep=time.sleep):
+        """
+        Parameters:
+        -----------
+        requests_per_second : float
+            1秒あたりのリクエスト数上限（0以下の場合は制限なし）
+        clock, sleep : Callable
+            現在時刻・待機の関数（テスト用）
+        """
+        self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """次のリクエストが許可されるまで待機"""
+        with self._lock:
+            now = self.clock()
+            scheduled = max(now, self._next_time)
+            self._next_time = scheduled + self.min_interval
+        delay = scheduled - now
+        if delay > 0:
+            self.sleep(delay)
+
+
+def analyze_sentiments(texts: list[str], verbose: bool = False, api: PerplexityAPI = None) -> list[str]:
+    """PerplexityAPIクラスを使用して複数のテキストの感情分析を実行（loaderと同じ方式）
+
+    Parameters:
+    -----------
+    texts : list[str]
+        分析対象のテキストリスト
+    verbose : bool
+        詳細ログ出力
+    api : PerplexityAPI, optional
+        再利用するAPIクライアント（未指定時は新規作成）
+    """
     if not PERPLEXITY_API_KEY:
         raise ValueError("PERPLEXITY_API_KEY が設定されていません。.env ファイルを確認してください。")
 
-    prompt = prompt_manager.get_sentiment_analysis_prompt(texts)
+    prompt = get_prompt_manager().get_sentiment_analysis_prompt(texts)
     model = os.environ.get("PERPLEXITY_DEFAULT_MODEL", "sonar")
-    api = PerplexityAPI(PERPLEXITY_API_KEY)
+    if api is None:
+        api = PerplexityAPI(PERPLEXITY_API_KEY)
 
     try:
         response_text, _ = api.call_perplexity_api(prompt, model=model)
@@ -127,7 +174,8 @@ def analyze_sentiments(texts: list[str], verbose: bool = False) -> list[str]:
                     print(f"    [DEBUG] 不足分を補完: texts数={len(texts)}, result数={len(result)}")
                 result.append("unknown")
 
-            return result
+            # 余剰分を切り捨て（バッチ間で結果がずれないようにする）
+            return result[:len(texts)]
         else:
             if verbose:
                 print(f"    [DEBUG] API応答が空のため、すべて'unknown'に設定")
@@ -136,133 +184,171 @@ def analyze_sentiments(texts: list[str], verbose: bool = False) -> list[str]:
         print(f"Perplexity API リクエストエラー: {e}")
         return ["unknown"] * len(texts)
 
-def process_google_search_results(data, args):
-    """Google検索結果ファイルを処理（entities構造に対応）"""
-    # 元のデータをそのまま使用
-    results = data
+def _is_valid_reputation_result(result) -> bool:
+    """titleとsnippetが揃っている（感情分析対象となる）エントリーか判定"""
+    title = result.get("title")
+    snippet = result.get("snippet")
+    return (isinstance(title, str) and isinstance(snippet, str) and
+            bool(title.strip()) and bool(snippet.strip()))
+
+def collect_sentiment_targets(data, verbose: bool = False):
+    """全カテゴリ・サブカテゴリ・エンティティのreputation_resultsから感情分析対象を収集
+
+    titleやsnippetが不足しているエントリーにはこの時点でsentiment="unknown"を設定する。
+
+    Returns:
+    --------
+    list[tuple[dict, str]]
+        (結果エントリー, 分析テキスト) のリスト
+    """
+    targets = []
 
     for category, subcategories in data.items():
-        for subcategory, content in tqdm(subcategories.items(), desc=f"処理中: {category}", disable=not args.verbose):
-            # entities構造: 各サービスのreputation_resultsを処理
+        for subcategory, content in subcategories.items():
             entities = content.get("entities", {})
 
             for entity_name, entity_data in entities.items():
-                # reputation_resultsのみ感情分析対象（titleとsnippetがある）
+                # official_resultsは感情分析対象外（titleやsnippetがないため）
                 reputation_results = entity_data.get("reputation_results", [])
+                valid_count = 0
+                invalid_count = 0
+
+                for result in reputation_results:
+                    if _is_valid_reputation_result(result):
+                        targets.append((result, f"{result['title']} {result['snippet']}"))
+                        valid_count += 1
+                    else:
+                        result["sentiment"] = "unknown"
+                        invalid_count += 1
 
-                # titleとsnippetがあるもののみを対象とする（データ構造に基づく厳格なフィルタリング）
-                valid_results = [
-                    r for r in reputation_results
-                    if r.get("title") and r.get("snippet") and
-                    isinstance(r.get("title"), str) and isinstance(r.get("snippet"), str) and
-                    r.get("title").strip() and r.get("snippet").strip()
-                ]
-
-                # titleやsnippetが空のエントリーはsentiment="unknown"に設定
-                invalid_results = [
-                    r for r in reputation_results
-                    if not (r.get("title") and r.get("snippet") and
-                    isinstance(r.get("title"), str) and isinstance(r.get("snippet"), str) and
-                    r.get("title").strip() and r.get("snippet").strip())
-                ]
-
-                # titleやsnippetが空のエントリーにsentiment="unknown"を設定
-                for result in invalid_results:
-                    result["sentiment"] = "unknown"
-
-                # --- ログ出力をperplexityと完全に揃える ---
-                if valid_results:
-                    if args.verbose:
-                        print(f"  {entity_name}: {len(valid_results)}件の評判データを感情分析対象として処理")
-
-                    # 5件ずつバッチ処理
-                    for i in range(0, len(valid_results), 5):
-                        batch = valid_results[i:i+5]
-                        texts = [f"{result['title']} {result['snippet']}" for result in batch]
-                        if args.verbose:
-                            print(f"    [DEBUG] entity={entity_name}, batch={i//5}, texts数={len(texts)}, texts={texts}")
-                        sentiments = analyze_sentiments(texts, verbose=args.verbose)
-                        if args.verbose:
-                            print(f"    [DEBUG] entity={entity_name}, batch={i//5}, sentiments数={len(sentiments)}, sentiments={sentiments}")
-
-                        for result, sentiment in zip(batch, sentiments):
-                            result["sentiment"] = sentiment
-
-                        time.sleep(1.25)  # API制限対策
-
-                if invalid_results:
-                    if args.verbose:
-                        print(f"  {entity_name}: {len(invalid_results)}件のエントリーをsentiment='unknown'に設定（titleやsnippetが不足）")
-
-                if not valid_results and not invalid_results:
-                    if args.verbose:
+                if verbose:
+                    if valid_count:
+                        print(f"  {entity_name}: {valid_count}件の評判データを感情分析対象として処理")
+                    if invalid_count:
+                        print(f"  {entity_name}: {invalid_count}件のエントリーをsentiment='unknown'に設定（titleやsnippetが不足）")
+                    if not valid_count and not invalid_count:
                         print(f"  {entity_name}: 感情分析対象のデータがありません")
 
-    return results
+    return targets
+
+def build_sentiment_batches(texts: list[str], max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                            max_batch_chars: int = DEFAULT_MAX_BATCH_CHARS) -> list[list[str]]:
+    """テキスト長に応じてバッチサイズを調整しながらバッチに分割
+
+    件数上限（max_batch_size）と文字数上限（max_batch_chars）のどちらかに
+    達した時点でバッチを区切る。1件で文字数上限を超えるテキストは単独バッチとする。
+    """
+    batches = []
+    current = []
+    current_chars = 0
+
+    for text in texts:
+        if current and (len(current) >= max_batch_size or current_chars + len(text) > max_batch_chars):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(text)
+        current_chars += len(text)
+
+    if current:
+        batches.append(current)
+    return batches
+
+def classify_texts(texts: list[str], verbose: bool = False, max_workers: int = DEFAULT_MAX_WORKERS,
+                   requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                   max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                   max_batch_chars: int = DEFAULT_MAX_BATCH_CHARS,
+                   use_cache: bool = True) -> dict:
+    """キャッシュ未登録のテキストのみをレート制限下で並列にバッチ分類
+
+    正規化テキストが同一のものは1件として分類し、結果を全件に展開する。
+
+    Returns:
+    --------
+    dict
+        テキスト -> 感情ラベル のマッピング
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    if not unique_texts:
+        return {}
 
-def process_perplexity_results(data, args):
-    """Perplexityの結果ファイルを処理（新しいentities構造に対応）"""
-    # 元のデータをそのまま使用
-    results = data
+    model = os.environ.get("PERPLEXITY_DEFAULT_MODEL", "sonar")
+    cache = SentimentLabelCache(model, get_prompt_manager().get_sentiment_analysis_prompt_version()) if use_cache else None
+
+    labels = {}
+    pending = {}  # キャッシュキー -> 同一キーを持つテキストのリスト
+    for text in unique_texts:
+        key = cache.key(text) if cache else text
+        cached = cache.get(key) if cache and key not in pending else None
+        if cached is not None:
+            labels[text] = cached
+        else:
+            pending.setdefault(key, []).append(text)
 
-    for category, subcategories in data.items():
-        for subcategory, content in tqdm(subcategories.items(), desc=f"処理中: {category}", disable=not args.verbose):
-            # 新しい構造: entities内の各サービスのreputation_resultsを処理
-            entities = content.get("entities", {})
+    if cache:
+        cache.log_stats()
 
-            for entity_name, entity_data in entities.items():
-                # official_resultsは感情分析対象外（titleやsnippetがないため）
-                # reputation_resultsのみ感情分析対象（titleとsnippetがある）
-                reputation_results = entity_data.get("reputation_results", [])
+    if pending:
+        representatives = {group[0]: key for key, group in pending.items()}
+        batches = build_sentiment_batches(list(representatives), max_batch_size, max_batch_chars)
+        logging.info(f"感情分析: 対象{len(texts)}件 / 分類対象{len(representatives)}件 / {len(batches)}バッチ "
+                     f"(workers={max_workers}, rate={requests_per_second}req/s)")
 
-                # titleとsnippetがあるもののみを対象とする（データ構造に基づく厳格なフィルタリング）
-                valid_results = [
-                    r for r in reputation_results
-                    if r.get("title") and r.get("snippet") and
-                    isinstance(r.get("title"), str) and isinstance(r.get("snippet"), str) and
-                    r.get("title").strip() and r.get("snippet").strip()
-                ]
-
-                # titleやsnippetが空のエントリーはsentiment="unknown"に設定
-                invalid_results = [
-                    r for r in reputation_results
-                    if not (r.get("title") and r.get("snippet") and
-                    isinstance(r.get("title"), str) and isinstance(r.get("snippet"), str) and
-                    r.get("title").strip() and r.get("snippet").strip())
-                ]
-
-                # titleやsnippetが空のエントリーにsentiment="unknown"を設定
-                for result in invalid_results:
-                    result["sentiment"] = "unknown"
-
-                if valid_results:
-                    if args.verbose:
-                        print(f"  {entity_name}: {len(valid_results)}件の評判データを感情分析対象として処理")
-
-                    # 5件ずつバッチ処理
-                    for i in range(0, len(valid_results), 5):
-                        batch = valid_results[i:i+5]
-                        texts = [f"{result['title']} {result['snippet']}" for result in batch]
-                        if args.verbose:
-                            print(f"    [DEBUG] entity={entity_name}, batch={i//5}, texts数={len(texts)}, texts={texts}")
-                        sentiments = analyze_sentiments(texts, verbose=args.verbose)
-                        if args.verbose:
-                            print(f"    [DEBUG] entity={entity_name}, batch={i//5}, sentiments数={len(sentiments)}, sentiments={sentiments}")
-
-                        for result, sentiment in zip(batch, sentiments):
-                            result["sentiment"] = sentiment
-
-                        time.sleep(1.25)  # API制限対策
-
-                if invalid_results:
-                    if args.verbose:
-                        print(f"  {entity_name}: {len(invalid_results)}件のエントリーをsentiment='unknown'に設定（titleやsnippetが不足）")
-
-                if not valid_results and not invalid_results:
-                    if args.verbose:
-                        print(f"  {entity_name}: 感情分析対象のデータがありません")
+        api = PerplexityAPI(PERPLEXITY_API_KEY)
+        limiter = RateLimiter(requests_per_second)
 
-    return results
+        def run_batch(batch_index, batch):
+            limiter.wait()
+            if verbose:
+                print(f"    [DEBUG] batch={batch_index}, texts数={len(batch)}, texts={batch}")
+            sentiments = analyze_sentiments(batch, verbose=verbose, api=api)
+            if verbose:
+                print(f"    [DEBUG] batch={batch_index}, sentiments数={len(sentiments)}, sentiments={sentiments}")
+            return batch, sentiments
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(run_batch, i, batch) for i, batch in enumerate(batches)]
+            for future in tqdm(as_completed(futures), total=len(futures), desc="感情分析", disable=not verbose):
+                batch, sentiments = future.result()
+                for text, sentiment in zip(batch, sentiments):
+                    key = representatives[text]
+                    for same_text in pending[key]:
+                        labels[same_text] = sentiment
+                    if cache:
+                        cache.put(key, sentiment)
+
+    if cache:
+        cache.save(verbose=verbose)
+
+    return labels
+
+def process_reputation_results(data, args):
+    """reputation_resultsの感情分析を一括実行（Google・Perplexity共通）
+
+    全エンティティの対象テキストを先に収集し、重複を除いて並列分類した後、
+    各エントリーにラベルを書き戻す。
+    """
+    targets = collect_sentiment_targets(data, verbose=args.verbose)
+    labels = classify_texts(
+        [text for _, text in targets],
+        verbose=args.verbose,
+        max_workers=getattr(args, "max_workers", DEFAULT_MAX_WORKERS),
+        requests_per_second=getattr(args, "rate_limit", DEFAULT_REQUESTS_PER_SECOND),
+        use_cache=not getattr(args, "no_cache", False)
+    )
+
+    for result, text in targets:
+        result["sentiment"] = labels.get(text, "unknown")
+
+    return data
+
+def process_google_search_results(data, args):
+    """Google検索結果ファイルを処理（entities構造に対応）"""
+    return process_reputation_results(data, args)
+
+def process_perplexity_results(data, args):
+    """Perplexityの結果ファイルを処理（新しいentities構造に対応）"""
+    return process_reputation_results(data, args)
 
 def process_results_file(file_path, date_str, args):
     """結果ファイルを読み込んで感情分析を実行（S3対応）"""
@@ -325,12 +411,17 @@ def main():
                         help='分析対象のデータタイプ（perplexity または google）')
     parser.add_argument('--runs', type=int, default=1, help='実行回数（ファイル名に含まれる、デフォルト: 1）')
     parser.add_argument('--input-file', help='入力ファイルのパス')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'並列リクエスト数（デフォルト: {DEFAULT_MAX_WORKERS}）')
+    parser.add_argument('--rate-limit', type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                        help=f'1秒あたりの最大リクエスト数（デフォルト: {DEFAULT_REQUESTS_PER_SECOND}）')
+    parser.add_argument('--no-cache', action='store_true', help='感情ラベルキャッシュを使用せず全件を再分析')
     parser.add_argument('--verbose', action='store_true', help='詳細なログ出力を有効化')
     args = parser.parse_args()
 
-    # 詳細ログの設定
+    # ログ設定（キャッシュのヒット率統計等のINFOログはverbose指定なしでも実行ログに出力）
+    setup_default_logging(verbose=args.verbose)
     if args.verbose:
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         logging.info("詳細ログモードが有効になりました")
 
     # 日付を取得（指定がなければ今日の日付）
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+感情ラベル永続キャッシュモジュール
+
+評判データ（title+snippet）の感情分析結果を、正規化テキストのハッシュをキーとして永続化する。
+キーにはモデル名とプロンプトバージョンを含めるため、モデルやプロンプトを変更した場合は
+自動的に再分析対象となる。
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import unicodedata
+import datetime
+
+from src.utils.storage_utils import save_results, load_json
+from src.utils.storage_config import S3_BUCKET_NAME, is_s3_enabled
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "SENTIMENT_CACHE_PATH", "corporate_bias_datasets/cache/sentiment_label_cache.json"
+)
+
+# キャッシュ対象とするラベル（unknownはAPI失敗の可能性があるため保存しない）
+CACHEABLE_LABELS = ("positive", "negative")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """キャッシュキー用にテキストを正規化（NFKC・小文字化・空白の統一）"""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+
+
+def make_cache_key(text: str, model: str, prompt_version: str) -> str:
+    """正規化テキスト・モデル名・プロンプトバージョンからキャッシュキーを生成"""
+    payload = f"{model}\x00{prompt_version}\x00{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SentimentLabelCache:
+    """感情ラベルの永続キャッシュ（ローカルJSON + S3同期）"""
+
+    def __init__(self, model: str, prompt_version: str, cache_path: str = DEFAULT_CACHE_PATH):
+        """
+        Parameters:
+        -----------
+        model : str
+            感情分析に使用するモデル名
+        prompt_version : str
+            感情分析プロンプトのバージョン
+        cache_path : str
+            キャッシュファイルのローカルパス（S3キーにも同じパスを使用）
+        """
+        self.model = model
+        self.prompt_version = prompt_version
+        self.cache_path = cache_path
+        self.labels = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """ローカル（なければS3）からキャッシュを読み込む"""
+        data = None
+        try:
+            if os.path.exists(self.cache_path):
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            elif is_s3_enabled():
+                data = load_json(f"s3://{S3_BUCKET_NAME}/{self.cache_path}")
+        except Exception as e:
+            logger.warning(f"感情ラベルキャッシュの読み込みに失敗しました（空のキャッシュで続行）: {e}")
+
+        self.labels = (data or {}).get("labels", {})
+        logger.info(f"感情ラベルキャッシュ読み込み: {len(self.labels)}件 ({self.cache_path})")
+
+    def key(self, text: str) -> str:
+        """テキストのキャッシュキーを取得"""
+        return make_cache_key(text, self.model, self.prompt_version)
+
+    def get(self, key: str):
+        """キャッシュ済みラベルを取得（ヒット率を集計）"""
+        label = self.labels.get(key)
+        if label is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return label
+
+    def put(self, key: str, label: str):
+        """ラベルを登録（positive/negativeのみ）"""
+        if label in CACHEABLE_LABELS and self.labels.get(key) != label:
+            self.labels[key] = label
+            self._dirty = True
+
+    def hit_rate(self) -> float:
+        """ヒット率（0.0〜1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def log_stats(self):
+        """ヒット率統計を実行ログに出力"""
+        logger.info(f"感情ラベルキャッシュ: ヒット{self.hits}件 / ミス{self.misses}件 "
+                    f"(ヒット率 {self.hit_rate():.1%}, 登録済み{len(self.labels)}件)")
+
+    def save(self, verbose: bool = False):
+        """変更があればキャッシュを保存（ローカル + S3）"""
+        if not self._dirty:
+            return
+        data = {
+            "updated_at": datetime.datetime.now().isoformat(),
+            "labels": self.labels
+        }
+        s3_key = self.cache_path if is_s3_enabled() else None
+        save_results(data, self.cache_path, s3_key, verbose=verbose)
+        self._dirty = False
@@ -4,6 +4,7 @@
 """
 企業バイアス評価用のカテゴリとサービス定義ファイル
 YAMLファイルからカテゴリとサービス情報を読み込む
+（YAMLは初回アクセス時に読み込む。モジュール属性 categories / viewpoints も利用可能）
 """
 
 from typing import List, Dict, Any, Tuple
@@ -44,21 +45,31 @@ def load_yaml_categories() -> Tuple[List[str], Dict[str, Any]]:
         logger.error(f"カテゴリ定義ファイルの読み込み中にエラーが発生しました: {e}")
         raise ConfigError(f"カテゴリ設定の読み込みに失敗しました: {e}", "categories")
 
-# グローバル変数として読み込み
-viewpoints, categories = load_yaml_categories()
+def _ensure_loaded():
+    """カテゴリとビューポイントを未読み込みの場合のみ読み込み、モジュール属性として保持"""
+    if "categories" not in globals():
+        reload_categories()
+    return globals()["viewpoints"], globals()["categories"]
+
+def __getattr__(name):
+    """モジュール属性 categories / viewpoints への初回アクセス時にYAMLを読み込む"""
+    if name in ("categories", "viewpoints"):
+        viewpoints, categories = _ensure_loaded()
+        return categories if name == "categories" else viewpoints
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_categories():
     """カテゴリとサービスのデータを取得する関数"""
-    return categories
+    return _ensure_loaded()[1]
 
 def get_viewpoints():
     """評価観点のリストを取得する関数"""
-    return viewpoints
+    return _ensure_loaded()[0]
 
 def get_all_categories():
     """すべてのカテゴリの数を取得"""
     count = 0
-    for category, subcategories in categories.items():
+    for category, subcategories in get_categories().items():
         for subcategory, services in subcategories.items():
             if not subcategory.startswith('#'):  # コメントアウトされていないサブカテゴリのみカウント
                 count += 1
@@ -67,7 +78,7 @@ def get_all_categories():
 def get_all_services():
     """すべてのサービスのリストを取得"""
     all_services = []
-    for category, subcategories in categories.items():
+    for category, subcategories in get_categories().items():
         for subcategory, services in subcategories.items():
             if not subcategory.startswith('#'):  # コメントアウトされていないサブカテゴリのみ
                 all_services.extend(services)
@@ -8,7 +8,7 @@
 """
 
 import streamlit as st
-from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.analysis.resource_registry import get_data_loader
 from src.utils.storage_config import get_base_paths
 
 
@@ -43,10 +43,10 @@ def render_analysis_type_selector():
 
 
 def render_date_selector(storage_mode, viz_type):
-    """日付選択UIを表示"""
+    """日付選択UIを表示（ローダーは再実行をまたいでプロセス内で共有）"""
     if storage_mode == "auto":
-        loader_local = HybridDataLoader("local")
-        loader_s3 = HybridDataLoader("s3")
+        loader_local = get_data_loader("local")
+        loader_s3 = get_data_loader("s3")
         dates_local = set(loader_local.list_available_dates(mode="local"))
         dates_s3 = set(loader_s3.list_available_dates(mode="s3"))
         all_dates = sorted(list(dates_local | dates_s3), reverse=True)
@@ -80,7 +80,7 @@ def render_date_selector(storage_mode, viz_type):
         # 時系列分析時はこのUIを表示しない
         return None, None, loader_local, loader_s3
     else:
-        loader = HybridDataLoader(storage_mode)
+        loader = get_data_loader(storage_mode)
         available_dates = loader.list_available_dates(mode=storage_mode)
         if not available_dates:
             st.sidebar.error("分析データが見つかりません")
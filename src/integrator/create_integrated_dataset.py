@@ -20,6 +20,7 @@
 
 from src.integrator.dataset_integrator import DatasetIntegrator
 from src.integrator.data_validator import DataValidator, ProcessingAbortedException
+from src.utils.upload_manager import flush_uploads
 
 
 def setup_logging(verbose: bool = False):
@@ -234,6 +235,12 @@ def main():
             logger.info("統合データセットは以下のディレクトリに保存されました:")
             logger.info(f"  {integrator.integrated_dir}")
 
+            # バックグラウンドS3アップロードの完了を待つ
+            upload_summary = flush_uploads()
+            if upload_summary["failed"]:
+                logger.error(f"S3アップロードに失敗したファイルがあります: {len(upload_summary['failed'])}件")
+                sys.exit(1)
+
         else:
             logger.error("統合データセットの作成に失敗しました")
             sys.exit(1)
@@ -14,7 +14,9 @@
 from .data_validator import DataValidator, ProcessingAbortedException
 from .schema_generator import SchemaGenerator
 from ..utils.storage_utils import save_results
+from ..utils.numeric_sidecar import write_numeric_sidecar
 from ..utils.storage_config import get_base_paths, get_s3_key
+from ..utils.profiling import profile_span, profiled
 
 # 新しいユーティリティをインポート
 from ..utils import (
@@ -68,7 +70,9 @@ def create_integrated_dataset(self, force_recreate: bool = False, verbose: bool
 
         try:
             # 1. 生データの読み込み
-            raw_data = self._load_raw_data(verbose, runs, storage_mode)
+            with profile_span("integration.load_raw_data", "integration", log_step=True) as span:
+                raw_data = self._load_raw_data(verbose, runs, storage_mode)
+                span.add_items(len(raw_data or {}))
             if not raw_data:
                 logger.error("読み込み可能な生データが見つかりません")
                 return {}
@@ -79,7 +83,9 @@ def create_integrated_dataset(self, force_recreate: bool = False, verbose: bool
                 logger.info(f"生データのキー: {list(raw_data.keys())}")
 
             try:
-                cleaned_data, validation_results = self.validator.process_data_with_validation(raw_data)
+                with profile_span("integration.validate", "validation", log_step=True) as span:
+                    cleaned_data, validation_results = self.validator.process_data_with_validation(raw_data)
+                    span.add_items(len(validation_results))
                 self.integration_metadata["validation_results"] = validation_results
                 self.integration_metadata["data_quality_score"] = self.validator.get_validation_summary().get("validation_score", 0.0)
 
@@ -102,22 +108,25 @@ def create_integrated_dataset(self, force_recreate: bool = False, verbose: bool
             if verbose:
                 logger.info("統合データセット作成中...")
 
-            integrated_dataset = self._create_integrated_structure(cleaned_data)
+            with profile_span("integration.create_structure", "integration", log_step=True):
+                integrated_dataset = self._create_integrated_structure(cleaned_data)
 
             # 4. スキーマ生成（変更検知ベース）
             if verbose:
                 logger.info("データセットスキーマ生成チェック中...")
 
-            if self._should_regenerate_schema(integrated_dataset):
-                if verbose:
-                    logger.info("データ構造の変化を検知 - スキーマを再生成します")
-                dataset_schema = self.schema_generator.generate_schema(integrated_dataset)
-                schema_regenerated = True
-            else:
-                if verbose:
-                    logger.info("データ構造に変化なし - 既存スキーマを使用します")
-                dataset_schema = self._load_existing_schema()
-                schema_regenerated = False
+            with profile_span("integration.schema", "integration", log_step=True) as span:
+                if self._should_regenerate_schema(integrated_dataset):
+                    if verbose:
+                        logger.info("データ構造の変化を検知 - スキーマを再生成します")
+                    dataset_schema = self.schema_generator.generate_schema(integrated_dataset)
+                    schema_regenerated = True
+                else:
+                    if verbose:
+                        logger.info("データ構造に変化なし - 既存スキーマを使用します")
+                    dataset_schema = self._load_existing_schema()
+                    schema_regenerated = False
+                span.set("regenerated", schema_regenerated)
 
             self.integration_metadata["schema_info"] = {
                 "field_count": dataset_schema["metadata"]["field_count"],
@@ -130,7 +139,8 @@ def create_integrated_dataset(self, force_recreate: bool = False, verbose: bool
             if verbose:
                 logger.info("ファイル保存中...")
 
-            self._save_integrated_files(integrated_dataset, dataset_schema, verbose, storage_mode)
+            with profile_span("integration.save_files", "io", log_step=True):
+                self._save_integrated_files(integrated_dataset, dataset_schema, verbose, storage_mode)
 
             # 6. 収集サマリー生成
             collection_summary = self._create_collection_summary(raw_data, cleaned_data)
@@ -220,6 +230,7 @@ def _load_raw_data(self, verbose: bool = True, runs: int = None, storage_mode: s
 
 
 
+    @profiled("integration.load_google_data", "integration")
     def _load_google_data(self, raw_data: Dict[str, Any], verbose: bool = True, storage_mode: str = None):
         """Google検索データの読み込み"""
         from src.utils.storage_utils import load_json
@@ -263,6 +274,7 @@ def _load_google_data(self, raw_data: Dict[str, Any], verbose: bool = True, stor
                 else:
                     logger.warning(f"Googleデータがローカル・S3ともに取得できません: {google_local} / S3:{google_s3}")
 
+    @profiled("integration.load_perplexity_sentiment", "integration")
     def _load_perplexity_sentiment_data(self, raw_data: Dict[str, Any], verbose: bool = True, runs: int = None, storage_mode: str = None):
         """Perplexity感情データの読み込み"""
         from src.utils.storage_utils import load_json
@@ -327,6 +339,7 @@ def _load_perplexity_sentiment_data(self, raw_data: Dict[str, Any], verbose: boo
                 else:
                     logger.warning(f"Perplexity感情データがローカル・S3ともに取得できません: {sentiment_local} / S3:{sentiment_s3}")
 
+    @profiled("integration.load_perplexity_rankings", "integration")
     def _load_perplexity_rankings_data(self, raw_data: Dict[str, Any], verbose: bool = True, runs: int = None, storage_mode: str = None):
         """Perplexityランキングデータの読み込み"""
         from src.utils.storage_utils import load_json
@@ -391,6 +404,7 @@ def _load_perplexity_rankings_data(self, raw_data: Dict[str, Any], verbose: bool
                 else:
                     logger.warning(f"Perplexityランキングデータがローカル・S3ともに取得できません: {rankings_local} / S3:{rankings_s3}")
 
+    @profiled("integration.load_perplexity_citations", "integration")
     def _load_perplexity_citations_data(self, raw_data: Dict[str, Any], verbose: bool = True, runs: int = None, storage_mode: str = None):
         """Perplexity引用データの読み込み"""
         from src.utils.storage_utils import load_json
@@ -489,7 +503,9 @@ def _save_integrated_files(self, integrated_dataset: Dict[str, Any], dataset_sch
         else:  # auto or None
             dataset_s3_key = get_s3_key("corporate_bias_dataset.json", self.date_str, "integrated")
 
-        save_results(integrated_dataset, dataset_path, dataset_s3_key, verbose)
+        if save_results(integrated_dataset, dataset_path, dataset_s3_key, verbose):
+            # 順位行列のメモリマップ用サイドカー（ローカルのみ。分析時に順位行列の構築を省略）
+            write_numeric_sidecar(integrated_dataset, self.integrated_dir)
 
         # スキーマ保存（再生成された場合のみ）
         schema_regenerated = self.integration_metadata.get("schema_info", {}).get("schema_regenerated", True)
@@ -658,7 +674,8 @@ def list_output_files(self) -> List[str]:
             "corporate_bias_dataset.json",
             "dataset_schema.json",
             "collection_summary.json",
-            "integration_metadata.json"
+            "integration_metadata.json",
+            "numeric_sidecar.json"
         ]
 
         for filename in files_to_check:
@@ -1,12 +1,26 @@
 # データローダーパッケージ
-from .perplexity_sentiment_loader import main as perplexity_sentiment_main
-from .perplexity_ranking_loader import main as perplexity_ranking_main
-from .perplexity_citations_loader import main as perplexity_citations_main
-from .google_search_loader import main as google_search_main
+# 各ローダーは初回アクセス時にインポートする（1種類だけ収集する場合に他のローダーを読み込まない）
+import importlib
+
+_LAZY_EXPORTS = {
+    'perplexity_sentiment_main': '.perplexity_sentiment_loader',
+    'perplexity_ranking_main': '.perplexity_ranking_loader',
+    'perplexity_citations_main': '.perplexity_citations_loader',
+    'google_search_main': '.google_search_loader',
+}
 
 __all__ = [
     'perplexity_sentiment_main',
     'perplexity_ranking_main',
     'perplexity_citations_main',
     'google_search_main'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(module_name, __name__).main
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@
 """
 
 import os
+import logging
 import datetime
 import requests
 import time
@@ -14,7 +15,7 @@
 from typing import Dict, Any, List, Optional
 from tqdm import tqdm
 from ..utils import (
-    extract_domain,
+    extract_domains,
     get_results_paths
 )
 from ..utils.storage_utils import get_results_paths, save_results
@@ -24,7 +25,7 @@
 # 新しいユーティリティをインポート
 from ..utils import (
     get_config_manager, get_logger, setup_default_logging,
-    handle_errors, log_api_call, log_data_operation,
+    handle_errors, log_api_call, log_data_operation, log_event,
     APIError, DataError
 )
 
@@ -36,9 +37,6 @@
 api_config = config_manager.get_api_config()
 storage_config = config_manager.get_storage_config()
 
-# カテゴリ・サービスの定義読み込み
-categories = get_categories()
-
 # -------------------------------------------------------------------
 # ユーティリティ関数
 # -------------------------------------------------------------------
@@ -98,7 +96,7 @@ def get_google_search_results(query: str, num_results: int = 10) -> Dict[str, An
 
         response.raise_for_status()
         data = response.json()
-        print(f"APIレスポンス: {data}")
+        log_event(logger, logging.DEBUG, "Google Custom Search APIレスポンス", query=query, response=data)
 
         # 検索結果を整形
         results = {
@@ -129,11 +127,12 @@ def process_search_results(data, service_name=None, services_dict=None, include_
         return []
     organic_results = data["organic_results"]
     results = []
-    for i, result in enumerate(organic_results):
+    # ドメインは全結果のリンクからまとめて抽出
+    domains = extract_domains(result.get("link", "") for result in organic_results)
+    for i, (result, domain) in enumerate(zip(organic_results, domains)):
         title = result.get("title", "")
         link = result.get("link", "")
         snippet = result.get("snippet", "")
-        domain = extract_domain(link)
 
         result_dict = {
             "rank": i + 1,
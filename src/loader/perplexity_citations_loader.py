@@ -8,6 +8,7 @@
 """
 
 import os
+import logging
 import datetime
 import time
 import argparse
@@ -25,12 +26,12 @@
 from ..utils.storage_config import get_s3_key
 from ..categories import get_categories, get_all_categories
 from ..utils.perplexity_api import PerplexityAPI
-from ..prompts.prompt_manager import PromptManager
+from ..prompts.prompt_manager import get_prompt_manager
 
 # 新しいユーティリティをインポート
 from ..utils import (
     get_config_manager, get_logger, setup_default_logging,
-    handle_errors, log_api_call, log_data_operation,
+    handle_errors, log_api_call, log_data_operation, log_event,
     APIError, DataError
 )
 
@@ -44,9 +45,6 @@
 api_config = config_manager.get_api_config()
 storage_config = config_manager.get_storage_config()
 
-# プロンプトマネージャーのインスタンスを作成
-prompt_manager = PromptManager()
-
 
 def extract_references_from_text(text):
     """
@@ -194,7 +192,7 @@ def get_metadata_from_serp(urls):
 
         # 各URLに対してメタデータを取得
         for i, url in enumerate(unique_urls):
-            print(f"  URL {i+1}/{len(unique_urls)} のメタデータを取得中: {url}")
+            log_event(logger, logging.DEBUG, "URLメタデータ取得", index=i + 1, total=len(unique_urls), url=url)
 
             # パラメータの設定
             params = {
@@ -304,8 +302,8 @@ def collect_citation_rankings(categories: Dict[str, Any]) -> Dict[str, Any]:
                 api = PerplexityAPI(perplexity_api_key)
                 answer, citations = api.call_perplexity_api(query)
                 if answer:
-                    print(f"  Perplexityからの応答:\n{answer[:200]}...")
-                    print(f"  サービス: {service} の citations: {citations}")
+                    log_event(logger, logging.DEBUG, "Perplexity応答", service=service, query=query,
+                              answer=answer[:200], citations=citations)
                     citation_data = []
                     if citations:
                         for i, citation in enumerate(citations):
@@ -323,7 +321,8 @@ def collect_citation_rankings(categories: Dict[str, Any]) -> Dict[str, Any]:
                                     "is_official": is_official
                                 }
                                 citation_data.append(citation_item)
-                                print(f"  引用情報を取得: URL={url}, ドメイン={domain}, 公式={is_official}")
+                                log_event(logger, logging.DEBUG, "引用情報を取得", url=url, domain=domain,
+                                          is_official=is_official)
                         print(f"  APIから引用情報を取得: {len(citation_data)}件")
                     if citation_data:
                         entities_results[service]["official_results"] = citation_data
@@ -338,8 +337,8 @@ def collect_citation_rankings(categories: Dict[str, Any]) -> Dict[str, Any]:
                 api = PerplexityAPI(perplexity_api_key)
                 answer, citations = api.call_perplexity_api(query)
                 if answer:
-                    print(f"  Perplexityからの応答:\n{answer[:200]}...")
-                    print(f"  サービス: {service} の citations: {citations}")
+                    log_event(logger, logging.DEBUG, "Perplexity応答", service=service, query=query,
+                              answer=answer[:200], citations=citations)
                     citation_data = []
                     if citations:
                         for i, citation in enumerate(citations):
@@ -356,7 +355,7 @@ def collect_citation_rankings(categories: Dict[str, Any]) -> Dict[str, Any]:
                                 }
                                 citation_data.append(citation_item)
                                 reputation_urls.append(url)
-                                print(f"  引用情報を取得: URL={url}, ドメイン={domain}")
+                                log_event(logger, logging.DEBUG, "引用情報を取得", url=url, domain=domain)
                         print(f"  APIから引用情報を取得: {len(citation_data)}件")
                     if citation_data:
                         entities_results[service]["reputation_results"] = citation_data
@@ -409,7 +408,7 @@ def generate_summary(subcategory, services, all_answers):
     print(f"複数回の実行結果を要約中: {subcategory}")
 
     # プロンプトを取得
-    prompt = prompt_manager.get_citations_summary_prompt(subcategory, services, all_answers)
+    prompt = get_prompt_manager().get_citations_summary_prompt(subcategory, services, all_answers)
 
     # APIで要約を生成
     try:
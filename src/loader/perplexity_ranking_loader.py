@@ -6,12 +6,13 @@
 """
 
 import os
+import logging
 import datetime
 import time
 import argparse
 from typing import Dict, Any, List
 from ..categories import get_categories, get_all_categories, load_yaml_categories
-from ..prompts.prompt_manager import PromptManager
+from ..prompts.prompt_manager import get_prompt_manager
 from ..utils.text_utils import extract_ranking_and_reasons
 from ..utils.perplexity_api import PerplexityAPI
 from ..utils.storage_utils import save_results, get_results_paths
@@ -20,7 +21,7 @@
 # 新しいユーティリティをインポート
 from ..utils import (
     get_config_manager, get_logger, setup_default_logging,
-    handle_errors, log_api_call, log_data_operation,
+    handle_errors, log_api_call, log_data_operation, log_event,
     APIError, DataError
 )
 
@@ -32,9 +33,6 @@
 api_config = config_manager.get_api_config()
 storage_config = config_manager.get_storage_config()
 
-# PromptManagerのインスタンスを作成
-prompt_manager = PromptManager()
-
 @handle_errors
 def collect_rankings(api_key: str, categories: Dict[str, Any], num_runs: int = 1) -> Dict[str, Any]:
     """
@@ -84,7 +82,7 @@ def collect_rankings(api_key: str, categories: Dict[str, Any], num_runs: int = 1
                 if num_runs > 1:
                     print(f"  実行 {run+1}/{num_runs}")
 
-                prompt = prompt_manager.get_ranking_prompt(subcategory, services)
+                prompt = get_prompt_manager().get_ranking_prompt(subcategory, services)
                 models_to_try = api.get_models_to_try()
                 response = None
                 citations = []
@@ -93,7 +91,8 @@ def collect_rankings(api_key: str, categories: Dict[str, Any], num_runs: int = 1
                     if response:
                         break
                 all_responses.append(response)
-                print(f"  Perplexityからの応答:\n{response[:200]}...")
+                log_event(logger, logging.DEBUG, "Perplexity応答", subcategory=subcategory, run=run + 1,
+                          response=response[:200] if response else response)
 
                 # 改良された抽出関数を使用
                 ranking, _ = extract_ranking_and_reasons(response, original_services=services)
@@ -115,7 +114,7 @@ def collect_rankings(api_key: str, categories: Dict[str, Any], num_runs: int = 1
                 if len(ranking) != len(services):
                     print(f"  ⚠️ 警告: 抽出されたランキングが完全ではありません ({len(ranking)}/{len(services)})")
                 else:
-                    print(f"  ✓ ランキング抽出完了: {ranking}")
+                    log_event(logger, logging.DEBUG, "ランキング抽出完了", subcategory=subcategory, ranking=ranking)
 
                 if run < num_runs - 1 or processed < total_categories:
                     print("  APIレート制限を考慮して待機中...")
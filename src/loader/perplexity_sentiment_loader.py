@@ -6,7 +6,7 @@
 import os
 from typing import Dict, Any, List
 from ..categories import get_categories
-from ..prompts.prompt_manager import PromptManager
+from ..prompts.prompt_manager import get_prompt_manager
 from ..prompts.sentiment_prompts import extract_score
 import numpy as np
 import argparse
@@ -29,12 +29,6 @@
 api_config = config_manager.get_api_config()
 storage_config = config_manager.get_storage_config()
 
-# カテゴリとサービスの定義を取得
-categories = get_categories()
-
-# PromptManagerのインスタンスを作成
-prompt_manager = PromptManager()
-
 @handle_errors
 def process_categories_with_multiple_runs(api_key: str, categories: Dict[str, Any], num_runs: int = 5) -> Dict[str, Any]:
     """複数回実行して平均値を取得（マスクあり・マスクなし両方とも各num_runs回ずつAPIを呼び出す）
@@ -55,7 +49,7 @@ def process_categories_with_multiple_runs(api_key: str, categories: Dict[str, An
                 "masked_url": [],
                 "masked_avg": 0.0,
                 "masked_std_dev": 0.0,
-                "masked_prompt": prompt_manager.get_sentiment_prompt(subcategory, masked=True),
+                "masked_prompt": get_prompt_manager().get_sentiment_prompt(subcategory, masked=True),
                 "entities": {}
             }
             for competitor in competitors:
@@ -73,7 +67,7 @@ def process_categories_with_multiple_runs(api_key: str, categories: Dict[str, An
         print(f"マスクあり 実行 {run+1}/{num_runs}")
         for category, subcategories_data in categories.items():
             for subcategory, competitors in subcategories_data.items():
-                masked_prompt = prompt_manager.get_sentiment_prompt(subcategory, masked=True)
+                masked_prompt = get_prompt_manager().get_sentiment_prompt(subcategory, masked=True)
                 masked_result, masked_citations = api.call_perplexity_api(masked_prompt)
                 results[category][subcategory]["masked_prompt"] = masked_prompt
                 results[category][subcategory]["masked_answer"].append(masked_result)
@@ -97,7 +91,7 @@ def process_categories_with_multiple_runs(api_key: str, categories: Dict[str, An
         for category, subcategories_data in categories.items():
             for subcategory, competitors in subcategories_data.items():
                 for competitor in competitors:
-                    unmasked_prompt = prompt_manager.get_sentiment_prompt(subcategory, masked=False, competitor=competitor)
+                    unmasked_prompt = get_prompt_manager().get_sentiment_prompt(subcategory, masked=False, competitor=competitor)
                     unmasked_result, unmasked_citations = api.call_perplexity_api(unmasked_prompt)
                     results[category][subcategory]["entities"][competitor]["unmasked_answer"].append(unmasked_result)
                     if unmasked_citations and isinstance(unmasked_citations, list) and isinstance(unmasked_citations[0], dict) and "url" in unmasked_citations[0]:
@@ -166,6 +160,9 @@ def main():
     today_date = datetime.datetime.now().strftime("%Y%m%d")
     paths = get_results_paths(today_date)
 
+    # カテゴリとサービスの定義を取得
+    categories = get_categories()
+
     if args.runs > 1:
         print(f"Perplexity APIを使用して{args.runs}回の実行データを取得します")
         result = process_categories_with_multiple_runs(perplexity_api_key, categories, args.runs)
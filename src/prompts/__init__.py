@@ -1,4 +1,4 @@
 # プロンプトテンプレート用パッケージ
-from .prompt_manager import PromptManager
+from .prompt_manager import PromptManager, get_prompt_manager
 
-__all__ = ['PromptManager']
\ No newline at end of file
+__all__ = ['PromptManager', 'get_prompt_manager']
\ No newline at end of file
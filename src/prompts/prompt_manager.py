@@ -7,6 +7,7 @@
 """
 
 import os
+import hashlib
 import yaml
 from typing import Dict, Optional, List
 
@@ -140,6 +141,22 @@ def get_sentiment_analysis_prompt(self, texts: List[str]) -> str:
         numbered_texts = "\n".join([f"{i+1}. {text}" for i, text in enumerate(texts)])
         return template.format(numbered_texts=numbered_texts)
 
+    def get_sentiment_analysis_prompt_version(self) -> str:
+        """
+        感情分析用プロンプトのバージョンを取得
+
+        設定ファイルのバージョンとテンプレート内容のハッシュを組み合わせるため、
+        テンプレートを変更するとバージョンも変わる。
+
+        Returns
+        -------
+        str
+            プロンプトバージョン（例: "1.0-3f2a9c1b"）
+        """
+        template = self.config["sentiment_analysis"]["template"]
+        digest = hashlib.sha1(template.encode("utf-8")).hexdigest()[:8]
+        return f"{self.config.get('version', '0')}-{digest}"
+
     def get_score_pattern(self) -> str:
         """
         感情スコア抽出用の正規表現パターンを取得
@@ -160,4 +177,15 @@ def get_rank_patterns(self) -> List[str]:
         List[str]
             正規表現パターンのリスト
         """
-        return self.config["ranking"]["rank_patterns"]
\ No newline at end of file
+        return self.config["ranking"]["rank_patterns"]
+
+# PromptManagerのシングルトンインスタンス（初回利用時にYAMLを読み込む）
+_prompt_manager = None
+
+
+def get_prompt_manager() -> PromptManager:
+    """プロンプト管理インスタンスを取得（シングルトン）"""
+    global _prompt_manager
+    if _prompt_manager is None:
+        _prompt_manager = PromptManager()
+    return _prompt_manager
@@ -13,19 +13,16 @@
 import argparse
 from dotenv import load_dotenv
 
-from .prompt_manager import PromptManager
+from .prompt_manager import get_prompt_manager
 from src.utils.text_utils import extract_ranking_and_reasons
 
 # .envファイルから環境変数を読み込む（APIキー取得のため）
 load_dotenv()
 
-# プロンプトマネージャーのインスタンスを作成
-prompt_manager = PromptManager()
-
 # ランキング抽出用プロンプト
 def get_ranking_prompt(subcategory, services):
     """ランキング抽出用のプロンプトを生成"""
-    return prompt_manager.get_ranking_prompt(subcategory, services)
+    return get_prompt_manager().get_ranking_prompt(subcategory, services)
 
 def extract_ranking(text, services):
     """
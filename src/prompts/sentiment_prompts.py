@@ -5,21 +5,15 @@
 Perplexity APIのプロンプトテンプレート
 """
 import re
-from .prompt_manager import PromptManager
-
-# プロンプトマネージャーのインスタンスを作成
-prompt_manager = PromptManager()
+from .prompt_manager import get_prompt_manager
 
 def get_masked_prompt(subcategory):
     """マスクありプロンプトを生成"""
-    return prompt_manager.get_sentiment_prompt(subcategory, masked=True)
+    return get_prompt_manager().get_sentiment_prompt(subcategory, masked=True)
 
 def get_unmasked_prompt(subcategory, competitor):
     """マスクなしプロンプトを生成"""
-    return prompt_manager.get_sentiment_prompt(subcategory, masked=False, competitor=competitor)
-
-# 評価値抽出用の正規表現パターン
-SCORE_PATTERN = prompt_manager.get_score_pattern()
+    return get_prompt_manager().get_sentiment_prompt(subcategory, masked=False, competitor=competitor)
 
 def extract_score(text):
     """テキストから評価値（1～10点）を抽出する関数"""
@@ -27,7 +21,7 @@ def extract_score(text):
         return None
 
     # 主な抽出パターンを試す（設定ファイルのパターン）
-    match = re.search(SCORE_PATTERN, text, re.IGNORECASE)
+    match = re.search(get_prompt_manager().get_score_pattern(), text, re.IGNORECASE)
     if match:
         score = float(match.group(2))
         if 1 <= score <= 10:
@@ -16,6 +16,7 @@
 from .simple_change_detector import SimpleChangeDetector
 from .simple_content_generator import SimpleContentGenerator
 from .twitter_client import TwitterClient
+from .post_outbox import PostOutbox, PostScheduler, STATUS_FAILED, STATUS_PENDING, STATUS_POSTED
 
 # 新しいユーティリティをインポート
 from ..utils import (
@@ -31,7 +32,8 @@ class IntegratedPostingSystem:
     """統合投稿システム（S3DataLoader統合版）"""
 
     @handle_errors
-    def __init__(self, storage_mode: str = "auto", thresholds: Optional[Dict] = None, max_changes_per_post: int = 5):
+    def __init__(self, storage_mode: str = "auto", thresholds: Optional[Dict] = None, max_changes_per_post: int = 5,
+                 detection_window: Optional[int] = None):
         """
         Parameters:
         -----------
@@ -41,10 +43,16 @@ def __init__(self, storage_mode: str = "auto", thresholds: Optional[Dict] = None
             変化検知の閾値設定
         max_changes_per_post : int
             1投稿あたりの最大変化数
+        detection_window : Optional[int]
+            複数日付変化検知のベースライン日付数（1以下の場合は前回との2点比較、
+            未指定時は環境変数SNS_CHANGE_DETECTION_WINDOW）
         """
         # 設定管理システムを使用
         config_manager = get_config_manager()
         sns_config = config_manager.get_sns_config()
+        if detection_window is None:
+            detection_window = int(sns_config.get('change_detection_window', '7'))
+        self.detection_window = detection_window
 
         # 各コンポーネントを初期化
         self.s3_loader = S3DataLoader(storage_mode)
@@ -55,8 +63,19 @@ def __init__(self, storage_mode: str = "auto", thresholds: Optional[Dict] = None
         # 投稿設定
         self.posting_enabled = sns_config.get('twitter_posting_enabled', 'true').lower() == 'true'
 
+        # 実投稿時は投稿アウトボックス経由で投稿（レート制限時は保留し、次回実行時に再開）
+        self.outbox = None
+        self.scheduler = None
+        if self.posting_enabled and self.twitter_client.is_authenticated:
+            self.outbox = PostOutbox()
+            self.scheduler = PostScheduler(
+                self.twitter_client, self.outbox,
+                max_wait_seconds=float(sns_config.get('outbox_max_wait_seconds', '60'))
+            )
+
         log_analysis_step("IntegratedPostingSystem初期化", "initialization", success=True)
-        logger.info(f"統合投稿システムを初期化しました（ストレージモード: {storage_mode}, 投稿有効: {self.posting_enabled}）")
+        logger.info(f"統合投稿システムを初期化しました（ストレージモード: {storage_mode}, 投稿有効: {self.posting_enabled}, "
+                    f"検知ウィンドウ: {self.detection_window}）")
 
     def post_latest_changes(self, force_post: bool = False) -> Dict:
         """
@@ -87,8 +106,17 @@ def post_latest_changes(self, force_post: bool = False) -> Dict:
 
             logger.info(f"最新分析日付: {latest_date}")
 
-            # 2. 比較データを取得
-            comparison_data = self.s3_loader.load_comparison_data(latest_date)
+            # 保留中・投稿済みの投稿がある場合は変化検知・コンテンツ生成を省略
+            resumed = self._resume_outbox(latest_date)
+            if resumed is not None:
+                return resumed
+
+            # 複数日付ウィンドウでの変化検知
+            if self.detection_window > 1:
+                return self._post_windowed_changes(latest_date, force_post)
+
+            # 2. 比較用のエンティティ指標を取得（必要な指標のみを射影読み込み）
+            comparison_data = self.s3_loader.load_comparison_metrics(latest_date)
             if not comparison_data:
                 logger.error(f"比較データの取得に失敗しました: {latest_date}")
                 return {
@@ -97,18 +125,12 @@ def post_latest_changes(self, force_post: bool = False) -> Dict:
                     "error": "comparison_data_load_failed"
                 }
 
-            # 3. エンティティ指標を抽出
-            previous_metrics = {}
-            current_metrics = {}
-
-            if comparison_data.get("previous"):
-                previous_metrics = self.s3_loader.extract_entity_metrics(comparison_data["previous"])
-
-            current_metrics = self.s3_loader.extract_entity_metrics(comparison_data["current"])
+            previous_metrics = comparison_data["previous"]
+            current_metrics = comparison_data["current"]
 
             logger.info(f"指標抽出完了: 前回{len(previous_metrics)}件, 今回{len(current_metrics)}件")
 
-            # 4. 投稿実行
+            # 3. 投稿実行
             return self._execute_posting(
                 previous_metrics,
                 current_metrics,
@@ -143,8 +165,17 @@ def post_specific_date_changes(self, target_date: str, force_post: bool = False)
         try:
             logger.info(f"指定日付の変化検知・投稿処理を開始: {target_date}")
 
-            # 1. 比較データを取得
-            comparison_data = self.s3_loader.load_comparison_data(target_date)
+            # 保留中・投稿済みの投稿がある場合は変化検知・コンテンツ生成を省略
+            resumed = self._resume_outbox(target_date)
+            if resumed is not None:
+                return resumed
+
+            # 複数日付ウィンドウでの変化検知
+            if self.detection_window > 1:
+                return self._post_windowed_changes(target_date, force_post)
+
+            # 1. 比較用のエンティティ指標を取得（必要な指標のみを射影読み込み）
+            comparison_data = self.s3_loader.load_comparison_metrics(target_date)
             if not comparison_data:
                 logger.error(f"比較データの取得に失敗しました: {target_date}")
                 return {
@@ -153,18 +184,12 @@ def post_specific_date_changes(self, target_date: str, force_post: bool = False)
                     "error": "comparison_data_load_failed"
                 }
 
-            # 2. エンティティ指標を抽出
-            previous_metrics = {}
-            current_metrics = {}
-
-            if comparison_data.get("previous"):
-                previous_metrics = self.s3_loader.extract_entity_metrics(comparison_data["previous"])
-
-            current_metrics = self.s3_loader.extract_entity_metrics(comparison_data["current"])
+            previous_metrics = comparison_data["previous"]
+            current_metrics = comparison_data["current"]
 
             logger.info(f"指標抽出完了: 前回{len(previous_metrics)}件, 今回{len(current_metrics)}件")
 
-            # 3. 投稿実行
+            # 2. 投稿実行
             return self._execute_posting(
                 previous_metrics,
                 current_metrics,
@@ -180,8 +205,36 @@ def post_specific_date_changes(self, target_date: str, force_post: bool = False)
                 "error": str(e)
             }
 
+    def _post_windowed_changes(self, target_date: str, force_post: bool) -> Dict:
+        """
+        直近detection_window日付の指標履歴から変化を検知して投稿
+
+        Parameters:
+        -----------
+        target_date : str
+            対象日付（YYYYMMDD形式）
+        force_post : bool
+            強制投稿フラグ
+
+        Returns:
+        --------
+        Dict
+            投稿結果
+        """
+        history = self.s3_loader.load_metric_history(target_date, self.detection_window)
+        if not history.get(target_date):
+            logger.error(f"指標履歴の取得に失敗しました: {target_date}")
+            return {
+                "success": False,
+                "posted": False,
+                "error": "comparison_data_load_failed"
+            }
+
+        changes = self.detector.detect_changes_windowed(history, window=self.detection_window)
+        return self._execute_posting({}, history[target_date], target_date, force_post, changes=changes)
+
     def _execute_posting(self, previous_metrics: Dict, current_metrics: Dict,
-                        analysis_date: str, force_post: bool) -> Dict:
+                        analysis_date: str, force_post: bool, changes: Optional[List[Dict]] = None) -> Dict:
         """
         投稿処理を実行
 
@@ -195,6 +248,8 @@ def _execute_posting(self, previous_metrics: Dict, current_metrics: Dict,
             分析日付
         force_post : bool
             強制投稿フラグ
+        changes : Optional[List[Dict]]
+            検知済みの変化リスト（指定時は2点比較の変化検知を省略）
 
         Returns:
         --------
@@ -203,7 +258,8 @@ def _execute_posting(self, previous_metrics: Dict, current_metrics: Dict,
         """
         try:
             # 1. 変化検知
-            changes = self.detector.detect_changes(previous_metrics, current_metrics)
+            if changes is None:
+                changes = self.detector.detect_changes(previous_metrics, current_metrics)
             logger.info(f"変化検知結果: {len(changes)}件の変化を検出")
 
             # 2. コンテンツ生成
@@ -271,9 +327,61 @@ def _execute_posting(self, previous_metrics: Dict, current_metrics: Dict,
                 "error": str(e)
             }
 
+    def _resume_outbox(self, analysis_date: str) -> Optional[Dict]:
+        """
+        アウトボックスに分析日付の投稿があれば、変化検知・コンテンツ生成をせずに再開する
+
+        Parameters:
+        -----------
+        analysis_date : str
+            分析日付
+
+        Returns:
+        --------
+        Optional[Dict]
+            投稿結果（アウトボックスに該当する投稿がない・失敗で終了している場合はNone）
+        """
+        if self.outbox is None:
+            return None
+        entry = self.outbox.find(analysis_date)
+        if entry is None or entry["status"] not in (STATUS_PENDING, STATUS_POSTED):
+            return None
+
+        if entry["status"] == STATUS_POSTED:
+            logger.info(f"分析日付{analysis_date}の投稿は投稿済みです: {entry['tweet_ids']}")
+            return self._outbox_result(entry, posted=False, reason="already_posted")
+
+        logger.info(f"アウトボックスの保留中の投稿を再開します: {entry['key']}")
+        summary = self.scheduler.run_pending()
+        return self._outbox_result(self.outbox.get(entry["key"]), summary=summary)
+
+    def _outbox_result(self, entry: Dict, posted: Optional[bool] = None, reason: Optional[str] = None,
+                       summary: Optional[Dict] = None) -> Dict:
+        """アウトボックスのエントリから投稿結果を作成"""
+        result = {
+            "success": entry["status"] != STATUS_FAILED,
+            "posted": entry["status"] == STATUS_POSTED if posted is None else posted,
+            "tweet_id": entry["tweet_ids"][0] if entry["tweet_ids"] else None,
+            "tweet_ids": entry["tweet_ids"],
+            "content": "\n".join(entry["texts"]),
+            "changes_count": entry["metadata"].get("changes_count", 0),
+            "post_type": entry["post_type"],
+            "analysis_date": entry["analysis_date"],
+            "outbox_key": entry["key"]
+        }
+        if entry["status"] == STATUS_PENDING:
+            retry_at = (summary or {}).get("retry_at")
+            result["reason"] = "queued_rate_limited" if self.outbox.rate_limit_reset_at > self.scheduler.clock() else "queued_retry"
+            result["retry_at"] = datetime.fromtimestamp(retry_at).isoformat() if retry_at else None
+        elif reason:
+            result["reason"] = reason
+        if entry["status"] == STATUS_FAILED:
+            result["error"] = entry["last_error"]
+        return result
+
     def _execute_actual_post(self, content: str, changes: List[Dict], post_type: str, analysis_date: str) -> Dict:
         """
-        実際のX API投稿を実行
+        実際のX API投稿を実行（アウトボックスに登録してからスケジューラーで投稿）
 
         Parameters:
         -----------
@@ -294,23 +402,29 @@ def _execute_actual_post(self, content: str, changes: List[Dict], post_type: str
         try:
             logger.info("実際のX API投稿を実行")
 
-            # X API投稿を実行
-            result = self.twitter_client.post_text(content)
+            # 生成済みの投稿をアウトボックスに登録し、保留中の投稿（前回分を含む）を順に投稿
+            entry = self.outbox.enqueue([content], analysis_date, post_type, {"changes_count": len(changes)})
+            summary = self.scheduler.run_pending()
+            entry = self.outbox.get(entry["key"])
 
-            if result.get("success"):
-                logger.info(f"X API投稿成功: {result.get('tweet_id')}")
+            if entry["status"] == STATUS_POSTED:
+                logger.info(f"X API投稿成功: {entry['tweet_ids'][0]}")
                 return {
                     "success": True,
                     "posted": True,
-                    "tweet_id": result.get("tweet_id"),
+                    "tweet_id": entry["tweet_ids"][0],
                     "content": content,
                     "changes_count": len(changes),
                     "post_type": post_type,
                     "analysis_date": analysis_date,
                     "posted_at": datetime.now()
                 }
+            elif entry["status"] == STATUS_PENDING:
+                # レート制限・一時的なエラーは保留し、次回実行時に再開
+                logger.warning(f"X API投稿を保留しました: {entry['last_error']}")
+                return self._outbox_result(entry, summary=summary)
             else:
-                logger.error(f"X API投稿失敗: {result.get('error')}")
+                logger.error(f"X API投稿失敗: {entry['last_error']}")
                 # 投稿失敗時はシミュレーションモードにフォールバック
                 logger.info("シミュレーションモードにフォールバック")
                 return self._execute_simulation_post(content, changes, post_type, analysis_date)
@@ -384,6 +498,8 @@ def _log_posting_result(self, result: Dict, changes: List[Dict], post_type: str,
                         metric = change.get("metric", "不明")
                         change_rate = change.get("change_rate", 0)
                         logger.info(f"  {i}. {entity} - {metric}: {change_rate}%")
+            elif result.get("success"):
+                logger.info(f"投稿保留: {result.get('reason')} (再開予定: {result.get('retry_at')}) - 分析日: {analysis_date}")
             else:
                 logger.warning(f"投稿失敗: {result.get('error', 'unknown_error')}")
 
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+X/Twitter投稿のアウトボックスとレート制限対応スケジューラー
+
+生成済みの投稿テキストを冪等キー付きでアウトボックス（ローカルJSON + S3同期）に保存してから投稿する。
+レート制限（429）で投稿できなかった場合は、X APIが返したリセット時刻まで投稿を保留し、
+次回実行時（再起動後を含む）に変化検知・コンテンツ生成をやり直さずに保留中の投稿から再開する。
+スレッドは投稿済みのツイートIDを記録し、途中で止まった場合は最後のツイートへの返信として続きから投稿する。
+"""
+
+import os
+import time
+import hashlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..utils import get_logger
+from ..utils.storage_utils import save_results, load_json
+from ..utils.storage_config import S3_BUCKET_NAME, is_s3_enabled
+
+logger = get_logger(__name__)
+
+DEFAULT_OUTBOX_PATH = os.environ.get("SNS_OUTBOX_PATH", "corporate_bias_datasets/cache/sns_outbox.json")
+
+# レート制限のリセット時刻が取得できない場合の待機時間（X APIのレート制限ウィンドウは15分）
+DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 15 * 60
+
+# レート制限以外のエラーの再試行（指数バックオフの基準秒数・最大試行回数）
+RETRY_BACKOFF_SECONDS = 60
+MAX_ATTEMPTS = 5
+
+STATUS_PENDING = "pending"
+STATUS_POSTED = "posted"
+STATUS_FAILED = "failed"
+
+
+def make_idempotency_key(analysis_date: str, post_type: str, texts: List[str]) -> str:
+    """分析日付・投稿タイプ・投稿テキストから冪等キーを生成（同じ投稿は1件としてまとめる）"""
+    payload = "\x00".join([analysis_date or "", post_type or ""] + list(texts))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _to_epoch(value: Any) -> Optional[float]:
+    """レート制限ヘッダーの値（UNIX時刻の文字列）を数値に変換"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_reset_at(rate_limit_info: Optional[Dict], now: float,
+                        default_backoff: float = DEFAULT_RATE_LIMIT_BACKOFF_SECONDS) -> float:
+    """
+    レート制限情報から投稿を再開できる時刻を求める
+
+    15分ウィンドウ（x-rate-limit-reset）と、24時間の投稿上限を使い切った場合は
+    24時間ウィンドウ（x-user-limit-24hour-reset）の遅い方。ヘッダーがない場合は now + default_backoff。
+
+    Parameters:
+    -----------
+    rate_limit_info : Optional[Dict]
+        TwitterClient._extract_rate_limit_info の戻り値
+    now : float
+        現在時刻（UNIX時刻）
+    default_backoff : float
+        リセット時刻が不明な場合の待機秒数
+
+    Returns:
+    --------
+    float
+        再開可能時刻（UNIX時刻）
+    """
+    headers = (rate_limit_info or {}).get("rate_limit_headers") or {}
+    candidates = [_to_epoch(headers.get("x-rate-limit-reset"))]
+    if str(headers.get("x-user-limit-24hour-remaining")) == "0":
+        candidates.append(_to_epoch(headers.get("x-user-limit-24hour-reset")))
+    candidates = [c for c in candidates if c is not None and c > now]
+    return max(candidates) if candidates else now + default_backoff
+
+
+class PostOutbox:
+    """投稿アウトボックス（冪等キー → 投稿エントリ、ローカルJSON + S3同期）"""
+
+    def __init__(self, outbox_path: str = DEFAULT_OUTBOX_PATH):
+        """
+        Parameters:
+        -----------
+        outbox_path : str
+            アウトボックスファイルのローカルパス（S3キーにも同じパスを使用）
+        """
+        self.outbox_path = outbox_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.rate_limit_reset_at = 0.0
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """ローカル（なければS3）からアウトボックスを読み込む"""
+        data = None
+        try:
+            if os.path.exists(self.outbox_path):
+                data = load_json(self.outbox_path)
+            elif is_s3_enabled():
+                data = load_json(f"s3://{S3_BUCKET_NAME}/{self.outbox_path}")
+        except Exception as e:
+            logger.warning(f"投稿アウトボックスの読み込みに失敗しました（空のアウトボックスで続行）: {e}")
+
+        data = data or {}
+        self.entries = data.get("entries", {})
+        self.rate_limit_reset_at = float(data.get("rate_limit_reset_at") or 0.0)
+        logger.info(f"投稿アウトボックス読み込み: {len(self.entries)}件（保留中{len(self.pending())}件）")
+
+    def save(self, verbose: bool = False):
+        """変更があればアウトボックスを保存（ローカル + S3）"""
+        if not self._dirty:
+            return
+        data = {
+            "updated_at": datetime.now().isoformat(),
+            "rate_limit_reset_at": self.rate_limit_reset_at,
+            "entries": self.entries
+        }
+        s3_key = self.outbox_path if is_s3_enabled() else None
+        save_results(data, self.outbox_path, s3_key, verbose=verbose)
+        self._dirty = False
+
+    def enqueue(self, texts: List[str], analysis_date: str, post_type: str,
+                metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        投稿を登録（同じ冪等キーの投稿が既にあれば既存のエントリを返す）
+
+        失敗として終了したエントリを再登録した場合は、保留中に戻して再試行する。
+        投稿前に中断されても次回実行で再開できるよう、登録後すぐにアウトボックスを保存する。
+
+        Parameters:
+        -----------
+        texts : List[str]
+            投稿テキスト（2件以上の場合はスレッド）
+        analysis_date : str
+            分析日付
+        post_type : str
+            投稿タイプ
+        metadata : Optional[Dict[str, Any]]
+            結果に含める付加情報（変化数など）
+
+        Returns:
+        --------
+        Dict[str, Any]
+            投稿エントリ
+        """
+        key = make_idempotency_key(analysis_date, post_type, texts)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {
+                "key": key,
+                "analysis_date": analysis_date,
+                "post_type": post_type,
+                "texts": list(texts),
+                "metadata": metadata or {},
+                "status": STATUS_PENDING,
+                "tweet_ids": [],
+                "attempts": 0,
+                "not_before": 0.0,
+                "last_error": None,
+                "created_at": datetime.now().isoformat(),
+                "posted_at": None
+            }
+            self.entries[key] = entry
+            self._dirty = True
+        elif entry["status"] == STATUS_FAILED:
+            self.update(key, status=STATUS_PENDING, attempts=0, not_before=0.0)
+        self.save()
+        return entry
+
+    def update(self, key: str, **fields):
+        """エントリの項目を更新"""
+        self.entries[key].update(fields)
+        self._dirty = True
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """冪等キーでエントリを取得"""
+        return self.entries.get(key)
+
+    def find(self, analysis_date: str) -> Optional[Dict[str, Any]]:
+        """分析日付の最新のエントリを取得（なければNone）"""
+        matches = [entry for entry in self.entries.values() if entry.get("analysis_date") == analysis_date]
+        return max(matches, key=lambda entry: entry["created_at"]) if matches else None
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """保留中のエントリ（登録順）"""
+        return sorted((entry for entry in self.entries.values() if entry["status"] == STATUS_PENDING),
+                      key=lambda entry: entry["created_at"])
+
+    def set_rate_limit_reset(self, reset_at: float):
+        """アカウント単位のレート制限の再開時刻を記録"""
+        if reset_at > self.rate_limit_reset_at:
+            self.rate_limit_reset_at = reset_at
+            self._dirty = True
+
+
+class PostScheduler:
+    """アウトボックスの保留中の投稿を、レート制限ウィンドウを守って順に投稿する"""
+
+    def __init__(self, client, outbox: PostOutbox, max_wait_seconds: float = 0,
+                 max_attempts: int = MAX_ATTEMPTS,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        """
+        Parameters:
+        -----------
+        client : TwitterClient
+            投稿に使うクライアント（post_text・post_thread）
+        outbox : PostOutbox
+            投稿アウトボックス
+        max_wait_seconds : float
+            レート制限の再開まで実行中に待つ最大秒数（超える場合は保留して次回実行に回す）
+        max_attempts : int
+            レート制限以外のエラーでの最大試行回数
+        clock, sleep : Callable
+            現在時刻・待機の関数（テスト用）
+        """
+        self.client = client
+        self.outbox = outbox
+        self.max_wait_seconds = max_wait_seconds
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self.sleep = sleep
+
+    def run_pending(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        保留中の投稿を登録順に投稿し、1件ごとにアウトボックスを保存
+
+        レート制限はアカウント単位のため、429を受けた後の投稿は再開時刻まで待ち、
+        待ち時間が max_wait_seconds を超える場合は保留のまま次回実行に回す。
+        投稿後すぐに状態を保存するため、待機中・投稿直後に中断されても再投稿しない。
+
+        Parameters:
+        -----------
+        keys : Optional[Iterable[str]]
+            対象とする冪等キー（未指定時は全ての保留中の投稿）
+
+        Returns:
+        --------
+        Dict[str, Any]
+            {"posted": [キー], "failed": [キー], "pending": [キー], "retry_at": 再開予定時刻 or None}
+        """
+        targets = set(keys) if keys is not None else None
+        summary = {"posted": [], "failed": [], "pending": [], "retry_at": None}
+
+        try:
+            for entry in self.outbox.pending():
+                if targets is not None and entry["key"] not in targets:
+                    continue
+                # アカウント単位の再開時刻とエントリごとの再試行時刻の遅い方まで待つ
+                wait = max(self.outbox.rate_limit_reset_at, entry["not_before"]) - self.clock()
+                if wait > self.max_wait_seconds:
+                    summary["pending"].append(entry["key"])
+                    continue
+                if wait > 0:
+                    logger.info(f"レート制限の再開まで{wait:.0f}秒待機します")
+                    self.sleep(wait)
+
+                status = self._post(entry)
+                self.outbox.save()
+                summary[status].append(entry["key"])
+        finally:
+            self.outbox.save()
+
+        retry_times = [max(self.outbox.rate_limit_reset_at, self.outbox.get(key)["not_before"])
+                       for key in summary["pending"]]
+        summary["retry_at"] = min(retry_times) if retry_times else None
+        return summary
+
+    def _post(self, entry: Dict[str, Any]) -> str:
+        """1件の投稿（スレッドは続きから）を実行し、エントリの状態を返す"""
+        key = entry["key"]
+        texts = entry["texts"]
+        tweet_ids = list(entry["tweet_ids"])
+
+        if len(texts) == 1:
+            result = self.client.post_text(texts[0])
+            if result.get("success"):
+                tweet_ids.append(result.get("tweet_id"))
+        else:
+            result = self.client.post_thread(texts[len(tweet_ids):],
+                                             in_reply_to_tweet_id=tweet_ids[-1] if tweet_ids else None)
+            tweet_ids.extend(result.get("tweet_ids") or [])
+
+        now = self.clock()
+        if result.get("success"):
+            self.outbox.update(key, status=STATUS_POSTED, tweet_ids=tweet_ids, last_error=None,
+                               posted_at=datetime.now().isoformat())
+            logger.info(f"アウトボックスの投稿完了: {key} ({len(tweet_ids)}件)")
+            return STATUS_POSTED
+
+        error = result.get("error")
+        if "rate_limit_info" in result:
+            # レート制限は試行回数に数えず、再開時刻まで保留
+            reset_at = rate_limit_reset_at(result["rate_limit_info"], now)
+            self.outbox.set_rate_limit_reset(reset_at)
+            self.outbox.update(key, tweet_ids=tweet_ids, not_before=reset_at, last_error=error)
+            logger.warning(f"レート制限のため投稿を保留: {key}（再開予定 {datetime.fromtimestamp(reset_at).isoformat()}）")
+            return STATUS_PENDING
+
+        attempts = entry["attempts"] + 1
+        if attempts >= self.max_attempts:
+            self.outbox.update(key, status=STATUS_FAILED, tweet_ids=tweet_ids, attempts=attempts, last_error=error)
+            logger.error(f"投稿失敗（{attempts}回試行）: {key} - {error}")
+            return STATUS_FAILED
+
+        not_before = now + RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+        self.outbox.update(key, tweet_ids=tweet_ids, attempts=attempts, not_before=not_before, last_error=error)
+        logger.warning(f"投稿失敗のため再試行を予約（{attempts}/{self.max_attempts}回目）: {key} - {error}")
+        return STATUS_PENDING
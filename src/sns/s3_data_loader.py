@@ -12,10 +12,18 @@
 from typing import Dict, List, Optional
 from datetime import datetime
 
-from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.analysis.resource_registry import get_data_loader
 
 logger = logging.getLogger(__name__)
 
+# extract_entity_metricsが参照する指標のパス仕様（射影読み込み用）
+ENTITY_METRIC_PATHS = [
+    "sentiment_bias_analysis.*.*.entities.*.basic_metrics.normalized_bias_index",
+    "ranking_bias_analysis.*.*.entities.*.avg_rank",
+    "relative_bias_analysis.*.*.market_dominance_analysis.integrated_fairness.component_scores.service_fairness",
+    "relative_bias_analysis.*.*.market_dominance_analysis.integrated_fairness.component_scores.enterprise_fairness",
+]
+
 
 class S3DataLoader:
     """S3データローダー（SNS投稿機能用）"""
@@ -27,7 +35,7 @@ def __init__(self, storage_mode: str = "auto"):
         storage_mode : str
             ストレージモード（"local", "s3", "auto"）
         """
-        self.hybrid_loader = HybridDataLoader(storage_mode)
+        self.hybrid_loader = get_data_loader(storage_mode)
         self.storage_mode = storage_mode
 
         logger.info(f"S3DataLoader初期化: mode={storage_mode}")
@@ -54,6 +62,29 @@ def load_analysis_results(self, date: str) -> Optional[Dict]:
             logger.error(f"分析結果読み込み失敗: {date}, エラー: {e}")
             return None
 
+    def load_entity_metrics(self, date: str) -> Optional[Dict]:
+        """
+        指定日付のエンティティ別指標を射影読み込みで取得
+
+        分析結果全体を読み込まず、ENTITY_METRIC_PATHSに一致する値のみをストリーム読み込みする。
+
+        Parameters:
+        -----------
+        date : str
+            日付（YYYYMMDD形式）
+
+        Returns:
+        --------
+        Optional[Dict]
+            エンティティ別指標データ（読み込み失敗時はNone）
+        """
+        try:
+            projected = self.hybrid_loader.load_analysis_results_projection(date, ENTITY_METRIC_PATHS)
+            return self.extract_entity_metrics(projected)
+        except Exception as e:
+            logger.error(f"エンティティ指標読み込み失敗: {date}, エラー: {e}")
+            return None
+
     def load_integrated_data(self, date: str) -> Optional[Dict]:
         """
         指定日付の統合データを読み込み
@@ -200,6 +231,76 @@ def load_comparison_data(self, current_date: str) -> Optional[Dict]:
             logger.error(f"比較データ読み込み失敗: {e}")
             return None
 
+    def load_comparison_metrics(self, current_date: str) -> Optional[Dict]:
+        """
+        比較用のエンティティ指標（前回と今回）を射影読み込みで取得
+
+        load_comparison_dataと異なり、分析結果全体ではなく指標のみを読み込む。
+
+        Parameters:
+        -----------
+        current_date : str
+            現在の分析日付（YYYYMMDD形式）
+
+        Returns:
+        --------
+        Optional[Dict]
+            {"previous": {...}, "current": {...}, "previous_date": ..., "current_date": ...}
+            （前回データがない場合のpreviousは空辞書、今回データが読めない場合はNone）
+        """
+        current_metrics = self.load_entity_metrics(current_date)
+        if current_metrics is None:
+            logger.error(f"現在のエンティティ指標を読み込めません: {current_date}")
+            return None
+
+        previous_date = self.get_previous_analysis_date(current_date)
+        previous_metrics = self.load_entity_metrics(previous_date) if previous_date else None
+        if previous_date and previous_metrics is None:
+            logger.warning(f"前回のエンティティ指標を読み込めません: {previous_date}")
+
+        return {
+            "previous": previous_metrics or {},
+            "current": current_metrics,
+            "previous_date": previous_date,
+            "current_date": current_date
+        }
+
+    def load_metric_history(self, current_date: str, window: int = 7) -> Dict[str, Dict]:
+        """
+        現在日付を含む直近（window+1）日付分のエンティティ指標を読み込み
+
+        各日付の分析結果は射影読み込みにより必要な指標のみを取得する。
+
+        Parameters:
+        -----------
+        current_date : str
+            現在の分析日付（YYYYMMDD形式）
+        window : int
+            ベースラインに使用する過去日付数
+
+        Returns:
+        --------
+        Dict[str, Dict]
+            {日付: エンティティ別指標データ}
+        """
+        try:
+            dates = sorted(d for d in self.list_available_dates() if d <= current_date)
+            if current_date not in dates:
+                dates.append(current_date)
+
+            history = {}
+            for date in dates[-(window + 1):]:
+                entity_metrics = self.load_entity_metrics(date)
+                if entity_metrics:
+                    history[date] = entity_metrics
+
+            logger.info(f"指標履歴読み込み: {len(history)}日付 (〜{current_date})")
+            return history
+
+        except Exception as e:
+            logger.error(f"指標履歴読み込み失敗: {e}")
+            return {}
+
     def extract_entity_metrics(self, analysis_results: Dict) -> Dict:
         """
         分析結果からエンティティ別の指標を抽出
@@ -5,18 +5,35 @@
 シンプルな変化検知クラス
 
 前回と今回の分析結果を比較して、閾値を超えた変化を検知します。
+複数日付の指標履歴から、移動ベースライン・zスコア・変化点を用いて検知するモードも提供します。
 """
 
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import warnings
+from contextlib import contextmanager
+
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _suppress_nan_warnings():
+    """全欠損系列に対するnanmean/nanstdの警告を抑制"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        yield
+
+
 class SimpleChangeDetector:
     """シンプルな変化検知クラス"""
 
+    # CUSUM統計量の有意水準5%の臨界値（Kolmogorov-Smirnov分布）
+    CHANGE_POINT_CRITICAL_VALUE = 1.358
+
     def __init__(self, thresholds: Optional[Dict] = None):
         """
         Parameters:
@@ -84,6 +101,190 @@ def detect_changes(self, previous_data: Dict, current_data: Dict) -> List[Dict]:
             logger.error(f"変化検知エラー: {e}")
             return []
 
+    def build_metric_history(self, metrics_by_date: Dict[str, Dict]) -> Dict:
+        """
+        日付別のエンティティ指標を（日付×エンティティ×指標）の配列に変換
+
+        Parameters:
+        -----------
+        metrics_by_date : Dict[str, Dict]
+            {日付: {エンティティ: {指標名: 値}}} 形式の指標データ
+
+        Returns:
+        --------
+        Dict
+            {"dates": [...], "entities": [...], "metrics": [...], "values": np.ndarray}
+            欠損値はNaN
+        """
+        dates = sorted(d for d, metrics in metrics_by_date.items() if metrics)
+        entities = sorted({e for d in dates for e in metrics_by_date[d]})
+        metrics = list(self.thresholds.keys())
+        for d in dates:
+            for entity_metrics in metrics_by_date[d].values():
+                metrics.extend(m for m in entity_metrics if m not in metrics)
+
+        entity_index = {e: i for i, e in enumerate(entities)}
+        metric_index = {m: i for i, m in enumerate(metrics)}
+        values = np.full((len(dates), len(entities), len(metrics)), np.nan)
+
+        for t, d in enumerate(dates):
+            for entity, entity_metrics in metrics_by_date[d].items():
+                for metric, value in entity_metrics.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        values[t, entity_index[entity], metric_index[metric]] = value
+
+        return {"dates": dates, "entities": entities, "metrics": metrics, "values": values}
+
+    def detect_changes_windowed(self, metrics_by_date: Dict[str, Dict], window: int = 7,
+                                z_threshold: float = 2.0, min_history: int = 3) -> List[Dict]:
+        """
+        複数日付の指標履歴から、最新日付の変化を全エンティティ・全指標まとめて検知
+
+        直前window日分の移動ベースライン（平均・標準偏差）に対するzスコアと、
+        従来の閾値（変化率・順位変化）の両方を満たすものを変化とする。
+        履歴がmin_history日に満たない場合は直前日付との2点比較（detect_changes）にフォールバックする。
+
+        Parameters:
+        -----------
+        metrics_by_date : Dict[str, Dict]
+            {日付: {エンティティ: {指標名: 値}}} 形式の指標データ（最新日付が検知対象）
+        window : int
+            ベースラインに使用する過去日付数
+        z_threshold : float
+            zスコアの閾値（絶対値）
+        min_history : int
+            ベースライン計算に必要な最小過去日付数
+
+        Returns:
+        --------
+        List[Dict]
+            検知された変化のリスト（重要度順）。detect_changesの出力項目に加え、
+            baseline_std, z_score, window, change_point_date を含む
+        """
+        try:
+            history = self.build_metric_history(metrics_by_date)
+            dates = history["dates"]
+
+            if len(dates) - 1 < min_history:
+                logger.info(f"履歴日付数が不足しているため2点比較で検知します: {len(dates)}日付")
+                if len(dates) < 2:
+                    return self.detect_changes({}, metrics_by_date[dates[-1]]) if dates else []
+                return self.detect_changes(metrics_by_date[dates[-2]], metrics_by_date[dates[-1]])
+
+            entities, metrics = history["entities"], history["metrics"]
+            values = history["values"][-(window + 1):]
+            window_dates = dates[-(window + 1):]
+            current = values[-1]
+            past = values[:-1]
+
+            observed = np.sum(~np.isnan(past), axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"), _suppress_nan_warnings():
+                baseline = np.nanmean(past, axis=0)
+                baseline_std = np.nanstd(past, axis=0, ddof=1)
+            baseline_std = np.where(observed > 1, baseline_std, 0.0)
+            diff = current - baseline
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                z_scores = np.where(baseline_std > 0, diff / baseline_std,
+                                    np.where(diff != 0, np.sign(diff) * np.inf, 0.0))
+                relative_rate = np.where(baseline != 0, np.abs(diff / baseline) * 100,
+                                         np.where(current > 0, 100.0, 0.0))
+
+            is_rank = np.array([m == "avg_rank" for m in metrics])
+            thresholds = np.array([self.thresholds.get(m, np.inf) for m in metrics], dtype=float)
+            change_rate = np.where(is_rank, np.abs(diff), relative_rate)
+            exceeds = np.where(is_rank, np.abs(diff) >= thresholds, relative_rate >= thresholds * 100)
+
+            alerts = (~np.isnan(current) & (observed >= min_history) & exceeds
+                      & (np.abs(z_scores) >= z_threshold))
+            change_points = self._detect_change_points(values)
+
+            changes = []
+            for e, m in zip(*np.nonzero(alerts)):
+                metric = metrics[m]
+                rate = float(change_rate[e, m])
+                if is_rank[m]:
+                    change_type = "improved" if diff[e, m] < 0 else "declined"
+                    significance = self._get_significance_level(rate * 10)
+                else:
+                    change_type = "increase" if diff[e, m] > 0 else "decrease"
+                    significance = self._get_significance_level(rate)
+
+                cp = change_points[e, m]
+                changes.append({
+                    "entity": entities[e],
+                    "type": change_type,
+                    "metric": metric,
+                    "previous_value": float(baseline[e, m]),
+                    "current_value": float(current[e, m]),
+                    "change_rate": round(rate, 2),
+                    "significance": significance,
+                    "baseline_std": float(baseline_std[e, m]),
+                    "z_score": round(float(z_scores[e, m]), 2) if np.isfinite(z_scores[e, m]) else None,
+                    "window": int(observed[e, m]),
+                    "change_point_date": window_dates[cp] if cp >= 0 else None
+                })
+
+            # 履歴のない新規エンティティ
+            new_entities = ~np.any(~np.isnan(past), axis=(0, 2)) & np.any(~np.isnan(current), axis=1)
+            for e in np.nonzero(new_entities)[0]:
+                entity = entities[e]
+                logger.info(f"新規エンティティを検出: {entity}")
+                changes.append({
+                    "entity": entity,
+                    "type": "new_entity",
+                    "metric": "new",
+                    "previous_value": None,
+                    "current_value": metrics_by_date[dates[-1]].get(entity),
+                    "change_rate": 100.0,
+                    "significance": "high"
+                })
+
+            changes.sort(key=lambda x: self._get_significance_score(x), reverse=True)
+
+            logger.info(f"変化検知完了（{len(window_dates) - 1}日付ベースライン）: {len(changes)}件の変化を検出")
+            return changes
+
+        except Exception as e:
+            logger.error(f"変化検知エラー（複数日付）: {e}")
+            return []
+
+    def _detect_change_points(self, values: np.ndarray) -> np.ndarray:
+        """
+        CUSUM統計量で各系列（エンティティ×指標）の変化点を一括検出
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            （日付×エンティティ×指標）の配列（欠損値はNaN）
+
+        Returns:
+        --------
+        np.ndarray
+            （エンティティ×指標）の変化点インデックス（新しい水準の開始日付、検出なしは-1）
+        """
+        n_dates = values.shape[0]
+        if n_dates < 3:
+            return np.full(values.shape[1:], -1, dtype=int)
+
+        with np.errstate(invalid="ignore", divide="ignore"), _suppress_nan_warnings():
+            mean = np.nanmean(values, axis=0)
+            # 水準シフトの影響を受けないよう、ノイズの大きさは隣接日付の差分のMADから推定する
+            diffs = np.diff(values, axis=0)
+            std = np.nanmedian(np.abs(diffs), axis=0) * 1.4826 / np.sqrt(2)
+            # 大半の日付で値が一定（差分の中央値が0）の系列は、差分の標準偏差を下限として使う
+            std = np.where(std > 0, std, np.nanstd(diffs, axis=0) / np.sqrt(2))
+        filled = np.where(np.isnan(values), mean, values)
+        cusum = np.cumsum(filled - mean, axis=0)[:-1]
+
+        abs_cusum = np.abs(cusum)
+        split = np.argmax(abs_cusum, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            statistic = np.max(abs_cusum, axis=0) / (std * np.sqrt(n_dates))
+
+        significant = np.isfinite(statistic) & (statistic >= self.CHANGE_POINT_CRITICAL_VALUE)
+        return np.where(significant, split + 1, -1)
+
     def _detect_entity_changes(self, entity_id: str, previous_metrics: Dict, current_metrics: Dict) -> List[Dict]:
         """
         個別エンティティの変化を検知
@@ -75,8 +75,8 @@ def post_latest_changes(self, force_post: bool = False) -> Dict:
 
             logger.info(f"最新分析日付: {latest_date}")
 
-            # 2. 比較データを取得
-            comparison_data = self.s3_loader.load_comparison_data(latest_date)
+            # 2. 比較用のエンティティ指標を取得（必要な指標のみを射影読み込み）
+            comparison_data = self.s3_loader.load_comparison_metrics(latest_date)
             if not comparison_data:
                 logger.error(f"比較データの取得に失敗しました: {latest_date}")
                 return {
@@ -85,18 +85,12 @@ def post_latest_changes(self, force_post: bool = False) -> Dict:
                     "error": "comparison_data_load_failed"
                 }
 
-            # 3. エンティティ指標を抽出
-            previous_metrics = {}
-            current_metrics = {}
-
-            if comparison_data.get("previous"):
-                previous_metrics = self.s3_loader.extract_entity_metrics(comparison_data["previous"])
-
-            current_metrics = self.s3_loader.extract_entity_metrics(comparison_data["current"])
+            previous_metrics = comparison_data["previous"]
+            current_metrics = comparison_data["current"]
 
             logger.info(f"指標抽出完了: 前回{len(previous_metrics)}件, 今回{len(current_metrics)}件")
 
-            # 4. 投稿実行
+            # 3. 投稿実行
             return self._execute_posting(
                 previous_metrics,
                 current_metrics,
@@ -131,8 +125,8 @@ def post_changes_for_date(self, target_date: str, force_post: bool = False) -> D
         try:
             logger.info(f"指定日付の変化検知・投稿処理を開始: {target_date}")
 
-            # 1. 比較データを取得
-            comparison_data = self.s3_loader.load_comparison_data(target_date)
+            # 1. 比較用のエンティティ指標を取得（必要な指標のみを射影読み込み）
+            comparison_data = self.s3_loader.load_comparison_metrics(target_date)
             if not comparison_data:
                 logger.error(f"比較データの取得に失敗しました: {target_date}")
                 return {
@@ -141,18 +135,12 @@ def post_changes_for_date(self, target_date: str, force_post: bool = False) -> D
                     "error": "comparison_data_load_failed"
                 }
 
-            # 2. エンティティ指標を抽出
-            previous_metrics = {}
-            current_metrics = {}
-
-            if comparison_data.get("previous"):
-                previous_metrics = self.s3_loader.extract_entity_metrics(comparison_data["previous"])
-
-            current_metrics = self.s3_loader.extract_entity_metrics(comparison_data["current"])
+            previous_metrics = comparison_data["previous"]
+            current_metrics = comparison_data["current"]
 
             logger.info(f"指標抽出完了: 前回{len(previous_metrics)}件, 今回{len(current_metrics)}件")
 
-            # 3. 投稿実行
+            # 2. 投稿実行
             return self._execute_posting(
                 previous_metrics,
                 current_metrics,
@@ -235,7 +235,10 @@ def _extract_rate_limit_info(self, error) -> Dict:
                         "rate_limit_headers": {
                             "x-rate-limit-limit": headers.get('x-rate-limit-limit'),
                             "x-rate-limit-remaining": headers.get('x-rate-limit-remaining'),
-                            "x-rate-limit-reset": headers.get('x-rate-limit-reset')
+                            "x-rate-limit-reset": headers.get('x-rate-limit-reset'),
+                            "x-user-limit-24hour-limit": headers.get('x-user-limit-24hour-limit'),
+                            "x-user-limit-24hour-remaining": headers.get('x-user-limit-24hour-remaining'),
+                            "x-user-limit-24hour-reset": headers.get('x-user-limit-24hour-reset')
                         }
                     }
                 else:
@@ -330,19 +333,24 @@ def post_with_image(self, text: str, image_path: str) -> Dict:
                 "error": str(e)
             }
 
-    def post_thread(self, texts: list) -> Dict:
+    def post_thread(self, texts: list, in_reply_to_tweet_id: Optional[str] = None) -> Dict:
         """
         スレッド投稿
 
+        途中で失敗した場合も投稿済みのツイートIDを返すため、呼び出し側は最後のIDへの返信として
+        残りのテキストから再開できる。
+
         Parameters:
         -----------
         texts : list
             投稿するテキストのリスト
+        in_reply_to_tweet_id : Optional[str]
+            最初のテキストを返信として投稿する先のツイートID（途中再開用）
 
         Returns:
         --------
         Dict
-            投稿結果
+            投稿結果（失敗時も "tweet_ids" に投稿済みのID、429の場合は "rate_limit_info" を含む）
         """
         if not self.is_authenticated:
             return {
@@ -364,15 +372,22 @@ def post_thread(self, texts: list) -> Dict:
                     text = text[:277] + "..."
                 validated_texts.append(text)
 
-            # スレッド投稿を実行
+            # スレッド投稿を実行（各ツイートは直前のツイートへの返信）
             tweet_ids = []
-            in_reply_to_tweet_id = None
 
             for text in validated_texts:
-                response = self.client.create_tweet(
-                    text=text,
-                    in_reply_to_tweet_id=in_reply_to_tweet_id
-                )
+                try:
+                    response = self.client.create_tweet(
+                        text=text,
+                        in_reply_to_tweet_id=in_reply_to_tweet_id
+                    )
+                except Exception as e:
+                    logger.error(f"スレッド投稿の一部が失敗（{len(tweet_ids)}/{len(validated_texts)}件投稿済み）: {e}")
+                    result = {"success": False, "error": str(e), "tweet_ids": tweet_ids}
+                    if "429" in str(e):
+                        result["error"] = "レート制限に達しました"
+                        result["rate_limit_info"] = self._extract_rate_limit_info(e)
+                    return result
 
                 if response and response.data:
                     tweet_id = response.data['id']
@@ -380,21 +395,19 @@ def post_thread(self, texts: list) -> Dict:
                     in_reply_to_tweet_id = tweet_id
                 else:
                     logger.error(f"スレッド投稿の一部が失敗: {text[:50]}...")
-                    break
+                    return {
+                        "success": False,
+                        "error": "スレッド投稿レスポンスが不正です",
+                        "tweet_ids": tweet_ids
+                    }
 
-            if tweet_ids:
-                logger.info(f"Xスレッド投稿成功: {len(tweet_ids)}件")
-                return {
-                    "success": True,
-                    "tweet_ids": tweet_ids,
-                    "texts": validated_texts,
-                    "created_at": datetime.now()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "スレッド投稿に失敗しました"
-                }
+            logger.info(f"Xスレッド投稿成功: {len(tweet_ids)}件")
+            return {
+                "success": True,
+                "tweet_ids": tweet_ids,
+                "texts": validated_texts,
+                "created_at": datetime.now()
+            }
 
         except Exception as e:
             logger.error(f"Xスレッド投稿失敗: {e}")
@@ -5,16 +5,22 @@
 共通ユーティリティパッケージ
 
 複数モジュールで使用する共通関数を提供します。
+描画系（matplotlib・seaborn・plotly等）を読み込むplot_utilsの関数は初回アクセス時にインポートします。
 """
 
+import importlib
+
 # text utils
-from .text_utils import extract_domain, is_negative, ratio
+from .text_utils import extract_domain, extract_domains, unique_domains, registrable_domain, is_negative, ratio
 
 # rank utils
 from .rank_utils import rbo, rank_map, compute_tau, compute_delta_ranks
 
-# plot utils
-from .plot_utils import plot_delta_ranks, plot_market_impact
+# plot utils（遅延インポート: 名前 → モジュール）
+_LAZY_EXPORTS = {
+    "plot_delta_ranks": ".plot_utils",
+    "plot_market_impact": ".plot_utils",
+}
 
 # storage utils (統合ファイル操作・ストレージAPI)
 from .storage_utils import (
@@ -41,5 +47,25 @@
 from .logger import (
     setup_logger, get_logger, setup_default_logging,
     log_function_call, log_function_result, log_data_operation,
-    log_api_call, log_analysis_step
-)
\ No newline at end of file
+    log_api_call, log_analysis_step,
+    log_event, configure_log_sampling, reset_log_sampling, stop_queue_listeners
+)
+
+# profiling
+from .profiling import (
+    Profiler, get_profiler, configure_profiling, profile_span, profiled, finalize_profiling
+)
+
+
+def __getattr__(name):
+    """遅延インポート対象の名前を初回アクセス時に読み込む"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -139,6 +139,8 @@ def get_sns_config(self) -> Dict[str, str]:
             'twitter_posting_enabled': self.get_env('TWITTER_POSTING_ENABLED', 'false'),
             'sns_monitoring_enabled': self.get_env('SNS_MONITORING_ENABLED', 'false'),
             'today_date': self.get_env('TODAY_DATE', ''),
+            'change_detection_window': self.get_env('SNS_CHANGE_DETECTION_WINDOW', '7'),
+            'outbox_max_wait_seconds': self.get_env('SNS_OUTBOX_MAX_WAIT_SECONDS', '60'),
         }
 
     def validate_config(self, config_type: str) -> bool:
@@ -170,6 +172,10 @@ def clear_cache(self) -> None:
         """設定キャッシュをクリア"""
         self._cache.clear()
 
+    def invalidate_cache(self, config_path: str) -> None:
+        """指定した設定ファイルのキャッシュを破棄（次回読み込み時にファイルから再読み込み）"""
+        self._cache.pop(config_path, None)
+
 
 # グローバルインスタンス
 _config_manager = None
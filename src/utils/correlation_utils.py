@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+グループ別相関分析のユーティリティモジュール
+
+サブカテゴリ等のグループごとのPearson/Spearman相関を、グループ単位のループではなく
+（グループ×要素）のパディング行列上の配列演算で一括計算する機能を提供します。
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+DEFAULT_PERMUTATION_SEED = 42
+
+
+def _pad_groups(values: np.ndarray, group_ids: np.ndarray, n_groups: int, fill: float):
+    """グループIDに従って値を（グループ×要素）の左詰め行列に配置"""
+    sizes = np.bincount(group_ids, minlength=n_groups)
+    order = np.argsort(group_ids, kind="stable")
+    sorted_groups = group_ids[order]
+    group_start = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    position = np.arange(group_ids.size) - group_start[sorted_groups]
+
+    matrix = np.full((n_groups, max(int(sizes.max(initial=0)), 1)), fill)
+    matrix[sorted_groups, position] = values[order]
+    return matrix
+
+
+def _masked_pearson(x: np.ndarray, y: np.ndarray, mask: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """最終軸方向のPearson相関係数（maskがFalseの要素は無視、定数列はNaN）"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_dev = np.where(mask, x - np.sum(np.where(mask, x, 0.0), axis=-1, keepdims=True) / n[..., None], 0.0)
+        y_dev = np.where(mask, y - np.sum(np.where(mask, y, 0.0), axis=-1, keepdims=True) / n[..., None], 0.0)
+        r = np.sum(x_dev * y_dev, axis=-1) / np.sqrt(np.sum(x_dev ** 2, axis=-1) * np.sum(y_dev ** 2, axis=-1))
+    return np.clip(r, -1.0, 1.0)
+
+
+def _pearson_p_values(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """相関係数の両側p値（t分布。n ≤ 2 の場合は1.0）"""
+    df = np.maximum(n - 2, 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = r * np.sqrt(df / (1.0 - r ** 2))
+    p_values = 2 * stats.t.sf(np.abs(t), df)
+    return np.where(n <= 2, np.where(np.isnan(r), np.nan, 1.0), p_values)
+
+
+def grouped_correlations(x: Sequence[float], y: Sequence[float], group_ids: Sequence[int],
+                         n_groups: Optional[int] = None, n_permutations: int = 0,
+                         seed: Optional[int] = DEFAULT_PERMUTATION_SEED) -> Dict[str, Any]:
+    """
+    グループごとのPearson/Spearman相関を一括計算
+
+    Parameters:
+    -----------
+    x, y : Sequence[float]
+        相関を計算する値（同じ長さ）
+    group_ids : Sequence[int]
+        各要素のグループID（0 〜 n_groups-1）
+    n_groups : int, optional
+        グループ数（未指定時は max(group_ids)+1）
+    n_permutations : int
+        置換検定の反復回数（0の場合は置換検定を行わない）
+    seed : int, optional
+        置換行列生成の乱数シード
+
+    Returns:
+    --------
+    Dict[str, Any]
+        n, pearson, pearson_p, spearman, spearman_p（各グループの配列）。
+        n_permutations > 0 の場合は pearson_permutation_p, spearman_permutation_p も含む
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    group_ids = np.asarray(group_ids, dtype=int)
+    if n_groups is None:
+        n_groups = int(group_ids.max()) + 1 if group_ids.size else 0
+
+    n = np.bincount(group_ids, minlength=n_groups).astype(float)
+    x_matrix = _pad_groups(x, group_ids, n_groups, np.inf)
+    y_matrix = _pad_groups(y, group_ids, n_groups, np.inf)
+    mask = np.isfinite(x_matrix)
+
+    # パディング（+inf）は常に最大順位となるため、有効要素の順位（平均順位）には影響しない
+    x_ranks = stats.rankdata(x_matrix, axis=1)
+    y_ranks = stats.rankdata(y_matrix, axis=1)
+
+    pearson = _masked_pearson(x_matrix, y_matrix, mask, n)
+    spearman = _masked_pearson(x_ranks, y_ranks, mask, n)
+    result = {
+        "n": n.astype(int),
+        "pearson": pearson,
+        "pearson_p": _pearson_p_values(pearson, n),
+        "spearman": spearman,
+        "spearman_p": _pearson_p_values(spearman, n)
+    }
+
+    if n_permutations > 0 and n_groups > 0:
+        result["pearson_permutation_p"] = _permutation_p_values(x_matrix, y_matrix, mask, n, pearson,
+                                                                 n_permutations, seed)
+        result["spearman_permutation_p"] = _permutation_p_values(x_ranks, y_ranks, mask, n, spearman,
+                                                                  n_permutations, seed)
+
+    return result
+
+
+def _permutation_p_values(x: np.ndarray, y: np.ndarray, mask: np.ndarray, n: np.ndarray,
+                          observed: np.ndarray, n_permutations: int, seed: Optional[int]) -> np.ndarray:
+    """
+    全グループで共有する置換行列を用いた両側置換検定p値
+
+    乱数キー行列（置換回数×最大要素数）を1つだけ生成し、各グループでは有効要素の範囲の
+    キーの順序で y を並べ替える。p値は (1 + #{|r_perm| ≥ |r_obs|}) / (1 + 置換回数)。
+    """
+    rng = np.random.default_rng(seed)
+    keys = rng.random((n_permutations, x.shape[1]))
+
+    # (置換回数, グループ, 要素) の添字行列：パディング位置は末尾に固定
+    masked_keys = np.where(mask[None, :, :], keys[:, None, :], np.inf)
+    permutation = np.argsort(masked_keys, axis=-1)
+    y_permuted = np.take_along_axis(np.broadcast_to(y, masked_keys.shape), permutation, axis=-1)
+
+    permuted = _masked_pearson(x[None, :, :], y_permuted, mask[None, :, :], n[None, :])
+    with np.errstate(invalid="ignore"):
+        exceed = np.sum(np.abs(permuted) >= np.abs(observed)[None, :] - 1e-12, axis=0)
+    p_values = (1.0 + exceed) / (1.0 + n_permutations)
+    return np.where(np.isnan(observed), np.nan, p_values)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+図の一括描画パイプライン
+
+plot_utils の図生成関数を、入力データのコンテンツハッシュでキャッシュしながら一括描画します。
+- 入力データ・描画関数名・plot_utils のソースから求めたハッシュがマニフェストと一致する図は再描画しない
+- 描画が必要な図はヘッドレスバックエンド（Agg）のプロセスプールで並列描画する
+- S3へのアップロードはスレッドプールで並行実行し、アップロード済みハッシュが一致する図は再アップロードしない
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .storage_utils import (
+    get_s3_client, should_save_to_s3, figure_s3_key, guess_figure_content_type
+)
+from .storage_config import S3_BUCKET_NAME
+
+logger = logging.getLogger(__name__)
+
+FIGURE_MANIFEST_FILENAME = ".figure_manifest.json"
+DEFAULT_UPLOAD_WORKERS = 8
+
+# 描画関数の実装が変わった場合にキャッシュを無効化するためのソースファイル
+_PLOT_UTILS_PATH = Path(__file__).with_name("plot_utils.py")
+
+
+class FigureSpec:
+    """描画する図の定義（描画関数名・引数・出力先）"""
+
+    def __init__(self, builder: str, kwargs: Dict[str, Any], output_path: str,
+                 s3_key: Optional[str] = None, dpi: int = 100):
+        """
+        Parameters:
+        -----------
+        builder : str
+            plot_utils の図生成関数名（output_path=None で図オブジェクトを返す関数）
+        kwargs : Dict[str, Any]
+            図生成関数の引数（JSONで表現できる値）
+        output_path : str
+            ローカル出力パス（拡張子で形式を決定、.html はplotlyの図）
+        s3_key : str, optional
+            S3キー（未指定時はローカルパスから生成）
+        dpi : int
+            解像度
+        """
+        self.builder = builder
+        self.kwargs = kwargs
+        self.output_path = output_path
+        self.s3_key = s3_key or figure_s3_key(output_path)
+        self.dpi = dpi
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _code_fingerprint() -> str:
+    try:
+        return hashlib.sha256(_PLOT_UTILS_PATH.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def figure_content_hash(spec: FigureSpec, code_fingerprint: str = None) -> str:
+    """図の入力データ・描画関数・描画設定から内容ハッシュを計算"""
+    payload = json.dumps({
+        "builder": spec.builder,
+        "kwargs": spec.kwargs,
+        "dpi": spec.dpi,
+        "format": os.path.splitext(spec.output_path)[1].lower(),
+        "code": _code_fingerprint() if code_fingerprint is None else code_fingerprint
+    }, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _init_render_worker() -> None:
+    """描画ワーカーの初期化（ヘッドレスバックエンドを設定）"""
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def _render_figure(builder: str, kwargs: Dict[str, Any], output_path: str, dpi: int) -> Tuple[bool, Optional[str]]:
+    """図を1枚描画して保存（ワーカープロセスで実行）。戻り値は (成功, エラーメッセージ)"""
+    try:
+        from . import plot_utils
+        import matplotlib.pyplot as plt
+
+        fig = getattr(plot_utils, builder)(**kwargs)
+        if fig is None:
+            return False, "図が生成されませんでした"
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 書き込み途中のファイルがキャッシュとして残らないよう一時ファイル経由で保存
+        root, ext = os.path.splitext(output_path)
+        temp_path = f"{root}.tmp{ext}"
+        if hasattr(fig, "savefig"):
+            fig.savefig(temp_path, dpi=dpi, bbox_inches="tight", format=ext.lstrip(".") or None)
+            plt.close(fig)
+        elif hasattr(fig, "write_html"):
+            fig.write_html(temp_path)
+        else:
+            return False, f"未対応の図オブジェクトです: {type(fig).__name__}"
+        os.replace(temp_path, output_path)
+        return True, None
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+class FigureRenderPipeline:
+    """コンテンツハッシュでキャッシュする図の並列描画・並行アップロード"""
+
+    def __init__(self, manifest_path: str, workers: int = None, upload_workers: int = DEFAULT_UPLOAD_WORKERS,
+                 storage_mode: str = None):
+        """
+        Parameters:
+        -----------
+        manifest_path : str
+            描画済み・アップロード済みハッシュを記録するマニフェストのパス
+        workers : int, optional
+            描画プロセス数（1の場合は逐次描画、未指定時はCPU数）
+        upload_workers : int
+            S3アップロードの並行数
+        storage_mode : str, optional
+            ストレージモード（未指定時は環境変数STORAGE_MODE）
+        """
+        self.manifest_path = manifest_path
+        self.workers = workers or os.cpu_count() or 1
+        self.upload_workers = max(1, upload_workers)
+        self.storage_mode = storage_mode
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("figures", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, figures: Dict[str, Dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"figures": figures}, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    def _render_all(self, specs: List[FigureSpec]) -> Dict[str, Optional[str]]:
+        """図を描画し、出力パス→エラーメッセージ（成功時None）を返す"""
+        results = {}
+        if self.workers <= 1 or len(specs) <= 1:
+            _init_render_worker()
+            for spec in specs:
+                ok, error = _render_figure(spec.builder, spec.kwargs, spec.output_path, spec.dpi)
+                results[spec.output_path] = None if ok else error
+            return results
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(specs)), initializer=_init_render_worker) as executor:
+            futures = {
+                executor.submit(_render_figure, spec.builder, spec.kwargs, spec.output_path, spec.dpi): spec
+                for spec in specs
+            }
+            for future in as_completed(futures):
+                spec = futures[future]
+                try:
+                    ok, error = future.result()
+                except Exception as e:  # ワーカープロセスの異常終了等
+                    ok, error = False, f"{type(e).__name__}: {e}"
+                results[spec.output_path] = None if ok else error
+        return results
+
+    def _upload_all(self, specs: List[FigureSpec]) -> Dict[str, Optional[str]]:
+        """図をS3に並行アップロードし、出力パス→エラーメッセージ（成功時None）を返す"""
+        s3_client = get_s3_client()
+
+        def upload(spec: FigureSpec) -> Optional[str]:
+            try:
+                s3_client.upload_file(spec.output_path, S3_BUCKET_NAME, spec.s3_key,
+                                      ExtraArgs={"ContentType": guess_figure_content_type(spec.output_path)})
+                return None
+            except Exception as e:
+                return f"{type(e).__name__}: {e}"
+
+        with ThreadPoolExecutor(max_workers=min(self.upload_workers, len(specs))) as executor:
+            futures = {executor.submit(upload, spec): spec for spec in specs}
+            return {futures[future].output_path: future.result() for future in as_completed(futures)}
+
+    def run(self, specs: List[FigureSpec], force: bool = False) -> Dict[str, Any]:
+        """
+        図を一括描画・アップロード
+
+        Parameters:
+        -----------
+        specs : List[FigureSpec]
+            描画する図の定義
+        force : bool
+            キャッシュを無視して全て再描画・再アップロードするか
+
+        Returns:
+        --------
+        Dict[str, Any]
+            total, rendered, render_skipped, uploaded, upload_skipped, failed（出力パス→エラー）, elapsed_seconds
+        """
+        started = time.perf_counter()
+        manifest = self._load_manifest()
+        code_fingerprint = _code_fingerprint()
+        hashes = {spec.output_path: figure_content_hash(spec, code_fingerprint) for spec in specs}
+        failed: Dict[str, str] = {}
+
+        # 1. 内容が変わった図・ファイルが存在しない図のみ描画
+        to_render = [spec for spec in specs if force or not os.path.exists(spec.output_path)
+                     or manifest.get(spec.output_path, {}).get("hash") != hashes[spec.output_path]]
+        if to_render:
+            logger.info(f"図の描画: {len(to_render)}/{len(specs)}件（workers={min(self.workers, len(to_render))}）")
+            for output_path, error in self._render_all(to_render).items():
+                if error:
+                    failed[output_path] = error
+                    manifest.pop(output_path, None)
+                else:
+                    manifest[output_path] = {"hash": hashes[output_path]}
+            self._save_manifest(manifest)
+
+        rendered = len(to_render) - len(failed)
+
+        # 2. アップロード済みハッシュと一致しない図のみアップロード
+        uploaded = 0
+        upload_skipped = 0
+        if should_save_to_s3(self.storage_mode):
+            to_upload = [spec for spec in specs if spec.output_path not in failed and (
+                force or manifest.get(spec.output_path, {}).get("uploaded_hash") != hashes[spec.output_path])]
+            upload_skipped = len(specs) - len(failed) - len(to_upload)
+            if to_upload:
+                logger.info(f"図のS3アップロード: {len(to_upload)}件（並行数={min(self.upload_workers, len(to_upload))}）")
+                for output_path, error in self._upload_all(to_upload).items():
+                    if error:
+                        failed[output_path] = f"S3アップロード失敗: {error}"
+                    else:
+                        manifest[output_path]["uploaded_hash"] = hashes[output_path]
+                        uploaded += 1
+                self._save_manifest(manifest)
+
+        for output_path, error in failed.items():
+            logger.warning(f"図の生成に失敗: {output_path}: {error}")
+
+        return {
+            "total": len(specs),
+            "rendered": rendered,
+            "render_skipped": len(specs) - len(to_render),
+            "uploaded": uploaded,
+            "upload_skipped": upload_skipped,
+            "failed": failed,
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
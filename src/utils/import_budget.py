@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+エントリーポイントのインポート時間計測と予算チェック
+
+各エントリーポイントを新しいPythonプロセスで読み込み（スクリプトは __main__ 以外の名前で
+トップレベルのみ実行し、main() は呼ばない）、所要時間と読み込まれたモジュールを計測します。
+SNS投稿・データ検証など短時間で終わるCIジョブが、使わない描画系・統計系ライブラリを
+インポート時に読み込んでいないことを確認するために使用します。
+"""
+
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# インポート時に読み込むと数百ms〜数秒かかるライブラリ
+HEAVY_MODULES = (
+    "matplotlib", "japanize_matplotlib", "seaborn", "plotly", "networkx",
+    "scipy", "pandas", "statsmodels", "boto3"
+)
+PLOTTING_MODULES = ("matplotlib", "japanize_matplotlib", "seaborn", "plotly", "networkx")
+
+LOADER_MODULES = (
+    "src.loader.perplexity_sentiment_loader", "src.loader.perplexity_ranking_loader",
+    "src.loader.perplexity_citations_loader", "src.loader.google_search_loader"
+)
+
+
+def _other_loaders(loader: str) -> Tuple[str, ...]:
+    return tuple(name for name in LOADER_MODULES if name != loader)
+
+
+# エントリーポイント → (予算ミリ秒, インポート時に読み込んではいけないモジュール)
+IMPORT_BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "scripts/sns/github_actions_sns_posting.py": (1000, HEAVY_MODULES),
+    "scripts/utils/validate_data.py": (1000, HEAVY_MODULES),
+    "scripts/data/collect_data.py": (1000, HEAVY_MODULES + LOADER_MODULES),
+    "scripts/data/integrate_data.py": (1000, HEAVY_MODULES),
+    "scripts/analysis/run_batch_analysis.py": (1000, HEAVY_MODULES),
+    "scripts/analysis/generate_figures.py": (1000, HEAVY_MODULES),
+    "scripts/analysis/run_bias_analysis.py": (4000, PLOTTING_MODULES),
+    "scripts/analysis/run_market_simulation.py": (4000, PLOTTING_MODULES),
+    "src.analysis.sentiment_analyzer": (1000, HEAVY_MODULES),
+    "src.integrator.create_integrated_dataset": (1000, HEAVY_MODULES),
+    **{loader: (1000, HEAVY_MODULES + _other_loaders(loader)) for loader in LOADER_MODULES},
+}
+
+_MEASURE_CODE = """
+import sys, json, time, runpy, importlib
+entry_point = sys.argv[1]
+started = time.perf_counter()
+if entry_point.endswith(".py"):
+    runpy.run_path(entry_point, run_name="import_budget")
+else:
+    importlib.import_module(entry_point)
+elapsed = time.perf_counter() - started
+print("IMPORT_BUDGET_RESULT " + json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """
+    -X importtime の出力からトップレベルのインポートと累積時間（μs）を抽出
+
+    Parameters:
+    -----------
+    stderr : str
+        python -X importtime の標準エラー出力
+
+    Returns:
+    --------
+    List[Tuple[str, int]]
+        (モジュール名, 累積μs) のリスト（累積時間の降順）
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        # ネストしたインポートは名前の前にインデントが付く（トップレベルは空白1つ）
+        if len(name) - len(name.lstrip(" ")) == 1:
+            entries.append((name.strip(), int(parts[1])))
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return entries
+
+
+def _matches(module: str, prefixes: Iterable[str]) -> List[str]:
+    return [prefix for prefix in prefixes if module == prefix or module.startswith(prefix + ".")]
+
+
+def measure_import(entry_point: str, repeat: int = 1, python: Optional[str] = None,
+                   cwd: Optional[str] = None) -> Dict[str, Any]:
+    """
+    エントリーポイントのインポート時間と読み込まれたモジュールを別プロセスで計測
+
+    Parameters:
+    -----------
+    entry_point : str
+        スクリプトパス（.py、プロジェクトルート相対）またはモジュール名
+    repeat : int
+        計測回数（最小値を採用）
+    python : str, optional
+        Python実行ファイル（デフォルト: 現在のインタプリタ）
+    cwd : str, optional
+        実行ディレクトリ（デフォルト: プロジェクトルート）
+
+    Returns:
+    --------
+    Dict[str, Any]
+        entry_point, elapsed_ms, modules, slowest（トップレベルの遅いインポート上位5件）
+    """
+    cwd = str(cwd or PROJECT_ROOT)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [cwd, env.get("PYTHONPATH")]))
+
+    best = None
+    for _ in range(max(1, repeat)):
+        completed = subprocess.run(
+            [python or sys.executable, "-X", "importtime", "-c", _MEASURE_CODE, entry_point],
+            capture_output=True, text=True, cwd=cwd, env=env
+        )
+        marker = [line for line in completed.stdout.splitlines() if line.startswith("IMPORT_BUDGET_RESULT ")]
+        if completed.returncode != 0 or not marker:
+            error_lines = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+            raise RuntimeError(f"インポートに失敗しました: {entry_point}: {' '.join(error_lines[-3:])}")
+        payload = json.loads(marker[-1][len("IMPORT_BUDGET_RESULT "):])
+        elapsed_ms = payload["elapsed"] * 1000
+        if best is None or elapsed_ms < best["elapsed_ms"]:
+            best = {
+                "entry_point": entry_point,
+                "elapsed_ms": elapsed_ms,
+                "modules": payload["modules"],
+                "slowest": [(name, us / 1000) for name, us in parse_importtime(completed.stderr)[:5]]
+            }
+    return best
+
+
+def check_import_budget(entry_point: str, budget_ms: float, forbidden: Sequence[str] = (),
+                        repeat: int = 1) -> Dict[str, Any]:
+    """
+    エントリーポイントがインポート時間予算内で、禁止モジュールを読み込んでいないかを確認
+
+    Returns:
+    --------
+    Dict[str, Any]
+        measure_import の結果に budget_ms, forbidden_loaded, ok を加えたもの
+    """
+    result = measure_import(entry_point, repeat=repeat)
+    forbidden_loaded = sorted({prefix for module in result["modules"] for prefix in _matches(module, forbidden)})
+    result.update({
+        "budget_ms": budget_ms,
+        "forbidden_loaded": forbidden_loaded,
+        "ok": result["elapsed_ms"] <= budget_ms and not forbidden_loaded
+    })
+    return result
+
+
+def check_import_budgets(entry_points: Optional[Iterable[str]] = None, repeat: int = 1) -> List[Dict[str, Any]]:
+    """IMPORT_BUDGETS の全エントリーポイント（または指定分）を確認"""
+    names = list(entry_points) if entry_points else list(IMPORT_BUDGETS)
+    results = []
+    for name in names:
+        budget_ms, forbidden = IMPORT_BUDGETS[name]
+        results.append(check_import_budget(name, budget_ms, forbidden, repeat=repeat))
+    return results
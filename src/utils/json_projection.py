@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+JSON射影読み込みモジュール
+
+大きなJSONファイルをチャンク単位でストリーム読み込みし、パス仕様に一致する値のみを
+実体化する。一致しない部分木は文字列・括弧の走査だけで読み飛ばすため、
+ファイル全体をパースした辞書を保持する場合に比べてメモリ使用量を大幅に抑えられる。
+
+パス仕様はドット区切りの文字列で、`*` は任意のキー（配列の場合は任意のインデックス）に一致する。
+    "sentiment_bias_analysis.*.*.entities.*.basic_metrics.normalized_bias_index"
+
+戻り値は元のJSONと同じ階層構造を持つ辞書で、一致したパスのみを含む
+（配列を経由するパスでは、インデックスを文字列キーとした辞書になる）。
+"""
+
+import io
+import re
+import json
+import codecs
+from typing import Any, Dict, Iterable, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_BODY = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+# 数値・リテラル（json.dump/json.loadsと同じくNaN・Infinity・-Infinityも受け付ける）
+_SCALAR = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null|NaN|-?Infinity")
+_SCALAR_CHARS = frozenset("0123456789+-.eEtrufalsnNIiy")
+
+# パス仕様トライ内で「ここで一致完了」を表すキー
+_TERMINAL = None
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def compile_path_spec(paths: Iterable[str]) -> Dict:
+    """
+    ドット区切りのパス仕様をトライ構造に変換
+
+    Parameters:
+    -----------
+    paths : Iterable[str]
+        パス仕様のリスト（`*` はワイルドカード）
+
+    Returns:
+    --------
+    Dict
+        セグメント -> 子トライ の入れ子辞書（一致完了ノードは None キーを持つ）
+    """
+    trie = {}
+    for path in paths:
+        node = trie
+        for segment in path.split("."):
+            node = node.setdefault(segment, {})
+        node[_TERMINAL] = True
+    return trie
+
+
+def _children(trie: Dict, key: str):
+    """キーに一致する子トライ（完全一致とワイルドカード）を結合して返す"""
+    exact = trie.get(key)
+    wildcard = trie.get("*")
+    if exact is None:
+        return wildcard
+    if wildcard is None:
+        return exact
+    return _merge_tries(exact, wildcard)
+
+
+def _merge_tries(a: Dict, b: Dict) -> Dict:
+    """2つのトライを結合"""
+    merged = dict(a)
+    for key, child in b.items():
+        if key is _TERMINAL:
+            merged[_TERMINAL] = True
+        elif key in merged:
+            merged[key] = _merge_tries(merged[key], child)
+        else:
+            merged[key] = child
+    return merged
+
+
+class _StreamReader:
+    """チャンク単位でJSONテキストを読み進めるリーダー"""
+
+    def __init__(self, fp, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.mark = None
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """次のチャンクを読み込む（読み込み済み部分はmark/pos以前を破棄）"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        base = self.pos if self.mark is None else min(self.mark, self.pos)
+        self.buf = self.buf[base:] + chunk
+        self.pos -= base
+        if self.mark is not None:
+            self.mark -= base
+        return True
+
+    def peek(self) -> str:
+        """空白を読み飛ばして次の文字を返す"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("JSONの途中でファイルが終了しました")
+
+    def expect(self, char: str):
+        """次の文字が指定文字であることを確認して読み進める"""
+        if self.peek() != char:
+            raise ValueError(f"JSON構文エラー: '{char}' が必要です (位置 {self.pos})")
+        self.pos += 1
+
+    def _match_string(self):
+        """現在位置の文字列リテラルの終端位置を返す"""
+        while True:
+            match = _STRING_BODY.match(self.buf, self.pos + 1)
+            if match:
+                return match.end()
+            if not self._fill():
+                raise ValueError("文字列リテラルが閉じられていません")
+
+    def read_string(self) -> str:
+        """文字列リテラルを読み込む"""
+        if self.peek() != '"':
+            raise ValueError(f"JSON構文エラー: 文字列が必要です (位置 {self.pos})")
+        end = self._match_string()
+        text = self.buf[self.pos:end]
+        self.pos = end
+        return json.loads(text)
+
+    def _match_scalar(self):
+        """現在位置の数値・リテラルの終端位置を返す"""
+        while True:
+            match = _SCALAR.match(self.buf, self.pos)
+            # チャンク境界で数値が途切れている可能性があるため、後続文字まで確認する
+            if match and (self.eof or (match.end() < len(self.buf)
+                                       and self.buf[match.end()] not in _SCALAR_CHARS)):
+                return match.end()
+            if not self._fill():
+                if match:
+                    return match.end()
+                raise ValueError(f"JSON構文エラー: 不正な値です (位置 {self.pos})")
+
+    def skip_value(self):
+        """値を実体化せずに読み飛ばす"""
+        char = self.peek()
+        if char == '"':
+            self.pos = self._match_string()
+        elif char in "[{":
+            self.pos += 1
+            depth = 1
+            while depth:
+                match = _STRUCTURE.search(self.buf, self.pos)
+                if match is None:
+                    self.pos = len(self.buf)
+                    if not self._fill():
+                        raise ValueError("JSONの途中でファイルが終了しました")
+                    continue
+                token = match.group()
+                if token == '"':
+                    self.pos = match.start()
+                    self.pos = self._match_string()
+                else:
+                    depth += 1 if token in "[{" else -1
+                    self.pos = match.end()
+        else:
+            self.pos = self._match_scalar()
+
+    def read_value(self) -> Any:
+        """値を実体化して返す"""
+        char = self.peek()
+        if char == '"':
+            return self.read_string()
+        self.mark = self.pos
+        try:
+            self.skip_value()
+            return json.loads(self.buf[self.mark:self.pos])
+        finally:
+            self.mark = None
+
+
+def _project(reader: _StreamReader, trie: Dict):
+    """トライに一致する部分のみを実体化（一致なしの場合はNoneを返す）"""
+    char = reader.peek()
+    if char not in "[{":
+        reader.skip_value()
+        return None
+
+    result = {}
+    is_object = char == "{"
+    reader.pos += 1
+    index = 0
+    closing = "}" if is_object else "]"
+
+    if reader.peek() == closing:
+        reader.pos += 1
+        return None
+
+    while True:
+        if is_object:
+            key = reader.read_string()
+            reader.expect(":")
+        else:
+            key = str(index)
+            index += 1
+
+        child = _children(trie, key)
+        if child is None:
+            reader.skip_value()
+        elif _TERMINAL in child:
+            result[key] = reader.read_value()
+        else:
+            value = _project(reader, child)
+            if value:
+                result[key] = value
+
+        char = reader.peek()
+        reader.pos += 1
+        if char == closing:
+            break
+        if char != ",":
+            raise ValueError(f"JSON構文エラー: ',' または '{closing}' が必要です")
+
+    return result
+
+
+def load_json_projection(source: Union[str, io.IOBase], paths: Iterable[str],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
+    """
+    JSONをストリーム読み込みし、パス仕様に一致する値のみを含む辞書を返す
+
+    Parameters:
+    -----------
+    source : str or file-like
+        ファイルパス、またはread()を持つオブジェクト（テキスト・バイナリ両対応。S3のStreamingBody等）
+    paths : Iterable[str]
+        パス仕様のリスト
+    chunk_size : int
+        1回の読み込みサイズ
+
+    Returns:
+    --------
+    Dict
+        一致したパスのみを含む辞書（一致なしの場合は空辞書）
+    """
+    trie = compile_path_spec(paths)
+
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as f:
+            return _project(_StreamReader(f, chunk_size), trie) or {}
+
+    sample = source.read(0)
+    if isinstance(sample, bytes):
+        source = codecs.getreader("utf-8")(source)
+    return _project(_StreamReader(source, chunk_size), trie) or {}
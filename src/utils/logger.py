@@ -5,13 +5,24 @@
 標準化ログ出力モジュール
 
 統一されたログフォーマットと出力機能を提供します。
+
+ホットループ向けに、以下の低オーバーヘッドなログ出力も提供します。
+- log_event(): レベル判定を最初に行い、メッセージは出力時まで整形しない構造化イベント
+- configure_log_sampling(): モジュール単位のサンプリング・レート制限
+- setup_logger(use_queue=True): キュー経由で別スレッドが書き込む非ブロッキング出力
 """
 
+import os
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from .config_manager import get_config_manager
 
@@ -67,18 +78,67 @@ def __init__(self):
         )
 
 
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    レコードを整形せずにキューへ渡すハンドラー
+
+    標準のQueueHandlerは呼び出し元スレッドでメッセージを整形するため、
+    整形（遅延メッセージの文字列化を含む）もリスナースレッド側で行うようにする。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# ロガー名 → 稼働中のキューリスナー
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_queue_lock = threading.Lock()
+
+
+def stop_queue_listeners() -> None:
+    """全キューリスナーを停止（キューに残ったレコードは書き出してから停止）"""
+    with _queue_lock:
+        listeners = list(_queue_listeners.values())
+        _queue_listeners.clear()
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(stop_queue_listeners)
+
+
+def _attach_handlers(logger: logging.Logger, handlers: List[logging.Handler], use_queue: bool) -> None:
+    """ハンドラーを直接、またはキュー経由で登録"""
+    if not use_queue:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    with _queue_lock:
+        _queue_listeners[logger.name] = listener
+    logger.addHandler(NonBlockingQueueHandler(log_queue))
+
+
 def setup_logger(name: str = None, level: str = 'INFO',
                 log_file: Optional[str] = None,
                 use_structured: bool = False,
                 include_timestamp: bool = True,
-                include_module: bool = True) -> logging.Logger:
-    """ロガーの設定"""
+                include_module: bool = True,
+                use_queue: bool = False) -> logging.Logger:
+    """ロガーの設定（name=""はルートロガー。use_queue=Trueの場合、出力はキュー経由で別スレッドが行う）"""
 
     # ロガーの取得
-    logger = logging.getLogger(name or __name__)
+    logger = logging.getLogger(__name__ if name is None else name)
 
-    # 既存のハンドラーをクリア
+    # 既存のハンドラー・キューリスナーをクリア
     logger.handlers.clear()
+    with _queue_lock:
+        previous_listener = _queue_listeners.pop(logger.name, None)
+    if previous_listener:
+        previous_listener.stop()
 
     # ログレベルの設定
     log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
@@ -93,7 +153,7 @@ def setup_logger(name: str = None, level: str = 'INFO',
     # コンソールハンドラー
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # ファイルハンドラー（指定された場合）
     if log_file:
@@ -102,7 +162,9 @@ def setup_logger(name: str = None, level: str = 'INFO',
 
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    _attach_handlers(logger, handlers, use_queue)
 
     return logger
 
@@ -112,6 +174,157 @@ def get_logger(name: str = None) -> logging.Logger:
     return logging.getLogger(name or __name__)
 
 
+class LogSamplingPolicy:
+    """
+    モジュール単位のサンプリング・レート制限
+
+    sample_rate は決定的に間引く（0.1 なら10件に1件、最初の1件は必ず出力）。
+    max_per_second はトークンバケットによる1秒あたりの上限。
+    抑制した件数は次に出力されるイベントの suppressed フィールドに付与する。
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_per_second: Optional[float] = None):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rateは0〜1で指定してください: {sample_rate}")
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self._seen = 0
+        self._tokens = float(max_per_second) if max_per_second else 0.0
+        self._last_refill = time.monotonic()
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[int]:
+        """出力する場合はそれまでの抑制件数、抑制する場合はNoneを返す"""
+        with self._lock:
+            if self.sample_rate < 1.0:
+                # n件目（0始まり）は floor(n × 割合) が増えたときのみ出力
+                n = self._seen
+                self._seen += 1
+                sampled = self.sample_rate > 0 and (
+                    n == 0 or int(n * self.sample_rate + 1e-9) != int((n - 1) * self.sample_rate + 1e-9))
+                if not sampled:
+                    self._suppressed += 1
+                    return None
+
+            if self.max_per_second:
+                now = time.monotonic()
+                self._tokens = min(float(self.max_per_second),
+                                   self._tokens + (now - self._last_refill) * self.max_per_second)
+                self._last_refill = now
+                if self._tokens < 1.0:
+                    self._suppressed += 1
+                    return None
+                self._tokens -= 1.0
+
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
+
+
+# ロガー名の接頭辞 → サンプリング設定
+_sampling_policies: Dict[str, LogSamplingPolicy] = {}
+# ロガー名 → 適用される設定（最長一致の解決結果のキャッシュ）
+_resolved_policies: Dict[str, Optional[LogSamplingPolicy]] = {}
+
+
+def configure_log_sampling(module: str, sample_rate: float = 1.0,
+                           max_per_second: Optional[float] = None) -> None:
+    """
+    log_event() のサンプリング・レート制限を設定
+
+    Parameters:
+    -----------
+    module : str
+        対象ロガー名の接頭辞（例: "src.analysis"）。配下のロガーにも適用される
+    sample_rate : float
+        出力する割合（0〜1）
+    max_per_second : float, optional
+        1秒あたりの最大出力件数
+    """
+    _sampling_policies[module] = LogSamplingPolicy(sample_rate, max_per_second)
+    _resolved_policies.clear()
+
+
+def reset_log_sampling() -> None:
+    """全てのサンプリング・レート制限設定を解除"""
+    _sampling_policies.clear()
+    _resolved_policies.clear()
+
+
+def configure_log_sampling_from_env(env_var: str = "LOG_SAMPLING") -> None:
+    """
+    環境変数からサンプリング設定を読み込み
+
+    書式: "モジュール=割合[:1秒あたり上限],..."（例: "src.analysis=0.1:20,src.loader=1:5"）
+    """
+    spec = os.environ.get(env_var, "").strip()
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        module, _, setting = item.partition("=")
+        rate, _, limit = setting.partition(":")
+        configure_log_sampling(module.strip(), float(rate or 1.0), float(limit) if limit else None)
+
+
+def _resolve_policy(name: str) -> Optional[LogSamplingPolicy]:
+    if name not in _resolved_policies:
+        matches = [prefix for prefix in _sampling_policies if name == prefix or name.startswith(prefix + ".")]
+        _resolved_policies[name] = _sampling_policies[max(matches, key=len)] if matches else None
+    return _resolved_policies[name]
+
+
+class _LazyEventMessage:
+    """出力時にのみ "イベント key=value ..." 形式へ整形されるメッセージ"""
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: Dict[str, Any]):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.event
+        return f"{self.event}: " + ", ".join(f"{key}={value}" for key, value in self.fields.items())
+
+
+def log_event(logger: logging.Logger, level: int, event: str, **fields: Any) -> bool:
+    """
+    構造化イベントを低オーバーヘッドで記録
+
+    レベルが無効な場合は即座に戻り、メッセージの整形は一切行わない。
+    有効な場合もサンプリング・レート制限を適用し、整形はハンドラーが出力する時点まで遅延する。
+    フィールドは StructuredFormatter の出力にもそのまま含まれる。
+
+    Parameters:
+    -----------
+    logger : logging.Logger
+        出力先ロガー
+    level : int
+        ログレベル（logging.DEBUG 等）
+    event : str
+        イベント名（メッセージ本文）
+    **fields
+        付随する値（整形は出力時）
+
+    Returns:
+    --------
+    bool
+        出力した場合True
+    """
+    if not logger.isEnabledFor(level):
+        return False
+
+    policy = _resolve_policy(logger.name)
+    if policy is not None:
+        suppressed = policy.allow()
+        if suppressed is None:
+            return False
+        if suppressed:
+            fields["suppressed"] = suppressed
+
+    logger.log(level, _LazyEventMessage(event, fields), extra={"extra_fields": fields}, stacklevel=2)
+    return True
+
+
 def log_function_call(func_name: str, args: tuple = None, kwargs: dict = None,
                      logger: logging.Logger = None) -> None:
     """関数呼び出しをログに記録"""
@@ -216,17 +429,27 @@ def log_analysis_step(step_name: str, analysis_type: str,
         logger.error(f"分析ステップ失敗: {json.dumps(analysis_info, ensure_ascii=False)}")
 
 
-def setup_default_logging(verbose: bool = False, log_file: str = None) -> None:
-    """デフォルトログ設定"""
-    level = 'DEBUG' if verbose else 'INFO'
+def setup_default_logging(verbose: bool = False, log_file: str = None, use_queue: bool = None) -> None:
+    """
+    デフォルトログ設定
+
+    環境変数 LOG_LEVEL（verbose指定時はDEBUG）、LOG_QUEUE_ENABLED（キュー経由の非ブロッキング出力）、
+    LOG_SAMPLING（log_eventのサンプリング設定）を反映する。
+    各モジュールのロガー（src.*・スクリプトの__main__）に適用されるよう、ルートロガーに設定する。
+    """
+    level = 'DEBUG' if verbose else os.environ.get('LOG_LEVEL', 'INFO')
+    if use_queue is None:
+        use_queue = os.environ.get('LOG_QUEUE_ENABLED', 'false').lower() in ('true', '1', 'yes')
 
-    # プロジェクト全体のログ設定
+    # プロジェクト全体のログ設定（モジュールのロガーはルートロガーへ伝播する）
     setup_logger(
-        name='corporate_bias_study',
+        name='',
         level=level,
         log_file=log_file,
-        use_structured=False  # デフォルトはシンプルフォーマット
+        use_structured=False,  # デフォルトはシンプルフォーマット
+        use_queue=use_queue
     )
+    configure_log_sampling_from_env()
 
     # 外部ライブラリのログレベルを調整
     logging.getLogger('urllib3').setLevel(logging.WARNING)
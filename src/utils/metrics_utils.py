@@ -8,7 +8,7 @@
 """
 
 import numpy as np
-from typing import Dict, List, Union, Any
+from typing import Dict, List, Union, Any, Optional, Sequence
 
 def calculate_hhi(market_share: Dict[str, float]) -> float:
     """
@@ -34,7 +34,30 @@ def calculate_hhi(market_share: Dict[str, float]) -> float:
         return 0.0
 
     # シェアを百分率に変換して二乗和を計算
-    return sum((share * 100) ** 2 for share in market_share.values())
+    return float(calculate_hhi_batch([list(market_share.values())])[0])
+
+def calculate_hhi_batch(shares, normalize: bool = False) -> np.ndarray:
+    """
+    行ごとのHHIを一括計算（行: サブカテゴリ・ブートストラップ複製など、列: 企業・サービス）
+
+    Parameters:
+    -----------
+    shares : array-like
+        [行, 企業] のシェア（0〜1の割合）。NaNは欠損（0として扱う）
+    normalize : bool
+        Trueの場合は各行を合計1に正規化してから計算（合計0の行は0）
+
+    Returns:
+    --------
+    np.ndarray
+        [行] のHHI値（0〜10000）
+    """
+    matrix = np.atleast_2d(np.asarray(shares, dtype=float))
+    matrix = np.where(np.isnan(matrix), 0.0, matrix)
+    if normalize:
+        totals = matrix.sum(axis=1, keepdims=True)
+        matrix = np.divide(matrix, totals, out=np.zeros_like(matrix), where=totals != 0)
+    return np.sum((matrix * 100) ** 2, axis=1)
 
 def gini_coefficient(values: List[float]) -> float:
     """
@@ -55,18 +78,60 @@ def gini_coefficient(values: List[float]) -> float:
     if not values or all(v == 0 for v in values):
         return 0.0
 
-    # 昇順にソート
-    sorted_values = sorted(values)
-    n = len(sorted_values)
+    return float(gini_coefficient_batch([values])[0])
 
-    # 累積シェアを計算
-    cumsum = np.cumsum(sorted_values)
+def gini_coefficient_batch(values) -> np.ndarray:
+    """
+    行ごとのジニ係数を一括計算（行: サブカテゴリ・ブートストラップ複製など、列: エンティティ）
 
-    # ジニ係数の計算
-    numerator = 2 * sum(i * val for i, val in enumerate(sorted_values, 1))
-    denominator = n * sum(sorted_values)
+    G = 2Σ i·x_(i) / (n·Σx) - (n + 1) / n（x_(i) は昇順に並べた値）。
+    有効な値が1件以下、または合計が0の行は0。
 
-    return numerator / denominator - (n + 1) / n
+    Parameters:
+    -----------
+    values : array-like
+        [行, エンティティ] の値。NaNは欠損（その行の計算から除外）
+
+    Returns:
+    --------
+    np.ndarray
+        [行] のジニ係数
+    """
+    matrix = np.atleast_2d(np.asarray(values, dtype=float))
+    counts = (~np.isnan(matrix)).sum(axis=1)
+
+    # NaNは昇順ソートで末尾に並ぶため、各行の先頭 counts 列が有効な値
+    ordered = np.sort(matrix, axis=1)
+    ordered = np.where(np.arange(matrix.shape[1])[None, :] < counts[:, None], ordered, 0.0)
+    totals = ordered.sum(axis=1)
+    weighted = ordered @ np.arange(1, matrix.shape[1] + 1, dtype=float)
+
+    valid = (counts > 1) & (totals != 0)
+    safe_counts = np.where(valid, counts, 1)
+    safe_totals = np.where(valid, totals, 1.0)
+    gini = 2 * weighted / (safe_counts * safe_totals) - (safe_counts + 1) / safe_counts
+    return np.where(valid, gini, 0.0)
+
+
+def percentile_interval(replicates, confidence_level: float = 95) -> tuple:
+    """
+    ブートストラップ複製からパーセンタイル法の信頼区間を列ごとに計算
+
+    Parameters:
+    -----------
+    replicates : array-like
+        [複製, ...] の統計量
+    confidence_level : float
+        信頼水準（%）
+
+    Returns:
+    --------
+    tuple
+        (下限, 上限)。replicatesが1次元の場合はfloat、それ以外は先頭軸を除いた形状の配列
+    """
+    alpha = (100 - confidence_level) / 2
+    lower, upper = np.percentile(np.asarray(replicates, dtype=float), [alpha, 100 - alpha], axis=0)
+    return lower, upper
 
 def statistical_parity_gap(top_probs: Dict[str, float]) -> float:
     """
@@ -312,6 +377,385 @@ def _analyze_competition_effects(adjusted_shares: Dict[str, float],
     }
 
 
+def bootstrap_bias_samples(bias_indices: Dict[str, float],
+                           delta_values: Optional[Dict[str, List[float]]] = None,
+                           n_samples: int = 1000,
+                           seed: Optional[int] = None,
+                           delta_scale=1.0) -> np.ndarray:
+    """
+    各企業のバイアス指標をブートストラップ分布からサンプリング
+
+    delta_values（実行回ごとの差分値）が2件以上ある企業は、その平均値をdelta_scaleで割った値の
+    ブートストラップ分布からサンプリングする。それ以外の企業はバイアス指標の点推定値を全サンプルで使用する。
+    正規化バイアス指標（Δ / サブカテゴリ内平均|Δ|）を渡す場合は、delta_scaleに同じ平均|Δ|を指定して
+    サンプルと点推定値の尺度を揃えること。
+
+    Parameters:
+    -----------
+    bias_indices : dict
+        企業名→バイアス指標（点推定値）
+    delta_values : dict, optional
+        企業名→差分値リスト
+    n_samples : int
+        サンプル数
+    seed : int, optional
+        乱数シード
+    delta_scale : float or array-like
+        差分値の平均をバイアス指標の尺度に変換する除数（正規化バイアス指標ではサブカテゴリ内平均|Δ|）。
+        複数サブカテゴリの企業をまとめてサンプリングする場合は、bias_indicesのキー順に企業ごとの除数を指定
+
+    Returns:
+    --------
+    np.ndarray
+        （サンプル数×企業数）の配列（列順はbias_indicesのキー順）
+    """
+    companies = list(bias_indices)
+    point = np.array([float(bias_indices[c]) for c in companies])
+    samples = np.tile(point, (n_samples, 1))
+    if not delta_values:
+        return samples
+
+    deltas = [np.asarray(delta_values.get(c) or [], dtype=float) for c in companies]
+    lengths = np.array([d.size for d in deltas])
+    targets = np.flatnonzero(lengths >= 2)
+    if targets.size == 0:
+        return samples
+
+    # （企業×実行回）のパディング行列から、企業ごとの実行回数の範囲で一括リサンプリング
+    max_len = int(lengths[targets].max())
+    padded = np.zeros((targets.size, max_len))
+    for row, index in enumerate(targets):
+        padded[row, :lengths[index]] = deltas[index]
+
+    rng = np.random.default_rng(seed)
+    picks = (rng.random((n_samples, targets.size, max_len)) * lengths[targets][None, :, None]).astype(int)
+    resampled = np.take_along_axis(np.broadcast_to(padded, picks.shape), picks, axis=-1)
+    valid = np.arange(max_len)[None, None, :] < lengths[targets][None, :, None]
+    scales = np.broadcast_to(np.asarray(delta_scale, dtype=float), point.shape)
+    samples[:, targets] = np.sum(resampled * valid, axis=-1) / lengths[targets] / scales[targets]
+    return samples
+
+
+def bootstrap_gini_interval(bias_indices: Dict[str, float],
+                            delta_values: Optional[Dict[str, List[float]]] = None,
+                            n_samples: int = 2000,
+                            seed: Optional[int] = None,
+                            confidence_level: float = 95,
+                            delta_scale: float = 1.0) -> Dict[str, Any]:
+    """
+    バイアス指標のジニ係数（不平等度）のブートストラップ信頼区間
+
+    bootstrap_bias_samplesで（複製×企業）のバイアス指標を生成し、gini_coefficient_batchで
+    全複製のジニ係数を一括計算してパーセンタイル法で区間を求める。
+    リサンプリングした企業と点推定値の企業が同じ尺度になるよう、正規化バイアス指標では
+    delta_scaleにサブカテゴリ内平均|Δ|を指定する。
+
+    Parameters:
+    -----------
+    bias_indices : dict
+        企業名→バイアス指標（点推定値）
+    delta_values : dict, optional
+        企業名→差分値リスト（2件以上ある企業のみリサンプリング）
+    n_samples : int
+        ブートストラップ複製数
+    seed : int, optional
+        乱数シード
+    confidence_level : float
+        信頼水準（%）
+    delta_scale : float
+        差分値の平均をバイアス指標の尺度に変換する除数（bootstrap_bias_samples参照）
+
+    Returns:
+    --------
+    dict
+        {"ci_lower", "ci_upper", "confidence_level", "n_samples", "bootstrapped_entities"}
+    """
+    samples = bootstrap_bias_samples(bias_indices, delta_values, n_samples, seed, delta_scale=delta_scale)
+    lower, upper = percentile_interval(gini_coefficient_batch(samples), confidence_level)
+    return {
+        "ci_lower": round(float(lower), 3),
+        "ci_upper": round(float(upper), 3),
+        "confidence_level": confidence_level,
+        "n_samples": n_samples,
+        "bootstrapped_entities": sum(1 for c in bias_indices if len((delta_values or {}).get(c) or []) >= 2)
+    }
+
+
+def _bias_adjusted_hhi(shares: np.ndarray, entity_columns: np.ndarray, bias: np.ndarray, weight: float) -> np.ndarray:
+    """
+    バイアスで調整した市場シェアのHHIを（行×複製）で一括計算
+
+    シェア調整はsimulate_market_impactと同じ式（max(0.001, シェア×(1 + 重み×sign(b)×√|b|))）。
+    調整後シェアは行ごとに元のシェア合計へ再スケールするため、バイアス0では元のHHIと一致する。
+
+    Parameters:
+    -----------
+    shares : np.ndarray
+        [行, 企業] の市場シェア（NaNは欠損）
+    entity_columns : np.ndarray
+        [行, 企業] に対応するbiasの企業列（-1はバイアスなし）
+    bias : np.ndarray
+        [行, 複製, エンティティ] のバイアス指標
+    weight : float
+        バイアスの重み
+
+    Returns:
+    --------
+    np.ndarray
+        [行, 複製] のHHI値（0〜10000）
+    """
+    has_bias = entity_columns >= 0
+    columns = np.broadcast_to(np.where(has_bias, entity_columns, 0)[:, None, :],
+                              bias.shape[:2] + entity_columns.shape[1:])
+    effect = np.where(has_bias[:, None, :], np.take_along_axis(bias, columns, axis=2), 0.0)
+    effect = np.nan_to_num(effect)
+    adjusted = shares[:, None, :] * (1 + weight * np.sign(effect) * np.sqrt(np.abs(effect)))
+    adjusted = np.where(has_bias[:, None, :], np.maximum(0.001, adjusted), shares[:, None, :])
+
+    totals = np.nansum(shares, axis=1)[:, None, None]
+    adjusted = adjusted * totals / np.nansum(adjusted, axis=2, keepdims=True)
+    return calculate_hhi_batch(adjusted.reshape(-1, shares.shape[1])).reshape(bias.shape[:2])
+
+
+def bootstrap_concentration_intervals(bias_rows: Sequence[Dict[str, float]],
+                                      delta_rows: Optional[Sequence[Optional[Dict[str, List[float]]]]] = None,
+                                      share_rows: Optional[Sequence[Optional[Dict[str, float]]]] = None,
+                                      share_entities: Optional[Sequence[Optional[Dict[str, str]]]] = None,
+                                      n_samples: int = 2000,
+                                      seed: Optional[int] = None,
+                                      confidence_level: float = 95,
+                                      delta_scales: Optional[Sequence[float]] = None,
+                                      hhi_weight: float = 0.1) -> List[Dict[str, Any]]:
+    """
+    複数サブカテゴリのジニ係数・バイアス調整HHIとブートストラップ信頼区間を一括計算
+
+    全サブカテゴリの企業をまとめてbootstrap_bias_samplesでサンプリングし、（サブカテゴリ×複製×企業）の
+    NaNパディング行列を一度だけ構築する。ジニ係数はgini_coefficient_batch、HHIはcalculate_hhi_batchで
+    全サブカテゴリ・全複製を一括計算し、パーセンタイル法で区間を求める。
+    バイアス調整HHIは、市場シェアをサンプリングしたバイアス指標で調整した（バイアスの重みづけをした露出シェアの）HHI。
+
+    Parameters:
+    -----------
+    bias_rows : Sequence[dict]
+        サブカテゴリごとの企業名→バイアス指標（点推定値）
+    delta_rows : Sequence[dict], optional
+        サブカテゴリごとの企業名→差分値リスト（2件以上ある企業のみリサンプリング）
+    share_rows : Sequence[dict], optional
+        サブカテゴリごとの市場参加者（サービス・企業）名→市場シェア。Noneのサブカテゴリは HHI を計算しない
+    share_entities : Sequence[dict], optional
+        サブカテゴリごとの市場参加者名→bias_rowsの企業名。省略時は同名の企業、対応しない参加者はバイアス0
+    n_samples : int
+        ブートストラップ複製数
+    seed : int, optional
+        乱数シード
+    confidence_level : float
+        信頼水準（%）
+    delta_scales : Sequence[float], optional
+        サブカテゴリごとの差分値の除数（bootstrap_bias_samples参照）。省略時は1.0
+    hhi_weight : float
+        シェア調整に使うバイアスの重み
+
+    Returns:
+    --------
+    List[dict]
+        サブカテゴリごとの {"gini_coefficient", "gini_confidence_interval", "bias_adjusted_hhi"}。
+        bias_adjusted_hhiは {"hhi_score", "ci_lower", "ci_upper", "confidence_level", "n_samples", "weight"}
+        （市場シェアがないサブカテゴリはNone）
+    """
+    n_rows = len(bias_rows)
+    if n_rows == 0:
+        return []
+    delta_rows = delta_rows or [None] * n_rows
+    share_rows = share_rows or [None] * n_rows
+    share_entities = share_entities or [None] * n_rows
+    delta_scales = [1.0] * n_rows if delta_scales is None else delta_scales
+
+    # 全サブカテゴリの企業を（サブカテゴリ, 企業名）のキーでまとめて一括サンプリング
+    keys = [(row, company) for row, bias_indices in enumerate(bias_rows) for company in bias_indices]
+    flat_samples = bootstrap_bias_samples(
+        {key: bias_rows[key[0]][key[1]] for key in keys},
+        {key: (delta_rows[key[0]] or {}).get(key[1]) or [] for key in keys},
+        n_samples, seed,
+        delta_scale=[delta_scales[row] for row, _ in keys]
+    )
+
+    # （サブカテゴリ×複製×企業）のNaNパディング行列
+    width = max((len(bias_indices) for bias_indices in bias_rows), default=0)
+    columns = [{company: col for col, company in enumerate(bias_indices)} for bias_indices in bias_rows]
+    row_index = np.array([row for row, _ in keys], dtype=int)
+    col_index = np.array([columns[row][company] for row, company in keys], dtype=int)
+    samples = np.full((n_rows, n_samples, width), np.nan)
+    samples.transpose(0, 2, 1)[row_index, col_index] = flat_samples.T
+    points = np.full((n_rows, 1, width), np.nan)
+    points[row_index, 0, col_index] = [bias_rows[row][company] for row, company in keys]
+
+    gini_points = gini_coefficient_batch(points[:, 0, :])
+    gini_lower, gini_upper = percentile_interval(
+        gini_coefficient_batch(samples.reshape(-1, width)).reshape(n_rows, n_samples).T, confidence_level
+    )
+
+    # 市場シェアのあるサブカテゴリの（サブカテゴリ×市場参加者）シェア行列とバイアス列の対応
+    share_targets = [row for row in range(n_rows) if share_rows[row]]
+    hhi_results = {}
+    if share_targets:
+        share_width = max(len(share_rows[row]) for row in share_targets)
+        shares = np.full((len(share_targets), share_width), np.nan)
+        entity_columns = np.full((len(share_targets), share_width), -1, dtype=int)
+        for i, row in enumerate(share_targets):
+            mapping = share_entities[row] or {}
+            for j, (participant, share) in enumerate(share_rows[row].items()):
+                shares[i, j] = float(share)
+                entity_columns[i, j] = columns[row].get(mapping.get(participant, participant), -1)
+
+        hhi_points = _bias_adjusted_hhi(shares, entity_columns, points[share_targets], hhi_weight)[:, 0]
+        hhi_lower, hhi_upper = percentile_interval(
+            _bias_adjusted_hhi(shares, entity_columns, samples[share_targets], hhi_weight).T, confidence_level
+        )
+        for i, row in enumerate(share_targets):
+            hhi_results[row] = {
+                "hhi_score": round(float(hhi_points[i]), 1),
+                "ci_lower": round(float(hhi_lower[i]), 1),
+                "ci_upper": round(float(hhi_upper[i]), 1),
+                "confidence_level": confidence_level,
+                "n_samples": n_samples,
+                "weight": hhi_weight
+            }
+
+    return [
+        {
+            "gini_coefficient": float(gini_points[row]),
+            "gini_confidence_interval": {
+                "ci_lower": round(float(gini_lower[row]), 3),
+                "ci_upper": round(float(gini_upper[row]), 3),
+                "confidence_level": confidence_level,
+                "n_samples": n_samples,
+                "bootstrapped_entities": sum(1 for c in bias_rows[row]
+                                             if len((delta_rows[row] or {}).get(c) or []) >= 2)
+            },
+            "bias_adjusted_hhi": hhi_results.get(row)
+        }
+        for row in range(n_rows)
+    ]
+
+
+def simulate_market_impact(market_share: Dict[str, float],
+                           bias_indices: Dict[str, float],
+                           delta_values: Optional[Dict[str, List[float]]] = None,
+                           weights: Sequence[float] = (0.05, 0.1, 0.2),
+                           bias_types: Sequence[str] = ("normalized_bias",),
+                           n_samples: int = 1000,
+                           seed: Optional[int] = None,
+                           percentiles: Sequence[float] = (5, 50, 95),
+                           delta_scale: float = 1.0) -> Dict[str, Any]:
+    """
+    AIバイアスによる市場シェア変動のモンテカルロシミュレーション
+
+    apply_bias_to_share_enhancedと同じシェア調整式・市場影響度スコアを、
+    （重み×バイアス種別×サンプル×企業）の行列演算で一括評価し、シナリオごとの分布を返す。
+
+    Parameters:
+    -----------
+    market_share : dict
+        元の市場シェア（企業名→シェア値）
+    bias_indices : dict
+        バイアス指標（企業名→バイアス値）
+    delta_values : dict, optional
+        企業名→差分値リスト（ブートストラップサンプリング用）
+    weights : Sequence[float]
+        掃引するバイアスの重み
+    bias_types : Sequence[str]
+        掃引するバイアス指標の種類（"normalized_bias", "delta_rank"）
+    n_samples : int
+        シナリオあたりのサンプル数
+    seed : int, optional
+        乱数シード
+    percentiles : Sequence[float]
+        分布要約に含めるパーセンタイル
+    delta_scale : float
+        差分値の平均をバイアス指標の尺度に変換する除数（bootstrap_bias_samples参照）
+
+    Returns:
+    --------
+    dict
+        {
+            "scenarios": [{"weight", "bias_type", "market_impact_score", "hhi_shift", "adjusted_hhi",
+                           "share_changes": {企業名: 分布要約}}, ...],
+            "baseline_hhi": 元シェア（正規化後）のHHI,
+            "simulation_metadata": シミュレーション情報
+        }
+        分布要約は mean, std, p{パーセンタイル}。HHI変化・調整後HHIは正規化後シェアの0〜10000スケール
+    """
+    companies = [c for c, v in market_share.items() if isinstance(v, (int, float))]
+    biased = [c for c in companies if c in bias_indices]
+    if not companies or not biased:
+        return {"scenarios": [], "baseline_hhi": 0.0, "simulation_metadata": {"error": "データ不足"}}
+
+    shares = np.array([float(market_share[c]) for c in companies])
+    total_share = shares.sum()
+    position = {c: i for i, c in enumerate(companies)}
+
+    # (サンプル, 企業) のバイアス効果。バイアス未定義の企業は0（シェア変化なし）
+    sampled = bootstrap_bias_samples({c: bias_indices[c] for c in biased}, delta_values, n_samples, seed,
+                                     delta_scale=delta_scale)
+    effects = np.zeros((n_samples, len(companies)))
+    effects[:, [position[c] for c in biased]] = sampled
+    has_bias = np.zeros(len(companies), dtype=bool)
+    has_bias[[position[c] for c in biased]] = True
+
+    signs = np.array([-1.0 if t == "delta_rank" else 1.0 for t in bias_types])
+    weight_array = np.asarray(weights, dtype=float)
+
+    # (重み, バイアス種別, サンプル, 企業) の調整後シェア（apply_bias_to_share_enhancedと同じ非線形調整）
+    effect = signs[None, :, None, None] * effects[None, None, :, :]
+    adjustment = weight_array[:, None, None, None] * np.sign(effect) * np.sqrt(np.abs(effect))
+    adjusted = np.where(has_bias, np.maximum(0.001, shares * (1 + adjustment)), shares)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        changes = np.where(shares > 0, (adjusted - shares) / shares, 0.0)
+
+    # 市場影響度スコア（_calculate_market_impact_scoreのベクトル版）
+    share_weights = shares / total_share if total_share > 0 else np.zeros_like(shares)
+    abs_changes = np.abs(changes)
+    change_variance = changes.var(axis=-1) if len(companies) > 1 else np.zeros(changes.shape[:-1])
+    impact = np.minimum(1.0, abs_changes.mean(axis=-1) * 0.4 + change_variance * 0.3
+                        + (abs_changes * share_weights).sum(axis=-1) * 0.3)
+
+    # HHI変化（元シェア・調整後シェアとも合計1に正規化して比較）
+    baseline_hhi = float(calculate_hhi_batch(share_weights)[0])
+    adjusted_hhi = calculate_hhi_batch(adjusted.reshape(-1, len(companies)), normalize=True).reshape(adjusted.shape[:-1])
+    hhi_shift = adjusted_hhi - baseline_hhi
+
+    def summarize(values: np.ndarray) -> Dict[str, float]:
+        summary = {"mean": round(float(values.mean()), 4), "std": round(float(values.std()), 4)}
+        for q, value in zip(percentiles, np.percentile(values, percentiles)):
+            summary[f"p{q:g}"] = round(float(value), 4)
+        return summary
+
+    scenarios = []
+    for w_index, weight in enumerate(weight_array):
+        for t_index, bias_type in enumerate(bias_types):
+            scenarios.append({
+                "weight": float(weight),
+                "bias_type": bias_type,
+                "market_impact_score": summarize(impact[w_index, t_index]),
+                "hhi_shift": summarize(hhi_shift[w_index, t_index]),
+                "adjusted_hhi": summarize(adjusted_hhi[w_index, t_index]),
+                "share_changes": {c: summarize(changes[w_index, t_index, :, position[c]]) for c in biased}
+            })
+
+    return {
+        "scenarios": scenarios,
+        "baseline_hhi": round(baseline_hhi, 2),
+        "simulation_metadata": {
+            "n_samples": n_samples,
+            "n_scenarios": len(scenarios),
+            "companies_analyzed": len(biased),
+            "total_companies": len(companies),
+            "bootstrapped_companies": sum(1 for c in biased if len((delta_values or {}).get(c) or []) >= 2),
+            "seed": seed
+        }
+    }
+
+
 # 既存のapply_bias_to_share関数は後方互換性のために保持
 def apply_bias_to_share(market_share: Dict[str, float],
                        delta_ranks: Dict[str, float],
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+統合データセットの数値サイドカー（メモリマップ読み込み用バイナリ）
+
+corporate_bias_dataset.json と同じディレクトリに、ランキングの順位を行列化した .npy ファイルと、
+その索引（numeric_sidecar.json）を出力する。
+分析エンジンは引用・検索結果など他のセクションのために元JSONも読み込むが、順位行列は
+np.load(mmap_mode="r") でメモリマップした行列をそのまま使い、Pythonのリストから行列を組み立てない。
+同じ日付を読む複数のワーカープロセスはページキャッシュを共有する。
+
+行列は float64 [行, 最大実行回数] で、実行回数に満たない列・数値以外の値（None等）は NaN。
+各行の元のリスト長は *_lengths.npy（int64）に保持する。
+- ranking_ranks: サブカテゴリ内のエンティティごとの ranking_summary.entities.*.all_ranks（サブカテゴリ単位で連続）
+
+索引には書き出し時点の元JSONのサイズ・更新時刻（mtime_ns）を記録し、元JSONが更新されていれば
+サイドカーは古いものとして扱う（load_numeric_sidecar は None を返す）。
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_FORMAT_VERSION = 1
+SIDECAR_INDEX_FILENAME = "numeric_sidecar.json"
+SOURCE_FILENAME = "corporate_bias_dataset.json"
+
+
+def _to_float(value: Any) -> float:
+    """数値はfloatに、それ以外（None・文字列・bool）はNaNに変換"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return np.nan
+
+
+def _pack_rows(rows: List[List[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """可変長リストを NaN 埋めの行列と元のリスト長に変換"""
+    lengths = np.array([len(row) for row in rows], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    matrix = np.full((len(rows), width), np.nan)
+    for i, row in enumerate(rows):
+        if row:
+            matrix[i, :len(row)] = [_to_float(v) for v in row]
+    return matrix, lengths
+
+
+def _source_stat(source_path: str) -> Dict[str, int]:
+    stat = os.stat(source_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def build_sidecar_arrays(dataset: Dict[str, Any]) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    統合データセットから行列と索引を構築
+
+    Parameters:
+    -----------
+    dataset : Dict[str, Any]
+        統合データセット（corporate_bias_dataset.json の内容）
+
+    Returns:
+    --------
+    Tuple[Dict[str, np.ndarray], Dict[str, Any]]
+        (配列名 → 配列（行列と *_lengths）, {"rankings": 索引})
+    """
+    rank_rows = []
+    ranking_index = {}
+
+    for category, subcategories in (dataset.get("perplexity_rankings") or {}).items():
+        if not isinstance(subcategories, dict):
+            continue
+        for subcategory, data in subcategories.items():
+            if not isinstance(data, dict):
+                continue
+            entities = [
+                (name, info.get("all_ranks") or [])
+                for name, info in ((data.get("ranking_summary") or {}).get("entities") or {}).items()
+                if isinstance(info, dict)
+            ]
+            start = len(rank_rows)
+            rank_rows.extend(ranks if isinstance(ranks, list) else [] for _, ranks in entities)
+            ranking_index.setdefault(category, {})[subcategory] = {
+                "rows": [start, len(rank_rows)],
+                "entities": [name for name, _ in entities]
+            }
+
+    arrays = {}
+    arrays["ranking_ranks"], arrays["ranking_ranks_lengths"] = _pack_rows(rank_rows)
+    return arrays, {"rankings": ranking_index}
+
+
+def write_numeric_sidecar(dataset: Dict[str, Any], directory: str,
+                          source_filename: str = SOURCE_FILENAME) -> Optional[str]:
+    """
+    統合データセットの数値サイドカーを書き出す
+
+    配列を一時ファイルに書いてから置き換え、最後に索引を書くため、書き出し中・書き出し失敗時に
+    読み込み側が新旧の混在したファイルを使うことはない（索引の元JSON情報が一致しない）。
+
+    Parameters:
+    -----------
+    dataset : Dict[str, Any]
+        統合データセット
+    directory : str
+        出力ディレクトリ（元JSONと同じ integrated/{日付}）
+    source_filename : str
+        元JSONのファイル名（保存済みであること）
+
+    Returns:
+    --------
+    Optional[str]
+        索引ファイルのパス（書き出し失敗時はNone）
+    """
+    try:
+        arrays, index = build_sidecar_arrays(dataset)
+        array_info = {}
+        for name, array in arrays.items():
+            filename = f"numeric_{name}.npy"
+            path = os.path.join(directory, filename)
+            with open(path + ".tmp", "wb") as f:
+                np.save(f, array)
+            os.replace(path + ".tmp", path)
+            array_info[name] = {"file": filename, "shape": list(array.shape), "dtype": str(array.dtype)}
+
+        sidecar_index = {
+            "format_version": SIDECAR_FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "source": {"file": source_filename, **_source_stat(os.path.join(directory, source_filename))},
+            "arrays": array_info,
+            **index
+        }
+        index_path = os.path.join(directory, SIDECAR_INDEX_FILENAME)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(sidecar_index, f, ensure_ascii=False)
+        os.replace(index_path + ".tmp", index_path)
+        logger.info(f"数値サイドカー保存: {index_path}")
+        return index_path
+    except Exception as e:
+        logger.warning(f"数値サイドカーの保存に失敗しました（JSONのみ使用）: {e}")
+        return None
+
+
+class NumericSidecar:
+    """メモリマップした数値サイドカーへのアクセス"""
+
+    def __init__(self, directory: str, index: Dict[str, Any]):
+        """
+        Parameters:
+        -----------
+        directory : str
+            サイドカーのディレクトリ
+        index : Dict[str, Any]
+            numeric_sidecar.json の内容
+        """
+        self.directory = directory
+        self.index = index
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def _array(self, name: str) -> np.ndarray:
+        """配列を読み取り専用でメモリマップ（初回アクセス時）"""
+        if name not in self._arrays:
+            path = os.path.join(self.directory, self.index["arrays"][name]["file"])
+            self._arrays[name] = np.load(path, mmap_mode="r")
+        return self._arrays[name]
+
+    def _rows(self, name: str, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+        """行範囲のビュー（列はその範囲の最大リスト長まで）とリスト長を返す（コピーなし）"""
+        lengths = self._array(f"{name}_lengths")[start:stop]
+        width = int(lengths.max()) if len(lengths) else 0
+        return self._array(name)[start:stop, :width], lengths
+
+    def rank_matrix(self, category: str, subcategory: str) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """
+        サブカテゴリの順位行列を取得
+
+        Returns:
+        --------
+        Optional[Tuple[List[str], np.ndarray, np.ndarray]]
+            (エンティティ名リスト, 順位行列 [E, R]（欠損はNaN）, 元のリスト長 [E])。
+            サブカテゴリがない場合はNone
+        """
+        entry = self.index.get("rankings", {}).get(category, {}).get(subcategory)
+        if entry is None:
+            return None
+        matrix, lengths = self._rows("ranking_ranks", *entry["rows"])
+        return entry["entities"], matrix, lengths
+
+
+def load_numeric_sidecar(directory: str, source_filename: str = SOURCE_FILENAME) -> Optional[NumericSidecar]:
+    """
+    数値サイドカーを読み込む（存在しない・形式が異なる・元JSONより古い場合はNone）
+
+    Parameters:
+    -----------
+    directory : str
+        integrated/{日付} ディレクトリ
+    source_filename : str
+        元JSONのファイル名
+
+    Returns:
+    --------
+    Optional[NumericSidecar]
+        メモリマップ読み込み用のサイドカー
+    """
+    index_path = os.path.join(directory, SIDECAR_INDEX_FILENAME)
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("format_version") != SIDECAR_FORMAT_VERSION:
+        logger.info(f"数値サイドカーの形式が異なるため使用しません: {index_path}")
+        return None
+    try:
+        current = _source_stat(os.path.join(directory, source_filename))
+    except OSError:
+        return None
+    source = index.get("source", {})
+    if source.get("size") != current["size"] or source.get("mtime_ns") != current["mtime_ns"]:
+        logger.info(f"数値サイドカーが元JSONより古いため使用しません: {index_path}")
+        return None
+    if not all(os.path.exists(os.path.join(directory, info["file"])) for info in index.get("arrays", {}).values()):
+        return None
+    return NumericSidecar(directory, index)
+
+
+def ensure_numeric_sidecar(directory: str, source_filename: str = SOURCE_FILENAME) -> bool:
+    """
+    数値サイドカーがない・古い場合に元JSONから作成する（既存の統合データへの後付け用）
+
+    Parameters:
+    -----------
+    directory : str
+        integrated/{日付} ディレクトリ
+    source_filename : str
+        元JSONのファイル名
+
+    Returns:
+    --------
+    bool
+        有効なサイドカーが存在する（または作成できた）場合はTrue
+    """
+    if load_numeric_sidecar(directory, source_filename) is not None:
+        return True
+    source_path = os.path.join(directory, source_filename)
+    if not os.path.exists(source_path):
+        return False
+    with open(source_path, "r", encoding="utf-8") as f:
+        dataset = json.load(f)
+    return write_numeric_sidecar(dataset, directory, source_filename) is not None
@@ -0,0 +1,390 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+パイプライン段階別プロファイリングモジュール
+
+収集・統合・検証・バイアス分析の各段階をスパン（区間）として計測し、
+ウォール時間・CPU時間・ピークメモリ・処理件数を記録する機能を提供します。
+計測結果はChromeトレース形式（chrome://tracing / Perfetto で表示可能）のJSONと
+段階別サマリー表として出力できます。
+
+環境変数 PROFILING_ENABLED=true または各スクリプトの --profile で有効化します。
+無効時の span() は共有の空スパンを返すだけで、計測処理は一切行いません。
+PROFILING_TRACE_MEMORY=true の場合は tracemalloc によるスパン単位のピークメモリも記録します
+（Pythonのメモリ確保を全て追跡するため、処理時間が大きく増加します）。
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+import functools
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .logger import log_analysis_step
+
+logger = logging.getLogger(__name__)
+
+PROFILING_ENV_VAR = "PROFILING_ENABLED"
+TRACE_MEMORY_ENV_VAR = "PROFILING_TRACE_MEMORY"
+OUTPUT_DIR_ENV_VAR = "PROFILING_OUTPUT_DIR"
+DEFAULT_OUTPUT_DIR = "profiles"
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "false").lower() in ("true", "1", "yes")
+
+
+def _max_rss_mb() -> Optional[float]:
+    """プロセスの最大常駐メモリ（MB、取得できない場合はNone）"""
+    if resource is None:
+        return None
+    # Linuxはキロバイト単位
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _NullSpan:
+    """プロファイリング無効時の空スパン"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def add_items(self, count: int) -> None:
+        pass
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """計測中のスパン"""
+
+    def __init__(self, profiler: "Profiler", name: str, category: str,
+                 items: Optional[int], log_step: bool, args: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.items = items
+        self.log_step = log_step
+        self.args = args
+        self.traced_peak = 0
+
+    def add_items(self, count: int) -> None:
+        """処理件数を加算"""
+        self.items = (self.items or 0) + int(count)
+
+    def set(self, key: str, value: Any) -> None:
+        """トレースに出力する任意の属性を設定"""
+        self.args[key] = value
+
+    def __enter__(self):
+        self.profiler._push(self)
+        self.start_ns = time.perf_counter_ns()
+        self.start_cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_ns = time.perf_counter_ns() - self.start_ns
+        cpu_s = time.process_time() - self.start_cpu
+        self.profiler._pop(self, wall_ns, cpu_s, failed=exc_type is not None)
+        return False
+
+
+class Profiler:
+    """スパンの記録・集計・出力を行うプロファイラ"""
+
+    def __init__(self, enabled: bool = None, trace_memory: bool = None):
+        """
+        Parameters:
+        -----------
+        enabled : bool, optional
+            計測を有効にするか（未指定時は環境変数 PROFILING_ENABLED）
+        trace_memory : bool, optional
+            tracemallocによるスパン単位のピークメモリを記録するか（未指定時は環境変数 PROFILING_TRACE_MEMORY）
+        """
+        self.enabled = False
+        self.trace_memory = False
+        self._records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._epoch_ns = time.perf_counter_ns()
+        self.configure(_env_flag(PROFILING_ENV_VAR) if enabled is None else enabled,
+                       _env_flag(TRACE_MEMORY_ENV_VAR) if trace_memory is None else trace_memory)
+
+    def configure(self, enabled: bool, trace_memory: bool = False) -> None:
+        """計測の有効・無効とメモリ追跡を切り替える"""
+        self.enabled = bool(enabled)
+        self.trace_memory = bool(enabled and trace_memory)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def reset(self) -> None:
+        """記録済みのスパンを破棄"""
+        with self._lock:
+            self._records = []
+            self._epoch_ns = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = "pipeline", items: int = None,
+             log_step: bool = False, **args):
+        """
+        計測スパンを返す（with文で使用）
+
+        Parameters:
+        -----------
+        name : str
+            スパン名（例: "analysis.sentiment_bias"）
+        category : str
+            段階の分類（collection, integration, validation, analysis 等）
+        items : int, optional
+            処理件数（スパン内で add_items() による加算も可能）
+        log_step : bool
+            終了時に log_analysis_step で実行時間を記録するか
+        **args
+            トレースに出力する任意の属性
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, items, log_step, args)
+
+    # --- スパンのスタック管理 ---
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, span: _Span) -> None:
+        stack = self._stack()
+        if self.trace_memory:
+            # 親スパンのここまでのピークを退避してから計測をリセット
+            current_peak = tracemalloc.get_traced_memory()[1]
+            if stack:
+                stack[-1].traced_peak = max(stack[-1].traced_peak, current_peak)
+            tracemalloc.reset_peak()
+        span.depth = len(stack)
+        stack.append(span)
+
+    def _pop(self, span: _Span, wall_ns: int, cpu_s: float, failed: bool) -> None:
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+
+        record = {
+            "name": span.name,
+            "category": span.category,
+            "start_us": (span.start_ns - self._epoch_ns) / 1000,
+            "wall_ms": wall_ns / 1e6,
+            "cpu_ms": cpu_s * 1000,
+            "max_rss_mb": _max_rss_mb(),
+            "items": span.items,
+            "depth": span.depth,
+            "thread_id": threading.get_ident(),
+            "failed": failed,
+            "args": span.args
+        }
+
+        if self.trace_memory:
+            span.traced_peak = max(span.traced_peak, tracemalloc.get_traced_memory()[1])
+            record["peak_traced_mb"] = span.traced_peak / (1024 * 1024)
+            if stack:
+                stack[-1].traced_peak = max(stack[-1].traced_peak, span.traced_peak)
+            tracemalloc.reset_peak()
+
+        with self._lock:
+            self._records.append(record)
+
+        if span.log_step:
+            log_analysis_step(span.name, span.category, input_size=span.items,
+                              execution_time=round(wall_ns / 1e9, 4), success=not failed, logger=logger)
+
+    # --- 集計・出力 ---
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """記録済みスパンのコピー（終了順）"""
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        スパン名別の集計（合計ウォール時間の降順）
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            name, category, calls, wall_ms, cpu_ms, max_wall_ms, max_rss_mb, peak_traced_mb, items
+        """
+        aggregated: Dict[tuple, Dict[str, Any]] = {}
+        for record in self.records:
+            key = (record["category"], record["name"])
+            entry = aggregated.setdefault(key, {
+                "name": record["name"], "category": record["category"], "calls": 0,
+                "wall_ms": 0.0, "cpu_ms": 0.0, "max_wall_ms": 0.0,
+                "max_rss_mb": None, "peak_traced_mb": None, "items": None
+            })
+            entry["calls"] += 1
+            entry["wall_ms"] += record["wall_ms"]
+            entry["cpu_ms"] += record["cpu_ms"]
+            entry["max_wall_ms"] = max(entry["max_wall_ms"], record["wall_ms"])
+            for field in ("max_rss_mb", "peak_traced_mb"):
+                if record.get(field) is not None:
+                    entry[field] = max(entry[field] or 0.0, record[field])
+            if record["items"] is not None:
+                entry["items"] = (entry["items"] or 0) + record["items"]
+
+        return sorted(aggregated.values(), key=lambda e: e["wall_ms"], reverse=True)
+
+    def format_summary_table(self) -> str:
+        """段階別サマリー表（テキスト）を生成"""
+        rows = self.summary()
+        if not rows:
+            return "（記録されたスパンはありません）"
+
+        def fmt(value, spec=".1f"):
+            return "-" if value is None else format(value, spec)
+
+        headers = ["stage", "category", "calls", "wall(ms)", "cpu(ms)", "max_rss(MB)", "peak_traced(MB)", "items"]
+        table = [[r["name"], r["category"], str(r["calls"]), fmt(r["wall_ms"]), fmt(r["cpu_ms"]),
+                  fmt(r["max_rss_mb"]), fmt(r["peak_traced_mb"]), fmt(r["items"], "d")] for r in rows]
+        widths = [max(len(h), *(len(row[i]) for row in table)) for i, h in enumerate(headers)]
+
+        lines = ["  ".join(h.ljust(w) if i < 2 else h.rjust(w) for i, (h, w) in enumerate(zip(headers, widths)))]
+        lines.append("  ".join("-" * w for w in widths))
+        for row in table:
+            lines.append("  ".join(c.ljust(w) if i < 2 else c.rjust(w) for i, (c, w) in enumerate(zip(row, widths))))
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chromeトレース形式（Trace Event Format）の辞書を生成"""
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = {"cpu_ms": round(record["cpu_ms"], 3), **record["args"]}
+            for field in ("items", "max_rss_mb", "peak_traced_mb"):
+                if record.get(field) is not None:
+                    args[field] = record[field]
+            if record["failed"]:
+                args["failed"] = True
+            events.append({
+                "name": record["name"],
+                "cat": record["category"],
+                "ph": "X",
+                "ts": round(record["start_us"], 3),
+                "dur": round(record["wall_ms"] * 1000, 3),
+                "pid": pid,
+                "tid": record["thread_id"],
+                "args": args
+            })
+        events.sort(key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, output_path: str) -> str:
+        """Chromeトレース形式のJSONを保存して保存先パスを返す"""
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return output_path
+
+
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """プロセス共通のプロファイラを取得"""
+    return _profiler
+
+
+def configure_profiling(enabled: bool = True, trace_memory: bool = None) -> Profiler:
+    """プロセス共通のプロファイラを有効化・無効化（trace_memory未指定時は環境変数に従う）"""
+    if trace_memory is None:
+        trace_memory = _env_flag(TRACE_MEMORY_ENV_VAR)
+    _profiler.configure(enabled, trace_memory)
+    return _profiler
+
+
+def profile_span(name: str, category: str = "pipeline", items: int = None, log_step: bool = False, **args):
+    """プロセス共通のプロファイラで計測スパンを返す（無効時は空スパン）"""
+    return _profiler.span(name, category, items, log_step, **args)
+
+
+def profiled(name: str = None, category: str = "pipeline",
+             items: Callable[[Any], Optional[int]] = None, log_step: bool = False):
+    """
+    関数・メソッドの呼び出しをスパンとして計測するデコレータ
+
+    Parameters:
+    -----------
+    name : str, optional
+        スパン名（未指定時は関数の修飾名）
+    category : str
+        段階の分類
+    items : Callable, optional
+        戻り値から処理件数を求める関数
+    log_step : bool
+        終了時に log_analysis_step で実行時間を記録するか
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _profiler.span(span_name, category, log_step=log_step) as span:
+                result = func(*args, **kwargs)
+                if items is not None:
+                    count = items(result)
+                    if count is not None:
+                        span.add_items(count)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def finalize_profiling(label: str = "pipeline", output_path: str = None) -> Optional[str]:
+    """
+    有効時のみ、サマリー表をログ出力しChromeトレースを保存
+
+    Parameters:
+    -----------
+    label : str
+        既定の出力ファイル名に使用するラベル
+    output_path : str, optional
+        トレースの保存先（未指定時は PROFILING_OUTPUT_DIR/{label}_{日時}.trace.json）
+
+    Returns:
+    --------
+    Optional[str]
+        保存先パス（無効時・スパンなしの場合はNone）
+    """
+    if not _profiler.enabled or not _profiler.records:
+        return None
+
+    if output_path is None:
+        output_dir = os.environ.get(OUTPUT_DIR_ENV_VAR, DEFAULT_OUTPUT_DIR)
+        output_path = os.path.join(output_dir, f"{label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.trace.json")
+
+    logger.info("⏱️ 段階別プロファイル:\n" + _profiler.format_summary_table())
+    _profiler.export_chrome_trace(output_path)
+    logger.info(f"⏱️ Chromeトレースを保存しました: {output_path}")
+    return output_path
@@ -9,7 +9,6 @@
 
 import math
 import numpy as np
-from scipy.stats import kendalltau
 
 def rbo(s1, s2, p=0.9):
     '''
@@ -102,7 +101,8 @@ def compute_tau(ranking1, ranking2):
         common_ranks1 = [ranks1[item] for item in common_items]
         common_ranks2 = [ranks2[item] for item in common_items]
 
-        # Kendallのタウ係数を計算
+        # Kendallのタウ係数を計算（scipy.statsは読み込みが重いため使用時にインポート）
+        from scipy.stats import kendalltau
         tau, _ = kendalltau(common_ranks1, common_ranks2)
         if np.isnan(tau):
             tau = 0.0
@@ -144,4 +144,110 @@ def compute_delta_ranks(ranking1, ranking2):
         else:
             delta_rank[item] = np.nan
 
-    return delta_rank
\ No newline at end of file
+    return delta_rank
+
+def build_rank_matrix(rank_lists):
+    '''
+    複数エンティティの実行回ごとの順位リストを エンティティ×実行回 の行列に変換
+
+    実行回数が揃っていない（ragged）リストは末尾をNaNで埋め、
+    None・数値以外の順位（欠損）もNaNとして扱う。
+
+    Parameters:
+    -----------
+    rank_lists : list of list
+        エンティティごとの順位リスト（all_ranks）
+
+    Returns:
+    --------
+    tuple
+        (順位行列 float64 [E, R]（欠損はNaN）, 元のリスト長 int [E])
+    '''
+    lengths = np.array([len(ranks) if ranks else 0 for ranks in rank_lists], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    matrix = np.full((len(rank_lists), width), np.nan)
+    for i, ranks in enumerate(rank_lists):
+        if ranks:
+            matrix[i, :len(ranks)] = [r if isinstance(r, (int, float)) and not isinstance(r, bool) else np.nan
+                                      for r in ranks]
+    return matrix, lengths
+
+def rank_matrix_stats(entity_ranks, consistency_scale=3.0):
+    '''
+    順位行列からエンティティ別の順位統計と全ペアの平均順位差をまとめて計算
+
+    Parameters:
+    -----------
+    entity_ranks : dict
+        エンティティ名→実行回ごとの順位リスト（all_ranks）
+    consistency_scale : float
+        一貫性スコア max(0, 1 - 標準偏差 / scale) の尺度
+
+    Returns:
+    --------
+    dict
+        entities : エンティティ名リスト（行の順序）
+        lengths : 元のリスト長（欠損を含む）
+        counts : 有効な順位の数
+        mean / std / range : 有効な順位の平均・母標準偏差・範囲（有効な順位がない場合はNaN / 0 / 0）
+        consistency : 一貫性スコア（有効な順位が1件以下の場合は1.0）
+        pairwise_mean_diff : [E, E] 行列。(i, j) は実行回ごとの順位差 i - j の平均
+            （リスト長が等しく、両方の順位がある実行回が1つ以上あるペアのみ。それ以外はNaN）
+    '''
+    entities = list(entity_ranks.keys())
+    matrix, lengths = build_rank_matrix([entity_ranks[e] for e in entities])
+    return rank_matrix_stats_from_matrix(entities, matrix, lengths, consistency_scale)
+
+def rank_matrix_stats_from_matrix(entities, matrix, lengths, consistency_scale=3.0):
+    '''
+    構築済みの順位行列（数値サイドカーのメモリマップ等）から rank_matrix_stats と同じ統計を計算
+
+    Parameters:
+    -----------
+    entities : list
+        エンティティ名リスト（行の順序）
+    matrix : np.ndarray
+        順位行列 [E, R]（欠損はNaN。読み取り専用でもよい）
+    lengths : np.ndarray
+        元のリスト長 [E]
+    consistency_scale : float
+        一貫性スコアの尺度
+
+    Returns:
+    --------
+    dict
+        rank_matrix_stats と同じ形式
+    '''
+    lengths = np.asarray(lengths, dtype=np.int64)
+    valid = ~np.isnan(matrix)
+    values = np.where(valid, matrix, 0.0)
+    counts = valid.sum(axis=1)
+    safe_counts = np.maximum(counts, 1)
+
+    sums = values.sum(axis=1)
+    mean = np.where(counts > 0, sums / safe_counts, np.nan)
+    deviations = np.where(valid, matrix - mean[:, None], 0.0)
+    std = np.sqrt((deviations * deviations).sum(axis=1) / safe_counts)
+    rank_max = np.where(valid, matrix, -np.inf).max(axis=1, initial=-np.inf)
+    rank_min = np.where(valid, matrix, np.inf).min(axis=1, initial=np.inf)
+    rank_range = np.where(counts > 0, rank_max - rank_min, 0.0)
+    consistency = np.where(counts > 1, np.maximum(0.0, 1.0 - std / consistency_scale), 1.0)
+
+    # 両方に順位がある実行回のみでの順位差の和と件数: Σ(x_i - x_j) = X_i·M_j - M_i·X_j
+    mask = valid.astype(np.float64)
+    pair_counts = mask @ mask.T
+    pair_sums = values @ mask.T - mask @ values.T
+    comparable = (lengths[:, None] == lengths[None, :]) & (pair_counts > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pairwise_mean_diff = np.where(comparable, pair_sums / pair_counts, np.nan)
+
+    return {
+        "entities": list(entities),
+        "lengths": lengths,
+        "counts": counts,
+        "mean": mean,
+        "std": std,
+        "range": rank_range,
+        "consistency": consistency,
+        "pairwise_mean_diff": pairwise_mean_diff
+    }
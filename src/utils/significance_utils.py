@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+統計的有意性検定のユーティリティモジュール
+
+符号検定と多重比較補正を、エンティティ単位のループではなく配列演算で一括計算する機能を提供します。
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+SUPPORTED_CORRECTION_METHODS = ("fdr_bh", "holm", "bonferroni")
+
+
+@lru_cache(maxsize=8)
+def _binom_cdf_table_cached(size: int) -> np.ndarray:
+    n = np.arange(size + 1)[:, None]
+    k = np.arange(size + 1)[None, :]
+    table = stats.binom.cdf(k, n, 0.5)
+    table.setflags(write=False)
+    return table
+
+
+def binom_cdf_table(n_max: int) -> np.ndarray:
+    """
+    p=0.5の二項分布の累積分布表を取得（キャッシュ済み）
+
+    表のサイズは2のべき乗に切り上げて生成するため、実行回数が多少増えても再計算されない。
+
+    Parameters:
+    -----------
+    n_max : int
+        必要な試行回数の最大値
+
+    Returns:
+    --------
+    np.ndarray
+        table[n, k] = P(X ≤ k | n, 0.5) の2次元配列（k > n の要素は1.0）
+    """
+    size = 64
+    while size < n_max:
+        size *= 2
+    return _binom_cdf_table_cached(size)
+
+
+def sign_test_p_values(deltas, min_count: int = 5) -> np.ndarray:
+    """
+    差分の2次元配列から全行の符号検定（両側）p値を一括計算
+
+    Parameters:
+    -----------
+    deltas : array-like
+        （エンティティ×実行回）の差分配列（unmasked - masked）。実行回数が揃わない行はNaNで埋める
+    min_count : int
+        検定に必要な最小データ数（未満の行のp値は1.0）
+
+    Returns:
+    --------
+    np.ndarray
+        各行の符号検定p値
+    """
+    deltas = np.atleast_2d(np.asarray(deltas, dtype=float))
+    if deltas.size == 0:
+        return np.ones(deltas.shape[0])
+
+    observed = np.sum(~np.isnan(deltas), axis=1)
+    positive = np.sum(deltas > 0, axis=1)
+    negative = np.sum(deltas < 0, axis=1)
+    total = positive + negative
+
+    table = binom_cdf_table(int(total.max()))
+    p_values = 2 * np.minimum(table[total, positive], table[total, negative])
+    p_values = np.minimum(p_values, 1.0)
+
+    return np.where((observed < min_count) | (total == 0), 1.0, p_values)
+
+
+def correct_p_values(p_values: Sequence[float], groups: Optional[Sequence[Any]] = None,
+                     method: str = "fdr_bh", alpha: float = 0.05) -> Dict[str, Any]:
+    """
+    グループごとの多重比較補正を一括で適用
+
+    groupsを指定すると、同じグループ値を持つp値同士でのみ補正を行う
+    （例: サブカテゴリごとに補正する場合は (category, subcategory) を渡す）。
+
+    Parameters:
+    -----------
+    p_values : Sequence[float]
+        補正前のp値
+    groups : Sequence, optional
+        各p値のグループ（未指定時は全体を1グループとして補正）
+    method : str
+        補正方法（"fdr_bh", "holm", "bonferroni"）
+    alpha : float
+        有意水準
+
+    Returns:
+    --------
+    Dict[str, Any]
+        corrected_p_values, rejected, group_sizes（各p値が属するグループの大きさ）, method, alpha
+    """
+    if method not in SUPPORTED_CORRECTION_METHODS:
+        raise ValueError(f"未対応の補正方法です: {method}（対応: {', '.join(SUPPORTED_CORRECTION_METHODS)}）")
+
+    p = np.asarray(p_values, dtype=float)
+    if p.size == 0:
+        return {"corrected_p_values": [], "rejected": [], "group_sizes": [], "method": method, "alpha": alpha}
+
+    if groups is None:
+        group_ids = np.zeros(p.size, dtype=int)
+    else:
+        _, group_ids = np.unique(np.asarray([str(g) for g in groups]), return_inverse=True)
+    group_sizes = np.bincount(group_ids)
+    m = group_sizes[group_ids]
+
+    if method == "bonferroni":
+        corrected = np.minimum(p * m, 1.0)
+    else:
+        descending = method == "fdr_bh"
+        # グループ内でp値を整列（BHは降順、Holmは昇順）し、（グループ×順位）の行列上で累積min/maxを一括計算する
+        order = np.lexsort((-p if descending else p, group_ids))
+        sorted_groups = group_ids[order]
+        group_start = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+        position = np.arange(p.size) - group_start[sorted_groups]
+        sorted_m = group_sizes[sorted_groups]
+
+        if descending:
+            adjusted = p[order] * sorted_m / (sorted_m - position)
+            matrix = np.full((group_sizes.size, group_sizes.max()), np.inf)
+            matrix[sorted_groups, position] = adjusted
+            matrix = np.minimum.accumulate(matrix, axis=1)
+        else:
+            adjusted = p[order] * (sorted_m - position)
+            matrix = np.full((group_sizes.size, group_sizes.max()), -np.inf)
+            matrix[sorted_groups, position] = adjusted
+            matrix = np.maximum.accumulate(matrix, axis=1)
+
+        corrected = np.empty_like(p)
+        corrected[order] = np.minimum(matrix[sorted_groups, position], 1.0)
+
+    return {
+        "corrected_p_values": corrected.tolist(),
+        "rejected": (corrected <= alpha).tolist(),
+        "group_sizes": m.tolist(),
+        "method": method,
+        "alpha": alpha
+    }
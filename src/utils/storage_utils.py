@@ -11,11 +11,9 @@
 import os
 import json
 import datetime
-import boto3
 import re
+import threading
 import numpy as np
-import matplotlib.pyplot as plt
-import japanize_matplotlib
 from .storage_config import is_s3_enabled, is_local_enabled, get_storage_config, get_base_paths
 from .storage_config import AWS_ACCESS_KEY, AWS_SECRET_KEY, AWS_REGION, S3_BUCKET_NAME
 from .storage_config import STORAGE_MODE
@@ -33,14 +31,29 @@ def default(self, obj):
             return obj.tolist()
         return super().default(obj)
 
+# S3クライアントのプロセス内キャッシュ（fork後の子プロセスでは作り直す）
+_s3_client_cache = {}
+_s3_client_lock = threading.Lock()
+
 def get_s3_client():
-    """S3クライアントを取得"""
-    return boto3.client(
-        "s3",
-        aws_access_key_id=AWS_ACCESS_KEY,
-        aws_secret_access_key=AWS_SECRET_KEY,
-        region_name=AWS_REGION
-    )
+    """S3クライアントを取得（同一プロセス内では生成済みクライアントを再利用）"""
+    pid = os.getpid()
+    client = _s3_client_cache.get(pid)
+    if client is None:
+        with _s3_client_lock:
+            client = _s3_client_cache.get(pid)
+            if client is None:
+                # boto3は読み込みに時間がかかるため、S3を使う場合のみ初回にインポート
+                import boto3
+                client = boto3.client(
+                    "s3",
+                    aws_access_key_id=AWS_ACCESS_KEY,
+                    aws_secret_access_key=AWS_SECRET_KEY,
+                    region_name=AWS_REGION
+                )
+                _s3_client_cache.clear()
+                _s3_client_cache[pid] = client
+    return client
 
 def get_today_str():
     """今日の日付を文字列（YYYYMMDD形式）で取得"""
@@ -248,6 +261,27 @@ def save_binary_data(data, local_path, s3_path=None, content_type=None):
 
     return result
 
+FIGURE_CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".svg": "image/svg+xml",
+    ".pdf": "application/pdf",
+    ".html": "text/html"
+}
+
+def guess_figure_content_type(path):
+    """図ファイルの拡張子からコンテンツタイプを推測"""
+    return FIGURE_CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream")
+
+def figure_s3_key(local_path):
+    """図のローカルパスからS3キーを生成（corporate_bias_datasets/プレフィックスを除去）"""
+    s3_path = local_path.replace("\\", "/")
+    # corporate_bias_datasetsディレクトリプレフィックスを削除（S3のパスを短くするため）
+    if s3_path.startswith("corporate_bias_datasets/"):
+        s3_path = s3_path.replace("corporate_bias_datasets/", "", 1)
+    return s3_path
+
 def save_figure(fig, local_path, s3_path=None, dpi=100, bbox_inches="tight", storage_mode=None):
     """
     Matplotlibの図を保存（ローカルとS3の両方に対応、STORAGE_MODE環境変数で制御）
@@ -296,30 +330,17 @@ def save_figure(fig, local_path, s3_path=None, dpi=100, bbox_inches="tight", sto
     if should_save_to_s3(mode) and result["local"]:
         # S3パスが指定されていない場合、ローカルパスからの変換を試みる
         if not s3_path:
-            s3_path = local_path.replace("\\", "/")
-            # corporate_bias_datasetsディレクトリプレフィックスを削除（S3のパスを短くするため）
-            if s3_path.startswith("corporate_bias_datasets/"):
-                s3_path = s3_path.replace("corporate_bias_datasets/", "", 1)
+            s3_path = figure_s3_key(local_path)
 
         try:
             s3_client = get_s3_client()
 
-            # 拡張子からコンテンツタイプを推測
-            ext = os.path.splitext(local_path)[1].lower()
-            content_type = {
-                ".png": "image/png",
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".svg": "image/svg+xml",
-                ".pdf": "application/pdf"
-            }.get(ext, "application/octet-stream")
-
-            # ファイルをアップロード
+            # ファイルをアップロード（拡張子からコンテンツタイプを推測）
             s3_client.upload_file(
                 local_path,
                 S3_BUCKET_NAME,
                 s3_path,
-                ExtraArgs={"ContentType": content_type}
+                ExtraArgs={"ContentType": guess_figure_content_type(local_path)}
             )
 
             print(f"図をS3に保存しました: s3://{S3_BUCKET_NAME}/{s3_path}")
@@ -419,28 +440,37 @@ def save_results(data, local_path, s3_key=None, verbose=False):
     - local_path: ローカル保存先パス
     - s3_key: S3保存先キー（Noneの場合はS3保存をスキップ、空文字列の場合は自動生成）
     - verbose: Trueなら詳細ログ
+    S3へはアップロードマネージャー経由でバックグラウンド転送する（ジョブ終了時に flush_uploads() で完了を待つ）
+    同じパスへの保存が繰り返されても転送内容が変わらないよう、S3へは保存時点のシリアライズ結果を送る。
+    ローカルファイルは一時ファイルに書き出してから置き換える（書きかけの内容を読まれない）
     """
     try:
+        payload = json.dumps(data, ensure_ascii=False, indent=2, cls=NumpyJSONEncoder).encode('utf-8')
         ensure_dir(os.path.dirname(local_path))
-        with open(local_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2, cls=NumpyJSONEncoder)
+        temp_path = f"{local_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, local_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
         if verbose:
             print(f"ローカルに保存しました: {local_path}")
     except Exception as e:
         print(f"ローカル保存エラー: {e}")
         return None
 
-    # S3保存
+    # S3保存（バックグラウンドでアップロード。完了はジョブ終了時の flush_uploads() で待つ）
     if is_s3_enabled() and s3_key is not None:
         if s3_key == "":
             # 空文字列の場合はlocal_pathからS3キーを自動生成
             s3_key = local_path.replace("\\", "/")
         try:
-            s3_client = get_s3_client()
-            with open(local_path, 'rb') as f:
-                s3_client.upload_fileobj(f, S3_BUCKET_NAME, s3_key)
+            from .upload_manager import get_upload_manager
+            get_upload_manager().submit_bytes(payload, s3_key, content_type="application/json")
             if verbose:
-                print(f"S3に保存しました: s3://{S3_BUCKET_NAME}/{s3_key}")
+                print(f"S3アップロードを投入しました: s3://{S3_BUCKET_NAME}/{s3_key}")
         except Exception as e:
             print(f"S3保存エラー: {e} s3://{S3_BUCKET_NAME}/{s3_key}")
     elif s3_key is None and verbose:
@@ -7,13 +7,31 @@
 URLやテキスト処理の共通機能を提供します
 '''
 
+import os
 import re
 import unicodedata
+import ipaddress
+from functools import lru_cache
 from urllib.parse import urlparse
 
+# URL→ドメインのLRUキャッシュの上限（引用・検索結果のURLは日付・サブカテゴリをまたいで重複が多い）
+DOMAIN_CACHE_SIZE = 65536
+
+# 登録可能ドメイン（eTLD+1）判定用の既定の公開サフィックス（2ラベル以上のもの）。
+# 1ラベルのTLD（com, jp等）は既定ルール（最後の1ラベルが公開サフィックス）で扱う。
+# 環境変数 PUBLIC_SUFFIX_LIST_PATH に public_suffix_list.dat のパスを指定すると、そちらを使う（オフライン）。
+DEFAULT_PUBLIC_SUFFIXES = frozenset({
+    "co.jp", "ne.jp", "or.jp", "ac.jp", "go.jp", "ed.jp", "gr.jp", "lg.jp", "ad.jp",
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "ltd.uk", "plc.uk", "me.uk",
+    "com.au", "net.au", "org.au", "edu.au", "gov.au",
+    "com.cn", "net.cn", "org.cn", "com.hk", "com.tw", "co.kr", "or.kr",
+    "com.sg", "com.br", "co.in", "co.nz", "co.za", "com.mx",
+    "github.io", "blogspot.com",
+})
+
 def extract_domain(url):
     '''
-    URLからドメインを抽出（www.を除去）
+    URLからドメインを抽出（www.を除去、結果はLRUキャッシュ）
 
     Parameters:
     -----------
@@ -25,10 +43,14 @@ def extract_domain(url):
     str
         抽出されたドメイン
     '''
-    try:
-        if not url:
-            return ""
+    if not url or not isinstance(url, str):
+        return ""
+    return _extract_domain_cached(url)
 
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def _extract_domain_cached(url):
+    """extract_domainの本体（文字列のURLのみ）"""
+    try:
         parsed = urlparse(url)
         domain = parsed.netloc
 
@@ -54,6 +76,128 @@ def extract_domain(url):
     except Exception:
         return ""
 
+class PublicSuffixRules:
+    """公開サフィックスリスト（通常ルール・ワイルドカード・例外）による登録可能ドメインの判定"""
+
+    def __init__(self, rules):
+        """
+        Parameters:
+        -----------
+        rules : iterable of str
+            公開サフィックスのルール（public_suffix_list.dat の書式: "co.jp", "*.kawasaki.jp", "!city.kawasaki.jp"）
+        """
+        self.rules = set()
+        self.wildcards = set()
+        self.exceptions = set()
+        for rule in rules:
+            rule = rule.strip().lower()
+            if not rule or rule.startswith("//"):
+                continue
+            rule = rule.split()[0]
+            if rule.startswith("!"):
+                self.exceptions.add(rule[1:])
+            elif rule.startswith("*."):
+                self.wildcards.add(rule[2:])
+            else:
+                self.rules.add(rule)
+
+    @classmethod
+    def from_file(cls, path):
+        """public_suffix_list.dat を読み込む"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f)
+
+    def suffix_length(self, labels):
+        """ドメインのラベル列のうち、公開サフィックスに当たる末尾のラベル数（該当なしは1）"""
+        for i in range(len(labels)):
+            candidate = ".".join(labels[i:])
+            if candidate in self.exceptions:
+                return len(labels) - i - 1
+            if candidate in self.rules or ".".join(labels[i + 1:]) in self.wildcards:
+                return len(labels) - i
+        return 1
+
+@lru_cache(maxsize=1)
+def get_public_suffix_rules():
+    """公開サフィックスのルール（PUBLIC_SUFFIX_LIST_PATH があればそのファイル、なければ既定のサフィックス）"""
+    path = os.getenv("PUBLIC_SUFFIX_LIST_PATH")
+    if path and os.path.exists(path):
+        return PublicSuffixRules.from_file(path)
+    return PublicSuffixRules(DEFAULT_PUBLIC_SUFFIXES)
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def registrable_domain(domain):
+    '''
+    ドメインを登録可能ドメイン（eTLD+1）にまとめる
+
+    例: "docs.aws.amazon.com" → "amazon.com"、"news.yahoo.co.jp" → "yahoo.co.jp"。
+    IPアドレス・1ラベルのホスト・公開サフィックスそのものはそのまま返す。
+
+    Parameters:
+    -----------
+    domain : str
+        extract_domainで正規化済みのドメイン
+
+    Returns:
+    --------
+    str
+        登録可能ドメイン
+    '''
+    if not domain:
+        return ""
+    try:
+        ipaddress.ip_address(domain)
+        return domain
+    except ValueError:
+        pass
+    labels = domain.rstrip(".").split(".")
+    keep = get_public_suffix_rules().suffix_length(labels) + 1
+    if keep > len(labels):
+        return domain
+    return ".".join(labels[-keep:])
+
+def extract_domains(urls, registrable=False):
+    '''
+    URLリストからドメインを一括抽出（入力と同じ順序・長さ）
+
+    同じURLは1回だけ正規化し、正規化結果はextract_domain・registrable_domainのLRUキャッシュを共有する。
+
+    Parameters:
+    -----------
+    urls : iterable of str
+        対象URL（ドメインのみの文字列も可）
+    registrable : bool
+        Trueの場合は登録可能ドメイン（eTLD+1）にまとめる
+
+    Returns:
+    --------
+    list of str
+        各URLのドメイン（抽出できない場合は空文字）
+    '''
+    urls = list(urls)
+    domains = {url: extract_domain(url) for url in dict.fromkeys(u for u in urls if isinstance(u, str))}
+    if registrable:
+        domains = {url: registrable_domain(domain) for url, domain in domains.items()}
+    return [domains.get(url, "") if isinstance(url, str) else "" for url in urls]
+
+def unique_domains(urls, registrable=False):
+    '''
+    URLリストから重複のないドメインを出現順に抽出（空のドメインは除外）
+
+    Parameters:
+    -----------
+    urls : iterable of str
+        対象URL
+    registrable : bool
+        Trueの場合は登録可能ドメイン（eTLD+1）にまとめる
+
+    Returns:
+    --------
+    list of str
+        出現順のドメイン
+    '''
+    return [domain for domain in dict.fromkeys(extract_domains(urls, registrable)) if domain]
+
 def is_negative(title, snippet):
     """タイトルとスニペットからネガティブコンテンツかを判定"""
     # ネガティブキーワードリスト（簡易版）
@@ -164,9 +308,8 @@ def clean_service_name(name):
         return name
 
     # 改良されたパターンリスト（prompt_config.ymlから取得）
-    from ..prompts.prompt_manager import PromptManager
-    prompt_manager = PromptManager()
-    patterns = prompt_manager.get_rank_patterns()
+    from ..prompts.prompt_manager import get_prompt_manager
+    patterns = get_prompt_manager().get_rank_patterns()
 
     lines = text.splitlines()
     rankings = []
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+S3へのバックグラウンド並行アップロード
+
+分析・統合処理の出力をキューに積み、ワーカースレッドプールでS3へ転送します。
+大きなファイルはマルチパート・パート並行転送を使用し、失敗時は指数バックオフで
+再試行します（同じキーへの同じ内容のPUTは冪等）。同じキーへのアップロードは投入順に
+実行されるため、後から投入した内容が最終的にS3に残ります。
+ジョブ終了時に flush() を呼ぶと、それまでに投入した全アップロードの完了を待ちます。
+
+環境変数:
+- UPLOAD_BACKGROUND: "false" の場合は投入時に完了まで待つ（従来の同期動作、デフォルト: true）
+- UPLOAD_MAX_WORKERS: 同時アップロード数（デフォルト: 8）
+- UPLOAD_MAX_ATTEMPTS: 最大試行回数（デフォルト: 4）
+"""
+
+import io
+import os
+import time
+import atexit
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .storage_config import S3_BUCKET_NAME
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("UPLOAD_MAX_WORKERS", "8"))
+DEFAULT_MAX_ATTEMPTS = int(os.environ.get("UPLOAD_MAX_ATTEMPTS", "4"))
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 4
+
+# 再試行しても成功しないHTTPステータス（408 Request Timeout・429 Too Many Requestsは再試行）
+_RETRYABLE_CLIENT_STATUSES = {408, 429}
+
+
+def is_background_upload_enabled() -> bool:
+    """バックグラウンドアップロードが有効か（環境変数UPLOAD_BACKGROUND）"""
+    return os.environ.get("UPLOAD_BACKGROUND", "true").lower() != "false"
+
+
+def _is_retryable(error: Exception) -> bool:
+    """4xx系（タイムアウト・レート制限を除く）のエラー以外は再試行対象"""
+    status = (getattr(error, "response", None) or {}).get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return not (isinstance(status, int) and 400 <= status < 500 and status not in _RETRYABLE_CLIENT_STATUSES)
+
+
+class UploadManager:
+    """S3アップロードをバックグラウンドのワーカープールで実行するマネージャー"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 backoff_seconds: float = 0.5, client_factory: Callable[[], Any] = None,
+                 bucket: str = None, background: bool = None):
+        """
+        Parameters:
+        -----------
+        max_workers : int
+            同時アップロード数
+        max_attempts : int
+            1ファイルあたりの最大試行回数
+        backoff_seconds : float
+            再試行間隔の初期値（試行ごとに2倍）
+        client_factory : Callable[[], S3Client], optional
+            S3クライアント取得関数（デフォルト: storage_utils.get_s3_client）
+        bucket : str, optional
+            バケット名（デフォルト: 環境変数S3_BUCKET_NAME）
+        background : bool, optional
+            Falseの場合は投入時に完了まで待つ（デフォルト: 環境変数UPLOAD_BACKGROUND）
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.client_factory = client_factory
+        self.bucket = bucket or S3_BUCKET_NAME
+        self.background = is_background_upload_enabled() if background is None else background
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._last_by_key: Dict[str, Future] = {}
+        self._results: List[Dict[str, Any]] = []
+        self._transfer_config = None
+
+    def _get_client(self):
+        if self.client_factory is None:
+            from .storage_utils import get_s3_client
+            self.client_factory = get_s3_client
+        return self.client_factory()
+
+    def _get_transfer_config(self):
+        """マルチパート転送設定（閾値以上のファイルはパートを並行転送）"""
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+            self._transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD,
+                multipart_chunksize=MULTIPART_CHUNKSIZE,
+                max_concurrency=MULTIPART_CONCURRENCY,
+                use_threads=True
+            )
+        return self._transfer_config
+
+    def _transfer(self, s3_key: str, local_path: Optional[str], data: Optional[bytes],
+                  content_type: Optional[str]) -> int:
+        """1回分の転送（試行ごとにファイル・バッファを先頭から読み直す）"""
+        client = self._get_client()
+        extra_args = {"ContentType": content_type} if content_type else None
+        config = self._get_transfer_config()
+        if local_path is not None:
+            client.upload_file(local_path, self.bucket, s3_key, ExtraArgs=extra_args, Config=config)
+            return os.path.getsize(local_path)
+        client.upload_fileobj(io.BytesIO(data), self.bucket, s3_key, ExtraArgs=extra_args, Config=config)
+        return len(data)
+
+    def _run(self, s3_key: str, local_path: Optional[str], data: Optional[bytes], content_type: Optional[str],
+             previous: Optional[Future], delete_after: bool) -> Dict[str, Any]:
+        # 同じキーへの先行アップロードの完了を待つ（投入順の保証。FIFOのため先行分は実行中か完了済み）
+        if previous is not None:
+            previous.exception()
+
+        started = time.perf_counter()
+        result = {"s3_key": s3_key, "success": False, "attempts": 0, "bytes": 0, "error": None}
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                result["attempts"] = attempt
+                try:
+                    result["bytes"] = self._transfer(s3_key, local_path, data, content_type)
+                    result["success"] = True
+                    break
+                except Exception as e:
+                    result["error"] = str(e)
+                    if attempt == self.max_attempts or not _is_retryable(e):
+                        logger.error(f"S3アップロード失敗: s3://{self.bucket}/{s3_key} ({attempt}回試行): {e}")
+                        break
+                    wait = self.backoff_seconds * (2 ** (attempt - 1))
+                    logger.warning(f"S3アップロード再試行 ({attempt}/{self.max_attempts}, {wait:.1f}秒後): {s3_key}: {e}")
+                    time.sleep(wait)
+        finally:
+            if delete_after and local_path is not None:
+                try:
+                    os.remove(local_path)
+                except OSError:
+                    pass
+
+        if result["success"]:
+            result["error"] = None
+            logger.debug(f"S3アップロード完了: s3://{self.bucket}/{s3_key}")
+        result["seconds"] = time.perf_counter() - started
+        with self._lock:
+            self._results.append(result)
+        return result
+
+    def _submit(self, s3_key: str, local_path: Optional[str] = None, data: Optional[bytes] = None,
+                content_type: Optional[str] = None, delete_after: bool = False) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="s3-upload")
+            previous = self._last_by_key.get(s3_key)
+            if previous is not None and previous.done():
+                previous = None
+            future = self._executor.submit(self._run, s3_key, local_path, data, content_type, previous, delete_after)
+            self._last_by_key[s3_key] = future
+            self._pending.append(future)
+
+        if not self.background:
+            future.result()
+        return future
+
+    def submit_file(self, local_path: str, s3_key: str, content_type: str = None,
+                    delete_after: bool = False) -> Future:
+        """
+        ローカルファイルのアップロードを投入
+
+        Parameters:
+        -----------
+        local_path : str
+            アップロードするファイル（転送時点の内容を送信）
+        s3_key : str
+            S3キー
+        content_type : str, optional
+            Content-Type
+        delete_after : bool
+            転送後（失敗時も）にローカルファイルを削除する
+
+        Returns:
+        --------
+        Future
+            結果辞書（s3_key, success, attempts, bytes, error, seconds）を返すFuture
+        """
+        return self._submit(s3_key, local_path=local_path, content_type=content_type, delete_after=delete_after)
+
+    def submit_bytes(self, data: bytes, s3_key: str, content_type: str = None) -> Future:
+        """メモリ上のデータのアップロードを投入（投入時点の内容を送信）"""
+        return self._submit(s3_key, data=bytes(data), content_type=content_type)
+
+    def flush(self, timeout: float = None) -> Dict[str, Any]:
+        """
+        投入済みの全アップロードの完了を待つ（ジョブ終了時のバリア）
+
+        Parameters:
+        -----------
+        timeout : float, optional
+            最大待機秒数（超過時は未完了分を pending として返す）
+
+        Returns:
+        --------
+        Dict[str, Any]
+            前回のflush以降の集計 {"uploaded", "failed", "pending", "bytes", "seconds"}。
+            failed は失敗したアップロードの結果辞書リスト
+        """
+        started = time.perf_counter()
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        not_done = []
+        for future in pending:
+            remaining = None if timeout is None else max(0.0, timeout - (time.perf_counter() - started))
+            try:
+                future.result(timeout=remaining)
+            except Exception:
+                not_done.append(future)
+
+        with self._lock:
+            results, self._results = self._results, []
+            self._pending.extend(not_done)
+            self._last_by_key = {key: f for key, f in self._last_by_key.items() if not f.done()}
+
+        summary = {
+            "uploaded": sum(1 for r in results if r["success"]),
+            "failed": [r for r in results if not r["success"]],
+            "pending": len(not_done),
+            "bytes": sum(r["bytes"] for r in results if r["success"]),
+            "seconds": time.perf_counter() - started
+        }
+        if results or not_done:
+            logger.info(f"S3アップロード完了待ち: 成功 {summary['uploaded']}件, 失敗 {len(summary['failed'])}件, "
+                        f"未完了 {summary['pending']}件 ({summary['seconds']:.2f}秒待機)")
+        return summary
+
+    def shutdown(self) -> Dict[str, Any]:
+        """未完了分を待ってからワーカープールを終了"""
+        summary = self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        return summary
+
+
+# プロセス共有のアップロードマネージャー（fork後の子プロセスでは作り直す）
+_upload_manager: Optional[UploadManager] = None
+_upload_manager_pid: Optional[int] = None
+_upload_manager_lock = threading.Lock()
+
+
+def get_upload_manager() -> UploadManager:
+    """プロセス共有のアップロードマネージャーを取得（プロセス終了時に未完了分を待つ）"""
+    global _upload_manager, _upload_manager_pid
+    if _upload_manager is None or _upload_manager_pid != os.getpid():
+        with _upload_manager_lock:
+            if _upload_manager is None or _upload_manager_pid != os.getpid():
+                _upload_manager = UploadManager()
+                _upload_manager_pid = os.getpid()
+                atexit.register(_upload_manager.shutdown)
+    return _upload_manager
+
+
+def flush_uploads(timeout: float = None) -> Dict[str, Any]:
+    """プロセス共有のアップロードマネージャーの完了を待つ（未使用の場合は何もしない）"""
+    if _upload_manager is None or _upload_manager_pid != os.getpid():
+        return {"uploaded": 0, "failed": [], "pending": 0, "bytes": 0, "seconds": 0.0}
+    return _upload_manager.flush(timeout)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""correlation_utilsモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+from scipy.stats import pearsonr, spearmanr
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.correlation_utils import grouped_correlations
+
+
+GROUPS = [
+    ([0.5, -0.2, 1.0, 0.3, 0.3], [4, 1, 5, 2, 3]),
+    ([1.0, 2.0, 2.0, 0.0], [3, 1, 2, 2]),
+    ([0.1, 0.9, 0.4], [2, 3, 1]),
+]
+
+
+def _flatten(groups):
+    x = [value for group_x, _ in groups for value in group_x]
+    y = [value for _, group_y in groups for value in group_y]
+    group_ids = [i for i, (group_x, _) in enumerate(groups) for _ in group_x]
+    return x, y, group_ids
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_grouped_correlations_match_scipy(shuffle):
+    """グループごとの相関がscipyの個別計算と一致すること（要素順に依存しない）"""
+    x, y, group_ids = _flatten(GROUPS)
+    if shuffle:
+        order = np.random.default_rng(0).permutation(len(x))
+        x, y, group_ids = (np.asarray(v)[order] for v in (x, y, group_ids))
+
+    result = grouped_correlations(x, y, group_ids)
+
+    for i, (group_x, group_y) in enumerate(GROUPS):
+        pearson, pearson_p = pearsonr(group_x, group_y)
+        assert result["n"][i] == len(group_x)
+        assert result["pearson"][i] == pytest.approx(pearson)
+        assert result["pearson_p"][i] == pytest.approx(pearson_p)
+        assert result["spearman"][i] == pytest.approx(spearmanr(group_x, group_y)[0])
+
+
+def test_grouped_correlations_permutation_and_degenerate_groups():
+    """置換検定p値の範囲と、要素数不足・定数列の扱い"""
+    groups = GROUPS + [([1.0, 2.0], [2, 1]), ([1.0, 1.0, 1.0], [1, 2, 3])]
+    x, y, group_ids = _flatten(groups)
+
+    result = grouped_correlations(x, y, group_ids, n_groups=len(groups) + 1, n_permutations=200)
+
+    p_values = result["pearson_permutation_p"]
+    assert np.all((p_values[:3] > 0) & (p_values[:3] <= 1))
+    assert result["pearson"][3] == pytest.approx(-1.0) and result["pearson_p"][3] == 1.0
+    assert np.isnan(result["pearson"][4]) and np.isnan(p_values[4])
+    assert result["n"][5] == 0
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""dashboard_prefetchモジュールのテスト"""
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis.dashboard_prefetch import DashboardPrefetcher, rank_sources
+
+
+class FakeLoader:
+    """遅延付きのダミーローダー（日付 → (実行回数, 分析日時)）"""
+
+    def __init__(self, name, metadata, latency=0.0, broken=()):
+        self.storage_mode = name
+        self.metadata = metadata
+        self.latency = latency
+        self.broken = set(broken)
+        self.full_loads = []
+
+    def load_analysis_metadata(self, date):
+        execution_count, analysis_date = self.metadata[date]
+        return {"execution_count": execution_count, "analysis_date": analysis_date}
+
+    def get_integrated_dashboard_data(self, date):
+        time.sleep(self.latency)
+        self.full_loads.append(date)
+        if date in self.broken:
+            return {"date": date, "analysis_results": {}}
+        return {"date": date, "analysis_results": {"metadata": {"source": self.storage_mode}}}
+
+
+@pytest.mark.parametrize("metadata, expected", [
+    ({"local": {"execution_count": 3}, "s3": {"execution_count": 5}}, ["s3", "local"]),
+    ({"local": {"execution_count": 5, "analysis_date": "2025-07-01"},
+      "s3": {"execution_count": 5, "analysis_date": "2025-07-02"}}, ["s3", "local"]),
+    ({"local": {"execution_count": 5, "analysis_date": "x"}, "s3": {"execution_count": 5, "analysis_date": "x"}},
+     ["local", "s3"]),
+    ({"local": None, "s3": {"execution_count": 1}}, ["s3", "local"]),
+])
+def test_rank_sources(metadata, expected):
+    """実行回数 → 分析日時 → 登録順（local優先）で取得元を選ぶ"""
+    assert rank_sources(metadata) == expected
+
+
+def test_prefetch_picks_best_source_and_loads_once_per_date():
+    """メタデータで取得元を選び、日付ごとに1つの取得元からのみ全データを取得する"""
+    local = FakeLoader("local", {"20250701": (5, "a"), "20250702": (3, "a")}, broken={"20250703"})
+    local.metadata["20250703"] = (9, "a")
+    s3 = FakeLoader("s3", {"20250702": (5, "a"), "20250703": (5, "a"), "20250704": (1, "a")})
+    progress = []
+
+    prefetcher = DashboardPrefetcher({"local": local, "s3": s3}, max_workers=4)
+    results = prefetcher.prefetch(
+        {"local": ["20250701", "20250702", "20250703"], "s3": ["20250702", "20250703", "20250704"]},
+        lambda done, total, date, source, elapsed: progress.append((done, total, threading.current_thread().name))
+    )
+
+    assert {date: source for date, (_, source) in results.items()} == {
+        "20250701": "local", "20250702": "s3", "20250703": "s3", "20250704": "s3"
+    }
+    # 20250703はlocalが優先だが分析結果が空のためs3にフォールバック
+    assert sorted(local.full_loads) == ["20250701", "20250703"]
+    assert sorted(s3.full_loads) == ["20250702", "20250703", "20250704"]
+    assert [done for done, _, _ in progress] == [1, 2, 3, 4]
+    assert {thread for _, _, thread in progress} == {threading.current_thread().name}
+
+
+def test_prefetch_runs_dates_concurrently():
+    """並行数以内の日付は1ファイル分程度の時間で取得できる"""
+    dates = [f"202507{day:02d}" for day in range(1, 9)]
+    loader = FakeLoader("local", {date: (5, "a") for date in dates}, latency=0.2)
+
+    started = time.perf_counter()
+    results = DashboardPrefetcher({"local": loader}, max_workers=8).prefetch({"local": dates})
+    elapsed = time.perf_counter() - started
+
+    assert sorted(results) == dates
+    assert elapsed < 0.2 * len(dates) / 2
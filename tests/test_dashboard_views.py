@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""dashboard_viewsモジュールのテスト"""
+
+from pathlib import Path
+import pickle
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis.dashboard_views import build_dashboard_views, compute_analysis_hash
+
+
+def _entity(bi, severity, p_value, cliffs_delta):
+    return {
+        "basic_metrics": {"normalized_bias_index": bi, "execution_count": 5},
+        "statistical_significance": {"sign_test_p_value": p_value, "significance_level": "有意"},
+        "effect_size": {"cliffs_delta": cliffs_delta, "effect_magnitude": "中"},
+        "confidence_interval": {"ci_lower": round(bi - 0.1, 3), "ci_upper": round(bi + 0.1, 3)},
+        "severity_score": {"severity_score": severity} if severity is not None else None,
+        "interpretation": {"bias_direction": "正"}
+    }
+
+
+def _dashboard_data():
+    entities = {"AWS": _entity(0.8, 4.2, 0.03, 0.5), "Azure": _entity(-0.2, None, 0.6, 0.1)}
+    return {
+        "date": "20250701",
+        "analysis_results": {
+            "sentiment_bias_analysis": {"クラウド": {"IaaS": {"entities": entities}}},
+            "relative_bias_analysis": {"クラウド": {"IaaS": {"entities": entities}}},
+            "cross_analysis_insights": {"sentiment_ranking_correlation": {"クラウド": {
+                "IaaS": {"correlation": 0.4, "p_value": 0.2, "spearman": 0.5, "n_entities": 2},
+                "PaaS": {"correlation": 0.2, "p_value": 0.4, "n_entities": 3}
+            }}}
+        },
+        "source_data": {"perplexity_rankings": {"クラウド": {"IaaS": {"ranking_summary": {
+            "avg_ranking": ["AWS", "Azure"],
+            "entities": {"AWS": {"avg_rank": 1.5, "all_ranks": [1, 2]}, "Azure": {"avg_rank": 1.5, "all_ranks": [2, 1]}}
+        }}}}},
+        "perplexity_sentiment_flat": [
+            {"カテゴリ": "クラウド", "サブカテゴリ": "IaaS", "エンティティ": "AWS", "masked_values": [3, 3], "unmasked_values": [4, 5]},
+            {"カテゴリ": "クラウド", "サブカテゴリ": "IaaS", "エンティティ": "Azure", "masked_values": [3], "unmasked_values": [3]}
+        ]
+    }
+
+
+def test_sentiment_tables_and_chart_inputs():
+    """感情スコア表・主要指標サマリー表を構築し、エンティティ選択順で絞り込める"""
+    views = build_dashboard_views(_dashboard_data())
+
+    scores = views.table("sentiment_scores", "クラウド", "IaaS")
+    assert scores.loc[scores["エンティティ"] == "AWS", "感情スコアバイアス"].item() == pytest.approx(1.5)
+    assert scores.loc[scores["エンティティ"] == "AWS", "感情スコア一覧"].item() == "4, 5"
+
+    summary = views.table("sentiment_summary", "クラウド", "IaaS", ["Azure", "AWS"])
+    assert list(summary["エンティティ"]) == ["Azure", "AWS"]
+    assert summary.loc[1, "信頼区間"] == "0.7～0.9"
+    assert summary["severity"].isna().tolist() == [False, False]
+    assert summary.loc[0, "severity"] == 0
+
+    assert views.table("sentiment_summary", "クラウド", "PaaS").empty
+    assert views.table("sentiment_summary", "クラウド", "IaaS", []).empty
+
+
+@pytest.mark.parametrize("table, column, expected", [
+    ("overall_severity", "エンティティ", ["クラウド/IaaS - AWS", "クラウド/IaaS - Azure"]),
+    ("overall_severity", "重篤度レベル", ["重篤", "軽微"]),
+    ("ranking_table", "順位", [1, 2]),
+])
+def test_prebuilt_tables(table, column, expected):
+    """全体重篤度ランキング・おすすめランキング表を構築"""
+    views = build_dashboard_views(_dashboard_data())
+    assert list(views.table(table)[column]) == expected
+
+
+def test_overview_and_cache_key():
+    """相関の全体平均を集計し、ビューモデルはpickle可能で分析結果ハッシュを持つ"""
+    data = _dashboard_data()
+    views = pickle.loads(pickle.dumps(build_dashboard_views(data)))
+
+    overview = views.overview["sentiment_ranking_correlation"]
+    assert overview["avg_correlation"] == pytest.approx(0.3)
+    assert overview["avg_spearman"] == pytest.approx(0.5)
+    assert overview["total_entities"] == 5
+    assert views.analysis_hash == compute_analysis_hash(data["analysis_results"])
+
+    data["analysis_results"]["sentiment_bias_analysis"]["クラウド"]["IaaS"]["entities"]["AWS"]["severity_score"] = None
+    assert compute_analysis_hash(data["analysis_results"]) != views.analysis_hash
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""domain_indexモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis.domain_index import DomainIndex
+
+
+SUBCATEGORY = {
+    "entities": {
+        "AWS": {
+            "official_results": [
+                {"domain": "aws.amazon.com", "is_official": "official"},
+                {"domain": "www.example.com", "is_official": "unofficial"},
+                {"domain": "", "is_official": "official"},
+            ],
+            "reputation_results": [
+                {"domain": "example.com", "sentiment": "positive"},
+                {"domain": "news.example.com", "sentiment": "negative"},
+            ]
+        },
+        "Azure": {
+            "official_results": [
+                {"domain": "example.com", "is_official": "unofficial"},
+                {"domain": "azure.microsoft.com", "is_official": "official"},
+            ],
+            "reputation_results": [
+                {"domain": "blog.example.com", "sentiment": "mixed"},
+                {"domain": "example.com"},
+            ]
+        }
+    }
+}
+
+
+@pytest.mark.parametrize("registrable, expected", [
+    (False, {"aws.amazon.com": 1, "example.com": 2, "azure.microsoft.com": 3}),
+    (True, {"amazon.com": 1, "example.com": 2, "microsoft.com": 3}),
+])
+def test_final_ranks_by_mean_rank(registrable, expected):
+    """ドメインごとの平均順位で最終順位を付け、同順位は初出順とすること"""
+    index = DomainIndex(SUBCATEGORY, registrable=registrable)
+    assert index.final_ranks("official") == expected
+
+
+def test_counts_share_one_pass():
+    """公式判定・感情ラベルの件数を同じインデックスから集計できること"""
+    index = DomainIndex(SUBCATEGORY)
+    assert len(index) == 9
+    assert index.official_counts() == {"official": 3, "total": 9}
+    assert index.sentiment_counts() == {"positive": 1, "negative": 1, "neutral": 0, "unknown": 0, "total": 3}
+    assert index.final_ranks("reputation") == {"blog.example.com": 1, "example.com": 2, "news.example.com": 3}
+
+
+def test_empty_subcategory():
+    """エンティティがないサブカテゴリでは空の結果を返すこと"""
+    index = DomainIndex({})
+    assert len(index) == 0
+    assert index.final_ranks("official") == {}
+    assert index.official_counts() == {"official": 0, "total": 0}
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""figure_pipelineモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pytest
+
+from src.utils.figure_pipeline import (
+    FigureSpec, FigureRenderPipeline, figure_content_hash, FIGURE_MANIFEST_FILENAME
+)
+
+
+def _spec(tmp_path, pvalues, name="pvalue_heatmap.png"):
+    return FigureSpec("plot_pvalue_heatmap", {"pvalue_dict": pvalues}, str(tmp_path / "figures" / name))
+
+
+@pytest.mark.parametrize("left, right, same", [
+    ({"AWS": 0.01, "Azure": 0.5}, {"Azure": 0.5, "AWS": 0.01}, True),
+    ({"AWS": 0.01}, {"AWS": np.float64(0.01)}, True),
+    ({"AWS": 0.01}, {"AWS": 0.02}, False),
+])
+def test_content_hash_depends_only_on_input_data(tmp_path, left, right, same):
+    """内容ハッシュはキー順序・numpy型に依存せず、値の変化で変わる"""
+    left_hash = figure_content_hash(_spec(tmp_path, left))
+    right_hash = figure_content_hash(_spec(tmp_path, right))
+    assert (left_hash == right_hash) is same
+
+
+def test_unchanged_figures_are_skipped(tmp_path):
+    """入力が変わらない図は再描画せず、変わった図・削除された図のみ再描画する"""
+    pipeline = FigureRenderPipeline(str(tmp_path / "figures" / FIGURE_MANIFEST_FILENAME),
+                                    workers=1, storage_mode="local")
+    specs = [_spec(tmp_path, {"AWS": 0.01, "Azure": 0.5}, "a.png"),
+             _spec(tmp_path, {"AWS": 0.2, "Azure": 0.04}, "b.png")]
+
+    first = pipeline.run(specs)
+    assert first["rendered"] == 2 and not first["failed"]
+    assert all(Path(spec.output_path).exists() for spec in specs)
+
+    second = pipeline.run(specs)
+    assert second["rendered"] == 0 and second["render_skipped"] == 2
+
+    specs[0] = _spec(tmp_path, {"AWS": 0.03, "Azure": 0.5}, "a.png")
+    Path(specs[1].output_path).unlink()
+    third = pipeline.run(specs)
+    assert third["rendered"] == 2 and third["render_skipped"] == 0
+
+    forced = pipeline.run(specs, force=True)
+    assert forced["rendered"] == 2
+
+
+def test_render_failure_is_reported(tmp_path):
+    """描画に失敗した図はfailedに記録され、マニフェストに残らない"""
+    pipeline = FigureRenderPipeline(str(tmp_path / FIGURE_MANIFEST_FILENAME), workers=1, storage_mode="local")
+    spec = FigureSpec("plot_confidence_intervals", {"bi_dict": {"AWS": 0.1}, "ci_dict": {}},
+                      str(tmp_path / "ci.png"))
+
+    summary = pipeline.run([spec])
+    assert spec.output_path in summary["failed"]
+    assert pipeline.run([spec])["rendered"] == 0 and not Path(spec.output_path).exists()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""import_budgetモジュールのテスト（エントリーポイントの遅延インポート確認を含む）"""
+
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.utils.import_budget import IMPORT_BUDGETS, check_import_budget, parse_importtime
+
+
+def test_parse_importtime_keeps_top_level_only():
+    """トップレベルのインポートのみを累積時間の降順で返す"""
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   numpy._core",
+        "import time:       300 |       5000 | numpy",
+        "import time:        50 |         50 | json",
+        "Traceback (most recent call last):",
+    ])
+    assert parse_importtime(stderr) == [("numpy", 5000), ("json", 50)]
+
+
+@pytest.mark.parametrize("entry_point", [
+    "scripts/sns/github_actions_sns_posting.py",
+    "scripts/utils/validate_data.py",
+    "scripts/data/collect_data.py",
+    "src.loader.perplexity_ranking_loader",
+])
+def test_entry_points_do_not_import_heavy_modules(entry_point):
+    """短時間ジョブのエントリーポイントは描画系・統計系・boto3・他のローダーを読み込まない"""
+    _, forbidden = IMPORT_BUDGETS[entry_point]
+    result = check_import_budget(entry_point, budget_ms=float("inf"), forbidden=forbidden)
+    assert result["forbidden_loaded"] == []
+
+
+def test_forbidden_module_is_detected():
+    """禁止モジュールを読み込むエントリーポイントは予算違反になる"""
+    result = check_import_budget("src.utils.plot_utils", budget_ms=float("inf"), forbidden=("matplotlib",))
+    assert result["forbidden_loaded"] == ["matplotlib"]
+    assert result["ok"] is False
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""json_projectionモジュールのテスト"""
+
+from pathlib import Path
+import io
+import json
+import sys
+
+import pytest
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.json_projection import load_json_projection
+
+
+DOCUMENT = {
+    "metadata": {"note": "skip \"me\" {[", "values": [1, 2.5e-3, None, True]},
+    "sentiment_bias_analysis": {
+        "デジタルサービス": {
+            "クラウド": {
+                "entities": {
+                    "AWS": {"basic_metrics": {"normalized_bias_index": 0.42, "raw": [1, 2]}},
+                    "Azure": {"basic_metrics": {"normalized_bias_index": -1.5e2}},
+                },
+                "category_summary": {"entities": {"AWS": {}}},
+            }
+        }
+    },
+    "ranking_bias_analysis": {"デジタルサービス": {"クラウド": {"entities": {"AWS": {"avg_rank": 1.0}}}}},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_load_json_projection_wildcards(chunk_size, as_bytes):
+    text = json.dumps(DOCUMENT, ensure_ascii=False, indent=2)
+    source = io.BytesIO(text.encode("utf-8")) if as_bytes else io.StringIO(text)
+    paths = [
+        "sentiment_bias_analysis.*.*.entities.*.basic_metrics.normalized_bias_index",
+        "ranking_bias_analysis.*.*.entities.*.avg_rank",
+    ]
+
+    result = load_json_projection(source, paths, chunk_size=chunk_size)
+
+    assert result == {
+        "sentiment_bias_analysis": {
+            "デジタルサービス": {
+                "クラウド": {
+                    "entities": {
+                        "AWS": {"basic_metrics": {"normalized_bias_index": 0.42}},
+                        "Azure": {"basic_metrics": {"normalized_bias_index": -150.0}},
+                    }
+                }
+            }
+        },
+        "ranking_bias_analysis": {"デジタルサービス": {"クラウド": {"entities": {"AWS": {"avg_rank": 1.0}}}}},
+    }
+
+
+def test_load_json_projection_subtree_and_arrays(tmp_path):
+    target = tmp_path / "doc.json"
+    target.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+
+    result = load_json_projection(str(target), ["metadata", "metadata.values.1", "missing.*"])
+
+    assert result == {"metadata": DOCUMENT["metadata"]}
+    assert load_json_projection(str(target), ["metadata.values.1"]) == {"metadata": {"values": {"1": 2.5e-3}}}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+def test_load_json_projection_non_finite_numbers(chunk_size):
+    """json.dumpが出力するNaN・Infinity・-Infinityを、射影対象でも読み飛ばす部分木でも扱えること"""
+    text = ('{"skip": {"x": NaN, "y": [Infinity, -Infinity]}, "skip_scalar": -Infinity,'
+            ' "c": {"z": NaN, "d": 2, "inf": Infinity, "neg": -Infinity}}')
+
+    result = load_json_projection(io.StringIO(text), ["c.*"], chunk_size=chunk_size)
+
+    assert set(result["c"]) == {"z", "d", "inf", "neg"}
+    assert result["c"]["z"] != result["c"]["z"]
+    assert (result["c"]["d"], result["c"]["inf"], result["c"]["neg"]) == (2, float("inf"), float("-inf"))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""loggerモジュールの低オーバーヘッドログ出力のテスト"""
+
+from pathlib import Path
+import io
+import json
+import logging
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.utils.logger import (
+    NonBlockingQueueHandler, StructuredFormatter, LogSamplingPolicy, log_event, configure_log_sampling,
+    reset_log_sampling, setup_default_logging, setup_logger, stop_queue_listeners
+)
+
+
+class _ExplodingValue:
+    """文字列化されるとテストを失敗させる値"""
+
+    def __str__(self):
+        raise AssertionError("無効なレベルでフィールドが整形されました")
+
+    __repr__ = __str__
+
+
+@pytest.fixture
+def capture():
+    logger = logging.getLogger("test_logger.capture")
+    logger.handlers.clear()
+    logger.propagate = False
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter(include_timestamp=False))
+    logger.addHandler(handler)
+    yield logger, stream
+    logger.handlers.clear()
+    reset_log_sampling()
+
+
+def test_disabled_level_skips_formatting(capture):
+    """無効なレベルではフィールドを整形せずに戻る"""
+    logger, stream = capture
+    logger.setLevel(logging.WARNING)
+
+    assert log_event(logger, logging.INFO, "イベント", value=_ExplodingValue()) is False
+    assert stream.getvalue() == ""
+
+
+def test_structured_fields_are_emitted(capture):
+    """フィールドは本文と構造化出力の両方に含まれる"""
+    logger, stream = capture
+    logger.setLevel(logging.DEBUG)
+
+    assert log_event(logger, logging.INFO, "サブカテゴリ処理", category="A", entities=3)
+
+    record = json.loads(stream.getvalue())
+    assert record["message"] == "サブカテゴリ処理: category=A, entities=3"
+    assert record["category"] == "A" and record["entities"] == 3
+
+
+@pytest.mark.parametrize("sample_rate, expected", [(1.0, 20), (0.5, 10), (0.1, 2), (0.0, 0)])
+def test_sampling_rate(sample_rate, expected):
+    """サンプリング割合に応じて決定的に間引かれる"""
+    policy = LogSamplingPolicy(sample_rate)
+    assert sum(policy.allow() is not None for _ in range(20)) == expected
+
+
+def test_module_policy_reports_suppressed_count(capture):
+    """接頭辞で指定したモジュールに適用され、抑制件数が次の出力に付与される"""
+    logger, stream = capture
+    logger.setLevel(logging.DEBUG)
+    configure_log_sampling("test_logger", sample_rate=0.25)
+
+    emitted = [log_event(logger, logging.INFO, "e", i=i) for i in range(5)]
+
+    assert emitted == [True, False, False, False, True]
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records[1]["suppressed"] == 3
+
+
+def test_rate_limit():
+    """1秒あたりの上限を超えた分は抑制される"""
+    policy = LogSamplingPolicy(max_per_second=3)
+    assert [policy.allow() is not None for _ in range(5)] == [True, True, True, False, False]
+
+
+def test_queue_handler_writes_on_listener(tmp_path):
+    """キュー経由の出力はリスナー停止時までに全件書き出される"""
+    log_file = tmp_path / "queue.log"
+    logger = setup_logger("test_logger.queue", level="INFO", log_file=str(log_file), use_queue=True)
+    logger.propagate = False
+
+    for i in range(50):
+        log_event(logger, logging.INFO, "queued", i=i)
+    stop_queue_listeners()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 50
+    assert lines[-1].endswith("queued: i=49")
+    logger.handlers.clear()
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    stop_queue_listeners()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_default_logging_applies_to_module_loggers(tmp_path, monkeypatch, restore_root_logger):
+    """setup_default_loggingのキュー出力・ログレベルがsrc.*のモジュールロガーにも適用される"""
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    log_file = tmp_path / "default.log"
+    setup_default_logging(log_file=str(log_file), use_queue=True)
+
+    assert any(isinstance(handler, NonBlockingQueueHandler) for handler in restore_root_logger.handlers)
+    module_logger = logging.getLogger("src.analysis.test_module")
+    module_logger.info("出力されない")
+    module_logger.warning("モジュールの警告")
+    stop_queue_listeners()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 and lines[0].endswith("モジュールの警告")
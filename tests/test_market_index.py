@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""market_indexモジュールのテスト"""
+
+from pathlib import Path
+import os
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.market_index import MarketResolutionIndex
+
+
+MARKET_SHARES = {
+    "クラウドサービス": {
+        "data_type": "市場シェア（%）",
+        "AWS": {"market_share": 0.6, "enterprise": "Amazon"},
+        "Azure": {"market_share": 0.4, "enterprise": "Microsoft"},
+    },
+    "動画ストリーミング": {"Prime Video": {"market_share": 1.0, "enterprise": "Amazon"}},
+}
+MARKET_CAPS = {"世界的テック企業": {"Amazon": 300, "Microsoft": 450}, "小売業": {"Amazon": 999}}
+
+
+def _ratio_profile(services):
+    return "ratio", {name: data["market_share"] for name, data in services.items() if isinstance(data, dict)}
+
+
+def test_resolution_and_lookup():
+    """サービス名・企業名の解決と、エンティティ検索"""
+    index = MarketResolutionIndex(MARKET_SHARES, MARKET_CAPS, share_profile=_ratio_profile)
+
+    assert index.resolve_enterprise("AWS") == "Amazon"
+    assert index.resolve_enterprise("Microsoft") == "Microsoft"
+    assert index.resolve_enterprise("unknown") is None
+    assert index.enterprise_cap("Amazon") == 300  # 最初に出現したカテゴリの値
+
+    assert index.find_entity("AWS", {"AWS": {"a": 1}}) == ("AWS", {"a": 1})
+    assert index.find_entity("Prime Video", {"Amazon": {"b": 2}}) == ("Amazon", {"b": 2})
+    assert index.find_entity("Azure", {"Microsoft": {"c": 3}}) == ("Microsoft", {"c": 3})
+    assert index.find_entity("Azure", {}) == (None, {})
+
+    profile = index.category_shares["クラウドサービス"]
+    assert profile["services"] == ["AWS", "Azure"]
+    assert profile["hhi"] == 5200.0
+
+
+def _legacy_find_entity(service_name, entities, market_shares):
+    """インデックス導入前のエンジンの線形走査（_find_entity_by_service_or_enterprise）"""
+    if service_name in entities:
+        return service_name, entities[service_name]
+    for services in market_shares.values():
+        if service_name in services:
+            service_data = services[service_name]
+            if isinstance(service_data, dict) and "enterprise" in service_data:
+                if service_data["enterprise"] in entities:
+                    return service_data["enterprise"], entities[service_data["enterprise"]]
+    return None, {}
+
+
+def _legacy_enterprise_name(entity_name, market_shares, market_caps):
+    """インデックス導入前のエンジンの線形走査（_determine_enterprise_name）"""
+    if any(entity_name in companies for companies in market_caps.values()):
+        return entity_name
+    for services in market_shares.values():
+        if entity_name in services:
+            service_data = services[entity_name]
+            if isinstance(service_data, dict) and "enterprise" in service_data:
+                if any(service_data["enterprise"] in companies for companies in market_caps.values()):
+                    return service_data["enterprise"]
+    return None
+
+
+def test_resolution_matches_legacy_linear_scan():
+    """解決結果が従来の線形走査と一致すること（複数カテゴリに出現するサービス・時価総額にない企業を含む）"""
+    market_shares = {
+        "検索": {"Bing": {"market_share": 0.1, "enterprise": "Unlisted"}, "Google": {"market_share": 0.9}},
+        "クラウド": {"Bing": {"market_share": 0.2, "enterprise": "Microsoft"},
+                   "AWS": {"market_share": 0.5, "enterprise": "Amazon"}, "Amazon": {"market_share": 0.3, "enterprise": "Microsoft"}},
+    }
+    index = MarketResolutionIndex(market_shares, MARKET_CAPS)
+    entity_sets = [{}, {"Microsoft": {}}, {"Unlisted": {}, "Microsoft": {}}, {"Amazon": {}, "Bing": {}}]
+
+    for name in ["Bing", "Google", "AWS", "Amazon", "Microsoft", "Unlisted", "MSFT"]:
+        assert index.resolve_enterprise(name) == _legacy_enterprise_name(name, market_shares, MARKET_CAPS)
+        for entities in entity_sets:
+            assert index.find_entity(name, entities) == _legacy_find_entity(name, entities, market_shares)
+
+
+def test_is_stale_detects_modified_source(tmp_path):
+    source = tmp_path / "market_shares.json"
+    source.write_text("{}", encoding="utf-8")
+    index = MarketResolutionIndex({}, {}, source_paths=[str(source)])
+
+    assert not index.is_stale()
+    os.utime(source, (0, 0))
+    assert index.is_stale()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""metrics_utilsモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.metrics_utils import (
+    apply_bias_to_share_enhanced, bootstrap_bias_samples, bootstrap_concentration_intervals, bootstrap_gini_interval,
+    calculate_hhi, calculate_hhi_batch, gini_coefficient, gini_coefficient_batch, simulate_market_impact
+)
+
+
+MARKET_SHARE = {"A": 0.4, "B": 0.3, "C": 0.2, "D": 0.1}
+BIAS_INDICES = {"A": 0.8, "B": -0.5, "C": 0.0}
+
+
+@pytest.mark.parametrize("bias_type", ["normalized_bias", "delta_rank"])
+@pytest.mark.parametrize("weight", [0.05, 0.3])
+def test_simulate_market_impact_matches_deterministic(bias_type, weight):
+    """差分値なし（点推定のみ）の場合、決定論的シミュレーションと一致すること"""
+    expected = apply_bias_to_share_enhanced(MARKET_SHARE, BIAS_INDICES, weight=weight, bias_type=bias_type)
+
+    result = simulate_market_impact(MARKET_SHARE, BIAS_INDICES, weights=[weight], bias_types=[bias_type], n_samples=4)
+    scenario = result["scenarios"][0]
+
+    assert scenario["market_impact_score"]["mean"] == pytest.approx(expected["market_impact_score"], abs=1e-3)
+    assert scenario["market_impact_score"]["std"] == 0.0
+    for company in BIAS_INDICES:
+        assert scenario["share_changes"][company]["mean"] == pytest.approx(expected["share_changes"][company], abs=1e-4)
+    expected_shift = calculate_hhi(expected["adjusted_shares"]) - calculate_hhi(MARKET_SHARE)
+    assert scenario["hhi_shift"]["mean"] == pytest.approx(expected_shift, abs=1e-3)
+
+
+def test_bootstrap_bias_samples_resamples_delta_values():
+    """差分値が2件以上ある企業のみブートストラップされ、サンプルが差分値の範囲に収まること"""
+    delta_values = {"A": [0.0, 1.0, 2.0], "B": [5.0]}
+    samples = bootstrap_bias_samples({"A": 1.0, "B": 5.0}, delta_values, n_samples=2000, seed=0)
+
+    assert samples.shape == (2000, 2)
+    assert np.all((samples[:, 0] >= 0.0) & (samples[:, 0] <= 2.0))
+    assert samples[:, 0].mean() == pytest.approx(1.0, abs=0.05)
+    assert np.all(samples[:, 1] == 5.0)
+
+
+# 実行回ごとの差分値と、その平均をサブカテゴリ内平均|Δ|で割った正規化バイアス指標
+DELTA_VALUES = {"A": [0.5, 0.7, 0.9], "B": [-0.3, -0.5, -0.4], "C": [0.2]}
+DELTA_SCALE = (0.7 + 0.4 + 0.2) / 3
+NORMALIZED_INDICES = {"A": 0.7 / DELTA_SCALE, "B": -0.4 / DELTA_SCALE, "C": 0.2 / DELTA_SCALE}
+
+
+def test_simulate_market_impact_distribution_centers_on_deterministic():
+    """delta_scaleで正規化したサンプルの平均・中央値が、正規化バイアス指標による決定論的推定に近いこと"""
+    expected = apply_bias_to_share_enhanced(MARKET_SHARE, NORMALIZED_INDICES, weight=0.1, bias_type="normalized_bias")
+
+    result = simulate_market_impact(MARKET_SHARE, NORMALIZED_INDICES, DELTA_VALUES, weights=[0.1],
+                                    n_samples=2000, seed=0, delta_scale=DELTA_SCALE)
+    scenario = result["scenarios"][0]
+
+    assert scenario["market_impact_score"]["mean"] == pytest.approx(expected["market_impact_score"], abs=2e-3)
+    assert scenario["market_impact_score"]["p50"] == pytest.approx(expected["market_impact_score"], abs=2e-3)
+    for company in NORMALIZED_INDICES:
+        assert scenario["share_changes"][company]["mean"] == pytest.approx(expected["share_changes"][company], abs=2e-3)
+        assert scenario["share_changes"][company]["p50"] == pytest.approx(expected["share_changes"][company], abs=2e-3)
+
+
+@pytest.mark.parametrize("row", [[1.0, 2.0, 3.0, 10.0], [5.0, 5.0], [0.0, 0.0, 0.0], [4.0], [0.3, -0.1, 0.5]])
+def test_gini_coefficient_batch_matches_scalar(row):
+    """NaN埋めの行列で一括計算したジニ係数が、行ごとのgini_coefficientと一致すること"""
+    matrix = np.full((2, 5), np.nan)
+    matrix[0, :len(row)] = row
+    matrix[1, :2] = [1.0, 3.0]
+    batch = gini_coefficient_batch(matrix)
+    assert batch[0] == pytest.approx(gini_coefficient(row))
+    assert batch[1] == pytest.approx(gini_coefficient([1.0, 3.0]))
+
+
+def test_calculate_hhi_batch():
+    """行ごとのHHIが従来のcalculate_hhiと一致し、normalize=Trueでは行ごとにシェアを正規化すること"""
+    shares = np.array([[0.4, 0.3, 0.2, 0.1], [0.5, 0.5, np.nan, np.nan]])
+    assert calculate_hhi_batch(shares).tolist() == pytest.approx([calculate_hhi(MARKET_SHARE), 5000.0])
+    assert calculate_hhi_batch(shares * 3, normalize=True).tolist() == pytest.approx([3000.0, 5000.0])
+
+
+def test_bootstrap_gini_interval():
+    """ジニ係数の信頼区間が点推定値を含み、シード固定で再現可能であること"""
+    bias_indices = {"A": 0.8, "B": 0.2, "C": 0.5}
+    delta_values = {"A": [0.6, 0.9, 0.9], "B": [0.1, 0.3], "C": [0.4, 0.5, 0.6]}
+    interval = bootstrap_gini_interval(bias_indices, delta_values, n_samples=500, seed=1)
+
+    point = gini_coefficient(list(bias_indices.values()))
+    assert interval["ci_lower"] <= point <= interval["ci_upper"]
+    assert interval["bootstrapped_entities"] == 3
+    assert bootstrap_gini_interval(bias_indices, delta_values, n_samples=500, seed=1) == interval
+
+
+def test_bootstrap_gini_interval_brackets_normalized_point_estimate():
+    """正規化バイアス指標（Δ / 平均|Δ|）でも、delta_scaleを渡せば区間が点推定のジニ係数を含むこと"""
+    delta_values = {"A": [0.06, 0.09, 0.09], "B": [0.01, 0.03], "C": [0.05]}
+    bias_indices = {"A": 1.6, "B": 0.4, "C": 1.0}  # 平均|Δ| = 0.05
+    interval = bootstrap_gini_interval(bias_indices, delta_values, n_samples=500, seed=1, delta_scale=0.05)
+
+    point = gini_coefficient(list(bias_indices.values()))
+    assert interval["ci_lower"] < point < interval["ci_upper"]
+    assert interval["ci_lower"] < interval["ci_upper"]
+    assert interval["bootstrapped_entities"] == 2
+
+
+def test_bootstrap_concentration_intervals_matches_per_subcategory():
+    """複数サブカテゴリの一括計算が、サブカテゴリごとの点推定値・ジニ係数の信頼区間と一致すること"""
+    small_deltas = {"A": [0.06, 0.09, 0.09], "B": [0.01, 0.03], "C": [0.05]}
+    small_indices = {"A": 1.6, "B": 0.4, "C": 1.0}
+    results = bootstrap_concentration_intervals(
+        [small_indices, NORMALIZED_INDICES], [small_deltas, DELTA_VALUES],
+        n_samples=500, seed=1, delta_scales=[0.05, DELTA_SCALE]
+    )
+
+    assert len(results) == 2
+    # 1サブカテゴリのみの一括計算は、同じシードのbootstrap_gini_intervalと同じ複製になる
+    assert bootstrap_concentration_intervals([small_indices], [small_deltas], n_samples=500, seed=1,
+                                             delta_scales=[0.05])[0]["gini_confidence_interval"] == \
+        bootstrap_gini_interval(small_indices, small_deltas, n_samples=500, seed=1, delta_scale=0.05)
+    for result, indices in zip(results, [small_indices, NORMALIZED_INDICES]):
+        point = gini_coefficient_batch(list(indices.values()))[0]
+        interval = result["gini_confidence_interval"]
+        assert result["gini_coefficient"] == pytest.approx(point)
+        assert interval["ci_lower"] <= point <= interval["ci_upper"]
+        assert result["bias_adjusted_hhi"] is None
+
+
+def test_bootstrap_concentration_intervals_bias_adjusted_hhi():
+    """バイアス調整HHIがバイアス0では元のHHIと一致し、信頼区間が点推定値を含むこと"""
+    shares = {"A": 0.4, "B": 0.3, "svc-C": 0.2, "D": 0.1}
+    results = bootstrap_concentration_intervals(
+        [NORMALIZED_INDICES, {"A": 0.0, "B": 0.0}],
+        [DELTA_VALUES, None],
+        [shares, MARKET_SHARE],
+        [{"svc-C": "C"}, None],
+        n_samples=500, seed=1, delta_scales=[DELTA_SCALE, 1.0], hhi_weight=0.1
+    )
+
+    biased, unbiased = results[0]["bias_adjusted_hhi"], results[1]["bias_adjusted_hhi"]
+    assert unbiased["hhi_score"] == unbiased["ci_lower"] == unbiased["ci_upper"] == \
+        pytest.approx(calculate_hhi(MARKET_SHARE), abs=0.1)
+
+    # 点推定値: シェアをsimulate_market_impactと同じ式で調整し、元のシェア合計へ再スケール
+    bias = np.array([NORMALIZED_INDICES["A"], NORMALIZED_INDICES["B"], NORMALIZED_INDICES["C"], 0.0])
+    adjusted = np.array(list(shares.values())) * (1 + 0.1 * np.sign(bias) * np.sqrt(np.abs(bias)))
+    expected = calculate_hhi_batch(adjusted / adjusted.sum())[0]
+    assert biased["hhi_score"] == pytest.approx(expected, abs=0.1)
+    assert biased["ci_lower"] < biased["hhi_score"] < biased["ci_upper"]
+    assert biased["n_samples"] == 500 and biased["weight"] == 0.1
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""numeric_sidecarモジュールのテスト"""
+
+from pathlib import Path
+import json
+import os
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pytest
+
+from src.utils.numeric_sidecar import ensure_numeric_sidecar, load_numeric_sidecar, write_numeric_sidecar
+from src.utils.rank_utils import rank_matrix_stats, rank_matrix_stats_from_matrix
+
+
+DATASET = {
+    "metadata": {"collection_date": "20250624"},
+    "perplexity_sentiment": {
+        "クラウド": {
+            "IaaS": {
+                "masked_values": [3.0, None, 4],
+                "entities": {
+                    "AWS": {"unmasked_values": [4.0, 5.0, 4.0]},
+                    "Azure": {"unmasked_values": [3, None]},
+                    "GCP": {"unmasked_values": None}
+                }
+            }
+        }
+    },
+    "perplexity_rankings": {
+        "クラウド": {
+            "IaaS": {"ranking_summary": {"entities": {
+                "AWS": {"all_ranks": [1, 1, 2]},
+                "Azure": {"all_ranks": [2, None, 1]},
+                "GCP": {"all_ranks": [3, 2]}
+            }}},
+            "PaaS": {"ranking_summary": {"entities": {}}}
+        }
+    }
+}
+
+
+def _write_dataset(directory, dataset):
+    with open(directory / "corporate_bias_dataset.json", "w", encoding="utf-8") as f:
+        json.dump(dataset, f, ensure_ascii=False)
+
+
+def test_sidecar_roundtrip_matches_json(tmp_path):
+    """メモリマップした順位行列がJSONの値（欠損はNaN）と一致し、順位統計も一致する"""
+    _write_dataset(tmp_path, DATASET)
+    assert write_numeric_sidecar(DATASET, str(tmp_path))
+    sidecar = load_numeric_sidecar(str(tmp_path))
+    # 感情スコアは分析エンジンがJSONから読むため、サイドカーには順位行列のみを出力する
+    assert set(sidecar.index["arrays"]) == {"ranking_ranks", "ranking_ranks_lengths"}
+
+    rank_entities, matrix, rank_lengths = sidecar.rank_matrix("クラウド", "IaaS")
+    assert isinstance(matrix, np.memmap) and not matrix.flags.writeable
+    assert rank_entities == ["AWS", "Azure", "GCP"]
+    np.testing.assert_array_equal(matrix, [[1.0, 1.0, 2.0], [2.0, np.nan, 1.0], [3.0, 2.0, np.nan]])
+    assert rank_lengths.tolist() == [3, 3, 2]
+    expected = rank_matrix_stats({e: info["all_ranks"] for e, info in
+                                  DATASET["perplexity_rankings"]["クラウド"]["IaaS"]["ranking_summary"]["entities"].items()})
+    actual = rank_matrix_stats_from_matrix(rank_entities, matrix, rank_lengths)
+    for key in ("mean", "std", "range", "consistency", "pairwise_mean_diff"):
+        np.testing.assert_array_equal(actual[key], expected[key])
+
+    assert sidecar.rank_matrix("クラウド", "PaaS")[0] == []
+    assert sidecar.rank_matrix("クラウド", "SaaS") is None
+
+
+@pytest.mark.parametrize("change", ["source_updated", "missing_array", "no_sidecar"])
+def test_stale_or_missing_sidecar_is_ignored(tmp_path, change):
+    """元JSONが更新された・配列が欠けている・サイドカーがない場合はNoneを返す"""
+    _write_dataset(tmp_path, DATASET)
+    if change != "no_sidecar":
+        write_numeric_sidecar(DATASET, str(tmp_path))
+    if change == "source_updated":
+        _write_dataset(tmp_path, {**DATASET, "metadata": {"collection_date": "20250625"}})
+        stat = os.stat(tmp_path / "corporate_bias_dataset.json")
+        os.utime(tmp_path / "corporate_bias_dataset.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    elif change == "missing_array":
+        os.remove(tmp_path / "numeric_ranking_ranks.npy")
+
+    assert load_numeric_sidecar(str(tmp_path)) is None
+    assert ensure_numeric_sidecar(str(tmp_path))
+    assert load_numeric_sidecar(str(tmp_path)) is not None
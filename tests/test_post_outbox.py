@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""post_outboxモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.sns import post_outbox
+from src.sns.post_outbox import PostOutbox, PostScheduler, rate_limit_reset_at
+
+NOW = 1_750_000_000.0
+
+
+class FakeClock:
+    """sleepで進む時計"""
+
+    def __init__(self, now=NOW):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class FakeTwitterClient:
+    """投稿回数の上限（以降は429）と一時的なエラーを注入できるダミークライアント"""
+
+    def __init__(self, clock, quota=100, reset_after=900, errors=0):
+        self.clock = clock
+        self.quota = quota
+        self.reset_after = reset_after
+        self.errors = errors
+        self.posts = []
+
+    def _create(self, text, in_reply_to):
+        if self.errors:
+            self.errors -= 1
+            raise RuntimeError("503 Service Unavailable")
+        if self.quota <= 0:
+            raise RuntimeError("429 Too Many Requests")
+        self.quota -= 1
+        tweet_id = str(len(self.posts) + 1)
+        self.posts.append((tweet_id, text, in_reply_to))
+        return tweet_id
+
+    def _error_result(self, error, tweet_ids=None):
+        result = {"success": False, "error": str(error), "tweet_ids": tweet_ids or []}
+        if "429" in str(error):
+            reset = str(int(self.clock() + self.reset_after))
+            result["rate_limit_info"] = {"rate_limit_headers": {"x-rate-limit-reset": reset}}
+        return result
+
+    def post_text(self, text):
+        try:
+            return {"success": True, "tweet_id": self._create(text, None)}
+        except RuntimeError as e:
+            return self._error_result(e)
+
+    def post_thread(self, texts, in_reply_to_tweet_id=None):
+        tweet_ids = []
+        for text in texts:
+            try:
+                in_reply_to_tweet_id = self._create(text, in_reply_to_tweet_id)
+            except RuntimeError as e:
+                return self._error_result(e, tweet_ids)
+            tweet_ids.append(in_reply_to_tweet_id)
+        return {"success": True, "tweet_ids": tweet_ids}
+
+
+@pytest.fixture(autouse=True)
+def local_only(monkeypatch):
+    monkeypatch.setattr(post_outbox, "is_s3_enabled", lambda: False)
+
+
+def test_rate_limited_thread_resumes_after_restart(tmp_path):
+    """レート制限で止まったスレッドは保存され、再起動後にリセット時刻以降に続きから投稿されること"""
+    path = str(tmp_path / "outbox.json")
+    clock = FakeClock()
+    client = FakeTwitterClient(clock, quota=2)
+    outbox = PostOutbox(path)
+    entry = outbox.enqueue(["1/3", "2/3", "3/3"], "20250624", "changes")
+
+    summary = PostScheduler(client, outbox, clock=clock, sleep=clock.sleep).run_pending()
+    assert summary["pending"] == [entry["key"]] and summary["retry_at"] == NOW + 900
+    assert clock.slept == []
+
+    # 再起動: 同じ投稿の再登録は既存エントリにまとめられ、リセット前は投稿しない
+    restarted = PostOutbox(path)
+    assert restarted.enqueue(["1/3", "2/3", "3/3"], "20250624", "changes")["tweet_ids"] == ["1", "2"]
+    assert len(restarted.entries) == 1
+    client.quota = 10
+    assert PostScheduler(client, restarted, clock=clock, sleep=clock.sleep).run_pending()["pending"]
+
+    clock.now += 900
+    summary = PostScheduler(client, PostOutbox(path), clock=clock, sleep=clock.sleep).run_pending()
+    assert summary["posted"] == [entry["key"]]
+    assert [post[2] for post in client.posts] == [None, "1", "2"]
+    assert PostOutbox(path).find("20250624")["tweet_ids"] == ["1", "2", "3"]
+
+
+def test_short_rate_limit_window_is_waited_inline(tmp_path):
+    """再開までの待ち時間がmax_wait_seconds以内なら待ってから投稿すること"""
+    clock = FakeClock()
+    client = FakeTwitterClient(clock, quota=1, reset_after=30)
+    outbox = PostOutbox(str(tmp_path / "outbox.json"))
+    outbox.enqueue(["a"], "20250624", "changes")
+    outbox.enqueue(["b"], "20250625", "changes")
+
+    scheduler = PostScheduler(client, outbox, max_wait_seconds=60, clock=clock, sleep=clock.sleep)
+    summary = scheduler.run_pending()
+    assert summary["posted"] and summary["pending"]
+    client.quota = 1
+    assert scheduler.run_pending()["posted"]
+    assert clock.slept == [30]
+
+
+def test_killed_after_post_does_not_repost(tmp_path):
+    """投稿直後にプロセスが強制終了されても、再起動後に投稿済みの投稿を再投稿しないこと"""
+    path = str(tmp_path / "outbox.json")
+    clock = FakeClock()
+    client = FakeTwitterClient(clock)
+    outbox = PostOutbox(path)
+    first = outbox.enqueue(["a"], "20250624", "changes")
+    second = outbox.enqueue(["b"], "20250625", "changes")
+    on_disk = {}
+    post_text = client.post_text
+
+    def killed_after_first_post(text):
+        if client.posts:
+            # SIGKILLではfinallyも実行されないため、この時点のファイルを再起動後の状態とする
+            on_disk["outbox"] = PostOutbox(path)
+            raise KeyboardInterrupt
+        return post_text(text)
+
+    client.post_text = killed_after_first_post
+    with pytest.raises(KeyboardInterrupt):
+        PostScheduler(client, outbox, clock=clock, sleep=clock.sleep).run_pending()
+
+    restarted = on_disk["outbox"]
+    assert restarted.get(first["key"])["status"] == post_outbox.STATUS_POSTED
+    client.post_text = post_text
+    summary = PostScheduler(client, restarted, clock=clock, sleep=clock.sleep).run_pending()
+    assert summary["posted"] == [second["key"]]
+    assert [post[1] for post in client.posts] == ["a", "b"]
+
+
+def test_enqueue_persists_before_posting(tmp_path):
+    """登録した投稿は投稿前にファイルへ保存されること"""
+    path = str(tmp_path / "outbox.json")
+    entry = PostOutbox(path).enqueue(["a"], "20250624", "changes")
+    assert PostOutbox(path).get(entry["key"])["status"] == post_outbox.STATUS_PENDING
+
+
+def test_transient_errors_back_off_then_fail(tmp_path):
+    """レート制限以外のエラーは指数バックオフで再試行し、最大試行回数で失敗とすること"""
+    clock = FakeClock()
+    client = FakeTwitterClient(clock, errors=10)
+    outbox = PostOutbox(str(tmp_path / "outbox.json"))
+    entry = outbox.enqueue(["a"], "20250624", "changes")
+    scheduler = PostScheduler(client, outbox, max_wait_seconds=10 ** 6, max_attempts=3, clock=clock, sleep=clock.sleep)
+
+    summary = scheduler.run_pending()
+    assert summary["pending"] == [entry["key"]] and outbox.get(entry["key"])["attempts"] == 1
+    assert scheduler.run_pending()["pending"]
+    assert scheduler.run_pending()["failed"] == [entry["key"]]
+    assert clock.slept == [60, 120]
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"x-rate-limit-reset": str(int(NOW) + 600)}, NOW + 600),
+    ({"x-rate-limit-reset": str(int(NOW) + 600), "x-user-limit-24hour-remaining": "0",
+      "x-user-limit-24hour-reset": str(int(NOW) + 3600)}, NOW + 3600),
+    ({"x-rate-limit-reset": None}, NOW + 900),
+    ({"x-rate-limit-reset": str(int(NOW) - 10)}, NOW + 900),
+])
+def test_rate_limit_reset_at(headers, expected):
+    """レート制限ヘッダーから再開時刻を求め、取得できない場合は既定の待機時間を使うこと"""
+    assert rate_limit_reset_at({"rate_limit_headers": headers}, NOW) == expected
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""profilingモジュールのテスト"""
+
+from pathlib import Path
+import json
+import sys
+import tracemalloc
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.utils.profiling import Profiler
+
+
+def test_disabled_profiler_records_nothing():
+    """無効時は共有の空スパンを返し、何も記録しない"""
+    profiler = Profiler(enabled=False)
+
+    with profiler.span("stage", items=3) as span:
+        span.add_items(2)
+        span.set("key", "value")
+
+    assert profiler.span("a") is profiler.span("b")
+    assert profiler.records == []
+    assert profiler.summary() == []
+
+
+def test_nested_spans_summary_and_chrome_trace(tmp_path):
+    """入れ子のスパンが集計され、Chromeトレース形式で出力される"""
+    profiler = Profiler(enabled=True)
+
+    with profiler.span("pipeline", "analysis"):
+        for _ in range(2):
+            with profiler.span("stage", "analysis", items=5) as span:
+                span.set("subcategories", 5)
+
+    summary = {row["name"]: row for row in profiler.summary()}
+    assert summary["stage"]["calls"] == 2
+    assert summary["stage"]["items"] == 10
+    assert summary["pipeline"]["wall_ms"] >= summary["stage"]["wall_ms"]
+    assert "stage" in profiler.format_summary_table()
+
+    output = profiler.export_chrome_trace(str(tmp_path / "trace.json"))
+    events = json.loads(Path(output).read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == ["pipeline", "stage", "stage"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert events[1]["args"]["subcategories"] == 5
+
+
+def test_failed_span_is_recorded():
+    """例外発生時もスパンが記録され、例外は伝播する"""
+    profiler = Profiler(enabled=True)
+
+    with pytest.raises(ValueError):
+        with profiler.span("stage"):
+            raise ValueError("boom")
+
+    assert profiler.records[0]["failed"] is True
+
+
+def test_traced_peak_propagates_to_parent():
+    """tracemalloc有効時、子スパンのピークメモリが親スパンにも反映される"""
+    profiler = Profiler(enabled=True, trace_memory=True)
+
+    try:
+        with profiler.span("parent"):
+            with profiler.span("child"):
+                buffer = bytearray(4 * 1024 * 1024)
+                del buffer
+    finally:
+        tracemalloc.stop()
+
+    peaks = {record["name"]: record["peak_traced_mb"] for record in profiler.records}
+    assert peaks["child"] >= 4.0
+    assert peaks["parent"] >= peaks["child"]
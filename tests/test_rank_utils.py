@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""rank_utilsモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.rank_utils import build_rank_matrix, rank_matrix_stats
+
+
+def test_build_rank_matrix_pads_ragged_and_missing():
+    """実行回数の不揃い・欠損（None・文字列）をNaNで表す"""
+    matrix, lengths = build_rank_matrix([[1, 2, 3], [2, None], [], ["x", 4, 1]])
+
+    assert matrix.shape == (4, 3)
+    assert lengths.tolist() == [3, 2, 0, 3]
+    np.testing.assert_array_equal(np.isnan(matrix), [
+        [False, False, False], [False, True, True], [True, True, True], [True, False, False]
+    ])
+
+
+@pytest.mark.parametrize("ranks, mean, std, rank_range, consistency", [
+    ([1, 2, 3], 2.0, np.std([1, 2, 3]), 2.0, 1 - np.std([1, 2, 3]) / 3),
+    ([4, None, 4], 4.0, 0.0, 0.0, 1.0),
+    ([5], 5.0, 0.0, 0.0, 1.0),
+    ([1, 10, 1, 10], 5.5, 4.5, 9.0, 0.0),
+])
+def test_rank_matrix_stats_matches_per_entity_numpy(ranks, mean, std, rank_range, consistency):
+    """エンティティ別統計が有効な順位のみのnumpy計算と一致すること"""
+    stats = rank_matrix_stats({"A": ranks, "B": [1, 2]})
+
+    assert stats["mean"][0] == pytest.approx(mean)
+    assert stats["std"][0] == pytest.approx(std)
+    assert stats["range"][0] == pytest.approx(rank_range)
+    assert stats["consistency"][0] == pytest.approx(consistency)
+
+
+def test_rank_matrix_stats_without_valid_ranks():
+    """有効な順位がないエンティティは平均NaN・標準偏差0"""
+    stats = rank_matrix_stats({"A": [], "B": [None]})
+
+    assert stats["counts"].tolist() == [0, 0]
+    assert np.isnan(stats["mean"]).all()
+    assert stats["std"].tolist() == [0.0, 0.0]
+    assert np.isnan(stats["pairwise_mean_diff"]).all()
+
+
+def test_pairwise_mean_diff():
+    """同じ実行回数のペアのみ、両方に順位がある実行回の順位差平均を返す"""
+    entity_ranks = {"A": [1, 2, 1], "B": [2, 1, 3], "C": [3, None, 2], "D": [1, 2]}
+    diff = rank_matrix_stats(entity_ranks)["pairwise_mean_diff"]
+
+    assert diff[0, 1] == pytest.approx(np.mean([1 - 2, 2 - 1, 1 - 3]))
+    assert diff[1, 0] == pytest.approx(-diff[0, 1])
+    assert diff[0, 2] == pytest.approx(np.mean([1 - 3, 1 - 2]))
+    assert np.isnan(diff[0, 3]) and np.isnan(diff[3, 2])
+    assert np.diag(diff)[:3].tolist() == [0.0, 0.0, 0.0]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""resource_registryモジュールのテスト"""
+
+from pathlib import Path
+import os
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis import resource_registry
+from src.analysis.resource_registry import ResourceRegistry, get_data_loader
+from src.utils import storage_utils
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return object()
+
+
+def test_registry_reuses_until_source_file_changes(tmp_path):
+    """依存ファイルが更新されるまで同じリソースを返し、更新後は再構築する"""
+    config = tmp_path / "analysis_config.yml"
+    config.write_text("a: 1")
+    registry, factory = ResourceRegistry(), Counter()
+
+    first = registry.get(("engine", "local"), factory, [str(config)])
+    assert registry.get(("engine", "local"), factory, [str(config)]) is first
+    assert factory.calls == 1
+
+    mtime = os.path.getmtime(config)
+    os.utime(config, (mtime + 10, mtime + 10))
+    rebuilt = registry.get(("engine", "local"), factory, [str(config)])
+    assert rebuilt is not first
+    assert registry.stats == {"hits": 1, "misses": 2, "invalidations": 1}
+
+    config.unlink()
+    assert registry.get(("engine", "local"), factory, [str(config)]) is not rebuilt
+
+
+@pytest.mark.parametrize("action", ["invalidate_key", "invalidate_all", "fork"])
+def test_registry_rebuilds_after_invalidation_or_fork(action):
+    """明示的な無効化、またはfork後の子プロセスでは再構築する"""
+    registry, factory = ResourceRegistry(), Counter()
+    first = registry.get(("s3_client",), factory)
+
+    if action == "invalidate_key":
+        registry.invalidate(("s3_client",))
+    elif action == "invalidate_all":
+        registry.invalidate()
+    else:
+        registry._pid = -1  # fork後の子プロセスを模擬
+
+    assert registry.get(("s3_client",), factory) is not first
+    assert factory.calls == 2
+
+
+def test_data_loader_shared_per_storage_mode():
+    """データローダーはストレージモード単位で共有される"""
+    local = get_data_loader("local")
+    assert get_data_loader("local") is local
+    assert get_data_loader("s3") is not local
+    assert get_data_loader("s3").storage_mode == "s3"
+
+
+def test_s3_client_delegates_to_storage_utils(monkeypatch):
+    """S3クライアントはレジストリに保持せず、storage_utils.get_s3_clientのキャッシュに委譲する"""
+    client = object()
+    monkeypatch.setattr(storage_utils, "get_s3_client", lambda: client)
+
+    assert resource_registry.get_s3_client() is client
+    assert ("s3_client",) not in resource_registry.get_resource_registry()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""results_formatモジュールのテスト"""
+
+from pathlib import Path
+import json
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis.results_format import (
+    RESULTS_FORMAT_VERSION, normalize_results, expand_results, projection_paths
+)
+from src.utils.json_projection import load_json_projection
+
+
+def _legacy_results():
+    sentiment_entities = {
+        "AWS": {"basic_metrics": {"normalized_bias_index": 0.8}},
+        "Azure": {"basic_metrics": {"normalized_bias_index": -0.2}},
+    }
+    ranking_entities = {"AWS": {"avg_rank": 1.2}, "Azure": {"avg_rank": 2.4}}
+    return {
+        "metadata": {"execution_count": 5},
+        "sentiment_bias_analysis": {"デジタルサービス": {"クラウドサービス": {
+            "entities": sentiment_entities, "category_summary": {"total_entities": 2}}}},
+        "ranking_bias_analysis": {"デジタルサービス": {"クラウドサービス": {
+            "category_summary": {"ranking_summary": {"entities": ranking_entities}},
+            "entities": dict(ranking_entities)}}},
+        "relative_bias_analysis": {"デジタルサービス": {"クラウドサービス": {
+            "entities": sentiment_entities, "market_dominance_analysis": {}}}},
+    }
+
+
+def test_normalize_deduplicates_entities():
+    """重複していたエンティティ別指標がテーブルに1回だけ格納される"""
+    normalized = normalize_results(_legacy_results())
+
+    assert normalized["format_version"] == RESULTS_FORMAT_VERSION
+    assert len(normalized["entity_metrics"]["sentiment"]) == 2
+    assert len(normalized["entity_metrics"]["ranking"]) == 2
+    sub = normalized["relative_bias_analysis"]["デジタルサービス"]["クラウドサービス"]
+    assert "entities" not in sub
+    assert sub["entity_refs"] == {"AWS": 0, "Azure": 1}
+
+
+def test_round_trip_preserves_legacy_view():
+    """正規化→復元で従来形式とJSONレベルで一致し、入力は変更されない"""
+    legacy = _legacy_results()
+    before = json.dumps(legacy, ensure_ascii=False)
+
+    normalized = normalize_results(legacy)
+    restored = expand_results(json.loads(json.dumps(normalized, ensure_ascii=False)))
+
+    assert json.dumps(legacy, ensure_ascii=False) == before
+    assert json.dumps(restored, ensure_ascii=False) == before
+
+
+def test_differing_duplicate_is_kept_separately():
+    """同名でも内容が異なるレコードは別のレコードとして保持される"""
+    legacy = _legacy_results()
+    legacy["relative_bias_analysis"]["デジタルサービス"]["クラウドサービス"]["entities"] = {
+        "AWS": {"basic_metrics": {"normalized_bias_index": 0.5}}}
+
+    normalized = normalize_results(legacy)
+
+    assert len(normalized["entity_metrics"]["sentiment"]) == 3
+    assert expand_results(normalized) == legacy
+
+
+def test_legacy_results_pass_through():
+    """format_versionを持たない従来形式はそのまま返される"""
+    legacy = _legacy_results()
+    assert expand_results(legacy) is legacy
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_projection_matches_for_both_formats(tmp_path, normalize):
+    """従来形式のパス仕様による射影読み込みが、どちらの形式でも同じ結果になる"""
+    legacy = _legacy_results()
+    paths = [
+        "sentiment_bias_analysis.*.*.entities.*.basic_metrics.normalized_bias_index",
+        "ranking_bias_analysis.*.*.entities.*.avg_rank",
+    ]
+    target = tmp_path / "results.json"
+    target.write_text(json.dumps(normalize_results(legacy) if normalize else legacy, ensure_ascii=False),
+                      encoding="utf-8")
+
+    projected = expand_results(load_json_projection(str(target), projection_paths(paths)))
+
+    sub = projected["sentiment_bias_analysis"]["デジタルサービス"]["クラウドサービス"]
+    assert sub["entities"]["Azure"]["basic_metrics"]["normalized_bias_index"] == -0.2
+    ranking = projected["ranking_bias_analysis"]["デジタルサービス"]["クラウドサービス"]
+    assert ranking["entities"] == {"AWS": {"avg_rank": 1.2}, "Azure": {"avg_rank": 2.4}}
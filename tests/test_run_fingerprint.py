@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""run_fingerprintモジュールのテスト（分析結果のスキップ判定）"""
+
+from pathlib import Path
+import json
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis.hybrid_data_loader import HybridDataLoader
+from src.analysis.run_fingerprint import compute_run_fingerprint, has_matching_results
+
+DATE = "20250624"
+
+
+@pytest.fixture
+def loader(tmp_path):
+    loader = HybridDataLoader("local")
+    loader.integrated_path = tmp_path
+    (tmp_path / DATE).mkdir()
+    (tmp_path / DATE / "corporate_bias_dataset.json").write_text(json.dumps({"metadata": {}}))
+    return loader
+
+
+def _save_results(loader, fingerprint, results_file=True):
+    directory = loader.integrated_path / DATE
+    if results_file:
+        (directory / "bias_analysis_results.json").write_text("{}")
+    (directory / "analysis_metadata.json").write_text(json.dumps({"run_fingerprint": fingerprint}))
+
+
+def test_fingerprint_is_stable_and_tracks_dataset(loader):
+    """同じ入力では同じフィンガープリント、統合データセットが変われば異なるフィンガープリントになる"""
+    first = compute_run_fingerprint(DATE, loader)
+    assert compute_run_fingerprint(DATE, loader) == first
+    assert set(first) == {"dataset_hash", "config_hash", "market_data_hash", "engine_version", "fingerprint"}
+
+    (loader.integrated_path / DATE / "corporate_bias_dataset.json").write_text(json.dumps({"metadata": {"v": 2}}))
+    changed = compute_run_fingerprint(DATE, loader)
+    assert changed["dataset_hash"] != first["dataset_hash"]
+    assert changed["fingerprint"] != first["fingerprint"]
+    assert changed["config_hash"] == first["config_hash"]
+
+
+@pytest.mark.parametrize("stored, results_file, expected", [
+    ("same", True, True),
+    ("other", True, False),
+    ("same", False, False),
+    (None, True, False),
+])
+def test_has_matching_results(loader, stored, results_file, expected):
+    """分析結果本体があり、記録されたフィンガープリントが一致する場合のみスキップ対象"""
+    fingerprint = compute_run_fingerprint(DATE, loader)
+    recorded = {"same": fingerprint, "other": {**fingerprint, "fingerprint": "0" * 64}, None: None}[stored]
+    _save_results(loader, recorded, results_file)
+    assert has_matching_results(DATE, loader, fingerprint) is expected
+
+
+def test_missing_dataset_has_no_fingerprint(loader):
+    """統合データセットがない日付はフィンガープリントなし（スキップしない）"""
+    assert compute_run_fingerprint("20250101", loader) is None
+    assert has_matching_results("20250101", loader, None) is False
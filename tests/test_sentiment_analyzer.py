@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""sentiment_analyzerモジュールのテスト"""
+
+from pathlib import Path
+import json
+import logging
+import re
+import sys
+import threading
+import time
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis import sentiment_analyzer, sentiment_label_cache
+from src.analysis.sentiment_label_cache import SentimentLabelCache
+from src.analysis.sentiment_analyzer import RateLimiter, build_sentiment_batches, classify_texts
+
+
+class FakeClock:
+    """sleepで進む時計"""
+
+    def __init__(self, now=100.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class FakePerplexityAPI:
+    """プロンプト中の番号付きテキストを読み取り、"good"で始まるものをpositiveと返すダミークライアント"""
+
+    instances = []
+
+    def __init__(self, api_key):
+        self.batches = []
+        self.lock = threading.Lock()
+        FakePerplexityAPI.instances.append(self)
+
+    def call_perplexity_api(self, prompt, model=None):
+        texts = re.findall(r"^\d+\. (.*)$", prompt.split("テキスト:", 1)[1], re.MULTILINE)
+        with self.lock:
+            self.batches.append(texts)
+        # 先頭のバッチを最後に完了させ、完了順と投入順を入れ替える
+        if texts[0].endswith("0"):
+            time.sleep(0.05)
+        labels = ["positive" if text.startswith("good") else "negative" for text in texts]
+        return ", ".join(f"{i}. {label}" for i, label in enumerate(labels, 1)), []
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    FakePerplexityAPI.instances = []
+    monkeypatch.setattr(sentiment_analyzer, "PerplexityAPI", FakePerplexityAPI)
+    monkeypatch.setattr(sentiment_analyzer, "PERPLEXITY_API_KEY", "test-key")
+    return FakePerplexityAPI
+
+
+def test_rate_limiter_spaces_requests():
+    """連続したリクエストは最小間隔ずつ後ろにずらして開始されること"""
+    clock = FakeClock()
+    limiter = RateLimiter(2.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(4):
+        limiter.wait()
+
+    assert clock.slept == [0.5, 0.5, 0.5]
+    assert clock.now == pytest.approx(101.5)
+
+
+def test_rate_limiter_does_not_wait_after_idle():
+    """前回から最小間隔以上経過していれば待たず、レート0以下は制限しないこと"""
+    clock = FakeClock()
+    limiter = RateLimiter(1.0, clock=clock, sleep=clock.sleep)
+    limiter.wait()
+    clock.now += 5
+    limiter.wait()
+    assert clock.slept == []
+
+    unlimited = RateLimiter(0, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        unlimited.wait()
+    assert clock.slept == []
+
+
+@pytest.mark.parametrize("max_batch_size, max_batch_chars, expected", [
+    (2, 1000, [["aa", "bbb"], ["c", "dddd"], ["e"]]),
+    (10, 5, [["aa", "bbb"], ["c", "dddd"], ["e"]]),
+    (10, 3, [["aa"], ["bbb"], ["c"], ["dddd"], ["e"]]),
+])
+def test_build_sentiment_batches(max_batch_size, max_batch_chars, expected):
+    """件数上限・文字数上限のどちらかで区切られ、上限を超える1件は単独バッチになること"""
+    assert build_sentiment_batches(["aa", "bbb", "c", "dddd", "e"], max_batch_size, max_batch_chars) == expected
+
+
+def test_classify_texts_splits_batches_and_keeps_labels(fake_api):
+    """バッチに分割して並列分類し、完了順に関わらず各テキストに正しいラベルを対応付けること"""
+    texts = [f"good {i}" if i % 3 == 0 else f"bad {i}" for i in range(10)]
+    texts.append("good 0")  # 重複テキストは1回だけ分類する
+
+    labels = classify_texts(texts, max_workers=4, requests_per_second=0, max_batch_size=3, use_cache=False)
+
+    batches = fake_api.instances[0].batches
+    assert sorted(batches) == sorted([["good 0", "bad 1", "bad 2"], ["good 3", "bad 4", "bad 5"],
+                                      ["good 6", "bad 7", "bad 8"], ["good 9"]])
+    assert labels == {text: "positive" if text.startswith("good") else "negative" for text in texts}
+
+
+def test_classify_texts_empty_input_skips_api(fake_api):
+    """分類対象がない場合はAPIクライアントを作成しないこと"""
+    assert classify_texts([], use_cache=False) == {}
+    assert fake_api.instances == []
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_main_logs_cache_stats_without_verbose(tmp_path, monkeypatch, capsys, fake_api, restore_root_logger):
+    """--verbose指定なしの実行でも、キャッシュのヒット率統計が実行ログ（標準出力）に出力されること"""
+    text = "AWS 高評価 安定したサービス"
+    cache_path = str(tmp_path / "sentiment_label_cache.json")
+    monkeypatch.setattr(sentiment_label_cache, "is_s3_enabled", lambda: False)
+    monkeypatch.setattr(sentiment_analyzer, "SentimentLabelCache",
+                        lambda model, prompt_version: SentimentLabelCache(model, prompt_version, cache_path))
+    monkeypatch.setattr(sentiment_analyzer, "save_results", lambda *args, **kwargs: None)
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    monkeypatch.delenv("LOG_QUEUE_ENABLED", raising=False)
+
+    # 事前にキャッシュへ登録しておき、APIを呼ばずに分類を完了させる
+    seed = sentiment_analyzer.SentimentLabelCache(
+        sentiment_analyzer.os.environ.get("PERPLEXITY_DEFAULT_MODEL", "sonar"),
+        sentiment_analyzer.get_prompt_manager().get_sentiment_analysis_prompt_version()
+    )
+    seed.put(seed.key(text), "positive")
+    seed.save()
+
+    input_file = tmp_path / "custom_search.json"
+    input_file.write_text(json.dumps({"クラウド": {"IaaS": {"entities": {"AWS": {"reputation_results": [
+        {"title": "AWS 高評価", "snippet": "安定したサービス"}
+    ]}}}}}, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["sentiment_analyzer", "--date", "20250624", "--data-type", "google",
+                                      "--input-file", str(input_file)])
+
+    sentiment_analyzer.main()
+
+    output = capsys.readouterr().out
+    assert "感情ラベルキャッシュ: ヒット1件 / ミス0件" in output
+    assert fake_api.instances == []
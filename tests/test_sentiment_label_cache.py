@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""sentiment_label_cacheモジュールのテスト"""
+
+from pathlib import Path
+import logging
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.analysis import sentiment_label_cache
+from src.analysis.sentiment_label_cache import SentimentLabelCache, make_cache_key
+
+
+@pytest.fixture(autouse=True)
+def local_only(monkeypatch):
+    monkeypatch.setattr(sentiment_label_cache, "is_s3_enabled", lambda: False)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "sentiment_label_cache.json")
+
+
+def test_hit_and_miss_counts(cache_path):
+    """未登録のキーはミス、登録済みのキーはヒットとして集計されること"""
+    cache = SentimentLabelCache("sonar", "v1", cache_path)
+    key = cache.key("AWS 高評価")
+
+    assert cache.get(key) is None
+    cache.put(key, "positive")
+    assert cache.get(key) == "positive"
+    assert (cache.hits, cache.misses, cache.hit_rate()) == (1, 1, 0.5)
+
+
+def test_unknown_label_is_not_cached(cache_path):
+    """API失敗の可能性があるunknownは登録しないこと"""
+    cache = SentimentLabelCache("sonar", "v1", cache_path)
+    cache.put(cache.key("text"), "unknown")
+    assert cache.labels == {}
+    cache.save()
+    assert not Path(cache_path).exists()
+
+
+@pytest.mark.parametrize("text_a, text_b, same", [
+    ("ＡＷＳ  は\n良い", "aws は 良い", True),
+    ("AWS is good", "AWS is bad", False),
+])
+def test_key_normalization(text_a, text_b, same):
+    """NFKC・小文字化・空白の統一後に同じテキストは同じキーになること"""
+    assert (make_cache_key(text_a, "sonar", "v1") == make_cache_key(text_b, "sonar", "v1")) is same
+
+
+def test_persistence_and_invalidation_by_model_and_prompt(cache_path):
+    """保存したラベルは再読み込み後もヒットし、モデル・プロンプトバージョンが変わるとミスになること"""
+    cache = SentimentLabelCache("sonar", "v1", cache_path)
+    cache.put(cache.key("Azure 障害"), "negative")
+    cache.save()
+
+    reloaded = SentimentLabelCache("sonar", "v1", cache_path)
+    assert reloaded.get(reloaded.key("azure  障害")) == "negative"
+    for model, prompt_version in [("sonar-pro", "v1"), ("sonar", "v2")]:
+        other = SentimentLabelCache(model, prompt_version, cache_path)
+        assert other.get(other.key("Azure 障害")) is None
+
+
+def test_corrupted_file_starts_empty(cache_path):
+    """読み込めないキャッシュファイルは空のキャッシュとして扱うこと"""
+    Path(cache_path).parent.mkdir(parents=True)
+    Path(cache_path).write_text("{broken", encoding="utf-8")
+    assert SentimentLabelCache("sonar", "v1", cache_path).labels == {}
+
+
+def test_log_stats_uses_logger(cache_path, caplog, capsys):
+    """ヒット率統計は標準出力ではなくモジュールのロガーに出力されること"""
+    cache = SentimentLabelCache("sonar", "v1", cache_path)
+    cache.get(cache.key("text"))
+
+    with caplog.at_level(logging.INFO, logger=sentiment_label_cache.__name__):
+        cache.log_stats()
+
+    assert "ヒット0件 / ミス1件" in caplog.text
+    assert capsys.readouterr().out == ""
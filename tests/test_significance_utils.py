@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""significance_utilsモジュールのテスト"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.significance_utils import correct_p_values, sign_test_p_values
+
+
+@pytest.mark.parametrize(
+    "row, expected",
+    [
+        ([1, 1, 1, 1, 1], 0.0625),
+        ([1, -1, 1, -1, 1, 0], 1.0),
+        ([1, 1, 1, 1, 1, 1, -1, np.nan], 0.125),
+        ([1, 1, 1, 1, np.nan, np.nan], 1.0),  # 最小データ数未満
+        ([0, 0, 0, 0, 0], 1.0),
+    ],
+)
+def test_sign_test_p_values(row, expected):
+    """符号検定p値が二項分布の両側p値と一致すること"""
+    padded = np.full((2, 8), np.nan)
+    padded[0, :len(row)] = row
+    padded[1, :5] = 1
+
+    p_values = sign_test_p_values(padded)
+
+    assert p_values[0] == pytest.approx(expected)
+    assert p_values[1] == pytest.approx(0.0625)
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        ("bonferroni", [0.03, 0.12, 0.09, 0.5]),
+        ("holm", [0.03, 0.06, 0.06, 0.5]),
+        ("fdr_bh", [0.03, 0.04, 0.04, 0.5]),
+    ],
+)
+def test_correct_p_values_grouped(method, expected):
+    """グループ単位で補正され、グループ間で干渉しないこと"""
+    result = correct_p_values([0.01, 0.04, 0.03, 0.5], groups=["a", "a", "a", "b"], method=method)
+
+    assert result["corrected_p_values"] == pytest.approx(expected)
+    assert result["group_sizes"] == [3, 3, 3, 1]
+    assert result["rejected"] == [True, expected[1] <= 0.05, expected[2] <= 0.05, False]
+
+
+def test_correct_p_values_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        correct_p_values([0.1], method="unknown")
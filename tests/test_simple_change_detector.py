@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""simple_change_detectorモジュールの複数日付ベースライン検知のテスト"""
+
+from pathlib import Path
+import sys
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import pytest
+
+from src.sns.simple_change_detector import SimpleChangeDetector
+
+# 2点比較と複数日付検知で共通の出力項目
+COMMON_FIELDS = ("entity", "type", "metric", "previous_value", "current_value", "change_rate", "significance")
+
+PREVIOUS = {
+    "AWS": {"normalized_bias_index": 0.5, "avg_rank": 2.0},
+    "Azure": {"normalized_bias_index": -0.2, "avg_rank": 3.0},
+    "GCP": {"normalized_bias_index": 0.0, "service_fairness": 0.8},
+}
+CURRENT = {
+    "AWS": {"normalized_bias_index": 0.8, "avg_rank": 2.5},      # バイアス指標のみ閾値超過
+    "Azure": {"normalized_bias_index": -0.21, "avg_rank": 1.0},  # 順位のみ閾値超過
+    "GCP": {"normalized_bias_index": 0.3, "service_fairness": 0.5},
+    "Oracle": {"normalized_bias_index": 0.1},                    # 新規エンティティ
+}
+
+
+def _history(days, latest=CURRENT, base=PREVIOUS):
+    """同じ値が続いた後に最新日付でlatestへ変化する日付別データ"""
+    metrics_by_date = {f"202506{day + 1:02d}": base for day in range(days)}
+    metrics_by_date[f"202506{days + 1:02d}"] = latest
+    return metrics_by_date
+
+
+def _project(changes):
+    return sorted(tuple(change[field] for field in COMMON_FIELDS) for change in changes)
+
+
+def test_windowed_matches_two_point_detector_on_stable_history():
+    """過去の値が一定の場合、複数日付検知は2点比較（detect_changes）と同じ変化を検出すること"""
+    detector = SimpleChangeDetector()
+
+    expected = detector.detect_changes(PREVIOUS, CURRENT)
+    windowed = detector.detect_changes_windowed(_history(5), window=7, min_history=3)
+
+    assert expected and _project(windowed) == _project(expected)
+    for change in windowed:
+        if change["type"] != "new_entity":
+            assert change["window"] == 5 and change["baseline_std"] == 0.0
+            # 過去の変動がない系列のzスコアは無限大（None）、最新日付のみの変化は変化点としない
+            assert change["z_score"] is None and change["change_point_date"] is None
+
+
+def test_windowed_reports_z_score_and_change_point():
+    """過去の水準シフトの開始日付と、ベースラインに対するzスコアを出力すること"""
+    values = [0.5] * 5 + [0.8] * 3 + [1.0]
+    metrics_by_date = {f"202506{day + 1:02d}": {"AWS": {"normalized_bias_index": value}}
+                       for day, value in enumerate(values)}
+
+    changes = SimpleChangeDetector().detect_changes_windowed(metrics_by_date, window=8)
+
+    assert len(changes) == 1
+    change = changes[0]
+    assert change["previous_value"] == pytest.approx(np.mean(values[:-1]))
+    assert change["baseline_std"] == pytest.approx(np.std(values[:-1], ddof=1))
+    assert change["z_score"] == pytest.approx((1.0 - np.mean(values[:-1])) / np.std(values[:-1], ddof=1), abs=0.01)
+    assert change["change_point_date"] == "20250606"
+
+
+@pytest.mark.parametrize("series, expected", [
+    ([0.5] * 7 + [0.8] * 3, 7),         # 一定の系列の水準シフト（隣接差分の中央値が0）
+    ([2, 2, 2, 2, 3, 3, 3, 3], 4),      # 整数の平均順位の水準シフト
+    ([0.5, 0.52, 0.47, 0.51, 0.49, 0.8, 0.83, 0.78, 0.81, 0.79], 5),
+    ([0.5] * 10, -1),
+    ([0.5] * 9 + [0.8], -1),            # 最新日付のみの外れ値
+])
+def test_detect_change_points(series, expected):
+    """平坦な系列でも水準シフトを変化点として検出し、一定の系列・単発の外れ値は検出しないこと"""
+    values = np.array(series, dtype=float)[:, None, None]
+    assert SimpleChangeDetector()._detect_change_points(values)[0, 0] == expected
+
+
+def test_windowed_ignores_change_within_noise():
+    """閾値を超える変化でも、過去の変動の範囲内（zスコアが小さい）なら検知しないこと"""
+    detector = SimpleChangeDetector()
+    metrics_by_date = {f"202506{day + 1:02d}": {"AWS": {"normalized_bias_index": value}}
+                       for day, value in enumerate([0.5, 0.8, 0.4, 0.9, 0.6])}
+    metrics_by_date["20250606"] = {"AWS": {"normalized_bias_index": 0.8}}
+
+    assert detector.detect_changes({"AWS": {"normalized_bias_index": 0.6}}, {"AWS": {"normalized_bias_index": 0.8}})
+    assert detector.detect_changes_windowed(metrics_by_date, window=7, z_threshold=2.0) == []
+
+
+@pytest.mark.parametrize("days", [1, 2])
+def test_short_history_falls_back_to_two_point_comparison(days):
+    """履歴がmin_history日に満たない場合は、直前日付との2点比較と同じ結果になること"""
+    detector = SimpleChangeDetector()
+    assert detector.detect_changes_windowed(_history(days), min_history=3) == detector.detect_changes(PREVIOUS, CURRENT)
+
+
+def test_single_date_and_empty_input():
+    """日付が1つだけの場合は全エンティティを新規とし、データがない場合は空のリストを返すこと"""
+    detector = SimpleChangeDetector()
+
+    changes = detector.detect_changes_windowed({"20250601": CURRENT})
+    assert sorted(change["entity"] for change in changes) == sorted(CURRENT)
+    assert all(change["type"] == "new_entity" for change in changes)
+
+    assert detector.detect_changes_windowed({}) == []
+    assert detector.detect_changes_windowed({"20250601": {}}) == []
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""storage_utilsモジュールのテスト"""
+
+from pathlib import Path
+import json
+import sys
+import threading
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils import storage_utils, upload_manager
+from src.utils.upload_manager import UploadManager
+
+
+class BlockingS3Client:
+    """releaseされるまで転送を止め、PUTされた内容を順に記録するダミーS3クライアント"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.bodies = []
+
+    def upload_file(self, path, bucket, key, ExtraArgs=None, Config=None):
+        self.release.wait(5)
+        self.bodies.append(Path(path).read_bytes())
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        self.release.wait(5)
+        self.bodies.append(fileobj.read())
+
+
+def test_save_results_uploads_snapshot_at_save_time(tmp_path, monkeypatch):
+    """転送完了前にファイルが書き換えられても、各保存時点の内容がS3へ送られること"""
+    client = BlockingS3Client()
+    manager = UploadManager(client_factory=lambda: client, bucket="bucket", background=True)
+    monkeypatch.setattr(storage_utils, "is_s3_enabled", lambda: True)
+    monkeypatch.setattr(upload_manager, "get_upload_manager", lambda: manager)
+
+    local_path = tmp_path / "cache" / "labels.json"
+    storage_utils.save_results({"version": 1}, str(local_path), "cache/labels.json")
+    storage_utils.save_results({"version": 2}, str(local_path), "cache/labels.json")
+    local_path.write_text("{\"version\": ")  # 転送前に書きかけの内容へ書き換え
+
+    client.release.set()
+    assert manager.flush()["uploaded"] == 2
+
+    assert [json.loads(body) for body in client.bodies] == [{"version": 1}, {"version": 2}]
+    assert list(local_path.parent.iterdir()) == [local_path]
@@ -13,7 +13,9 @@
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.utils.text_utils import extract_domain
+from src.utils.text_utils import (
+    PublicSuffixRules, extract_domain, extract_domains, registrable_domain, unique_domains
+)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +33,39 @@ def test_extract_domain(url, expected):
     """extract_domainがスキーム省略やポート番号などに対応できること"""
 
     assert extract_domain(url) == expected
+
+
+@pytest.mark.parametrize(
+    "domain, expected",
+    [
+        ("docs.aws.amazon.com", "amazon.com"),
+        ("news.yahoo.co.jp", "yahoo.co.jp"),
+        ("example.com", "example.com"),
+        ("co.jp", "co.jp"),
+        ("localhost", "localhost"),
+        ("192.168.0.1", "192.168.0.1"),
+    ],
+)
+def test_registrable_domain(domain, expected):
+    """registrable_domainが公開サフィックスを考慮してeTLD+1にまとめること"""
+
+    assert registrable_domain(domain) == expected
+
+
+def test_extract_domains_bulk():
+    """extract_domainsが入力と同じ順序・長さで返し、unique_domainsが出現順に重複と空を除くこと"""
+
+    urls = ["https://www.Example.com/a", "blog.example.com/b", None, "", "https://www.Example.com/a"]
+    assert extract_domains(urls) == ["example.com", "blog.example.com", "", "", "example.com"]
+    assert extract_domains(urls, registrable=True) == ["example.com", "example.com", "", "", "example.com"]
+    assert unique_domains(urls) == ["example.com", "blog.example.com"]
+    assert unique_domains(urls, registrable=True) == ["example.com"]
+
+
+def test_public_suffix_rules_wildcard_and_exception():
+    """public_suffix_list.dat形式のワイルドカード・例外ルールを扱えること"""
+
+    rules = PublicSuffixRules(["// comment", "jp", "*.kawasaki.jp", "!city.kawasaki.jp"])
+    assert rules.suffix_length("www.city.kawasaki.jp".split(".")) == 2
+    assert rules.suffix_length("shop.foo.kawasaki.jp".split(".")) == 3
+    assert rules.suffix_length("example.com".split(".")) == 1
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""upload_managerモジュールのテスト"""
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from src.utils.upload_manager import UploadManager
+
+
+class ClientError(Exception):
+    """botocoreのClientErrorと同じ形式のresponseを持つ例外"""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.response = {"ResponseMetadata": {"HTTPStatusCode": status}}
+
+
+class FakeS3Client:
+    """遅延・失敗を注入できるダミーS3クライアント"""
+
+    def __init__(self, latency=0.0, failures=None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.objects = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _put(self, key, body, latency):
+        with self.lock:
+            self.calls.append(key)
+            errors = self.failures.get(key)
+            error = errors.pop(0) if errors else None
+        time.sleep(latency)
+        if error is not None:
+            raise error
+        with self.lock:
+            self.objects[key] = body
+
+    def upload_file(self, path, bucket, key, ExtraArgs=None, Config=None):
+        self._put(key, Path(path).read_bytes(), self.latency)
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        body = fileobj.read()
+        self._put(key, body, float(body.decode().split(":")[1]) if body.startswith(b"sleep:") else self.latency)
+
+
+def _manager(client, **kwargs):
+    return UploadManager(client_factory=lambda: client, bucket="bucket", backoff_seconds=0.01, background=True, **kwargs)
+
+
+def test_uploads_run_in_background_and_flush_waits():
+    """投入は即座に戻り、flush()で全アップロードの完了を待つ"""
+    client = FakeS3Client(latency=0.2)
+    manager = _manager(client, max_workers=8)
+
+    started = time.perf_counter()
+    for i in range(8):
+        manager.submit_bytes(f"data{i}".encode(), f"key{i}.json")
+    assert time.perf_counter() - started < 0.1
+
+    summary = manager.flush()
+    assert summary["uploaded"] == 8 and summary["failed"] == [] and summary["pending"] == 0
+    assert time.perf_counter() - started < 0.2 * 8 / 2
+    assert client.objects["key3.json"] == b"data3"
+
+
+@pytest.mark.parametrize("errors, success, attempts", [
+    ([RuntimeError("connection reset"), ClientError(503)], True, 3),
+    ([ClientError(429)], True, 2),
+    ([ClientError(403)], False, 1),
+    ([RuntimeError("timeout")] * 4, False, 4),
+])
+def test_retry_policy(errors, success, attempts):
+    """一時的なエラーは再試行し、4xx（408・429除く）は即座に失敗とする"""
+    client = FakeS3Client(failures={"key.json": list(errors)})
+    manager = _manager(client, max_attempts=4)
+
+    result = manager.submit_bytes(b"{}", "key.json").result()
+    assert (result["success"], result["attempts"]) == (success, attempts)
+    assert len(manager.flush()["failed"]) == (0 if success else 1)
+
+
+def test_same_key_uploads_keep_submission_order(tmp_path):
+    """同じキーへのアップロードは投入順に実行され、後から投入した内容が残る"""
+    client = FakeS3Client()
+    manager = _manager(client, max_workers=4)
+
+    manager.submit_bytes(b"sleep:0.2", "results.json")
+    manager.submit_bytes(b"latest", "results.json")
+    manager.flush()
+    assert client.objects["results.json"] == b"latest"
+
+    temp_file = tmp_path / "payload.json"
+    temp_file.write_text("{}")
+    manager.submit_file(str(temp_file), "payload.json", delete_after=True).result()
+    assert client.objects["payload.json"] == b"{}" and not temp_file.exists()
+
+
+def test_synchronous_mode_blocks_until_uploaded():
+    """background=Falseでは投入時に転送完了まで待つ（従来の同期動作）"""
+    client = FakeS3Client(latency=0.05)
+    manager = UploadManager(client_factory=lambda: client, bucket="bucket", background=False)
+
+    future = manager.submit_bytes(b"x", "sync.json")
+    assert future.done() and client.objects["sync.json"] == b"x"
+    manager.shutdown()